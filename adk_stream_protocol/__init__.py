@@ -44,6 +44,7 @@ from .ags import (
     register_delegate,
     sse_agent,
     sse_agent_runner,
+    unregister_delegate,
 )
 
 # === Protocol Layer ===
@@ -100,4 +101,5 @@ __all__ = [
     "sse_agent",
     "sse_agent_runner",
     "stream_adk_to_ai_sdk",
+    "unregister_delegate",
 ]
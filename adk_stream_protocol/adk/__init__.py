@@ -10,15 +10,23 @@ Components:
 - SessionStore: Central session storage class
 - get_or_create_session: Session factory with connection-based isolation
 - sync_conversation_history_to_session: Message history synchronization
+- advance_history_cursor: Delta-history protocol (client sends only new messages)
+- configure_session_eviction: LRU / idle-TTL bounds for the session store
+- pin_session / release_session: Connection-scoped session lifecycle
 - clear_sessions: Session cleanup for testing
 """
 
 from .session import (
     Event,
+    EvictionCallback,
     SessionStore,
     _session_store,
+    advance_history_cursor,
     clear_sessions,
+    configure_session_eviction,
     get_or_create_session,
+    pin_session,
+    release_session,
     sync_conversation_history_to_session,
 )
 
@@ -27,10 +35,15 @@ __all__ = [
     # Re-export from google.adk
     "Event",
     # Session Management
+    "EvictionCallback",
     "SessionStore",
     # Internal state (for testing)
     "_session_store",
+    "advance_history_cursor",
     "clear_sessions",
+    "configure_session_eviction",
     "get_or_create_session",
+    "pin_session",
+    "release_session",
     "sync_conversation_history_to_session",
 ]
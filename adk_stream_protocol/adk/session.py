@@ -6,10 +6,24 @@ conversation history synchronization, and other ADK-related operations.
 These functions are used by both ADK SSE and ADK BIDI modes.
 """
 
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
 from loguru import logger
+from pydantic import BaseModel
+
+from adk_stream_protocol.ags import Error, Ok, Result
+
+
+# Eviction callback: (session_id, session) -> None, called after the session left the store
+EvictionCallback = Callable[[str, Any], None]
 
 
 class SessionStore:
@@ -20,30 +34,94 @@ class SessionStore:
     previously module-level globals. This improves testability and
     makes state management more explicit.
 
+    Eviction (bounded memory):
+        Sessions are kept in least-recently-used order. With max_sessions set,
+        the least recently used sessions are evicted when the store is full;
+        with idle_ttl_seconds set, sessions not accessed for that long are
+        evicted on the next store access. Pinned sessions (an open /live
+        connection) are never evicted automatically.
+
+        On eviction, sessions of an InMemorySessionService are deleted from
+        ADK as well, then on_evict runs (e.g., to release the session's
+        FrontendToolDelegate and ApprovalEngine). Sessions of persistent
+        services (SQLite) keep their synced message count, so reloading them
+        does not append the history a second time.
+
     Thread-safety: This implementation is NOT thread-safe. It assumes
     single-threaded async operation within one event loop.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty session store."""
-        # Session storage (shared across all ADK modes)
-        self._sessions: dict[str, Any] = {}
+    def __init__(
+        self,
+        max_sessions: int | None = None,
+        idle_ttl_seconds: float | None = None,
+        on_evict: EvictionCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize empty session store.
+
+        Args:
+            max_sessions: Maximum number of unpinned sessions (None = unbounded)
+            idle_ttl_seconds: Evict sessions idle for this long (None = never)
+            on_evict: Called with (session_id, session) for every evicted session
+            clock: Time source for idle tracking (monotonic seconds)
+        """
+        self.max_sessions = max_sessions
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.on_evict = on_evict
+        self._clock = clock
+        # Session storage (shared across all ADK modes), least recently used first
+        self._sessions: OrderedDict[str, Any] = OrderedDict()
+        # Last access time per session (same order as _sessions)
+        self._last_access: dict[str, float] = {}
+        # ADK session service each session belongs to (decides ADK-side cleanup)
+        self._services: dict[str, Any] = {}
+        # Sessions with an open connection (excluded from automatic eviction)
+        self._pinned: set[str] = set()
         # Synced message count tracking (persists across HTTP requests)
         # Key: session_id, Value: number of messages synced
         # NOTE: session.state dict does NOT persist across HTTP requests in ADK,
         # so we maintain this separately to prevent duplicate history syncing
         self._synced_message_counts: dict[str, int] = {}
+        # Content fingerprint of each synced message, in message order
+        # (detects edited / regenerated history without re-syncing everything)
+        self._synced_fingerprints: dict[str, list[str]] = {}
+        # Delta-history protocol: number of frontend messages the session already
+        # reflects (see advance_history_cursor)
+        self._history_cursors: dict[str, int] = {}
+        self.evicted_count = 0
 
-    def get_session(self, session_id: str) -> Any | None:
-        """Get session by ID, or None if not found."""
-        return self._sessions.get(session_id)
+    def __len__(self) -> int:
+        return len(self._sessions)
 
-    def set_session(self, session_id: str, session: Any) -> None:
-        """Store session by ID."""
+    def get_session(self, session_id: str) -> Any | None:
+        """Get session by ID (marks it as recently used), or None if not found."""
+        self.evict_expired()
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._touch(session_id)
+        return session
+
+    def set_session(self, session_id: str, session: Any, session_service: Any = None) -> None:
+        """
+        Store session by ID, evicting idle / least recently used sessions if needed.
+
+        Args:
+            session_id: Session ID
+            session: ADK Session
+            session_service: ADK session service that owns the session (optional)
+        """
         self._sessions[session_id] = session
+        if session_service is not None:
+            self._services[session_id] = session_service
+        self._touch(session_id)
+        self.evict_expired()
+        self._evict_over_capacity()
 
     def has_session(self, session_id: str) -> bool:
         """Check if session exists."""
+        self.evict_expired()
         return session_id in self._sessions
 
     def get_synced_count(self, session_id: str) -> int:
@@ -54,12 +132,129 @@ class SessionStore:
         """Set synced message count for a session."""
         self._synced_message_counts[session_id] = count
 
+    def get_synced_fingerprints(self, session_id: str) -> list[str]:
+        """Get content fingerprints of the synced messages of a session (message order)."""
+        return self._synced_fingerprints.get(session_id, [])
+
+    def set_synced_fingerprints(self, session_id: str, fingerprints: list[str]) -> None:
+        """Record the synced messages of a session by fingerprint (also sets the synced count)."""
+        self._synced_fingerprints[session_id] = fingerprints
+        self._synced_message_counts[session_id] = len(fingerprints)
+
+    def get_history_cursor(self, session_id: str) -> int | None:
+        """Get the delta-history cursor of a session (None = client must send full history)."""
+        return self._history_cursors.get(session_id)
+
+    def set_history_cursor(self, session_id: str, cursor: int) -> None:
+        """Set the delta-history cursor of a session."""
+        self._history_cursors[session_id] = cursor
+
+    def pin(self, session_id: str) -> None:
+        """Exclude a session from automatic eviction (e.g., while its /live socket is open)."""
+        self._pinned.add(session_id)
+
+    def unpin(self, session_id: str) -> None:
+        """Make a pinned session evictable again (marks it as recently used)."""
+        self._pinned.discard(session_id)
+        if session_id in self._sessions:
+            self._touch(session_id)
+
+    def evict(self, session_id: str) -> bool:
+        """
+        Remove a session now (pinned or not) and run eviction cleanup.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            True if the session was in the store
+        """
+        session = self._sessions.pop(session_id, None)
+        self._last_access.pop(session_id, None)
+        self._pinned.discard(session_id)
+        service = self._services.pop(session_id, None)
+        if session is None:
+            return False
+
+        self.evicted_count += 1
+        if isinstance(service, InMemorySessionService) or service is None:
+            self._synced_message_counts.pop(session_id, None)
+            self._synced_fingerprints.pop(session_id, None)
+            self._history_cursors.pop(session_id, None)
+        if isinstance(service, InMemorySessionService):
+            _schedule_adk_delete(service, session)
+        logger.info(f"[SessionStore] Evicted session {session_id} ({len(self._sessions)} left)")
+        if self.on_evict is not None:
+            self.on_evict(session_id, session)
+        return True
+
+    def evict_expired(self) -> int:
+        """
+        Evict unpinned sessions idle for longer than idle_ttl_seconds.
+
+        Returns:
+            Number of evicted sessions
+        """
+        if self.idle_ttl_seconds is None:
+            return 0
+        deadline = self._clock() - self.idle_ttl_seconds
+        expired: list[str] = []
+        # Oldest first: stop at the first unpinned session that is still fresh
+        for session_id in self._sessions:
+            if session_id in self._pinned:
+                continue
+            if self._last_access[session_id] > deadline:
+                break
+            expired.append(session_id)
+        for session_id in expired:
+            self.evict(session_id)
+        return len(expired)
+
     def clear_all(self) -> None:
         """Clear all sessions and synced message counts."""
         self._sessions.clear()
+        self._last_access.clear()
+        self._services.clear()
+        self._pinned.clear()
         self._synced_message_counts.clear()
+        self._synced_fingerprints.clear()
+        self._history_cursors.clear()
         logger.info("Cleared all ADK sessions and synced message counts")
 
+    def _touch(self, session_id: str) -> None:
+        self._sessions.move_to_end(session_id)
+        self._last_access[session_id] = self._clock()
+
+    def _evict_over_capacity(self) -> None:
+        if self.max_sessions is None:
+            return
+        pinned = len(self._pinned & self._sessions.keys())
+        excess = len(self._sessions) - pinned - self.max_sessions
+        if excess <= 0:
+            return
+        victims = [sid for sid in self._sessions if sid not in self._pinned][:excess]
+        for session_id in victims:
+            self.evict(session_id)
+
+
+# Strong references to in-flight ADK deletes (tasks are otherwise only weakly referenced)
+_pending_deletes: set[asyncio.Task[None]] = set()
+
+
+def _schedule_adk_delete(service: InMemorySessionService, session: Any) -> None:
+    """Delete an evicted session from ADK's in-memory service (fire-and-forget)."""
+    try:  # nosemgrep: forbid-try-except - eviction may run outside an event loop (tests, shutdown)
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(
+        service.delete_session(
+            app_name=session.app_name, user_id=session.user_id, session_id=session.id
+        )
+    )
+    _pending_deletes.add(task)
+    task.add_done_callback(_pending_deletes.discard)
+
 
 # Module-level singleton instance for backward compatibility
 _session_store = SessionStore()
@@ -151,10 +346,70 @@ async def get_or_create_session(
         + (f", connection: {connection_signature}" if connection_signature else "")
     )
     session = await _create_adk_session(agent_runner, app_name, user_id, session_id)
-    _session_store.set_session(session_id, session)
+    _session_store.set_session(session_id, session, agent_runner.session_service)
     return session
 
 
+def configure_session_eviction(
+    max_sessions: int | None = None,
+    idle_ttl_seconds: float | None = None,
+    on_evict: EvictionCallback | None = None,
+) -> None:
+    """
+    Bound the shared session store (see SessionStore for the eviction rules).
+
+    Args:
+        max_sessions: Maximum number of unpinned sessions (None = unbounded)
+        idle_ttl_seconds: Evict sessions idle for this long (None = never)
+        on_evict: Called with (session_id, session) for every evicted session
+    """
+    _session_store.max_sessions = max_sessions
+    _session_store.idle_ttl_seconds = idle_ttl_seconds
+    _session_store.on_evict = on_evict
+
+
+def pin_session(session_id: str) -> None:
+    """Keep a session out of automatic eviction while its connection is open."""
+    _session_store.pin(session_id)
+
+
+def release_session(session_id: str) -> None:
+    """
+    Connection-scoped session is over (e.g., /live socket closed): evict it now.
+
+    Runs the eviction cleanup (ADK in-memory session, on_evict callback).
+    """
+    _session_store.evict(session_id)
+
+
+def _message_fingerprint(message: Any) -> str:
+    """Content fingerprint of a frontend message (pydantic model or plain JSON data)."""
+    if isinstance(message, BaseModel):
+        payload = message.model_dump_json(exclude_none=True)
+    else:
+        payload = json.dumps(message, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+async def _reset_session_events(session_service: Any, session: Any) -> None:
+    """
+    Recreate a session without events, keeping its ids and stored state.
+
+    ADK session services cannot delete events, so an edited history is replayed
+    into a fresh copy of the session instead of being appended after the stale
+    events. The caller's session object is updated in place (its local state,
+    e.g. the ApprovalEngine, is kept).
+    """
+    ids = {"app_name": session.app_name, "user_id": session.user_id, "session_id": session.id}
+    stored = await session_service.get_session(**ids)
+    await session_service.delete_session(**ids)
+    fresh = await session_service.create_session(
+        state=stored.state if stored is not None else None, **ids
+    )
+    session.events.clear()
+    session.last_update_time = fresh.last_update_time
+
+
 async def sync_conversation_history_to_session(
     session: Any,
     session_service: Any,
@@ -168,10 +423,10 @@ async def sync_conversation_history_to_session(
     history when switching from other modes (e.g., Gemini Direct -> ADK SSE/BIDI).
 
     The function:
-    1. Checks existing session events to avoid duplicates
-    2. Tracks synced messages using session state
-    3. Only syncs new messages that haven't been added yet
-    4. Creates proper ADK Events for historical messages
+    1. Fingerprints the history and compares it with the synced fingerprints
+    2. Finds the first edited / regenerated message within the synced prefix
+    3. If a synced message changed, recreates the session without events and
+       syncs the whole history again; otherwise only syncs the new messages
 
     Args:
         session: ADK session object
@@ -186,56 +441,110 @@ async def sync_conversation_history_to_session(
         - Messages list includes both user and assistant messages
         - The last message in the list is typically the new message
         - This function syncs all except the last message
+        - ADK events cannot be removed, so after an edit the session is recreated
+          (events produced by earlier runs are dropped with the stale history)
+        - Synced counts without fingerprints (set_synced_count) are trusted as-is
+        - Messages are appended one append_event() at a time: ADK has no public
+          batch append, so with SqliteSessionService each one is its own commit
     """
     # Frontend sends all messages including the new one
     # We need to sync all except the last message (which will be sent as new_message)
     messages_to_sync = messages[:-1] if len(messages) > 1 else []
+    fingerprints = [_message_fingerprint(msg) for msg in messages_to_sync]
 
-    # Edge case: Check if we need to sync (avoid duplicates)
-    # We track synced message count in persistent dict (not session.state, which resets)
+    # We track synced messages in the persistent store (not session.state, which resets)
     synced_count = _session_store.get_synced_count(session.id)
+    synced_fingerprints = _session_store.get_synced_fingerprints(session.id)
+
+    # Verify the fingerprinted part of the synced prefix; rebuild on the first change
+    sync_from = min(synced_count, len(messages_to_sync))
+    for index, (synced, current) in enumerate(
+        zip(synced_fingerprints[:sync_from], fingerprints, strict=False)
+    ):
+        if synced != current:
+            logger.warning(
+                f"[{current_mode}] History changed at message {index} "
+                f"(edited or regenerated), rebuilding session {session.id}"
+            )
+            await _reset_session_events(session_service, session)
+            sync_from = 0
+            break
+
+    new_messages_to_sync = messages_to_sync[sync_from:]
+    if not new_messages_to_sync:
+        return 0
 
-    # Calculate how many new messages need syncing
-    new_messages_to_sync = (
-        messages_to_sync[synced_count:] if synced_count < len(messages_to_sync) else []
+    logger.info(
+        f"[{current_mode}] Syncing {len(new_messages_to_sync)} new messages "
+        f"(already synced: {sync_from})"
     )
 
-    # If there are new messages to sync
-    if new_messages_to_sync:
-        logger.info(
-            f"[{current_mode}] Syncing {len(new_messages_to_sync)} new messages "
-            f"(already synced: {synced_count})"
+    for event_index, msg in enumerate(new_messages_to_sync, start=sync_from):
+        msg_content = msg.to_adk_content()
+        # Create unique invocation ID based on absolute position
+        event = Event(
+            invocation_id=f"sync_{event_index}_{msg_content.role}",
+            author=msg_content.role,
+            content=msg_content,
         )
 
-        # Add only the new messages as events
-        for i, msg in enumerate(new_messages_to_sync):
-            msg_content = msg.to_adk_content()
+        # Append to session via session service
+        await session_service.append_event(session=session, event=event)
 
-            # Create unique invocation ID based on absolute position
-            event_index = synced_count + i
+        logger.info(f"[{current_mode}] Synced message {event_index}: role={msg_content.role}")
 
-            # Create event for this historical message
-            event = Event(
-                invocation_id=f"sync_{event_index}_{msg_content.role}",
-                author=msg_content.role,
-                content=msg_content,
-            )
+    # Update the synced state in the persistent store (persists across HTTP requests)
+    _session_store.set_synced_fingerprints(session.id, fingerprints)
+    logger.info(
+        f"[{current_mode}] Synced messages {sync_from}-{len(messages_to_sync) - 1} "
+        f"for session {session.id}"
+    )
+    return len(new_messages_to_sync)
 
-            # Append to session via session service
-            await session_service.append_event(session=session, event=event)
 
-            logger.info(f"[{current_mode}] Synced message {event_index}: role={msg_content.role}")
+def advance_history_cursor(
+    session_id: str, messages: list, history_cursor: int | None = None
+) -> Result[int, int | None]:
+    """
+    Accept a request's messages under the delta-history protocol.
 
-        # Update the synced count in persistent dict (persists across HTTP requests)
-        _session_store.set_synced_count(session.id, len(messages_to_sync))
-        logger.info(
-            f"[{current_mode}] Updated synced_message_count to {len(messages_to_sync)} "
-            f"for session {session.id}"
-        )
+    Delta-history protocol (opt-in, /stream and BIDI message events):
+        Instead of the full conversation every turn, the client sends
+        historyCursor (number of messages before the ones it sends) plus only
+        the trailing messages; the ADK session is the source of truth for the
+        rest. The cursor is the frontend message count once the turn is done,
+        so the client's next cursor is normally "all but my last message".
+
+        A cursor is accepted when it equals the session's cursor, or is one
+        less (the last message is re-sent because it changed, e.g., a tool
+        approval was added to the assistant message). Anything else (edit,
+        regeneration, lost server state) is a mismatch: the client must resync
+        by re-sending its full history (history_cursor=None).
 
-        return len(new_messages_to_sync)
+    Args:
+        session_id: ADK session ID
+        messages: Messages of the request (full history, or the tail after the cursor)
+        history_cursor: Client cursor (None = messages is the full history)
+
+    Returns:
+        Ok(new cursor), or Error(expected cursor) on mismatch (None = unknown,
+        full history required)
+    """
+    expected = _session_store.get_history_cursor(session_id)
+    if history_cursor is not None and (
+        expected is None or history_cursor not in (expected - 1, expected)
+    ):
+        logger.warning(
+            f"[Session] History cursor mismatch for {session_id}: "
+            f"got {history_cursor}, expected {expected}"
+        )
+        return Error(expected)
 
-    return 0
+    cursor = (history_cursor or 0) + len(messages)
+    if messages and messages[-1].role == "user":
+        cursor += 1  # The response becomes a new assistant message
+    _session_store.set_history_cursor(session_id, cursor)
+    return Ok(cursor)
 
 
 def clear_sessions() -> None:
@@ -11,7 +11,17 @@ For adk web debugging:
 """
 
 # Internal utilities (Result types, Frontend tool registry)
-from ._internal import Error, Ok, Result, get_delegate, register_delegate
+from ._internal import (
+    DelegateRegistryStats,
+    Error,
+    Ok,
+    Result,
+    configure_delegate_registry,
+    delegate_registry_stats,
+    get_delegate,
+    register_delegate,
+    unregister_delegate,
+)
 from .runner import (
     BIDI_CONFIRMATION_TOOLS,
     BIDI_MODEL,
@@ -42,6 +52,7 @@ __all__ = [
     "BIDI_MODEL",
     "SSE_CONFIRMATION_TOOLS",
     "SSE_MODEL",
+    "DelegateRegistryStats",
     "Error",
     "Ok",
     "Result",
@@ -49,6 +60,8 @@ __all__ = [
     "bidi_agent_runner",
     "bidi_app",
     "change_bgm",
+    "configure_delegate_registry",
+    "delegate_registry_stats",
     "execute_get_location",
     "execute_process_payment",
     "get_delegate",
@@ -60,4 +73,5 @@ __all__ = [
     "sse_agent",
     "sse_agent_runner",
     "sse_app",
+    "unregister_delegate",
 ]
@@ -18,21 +18,38 @@ except ImportError:
 
 # ========== Frontend Tool Registry ==========
 try:
-    from .registry import _REGISTRY, get_delegate, register_delegate
+    from .registry import (
+        _REGISTRY,
+        DelegateRegistryStats,
+        configure_delegate_registry,
+        delegate_registry_stats,
+        get_delegate,
+        register_delegate,
+        unregister_delegate,
+    )
 except ImportError:
     from registry import (  # type: ignore[import-not-found, no-redef]
         _REGISTRY,
+        DelegateRegistryStats,
+        configure_delegate_registry,
+        delegate_registry_stats,
         get_delegate,
         register_delegate,
+        unregister_delegate,
     )
 
 __all__ = [
     "_REGISTRY",
+    # Registry gauges
+    "DelegateRegistryStats",
     "Error",
     # Result types
     "Ok",
     "Result",
     # Registry functions
+    "configure_delegate_registry",
+    "delegate_registry_stats",
     "get_delegate",
     "register_delegate",
+    "unregister_delegate",
 ]
@@ -15,11 +15,23 @@ Pattern:
     4. Session.id persists across invocation_id continuations (multi-turn)
 
 Lifecycle:
-    - Register: When HTTP request starts (/stream endpoint)
+    - Register: When HTTP request starts (/stream endpoint) or /live connects
     - Lookup: When tool executes (get_location, change_bgm)
-    - Cleanup: After session ends or timeout (not yet implemented)
+    - Cleanup: unregister_delegate() when the session is evicted from the SessionStore
+      (idle SSE session, closed /live socket)
+
+Entry Lifetime:
+    Entries are weak references plus a strong "lease" that is renewed on every
+    register/lookup. With an idle TTL configured (configure_delegate_registry),
+    leases older than the TTL are dropped on the next registry access; the entry
+    then lives only as long as something else holds the delegate (e.g., an open
+    /live connection). Leases of delegates with pending calls are never dropped.
 """
 
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -30,8 +42,103 @@ if TYPE_CHECKING:
     from adk_stream_protocol.tools.frontend_tool_service import FrontendToolDelegate
 
 
+@dataclass
+class DelegateRegistryStats:
+    """
+    Size gauges of the delegate registry.
+
+    Attributes:
+        delegates: Registered delegates still alive
+        leased: Delegates kept alive by the registry itself
+        pending_calls: Frontend tool calls awaiting a result (all delegates)
+        pre_resolved_results: Cached SSE Pattern A results (all delegates)
+    """
+
+    delegates: int = 0
+    leased: int = 0
+    pending_calls: int = 0
+    pre_resolved_results: int = 0
+
+
+class _DelegateRegistry:
+    """session_id → FrontendToolDelegate, weak entries with idle-TTL leases."""
+
+    def __init__(self) -> None:
+        self.idle_ttl_seconds: float | None = None
+        self._entries: weakref.WeakValueDictionary[str, FrontendToolDelegate] = (
+            weakref.WeakValueDictionary()
+        )
+        # Strong references, least recently used first: session_id → (delegate, last access)
+        self._leases: OrderedDict[str, tuple[FrontendToolDelegate, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def register(self, session_id: str, delegate: FrontendToolDelegate) -> None:
+        self._expire_leases()
+        self._entries[session_id] = delegate
+        self._lease(session_id, delegate)
+
+    def get(self, session_id: str) -> FrontendToolDelegate | None:
+        self._expire_leases()
+        delegate = self._entries.get(session_id)
+        if delegate is not None:
+            self._lease(session_id, delegate)
+        return delegate
+
+    def pop(
+        self, session_id: str, default: FrontendToolDelegate | None = None
+    ) -> FrontendToolDelegate | None:
+        self._leases.pop(session_id, None)
+        return self._entries.pop(session_id, default)
+
+    def clear(self) -> None:
+        self._leases.clear()
+        self._entries.clear()
+
+    def stats(self) -> DelegateRegistryStats:
+        self._expire_leases()
+        stats = DelegateRegistryStats(leased=len(self._leases))
+        for delegate in list(self._entries.values()):
+            stats.delegates += 1
+            stats.pending_calls += delegate.pending_call_count
+            stats.pre_resolved_results += delegate.pre_resolved_count
+        return stats
+
+    def _lease(self, session_id: str, delegate: FrontendToolDelegate) -> None:
+        self._leases[session_id] = (delegate, time.monotonic())
+        self._leases.move_to_end(session_id)
+
+    def _expire_leases(self) -> None:
+        if self.idle_ttl_seconds is None:
+            return
+        deadline = time.monotonic() - self.idle_ttl_seconds
+        while self._leases:
+            session_id, (delegate, last_access) = next(iter(self._leases.items()))
+            if last_access > deadline:
+                return
+            if delegate.pending_call_count:
+                self._lease(session_id, delegate)  # In use: renew instead of dropping
+                continue
+            del self._leases[session_id]
+            logger.debug(f"[FrontendToolRegistry] Lease expired for session_id: {session_id}")
+
+
 # Global registry: session_id → FrontendToolDelegate
-_REGISTRY: dict[str, FrontendToolDelegate] = {}
+_REGISTRY = _DelegateRegistry()
+
+
+def configure_delegate_registry(idle_ttl_seconds: float | None = None) -> None:
+    """
+    Set the idle TTL of registry leases (None = leases never expire).
+
+    Args:
+        idle_ttl_seconds: Drop the registry's own reference after this much idle time
+    """
+    _REGISTRY.idle_ttl_seconds = idle_ttl_seconds
 
 
 def register_delegate(session_id: str, delegate: FrontendToolDelegate) -> None:
@@ -42,7 +149,7 @@ def register_delegate(session_id: str, delegate: FrontendToolDelegate) -> None:
         session_id: ADK session ID (from session.id)
         delegate: FrontendToolDelegate instance for this session
     """
-    _REGISTRY[session_id] = delegate
+    _REGISTRY.register(session_id, delegate)
     logger.info(f"[FrontendToolRegistry] Registered delegate for session_id: {session_id}")
 
 
@@ -62,3 +169,24 @@ def get_delegate(session_id: str) -> FrontendToolDelegate | None:
     else:
         logger.warning(f"[FrontendToolRegistry] No delegate found for session_id: {session_id}")
     return delegate
+
+
+def unregister_delegate(session_id: str) -> FrontendToolDelegate | None:
+    """
+    Remove the FrontendToolDelegate of a session (session ended or evicted).
+
+    Args:
+        session_id: ADK session ID
+
+    Returns:
+        The removed delegate, or None if none was registered
+    """
+    delegate = _REGISTRY.pop(session_id, None)
+    if delegate:
+        logger.info(f"[FrontendToolRegistry] Unregistered delegate for session_id: {session_id}")
+    return delegate
+
+
+def delegate_registry_stats() -> DelegateRegistryStats:
+    """Size gauges of the delegate registry (for /health and metrics)."""
+    return _REGISTRY.stats()
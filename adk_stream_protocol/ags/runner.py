@@ -99,7 +99,7 @@ SSE_TOOLS = [
 #
 # IMPORTANT: Cannot use FunctionTool(..., require_confirmation=True) in BIDI mode
 # because Live API doesn't support automatic tool response handling.
-# Use BLOCKING behavior to await approval_queue inside tool function.
+# Use BLOCKING behavior to await the session's ApprovalEngine inside tool function.
 
 
 # Sync wrappers for FunctionDeclaration creation (from_callable_with_api_option cannot handle ToolContext)
@@ -233,7 +233,8 @@ async def process_payment(
 
     Implementation by mode:
     - SSE: ADK handles confirmation automatically, this function executes after approval
-    - BIDI: Awaits approval via approval_queue, returns final result after approval/denial
+    - BIDI: Awaits approval via the session's ApprovalEngine, returns final result
+           after approval/denial
            (Uses types.Behavior.BLOCKING to allow awaiting without blocking event loop)
 
     Args:
@@ -262,34 +263,31 @@ async def process_payment(
 
         tool_call_id = tool_context.function_call_id
 
-        # Get approval_queue from session state
-        approval_queue = tool_context.session.state.get("approval_queue")
+        # Get the approval engine from session state
+        approvals = tool_context.session.state.get("approval_engine")
 
-        if not approval_queue:
-            logger.error("[process_payment] No approval_queue in session state!")
+        if not approvals:
+            logger.error("[process_payment] No approval_engine in session state!")
             return {
                 "success": False,
-                "error": "approval_queue not configured",
+                "error": "approval_engine not configured",
                 "transaction_id": None,
             }
 
-        # Register this tool call for approval
-        approval_queue.request_approval(
-            tool_call_id,
-            "process_payment",
-            {
-                "amount": amount,
-                "recipient": recipient,
-                "currency": currency,
-                "description": description,
-            },
-        )
-        logger.info(f"[process_payment] Registered approval request for {tool_call_id}")
-
         # Await approval (BLOCKING behavior allows this without blocking event loop)
         try:
             logger.info("[process_payment] ⏳ Awaiting approval...")
-            approval_result = await approval_queue.wait_for_approval(tool_call_id, timeout=30.0)
+            approval_result = await approvals.wait(
+                tool_call_id,
+                "process_payment",
+                {
+                    "amount": amount,
+                    "recipient": recipient,
+                    "currency": currency,
+                    "description": description,
+                },
+                timeout=30.0,
+            )
             logger.info(f"[process_payment] ✓ Approval received: {approval_result}")
 
             if approval_result.get("approved"):
@@ -325,8 +323,8 @@ async def change_bgm(track: int, tool_context: ToolContext | None = None) -> dic
     - BIDI mode: Frontend delegation (via FrontendToolDelegate)
 
     Mode Detection:
-    - BIDI mode: confirmation_delegate exists in session.state
-    - SSE mode: No confirmation_delegate
+    - BIDI mode: session.state["mode"] == "bidi"
+    - SSE mode: Any other mode
 
     Args:
         track: Track number (1 or 2) - matches frontend "BGM 1" and "BGM 2" labels
@@ -339,9 +337,8 @@ async def change_bgm(track: int, tool_context: ToolContext | None = None) -> dic
     logger.info(f"[change_bgm] track={track}, tool_context={tool_context}")
 
     if tool_context:
-        # Detect BIDI mode by checking for confirmation_delegate
-        confirmation_delegate = tool_context.session.state.get("confirmation_delegate")
-        if confirmation_delegate:
+        # Detect BIDI mode (set by live_chat)
+        if tool_context.session.state.get("mode") == "bidi":
             # BIDI mode - delegate execution to frontend
             logger.info("[change_bgm] BIDI mode detected - delegating to frontend")
             delegate = get_delegate(tool_context.session.id)
@@ -355,6 +352,7 @@ async def change_bgm(track: int, tool_context: ToolContext | None = None) -> dic
             result_or_error = await delegate.execute_on_frontend(
                 tool_name="change_bgm",
                 args={"track": track},
+                function_call_id=tool_context.function_call_id,
             )
             match result_or_error:
                 case Ok(result):
@@ -376,7 +374,9 @@ async def change_bgm(track: int, tool_context: ToolContext | None = None) -> dic
     }
 
 
-async def execute_get_location(session_id: str) -> dict[str, Any]:
+async def execute_get_location(
+    session_id: str, function_call_id: str | None = None
+) -> dict[str, Any]:
     """
     Execute location retrieval logic via frontend delegation (separated for reuse in BIDI mode).
 
@@ -387,6 +387,8 @@ async def execute_get_location(session_id: str) -> dict[str, Any]:
 
     Args:
         session_id: Session ID to get the frontend delegate
+        function_call_id: ADK function_call.id of this call (picks the right one when
+            several get_location calls are outstanding)
 
     Returns:
         User's location information from browser Geolocation API
@@ -406,6 +408,7 @@ async def execute_get_location(session_id: str) -> dict[str, Any]:
     result_or_error = await delegate.execute_on_frontend(
         tool_name="get_location",
         args={},
+        function_call_id=function_call_id,
     )
     match result_or_error:
         case Ok(result):
@@ -450,33 +453,27 @@ async def get_location(tool_context: ToolContext) -> dict[str, Any]:
 
         tool_call_id = tool_context.function_call_id
 
-        # Get approval_queue from session state
-        approval_queue = tool_context.session.state.get("approval_queue")
+        # Get the approval engine from session state
+        approvals = tool_context.session.state.get("approval_engine")
 
-        if not approval_queue:
-            logger.error("[get_location] No approval_queue in session state!")
+        if not approvals:
+            logger.error("[get_location] No approval_engine in session state!")
             return {
                 "success": False,
-                "error": "approval_queue not configured",
+                "error": "approval_engine not configured",
             }
 
-        # Register this tool call for approval
-        approval_queue.request_approval(
-            tool_call_id,
-            "get_location",
-            {},
-        )
-        logger.info(f"[get_location] Registered approval request for {tool_call_id}")
-
         # Await approval (BLOCKING behavior allows this without blocking event loop)
         try:
             logger.info("[get_location] ⏳ Awaiting approval...")
-            approval_result = await approval_queue.wait_for_approval(tool_call_id, timeout=30.0)
+            approval_result = await approvals.wait(tool_call_id, "get_location", {}, timeout=30.0)
             logger.info(f"[get_location] ✓ Approval received: {approval_result}")
 
             if approval_result.get("approved"):
                 logger.info("[get_location] ✅ APPROVED - executing frontend delegation")
-                return await execute_get_location(tool_context.session.id)
+                return await execute_get_location(
+                    tool_context.session.id, tool_context.function_call_id
+                )
             else:
                 logger.info("[get_location] ❌ DENIED - rejecting location access")
                 return {
@@ -494,4 +491,4 @@ async def get_location(tool_context: ToolContext) -> dict[str, Any]:
     # SSE mode: ADK handles confirmation automatically via require_confirmation=True
     # Execute frontend delegation directly (ADK has already handled approval)
     logger.info("[get_location] SSE mode - executing frontend delegation")
-    return await execute_get_location(tool_context.session.id)
+    return await execute_get_location(tool_context.session.id, tool_context.function_call_id)
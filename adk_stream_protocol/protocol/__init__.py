@@ -7,11 +7,21 @@ This subpackage handles format conversion between:
 
 Components:
 - StreamProtocolConverter: Converts ADK events to SSE format
+- SseFrame: Typed SSE frame (event dict + lazily-cached wire encoding)
+- CoalesceConfig: Optional text/reasoning delta coalescing windows
+- encode_pcm_frame / decode_pcm_frame: Binary PCM WebSocket frames (negotiated BIDI mode)
 - IDMapper: Bidirectional ID mapping (formerly ADKVercelIDMapper)
 - ChatMessage, TextPart, etc.: AI SDK v6 type definitions
+- ImageIngest: Request-scoped, decode-once image payloads (header-sniffed dimensions)
+- BlobStore: Content-addressed store of uploaded files ("adk-blob:" FilePart handles)
+- OffloadPool: Size-gated thread / process pool for CPU-heavy payload work
+- MessageEvent, parse_upstream_event, etc.: Typed upstream WebSocket events (BIDI mode)
 """
 
+from .blob_store import BLOB_URL_PREFIX, BlobRef, BlobStore, configure_blob_store, get_blob_store
+from .delta_coalescer import CoalesceConfig
 from .id_mapper import IDMapper
+from .image_ingest import DecodedImage, ImageInfo, ImageIngest, sniff_image_info
 from .message_types import (
     ChatMessage,
     FilePart,
@@ -24,30 +34,86 @@ from .message_types import (
     ToolCallState,
     ToolResultPart,
     ToolUsePart,
+    predecode_images,
     process_chat_message_for_bidi,
 )
+from .offload import (
+    OffloadConfig,
+    OffloadKind,
+    OffloadPool,
+    OffloadStats,
+    configure_offload_pool,
+    get_offload_pool,
+    offload_pool_stats,
+)
+from .pcm_frame import PCM_BINARY_SUBPROTOCOL, decode_pcm_frame, encode_pcm_frame
+from .sse_frame import SseFrame
 from .stream_protocol import (
     StreamProtocolConverter,
     format_sse_event,
     stream_adk_to_ai_sdk,
 )
+from .upstream_events import (
+    AudioChunkEvent,
+    AudioControlEvent,
+    InterruptEvent,
+    MessageEvent,
+    PingEvent,
+    ToolResultEvent,
+    UnknownEvent,
+    UpstreamEvent,
+    parse_upstream_event,
+    to_upstream_event,
+)
 
 
 __all__ = [
+    "BLOB_URL_PREFIX",
+    "PCM_BINARY_SUBPROTOCOL",
+    "AudioChunkEvent",
+    "AudioControlEvent",
+    "BlobRef",
+    "BlobStore",
     "ChatMessage",
+    "CoalesceConfig",
+    "DecodedImage",
     "FilePart",
     "GenericPart",
     "IDMapper",
+    "ImageInfo",
+    "ImageIngest",
     "ImagePart",
+    "InterruptEvent",
+    "MessageEvent",
     "MessagePart",
+    "OffloadConfig",
+    "OffloadKind",
+    "OffloadPool",
+    "OffloadStats",
+    "PingEvent",
+    "SseFrame",
     "StepPart",
     "StreamProtocolConverter",
     "TextPart",
     "ToolApproval",
     "ToolCallState",
+    "ToolResultEvent",
     "ToolResultPart",
     "ToolUsePart",
+    "UnknownEvent",
+    "UpstreamEvent",
+    "configure_blob_store",
+    "configure_offload_pool",
+    "decode_pcm_frame",
+    "encode_pcm_frame",
     "format_sse_event",
+    "get_blob_store",
+    "get_offload_pool",
+    "offload_pool_stats",
+    "parse_upstream_event",
+    "predecode_images",
     "process_chat_message_for_bidi",
+    "sniff_image_info",
     "stream_adk_to_ai_sdk",
+    "to_upstream_event",
 ]
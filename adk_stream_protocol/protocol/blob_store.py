@@ -0,0 +1,202 @@
+"""
+Content-Addressed Blob Store for uploaded files (images).
+
+Without it, an image enters as a base64 data URL inside a message and is resent
+with every later turn (the whole history is in each request). With it, the
+client uploads the file once (POST /upload streams the body here) and the
+FilePart carries only the returned handle:
+
+    {"type": "file", "filename": "photo.jpg", "mediaType": "image/jpeg",
+     "url": "adk-blob:<sha256 hex>"}
+
+ChatMessage.to_adk_content() resolves the handle to bytes only when the part
+is converted (ImageIngest.load_url), so parsing and fingerprinting a long
+history never touches the file.
+
+Layout:
+    <root>/<hex[:2]>/<hex>   content, named by its SHA-256 (identical uploads dedupe)
+    <root>/tmp/              uploads in progress (renamed into place when complete)
+
+Memory mapping (optional): reads go through a small LRU of mmap'd files, so
+repeated loads of a hot image are served from the page cache without a file
+read per request. types.Blob needs bytes, so conversion still copies once.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from adk_stream_protocol.ags import Error, Ok, Result
+
+
+# FilePart.url scheme for stored blobs (data URLs keep working as before)
+BLOB_URL_PREFIX = "adk-blob:"
+
+_DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    """A stored blob: the handle to put in FilePart.url, plus its size."""
+
+    url: str
+    size: int
+
+
+def blob_digest(url: str) -> str | None:
+    """
+    Extract the SHA-256 hex digest from an "adk-blob:" handle.
+
+    Returns:
+        Digest, or None if url is not a well-formed blob handle
+    """
+    if not url.startswith(BLOB_URL_PREFIX):
+        return None
+    digest = url[len(BLOB_URL_PREFIX) :]
+    return digest if _DIGEST_PATTERN.fullmatch(digest) else None
+
+
+class BlobStore:
+    """On-disk store of uploaded files, addressed by SHA-256 of their content."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_bytes: int = 20 * 1024 * 1024,
+        memory_map: bool = False,
+        max_mapped_files: int = 32,
+    ) -> None:
+        """
+        Initialize blob store (creates the directories).
+
+        Args:
+            root: Store directory
+            max_bytes: Largest accepted upload
+            memory_map: Serve reads from an LRU of mmap'd files
+            max_mapped_files: mmap LRU size (memory_map only)
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.memory_map = memory_map
+        self._max_mapped_files = max_mapped_files
+        self._mapped: OrderedDict[str, mmap.mmap] = OrderedDict()
+        self._tmp_dir = self.root / "tmp"
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, digest: str) -> Path:
+        """Location of the blob with this digest."""
+        return self.root / digest[:2] / digest
+
+    async def put_stream(self, chunks: AsyncIterable[bytes]) -> Result[BlobRef, str]:
+        """
+        Stream an upload into the store, hashing as it is written.
+
+        Args:
+            chunks: Body chunks (e.g., Starlette Request.stream())
+
+        Returns:
+            Ok(BlobRef) with the "adk-blob:" handle, or Error(reason) if the
+            upload exceeds max_bytes (nothing is kept)
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=self._tmp_dir)
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, "wb") as tmp_file:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > self.max_bytes:
+                    break
+                hasher.update(chunk)
+                tmp_file.write(chunk)
+        if size > self.max_bytes:
+            tmp_path.unlink(missing_ok=True)
+            return Error(f"Upload exceeds {self.max_bytes} bytes")
+        return Ok(self._commit(tmp_path, hasher.hexdigest(), size))
+
+    def put_bytes(self, data: bytes) -> Result[BlobRef, str]:
+        """Store an in-memory payload (same result as put_stream)."""
+        if len(data) > self.max_bytes:
+            return Error(f"Upload exceeds {self.max_bytes} bytes")
+        fd, tmp_name = tempfile.mkstemp(dir=self._tmp_dir)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        return Ok(self._commit(Path(tmp_name), hashlib.sha256(data).hexdigest(), len(data)))
+
+    def read(self, url: str) -> Result[bytes, str]:
+        """
+        Load the content of a blob handle.
+
+        Args:
+            url: "adk-blob:<sha256 hex>" handle (FilePart.url)
+
+        Returns:
+            Ok(bytes), or Error(reason) for a malformed or unknown handle
+        """
+        digest = blob_digest(url)
+        if digest is None:
+            return Error(f"Not a blob handle: {url[:80]}")
+        path = self.path_for(digest)
+        if not path.is_file():
+            return Error(f"Unknown blob: {digest}")
+        if not self.memory_map or path.stat().st_size == 0:  # Empty files cannot be mapped
+            return Ok(path.read_bytes())
+        return Ok(self._mapped_file(digest, path)[:])
+
+    def close(self) -> None:
+        """Unmap all memory-mapped files."""
+        for mapped in self._mapped.values():
+            mapped.close()
+        self._mapped.clear()
+
+    def _commit(self, tmp_path: Path, digest: str, size: int) -> BlobRef:
+        final_path = self.path_for(digest)
+        if final_path.exists():
+            tmp_path.unlink(missing_ok=True)  # Same content already stored
+        else:
+            final_path.parent.mkdir(exist_ok=True)
+            tmp_path.replace(final_path)
+            logger.info(f"[BlobStore] Stored {digest} ({size} bytes)")
+        return BlobRef(url=f"{BLOB_URL_PREFIX}{digest}", size=size)
+
+    def _mapped_file(self, digest: str, path: Path) -> mmap.mmap:
+        mapped = self._mapped.get(digest)
+        if mapped is None:
+            with path.open("rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped[digest] = mapped
+            while len(self._mapped) > self._max_mapped_files:
+                _, oldest = self._mapped.popitem(last=False)
+                oldest.close()
+        self._mapped.move_to_end(digest)
+        return mapped
+
+
+# Process-wide store used to resolve "adk-blob:" handles (None = uploads disabled)
+_BLOB_STORE: BlobStore | None = None
+
+
+def configure_blob_store(store: BlobStore | None) -> None:
+    """
+    Set the store that resolves "adk-blob:" handles (None disables them).
+
+    Args:
+        store: BlobStore instance, or None
+    """
+    global _BLOB_STORE
+    if _BLOB_STORE is not None and _BLOB_STORE is not store:
+        _BLOB_STORE.close()
+    _BLOB_STORE = store
+
+
+def get_blob_store() -> BlobStore | None:
+    """The configured blob store, or None if uploads are disabled."""
+    return _BLOB_STORE
@@ -0,0 +1,266 @@
+"""
+Delta Coalescing Stage for AI SDK v6 Data Stream Protocol.
+
+Transcription handlers and partial text streaming emit one text-delta per tiny
+fragment, which becomes one WebSocket message / SSE chunk each. This optional
+stage merges consecutive text-delta / reasoning-delta frames for the same block
+id into a single frame.
+
+Flush Rules:
+    - Any other event type (text-end, tool-*, finish, [DONE], ...) flushes the
+      buffered delta first, then passes through unchanged, so ordering is preserved.
+    - A delta for a different block id or delta type flushes the buffer.
+    - Byte window: the buffer is flushed once it holds max_bytes of UTF-8 text.
+    - Time window: the buffer is flushed window_ms after its first delta, even
+      if the upstream stream is idle (a pending-read timer, not only on arrival).
+    - End of stream flushes the buffer.
+
+Merged frames are equivalent to concatenating the deltas client-side, so the
+frontend needs no changes.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass
+
+from .sse_frame import SseFrame
+
+
+# Delta event types eligible for coalescing
+COALESCIBLE_DELTA_TYPES = frozenset({"text-delta", "reasoning-delta"})
+
+
+@dataclass(frozen=True)
+class CoalesceConfig:
+    """
+    Delta coalescing windows.
+
+    Attributes:
+        window_ms: Max milliseconds a delta may be held for merging (None = no time limit)
+        max_bytes: Flush merged delta once it reaches this many UTF-8 bytes (None = no limit)
+    """
+
+    window_ms: float | None = None
+    max_bytes: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """True if at least one window is configured."""
+        return self.window_ms is not None or self.max_bytes is not None
+
+
+class _DeltaBuffer:
+    """Accumulates consecutive deltas for one (type, id) pair."""
+
+    __slots__ = ("block_id", "byte_count", "event_type", "parts", "started_at")
+
+    def __init__(self) -> None:
+        self.event_type = "text-delta"
+        self.block_id: str | None = None
+        self.parts: list[str] = []
+        self.byte_count = 0
+        self.started_at = 0.0
+
+    def is_empty(self) -> bool:
+        return not self.parts
+
+    def drain(self) -> list[SseFrame]:
+        """Return the merged frame (empty list if nothing is buffered) and reset."""
+        if not self.parts:
+            return []
+        merged = SseFrame.text_delta(self.block_id, "".join(self.parts), self.event_type)
+        self.parts = []
+        self.byte_count = 0
+        return [merged]
+
+    def push(
+        self, frame: SseFrame, window_s: float | None, max_bytes: int | None
+    ) -> list[SseFrame]:
+        """
+        Feed one frame, returning the frames that are ready to be sent.
+
+        Args:
+            frame: Next upstream frame
+            window_s: Time window in seconds (None = no time limit)
+            max_bytes: Byte window (None = no size limit)
+
+        Returns:
+            Frames to emit, in order
+        """
+        # Check frame.type first: reading frame.event would build data-pcm payloads
+        event = frame.event if frame.type in COALESCIBLE_DELTA_TYPES else None
+        if event is None or not isinstance(event.get("delta"), str):
+            # Any other event type flushes the buffer and passes through
+            return [*self.drain(), frame]
+
+        ready: list[SseFrame] = []
+        if self.parts and (event["type"] != self.event_type or event.get("id") != self.block_id):
+            ready = self.drain()
+
+        delta = event["delta"]
+        if not self.parts:
+            self.event_type = event["type"]
+            self.block_id = event.get("id")
+            self.started_at = time.monotonic()
+        self.parts.append(delta)
+        self.byte_count += len(delta.encode("utf-8"))
+
+        if (max_bytes is not None and self.byte_count >= max_bytes) or (
+            window_s is not None and time.monotonic() - self.started_at >= window_s
+        ):
+            ready.extend(self.drain())
+        return ready
+
+
+async def coalesce_deltas(
+    frames: AsyncIterator[SseFrame],
+    window_ms: float | None = None,
+    max_bytes: int | None = None,
+) -> AsyncGenerator[SseFrame]:
+    """
+    Merge consecutive text-delta / reasoning-delta frames for the same block id.
+
+    Args:
+        frames: Upstream frame stream (e.g., converted ADK events)
+        window_ms: Max time a delta may wait in the buffer (None = no time limit)
+        max_bytes: Flush once buffered delta text reaches this many UTF-8 bytes
+            (None = no size limit)
+
+    Yields:
+        SseFrame objects, with runs of deltas merged
+
+    Note:
+        With neither window set, deltas are merged until the next non-delta frame.
+    """
+    buffer = _DeltaBuffer()
+
+    if window_ms is None:
+        # Size-only window: flushes are driven by arriving frames, no timer needed
+        try:  # nosemgrep: forbid-try-except - buffered text goes out before an upstream error
+            async for frame in frames:
+                for ready in buffer.push(frame, None, max_bytes):
+                    yield ready
+        except Exception:
+            for ready in buffer.drain():
+                yield ready
+            raise
+        for ready in buffer.drain():
+            yield ready
+        return
+
+    async for ready in _coalesce_with_timer(frames, buffer, window_ms / 1000, max_bytes):
+        yield ready
+
+
+async def _coalesce_with_timer(
+    frames: AsyncIterator[SseFrame],
+    buffer: _DeltaBuffer,
+    window_s: float,
+    max_bytes: int | None,
+) -> AsyncGenerator[SseFrame]:
+    """Time-window variant: only the wait for upstream is bounded by the window."""
+    reader = _UpstreamReader(frames)
+
+    try:
+        while True:
+            # Wake up when the time window expires so an idle upstream
+            # does not hold back buffered text
+            timeout = None
+            if not buffer.is_empty():
+                timeout = max(window_s - (time.monotonic() - buffer.started_at), 0)
+            try:  # nosemgrep: forbid-try-except - window flush, and buffered text before errors
+                frame = await reader.read(timeout)
+            except _WindowExpiredError:
+                # The read stays outstanding and is picked up by the next read()
+                for ready in buffer.drain():
+                    yield ready
+                continue
+            except Exception:
+                # Text received before the upstream error still reaches the client
+                for ready in buffer.drain():
+                    yield ready
+                raise
+            if frame is None:
+                break
+
+            for ready in buffer.push(frame, window_s, max_bytes):
+                yield ready
+
+        for ready in buffer.drain():
+            yield ready
+    finally:
+        await reader.aclose()
+
+
+class _WindowExpiredError(Exception):
+    """No upstream frame arrived before the buffered delta's time window ran out."""
+
+
+class _UpstreamReader:
+    """
+    Reads upstream frames in one long-lived task, one frame per request.
+
+    The source only advances when read() asks for the next frame, and every
+    step of it runs in the same task (and contextvars context). A read that
+    times out stays outstanding and is picked up by the next read() call.
+    """
+
+    def __init__(self, frames: AsyncIterator[SseFrame]) -> None:
+        self._source = aiter(frames)
+        self._requests: asyncio.Queue[None] = asyncio.Queue(maxsize=1)
+        self._results: asyncio.Queue[SseFrame | Exception | None] = asyncio.Queue(maxsize=1)
+        self._requested = False
+        self._source_closed = False
+        self._task = asyncio.create_task(self._run(), name="delta-coalescer-reader")
+
+    async def read(self, timeout: float | None) -> SseFrame | None:
+        """
+        Return the next upstream frame, or None at end of stream.
+
+        Raises:
+            _WindowExpiredError: No frame arrived within timeout seconds
+            Exception: Re-raised from the upstream source (including its TimeoutError)
+        """
+        if not self._requested:
+            self._requests.put_nowait(None)
+            self._requested = True
+        try:  # nosemgrep: forbid-try-except - tell the window apart from upstream timeouts
+            async with asyncio.timeout(timeout):
+                result = await self._results.get()
+        except TimeoutError:
+            raise _WindowExpiredError from None
+        self._requested = False
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def aclose(self) -> None:
+        """Stop the reader task; it closes the source generator on its way out."""
+        self._task.cancel()
+        await asyncio.wait({self._task})
+        if not self._source_closed:
+            # Cancelled before its first step: the finally block never ran
+            await self._close_source()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._requests.get()
+                try:  # nosemgrep: forbid-try-except - hand upstream errors to the consumer
+                    frame = await anext(self._source)
+                except StopAsyncIteration:
+                    self._results.put_nowait(None)
+                    return
+                except Exception as e:
+                    self._results.put_nowait(e)
+                    return
+                self._results.put_nowait(frame)
+        finally:
+            await self._close_source()
+
+    async def _close_source(self) -> None:
+        self._source_closed = True
+        aclose = getattr(self._source, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -7,20 +7,30 @@ This module provides a decoupled abstraction layer for ID conversion between:
 
 Design:
 - Single source of truth for tool_name → function_call.id mappings
-- Supports bidirectional lookup (forward and reverse)
+- Multi-valued: one model turn may call the same tool several times in
+  parallel, so each tool_name keeps a FIFO of outstanding call ids and every
+  execution claims its own (registration order = ADK execution order)
+- Supports bidirectional lookup (forward and reverse), all O(1)
 - Context-aware resolution for intercepted tools (e.g., adk_request_confirmation)
+- Bounded: the oldest ids are forgotten beyond max_retained (aborted turns)
+
+Concurrency:
+    All operations are synchronous (no await between lookup and update), so
+    concurrent tool coroutines on the event loop never claim the same id.
 
 Usage:
     mapper = IDMapper()
 
-    # Register mapping when function_call arrives
+    # Register mapping when function_call arrives (once per call)
     mapper.register("process_payment", "function-call-123")
+    mapper.register("process_payment", "function-call-124")
 
-    # Normal tool execution
-    function_call_id = mapper.get_function_call_id("process_payment")
+    # Tool execution: each call claims the oldest outstanding id
+    function_call_id = mapper.claim("process_payment")  # → "function-call-123"
+    function_call_id = mapper.claim("process_payment")  # → "function-call-124"
 
     # Intercepted tool execution (with original context)
-    function_call_id = mapper.get_function_call_id(
+    function_call_id = mapper.claim(
         "adk_request_confirmation",
         original_context={"name": "process_payment", "id": "function-call-123"}
     )
@@ -42,14 +52,27 @@ class IDMapper:
     enabling tools to work without direct knowledge of ID conversion logic.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty ID mapping tables."""
-        # Forward lookup: tool_name → function_call.id
-        self._tool_name_to_id: dict[str, str] = {}
+    def __init__(self, max_retained: int = 1024) -> None:
+        """
+        Initialize empty ID mapping tables.
+
+        Args:
+            max_retained: Call ids remembered for reverse lookup (oldest dropped first)
+        """
+        # Forward lookup: tool_name → outstanding (unclaimed) function_call.ids, oldest first
+        # (dict as insertion-ordered set: O(1) append, pop-oldest and removal by id)
+        self._outstanding: dict[str, dict[str, None]] = {}
 
-        # Reverse lookup: function_call.id → tool_name
+        # Reverse lookup: function_call.id → tool_name (insertion order = retention order)
         self._id_to_tool_name: dict[str, str] = {}
 
+        self._max_retained = max_retained
+
+    @property
+    def outstanding_count(self) -> int:
+        """Registered call ids not yet claimed by a tool execution."""
+        return sum(len(ids) for ids in self._outstanding.values())
+
     def register(self, tool_name: str, function_call_id: str) -> None:
         """
         Register a mapping between tool_name and function_call.id.
@@ -62,18 +85,17 @@ class IDMapper:
             function_call_id: Vercel AI SDK function_call.id (e.g., "function-call-123")
 
         Note:
-            If tool_name is already registered, the old mapping will be overwritten
-            and the reverse lookup will be updated accordingly.
+            Earlier ids of the same tool stay registered (parallel calls); each is
+            handed out once by claim(). Registering a known id again is a no-op.
         """
-        # Clean up old mapping if tool_name was previously registered
-        if tool_name in self._tool_name_to_id:
-            old_id = self._tool_name_to_id[tool_name]
-            if old_id in self._id_to_tool_name:
-                del self._id_to_tool_name[old_id]
-
-        # Register new mapping (bidirectional)
-        self._tool_name_to_id[tool_name] = function_call_id
+        if function_call_id in self._id_to_tool_name:
+            logger.debug(f"[IDMapper] Already registered: {tool_name} → {function_call_id}")
+            return
+
+        self._outstanding.setdefault(tool_name, {})[function_call_id] = None
         self._id_to_tool_name[function_call_id] = tool_name
+        if len(self._id_to_tool_name) > self._max_retained:
+            self._forget(next(iter(self._id_to_tool_name)))
 
         logger.debug(f"[IDMapper] Registered: {tool_name} → {function_call_id}")
 
@@ -81,9 +103,10 @@ class IDMapper:
         self,
         tool_name: str,
         original_context: dict[str, Any] | None = None,
+        function_call_id: str | None = None,
     ) -> str | None:
         """
-        Get function_call.id for tool execution.
+        Get function_call.id for tool execution (without claiming it).
 
         Supports both direct tool execution and intercepted tool execution.
         For intercepted tools (e.g., adk_request_confirmation), uses the
@@ -93,9 +116,13 @@ class IDMapper:
             tool_name: Tool name being executed (may be intercepted tool name)
             original_context: Original function_call context for intercepted tools
                             Expected to contain {"name": str, "id": str, ...}
+            function_call_id: Exact id the caller knows (ToolContext.function_call_id)
 
         Returns:
-            function_call.id if mapping exists, None otherwise
+            The exact id (function_call_id or original_context["id"]) if one is
+            given and outstanding, else the oldest outstanding function_call.id
+            when no exact id is given; None otherwise (an exact id that is not
+            outstanding never resolves to a sibling call's id)
 
         Examples:
             # Normal tool execution
@@ -109,12 +136,49 @@ class IDMapper:
             )
             # → Returns function_call.id for "process_payment"
         """
+        lookup_name, exact_id = self._lookup_key(tool_name, original_context)
+        exact_id = function_call_id or exact_id
+        ids = self._outstanding.get(lookup_name)
+        if not ids:
+            return None
+        if exact_id is not None:
+            return exact_id if exact_id in ids else None
+        return next(iter(ids))
+
+    def claim(
+        self,
+        tool_name: str,
+        original_context: dict[str, Any] | None = None,
+        function_call_id: str | None = None,
+    ) -> str | None:
+        """
+        Take the function_call.id for one tool execution.
+
+        Same resolution as get_function_call_id(), but the id is removed from the
+        outstanding calls, so a parallel execution of the same tool gets the next
+        one. The reverse lookup (resolve_tool_result) keeps working.
+
+        Returns:
+            function_call.id, or None if no matching call of the tool is outstanding
+        """
+        claimed_id = self.get_function_call_id(tool_name, original_context, function_call_id)
+        if claimed_id is None:
+            return None
+        lookup_name, _ = self._lookup_key(tool_name, original_context)
+        self._discard_outstanding(lookup_name, claimed_id)
+        logger.debug(f"[IDMapper] Claimed: {lookup_name} → {claimed_id}")
+        return claimed_id
+
+    def _lookup_key(
+        self, tool_name: str, original_context: dict[str, Any] | None
+    ) -> tuple[str, str | None]:
+        """Tool name whose ids to use, and the exact id the context asks for (if any)."""
         # Special case: adk_request_confirmation must use its own registered ID
         # even when original_context is provided. This ensures confirmation Future
         # uses a separate ID from the original tool Future.
         if tool_name == "adk_request_confirmation":
             logger.debug("[IDMapper] Confirmation tool lookup: using tool_name directly")
-            return self._tool_name_to_id.get(tool_name)
+            return tool_name, None
 
         # For other intercepted tools: use original context
         if original_context and "name" in original_context:
@@ -122,11 +186,11 @@ class IDMapper:
             logger.debug(
                 f"[IDMapper] Context-aware lookup: {tool_name} → original_name={lookup_name}"
             )
-        else:
-            # For normal tools: use tool_name directly
-            lookup_name = tool_name
+            exact_id = original_context.get("id")
+            return lookup_name, exact_id if isinstance(exact_id, str) else None
 
-        return self._tool_name_to_id.get(lookup_name)
+        # For normal tools: use tool_name directly
+        return tool_name, None
 
     def resolve_tool_result(self, function_call_id: str) -> str | None:
         """
@@ -163,12 +227,30 @@ class IDMapper:
 
         return None
 
+    def _forget(self, function_call_id: str) -> None:
+        """Drop a call id from both tables (retention limit)."""
+        tool_name = self._id_to_tool_name.pop(function_call_id)
+        if self._discard_outstanding(tool_name, function_call_id):
+            logger.warning(
+                f"[IDMapper] Dropped unclaimed id (retention limit): "
+                f"{tool_name} → {function_call_id}"
+            )
+
+    def _discard_outstanding(self, tool_name: str, function_call_id: str) -> bool:
+        ids = self._outstanding.get(tool_name)
+        if ids is None or function_call_id not in ids:
+            return False
+        del ids[function_call_id]
+        if not ids:
+            del self._outstanding[tool_name]
+        return True
+
     def _clear(self) -> None:
         """
         Clear all registered mappings.
 
         Useful for cleanup or testing purposes.
         """
-        self._tool_name_to_id.clear()
+        self._outstanding.clear()
         self._id_to_tool_name.clear()
         logger.debug("[IDMapper] Cleared all mappings")
@@ -0,0 +1,253 @@
+"""
+Image Ingest - decode base64 image payloads once per request.
+
+An image travels through several conversion steps of one request: ChatMessage
+to_adk_content() (ImagePart / FilePart), the BIDI image blob extraction, and
+the /stream debug dump of the history. ImageIngest decodes each distinct
+payload once and hands the same bytes to every step, memoized by content hash
+of the base64 text.
+
+Image dimensions are read by sniffing the PNG / JPEG / WebP / GIF headers, so
+the hot path never opens the full image (no PIL decode just for a log line).
+
+FilePart URLs may also be "adk-blob:" handles of uploaded files (see
+blob_store.py); load_url() reads those from the blob store, once per request.
+
+Large payloads: decode_async() / load_url_async() run the decode on the
+offload pool (see offload.py) when the payload is above its threshold, so a
+multi-megabyte upload does not stall the event loop. The result lands in the
+same memo, and the synchronous conversion steps that follow reuse it.
+
+Lifetime: one ImageIngest per request (or per to_adk_content() call when the
+caller does not pass one); the memo is dropped with it.
+"""
+
+import base64
+import hashlib
+import struct
+from dataclasses import dataclass
+
+from loguru import logger
+
+from adk_stream_protocol.ags import Error, Ok
+
+from .blob_store import BLOB_URL_PREFIX, get_blob_store
+from .offload import get_offload_pool
+
+
+# Header sniffing limits (bytes)
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_HEADER_SIZE = 24  # Signature + IHDR length/type + width + height
+_GIF_HEADER_SIZE = 10
+_WEBP_HEADER_SIZE = 30
+_WEBP_VP8L_SIGNATURE = 0x2F
+_JPEG_MARKER_PREFIX = 0xFF
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xDA)})
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """Image dimensions and format sniffed from the file header."""
+
+    width: int
+    height: int
+    format: str  # "PNG" | "JPEG" | "WEBP" | "GIF" (same names as PIL)
+
+
+@dataclass(frozen=True)
+class DecodedImage:
+    """A decoded payload plus its sniffed header info (None if not a known image format)."""
+
+    data: bytes
+    info: ImageInfo | None
+
+
+def _sniff_png(data: bytes) -> ImageInfo | None:
+    if len(data) < _PNG_HEADER_SIZE or data[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", data[16:24])
+    return ImageInfo(width, height, "PNG")
+
+
+def _sniff_gif(data: bytes) -> ImageInfo | None:
+    if len(data) < _GIF_HEADER_SIZE:
+        return None
+    width, height = struct.unpack("<HH", data[6:10])
+    return ImageInfo(width, height, "GIF")
+
+
+def _sniff_webp(data: bytes) -> ImageInfo | None:
+    if len(data) < _WEBP_HEADER_SIZE:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":  # Lossy: keyframe start code
+        width, height = struct.unpack("<HH", data[26:30])
+        return ImageInfo(width & 0x3FFF, height & 0x3FFF, "WEBP")
+    if chunk == b"VP8L" and data[20] == _WEBP_VP8L_SIGNATURE:  # Lossless: 14-bit (size - 1) fields
+        bits = int.from_bytes(data[21:25], "little")
+        return ImageInfo((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, "WEBP")
+    if chunk == b"VP8X":  # Extended: 24-bit canvas (size - 1) fields
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return ImageInfo(width, height, "WEBP")
+    return None
+
+
+def _sniff_jpeg(data: bytes) -> ImageInfo | None:
+    # Walk the marker segments up to the first start-of-frame (SOFn) header
+    index = 2
+    while index + 9 <= len(data):
+        if data[index] != _JPEG_MARKER_PREFIX:
+            return None
+        marker = data[index + 1]
+        if marker == _JPEG_MARKER_PREFIX:  # Fill byte
+            index += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            index += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", data[index + 5 : index + 9])
+            return ImageInfo(width, height, "JPEG")
+        (segment_length,) = struct.unpack(">H", data[index + 2 : index + 4])
+        index += 2 + segment_length
+    return None
+
+
+def sniff_image_info(data: bytes) -> ImageInfo | None:
+    """
+    Read image dimensions and format from the file header (no full decode).
+
+    Args:
+        data: Raw image bytes
+
+    Returns:
+        ImageInfo, or None if the format is not PNG/JPEG/WebP/GIF or the header is truncated
+    """
+    if data.startswith(_PNG_SIGNATURE):
+        return _sniff_png(data)
+    if data.startswith(b"\xff\xd8"):
+        return _sniff_jpeg(data)
+    if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        return _sniff_webp(data)
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return _sniff_gif(data)
+    return None
+
+
+def _decode_payload(base64_data: str, strict: bool) -> DecodedImage:
+    """Decode and sniff one payload (module-level: runs in any offload pool kind)."""
+    data = base64.b64decode(base64_data, validate=strict)
+    return DecodedImage(data=data, info=sniff_image_info(data))
+
+
+def _memo_key(base64_data: str, strict: bool) -> bytes:
+    digest = hashlib.blake2b(base64_data.encode("ascii", "replace"), digest_size=16).digest()
+    return digest + (b"s" if strict else b"")  # A lenient decode does not prove strict validity
+
+
+def _data_url_payload(url: str) -> str | None:
+    """Return the base64 content of a "data:<type>;base64,<content>" URL (None if not one)."""
+    if not url.startswith("data:"):
+        return None
+    data_url_parts = url.split(",", 1)
+    if len(data_url_parts) != 2:  # noqa: PLR2004 - data URL format: "data:type;base64,content"
+        return None
+    return data_url_parts[1]
+
+
+class ImageIngest:
+    """
+    Per-request base64 decode memo, keyed by content hash.
+
+    decode() returns the same DecodedImage for the same payload, whichever
+    message part (ImagePart data, FilePart data URL) or step it comes from.
+    """
+
+    def __init__(self) -> None:
+        self._decoded: dict[bytes, DecodedImage] = {}
+        self.decode_count = 0  # Distinct payloads decoded (for logs and tests)
+
+    def decode(self, base64_data: str, *, strict: bool = False) -> DecodedImage:
+        """
+        Decode a base64 payload (once per distinct content) and sniff its header.
+
+        Args:
+            base64_data: base64 text (ImagePart.data, or the part after "base64," of a data URL)
+            strict: Reject non-alphabet characters (base64.b64decode validate=True)
+
+        Returns:
+            DecodedImage with the raw bytes and the sniffed ImageInfo
+
+        Raises:
+            ValueError: If data is not valid base64 (binascii.Error)
+        """
+        key = _memo_key(base64_data, strict)
+        decoded = self._decoded.get(key)
+        if decoded is None:
+            decoded = _decode_payload(base64_data, strict)
+            self._decoded[key] = decoded
+            self.decode_count += 1
+        return decoded
+
+    async def decode_async(self, base64_data: str, *, strict: bool = False) -> DecodedImage:
+        """
+        decode(), run on the offload pool when the payload is above its threshold.
+
+        Raises:
+            ValueError: If data is not valid base64 (binascii.Error)
+        """
+        pool = get_offload_pool()
+        if pool is None or not pool.should_offload(len(base64_data)):
+            return self.decode(base64_data, strict=strict)
+        key = _memo_key(base64_data, strict)
+        decoded = self._decoded.get(key)
+        if decoded is None:
+            decoded = await pool.run(_decode_payload, base64_data, strict, size=len(base64_data))
+            self._decoded[key] = decoded
+            self.decode_count += 1
+        return decoded
+
+    def load_url(self, url: str) -> DecodedImage | None:
+        """
+        Load a FilePart URL: a base64 data URL or an "adk-blob:" handle.
+
+        Args:
+            url: FilePart.url
+
+        Returns:
+            DecodedImage, or None for other URL schemes and unresolvable blob handles
+
+        Raises:
+            ValueError: If a data URL does not hold valid base64 (binascii.Error)
+        """
+        if url.startswith(BLOB_URL_PREFIX):
+            return self._load_blob(url)
+        base64_data = _data_url_payload(url)
+        return self.decode(base64_data) if base64_data is not None else None
+
+    async def load_url_async(self, url: str) -> DecodedImage | None:
+        """load_url(), with data URL payloads decoded via decode_async()."""
+        if url.startswith(BLOB_URL_PREFIX):
+            return self._load_blob(url)
+        base64_data = _data_url_payload(url)
+        return await self.decode_async(base64_data) if base64_data is not None else None
+
+    def _load_blob(self, url: str) -> DecodedImage | None:
+        key = url.encode("ascii", "replace")
+        decoded = self._decoded.get(key)
+        if decoded is not None:
+            return decoded
+        store = get_blob_store()
+        if store is None:
+            logger.warning(f"[IMAGE INPUT] No blob store configured, cannot resolve {url[:80]}")
+            return None
+        match store.read(url):
+            case Ok(data):
+                decoded = DecodedImage(data=data, info=sniff_image_info(data))
+                self._decoded[key] = decoded
+                return decoded
+            case Error(reason):
+                logger.warning(f"[IMAGE INPUT] {reason}")
+                return None
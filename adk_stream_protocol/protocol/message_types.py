@@ -33,15 +33,26 @@ Tool Call States (UIToolInvocation):
 - "output-denied": User denied tool execution
 """
 
-import base64
+from collections.abc import Iterable
 from enum import Enum
-from io import BytesIO
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 from google.genai import types
 from loguru import logger
-from PIL import Image
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    Field,
+    PrivateAttr,
+    Tag,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
+
+from .image_ingest import DecodedImage, ImageIngest
 
 
 # ============================================================
@@ -49,17 +60,27 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 # ============================================================
 
 
-def _extract_image_metadata(image_bytes: bytes) -> tuple[int, int, str | None]:
-    """Extract image dimensions and format from raw bytes.
+def _format_dimensions(decoded: DecodedImage) -> str:
+    """Log fragment with the sniffed image header info."""
+    if decoded.info is None:
+        return "dimensions=unknown, format=None"
+    return f"dimensions={decoded.info.width}x{decoded.info.height}, format={decoded.info.format}"
 
-    Args:
-        image_bytes: Raw image data
 
-    Returns:
-        (width, height, format) tuple where format may be None
+_BASE64_ALPHABET = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
+_BASE64_SAMPLE_CHARS = 64
+
+
+def _looks_like_base64(data: str) -> bool:
+    """Cheap structural base64 check: padded length plus the alphabet of head and tail.
+
+    The full decode is deferred to conversion time (ImageIngest), so parsing a
+    long history does not decode every image it carries.
     """
-    with Image.open(BytesIO(image_bytes)) as img:
-        return img.size[0], img.size[1], img.format
+    if len(data) % 4:
+        return False
+    sample = data[:_BASE64_SAMPLE_CHARS] + data[-_BASE64_SAMPLE_CHARS:]
+    return all(char in _BASE64_ALPHABET for char in sample)
 
 
 # ============================================================
@@ -144,18 +165,14 @@ class ImagePart(BaseModel):
     @field_validator("data")
     @classmethod
     def validate_data(cls, v: str) -> str:
-        """Validate that data is not empty and is valid base64."""
+        """Validate that data is not empty and looks like base64 (decoded lazily)."""
         if not v or len(v.strip()) == 0:
             msg = "Image data cannot be empty"
             raise ValueError(msg)
 
-        # Validate base64 encoding
-        # Reason: Standard library exception translation - converting base64 decode errors to ValueError
-        try:  # nosemgrep: forbid-try-except
-            base64.b64decode(v, validate=True)
-        except Exception as e:
-            msg = f"Invalid base64 encoding: {e!s}"
-            raise ValueError(msg) from e
+        if not _looks_like_base64(v):
+            msg = "Invalid base64 encoding"
+            raise ValueError(msg)
 
         return v
 
@@ -174,7 +191,9 @@ class FilePart(BaseModel):
 
     type: Literal["file"] = "file"
     filename: str
-    url: str  # data URL with base64 content (e.g., "data:image/png;base64,...")
+    # data URL with base64 content (e.g., "data:image/png;base64,...")
+    # or an uploaded blob handle ("adk-blob:<sha256>", see blob_store.py)
+    url: str
     media_type: str = Field(alias="mediaType")  # MIME type (e.g., "image/png")
 
 
@@ -300,14 +319,64 @@ class GenericPart(BaseModel):
 # ============================================================
 
 
-# Use Union type with GenericPart as fallback for unknown types
-# IMPORTANT: GenericPart must be last in the union to act as a catch-all.
-# Pydantic tries each type in order, so specific types must come before generic ones.
-# StepPart handles known internal chunks (start, step-start, start-step, finish-step).
-# Only truly unknown types fall through to GenericPart, preventing 422 validation errors.
-MessagePart = (
-    TextPart | ImagePart | FilePart | ToolUsePart | ToolResultPart | StepPart | GenericPart
-)
+# Tagged dispatch on "type": each part is validated against exactly one model
+# instead of Pydantic trying every union member in turn.
+# Exact types are looked up first ("tool-result" must win over the "tool-" prefix),
+# then the "tool-{toolName}" family goes to ToolUsePart. Everything else is generic.
+# Parts without "type" still try the models whose type has a default (old smart-union path).
+_PART_TAGS: dict[str, str] = {
+    "text": "text",
+    "image": "image",
+    "file": "file",
+    "tool-result": "tool-result",
+    "tool-use": "tool",
+    "dynamic-tool": "tool",
+    "start": "step",
+    "step-start": "step",
+    "start-step": "step",
+    "finish-step": "step",
+}
+_TOOL_TYPE_PREFIX = "tool-"
+
+
+def _part_tag(value: Any) -> str:
+    """Discriminator for MessagePart: map a raw part (or part model) to its tag."""
+    if isinstance(value, GenericPart):
+        return "generic"  # Already a fallback part: keep it as is
+    part_type = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    if part_type is None:
+        return "untyped"
+    if not isinstance(part_type, str):
+        return "generic"
+    tag = _PART_TAGS.get(part_type)
+    if tag is not None:
+        return tag
+    if part_type.startswith(_TOOL_TYPE_PREFIX):
+        return "tool"
+    return "generic"
+
+
+def _fallback_to_generic(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Keep the union's GenericPart fallback: an invalid specific part must not cause a 422."""
+    # Reason: Validation error recovery - retry the tagged part as GenericPart
+    try:  # nosemgrep: forbid-try-except
+        return handler(value)
+    except ValidationError:
+        return GenericPart.model_validate(value)
+
+
+MessagePart = Annotated[
+    Annotated[TextPart, Tag("text")]
+    | Annotated[ImagePart, Tag("image")]
+    | Annotated[FilePart, Tag("file")]
+    | Annotated[ToolUsePart, Tag("tool")]
+    | Annotated[ToolResultPart, Tag("tool-result")]
+    | Annotated[StepPart, Tag("step")]
+    | Annotated[GenericPart, Tag("generic")]
+    | Annotated[TextPart | ImagePart | FilePart | ToolResultPart, Tag("untyped")],
+    Discriminator(_part_tag),
+    WrapValidator(_fallback_to_generic),
+]
 """
 Union type for all message parts (AI SDK v6 format).
 
@@ -315,7 +384,8 @@ Corresponds to: UIMessagePart (discriminated union)
 
 This is the Python equivalent of AI SDK v6's UIMessagePart type.
 It includes all possible message part types that can be sent
-between frontend and backend.
+between frontend and backend. Parts are dispatched on "type" (see _part_tag);
+a part that fails its specific model falls back to GenericPart.
 """
 
 
@@ -350,6 +420,9 @@ class ChatMessage(BaseModel):
     )
     parts: list[MessagePart] | None = None  # AI SDK v6 format with discriminated union
 
+    # Request-scoped ImageIngest, set by to_adk_content() for the part helpers
+    _image_ingest: ImageIngest | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_content_or_parts(self) -> ChatMessage:
         """Ensure at least one of content or parts is provided."""
@@ -371,40 +444,39 @@ class ChatMessage(BaseModel):
 
     def _process_image_part(self, part: ImagePart) -> types.Part | None:
         """Process ImagePart and return ADK Part."""
-        image_bytes = base64.b64decode(part.data)
-        width, height, image_format = _extract_image_metadata(image_bytes)
+        # Reason: Parsing only checks the base64 structure - skip payloads that fail to decode
+        # Set by to_adk_content(); a direct call decodes without a shared memo
+        image_ingest = self._image_ingest or ImageIngest()
+        try:  # nosemgrep: forbid-try-except
+            decoded = image_ingest.decode(part.data, strict=True)
+        except ValueError as e:
+            logger.warning(f"[IMAGE INPUT] Skipping image with invalid base64: {e!s}")
+            return None
 
         logger.info(
             f"[IMAGE INPUT] media_type={part.media_type}, "
-            f"size={len(image_bytes)} bytes, "
-            f"dimensions={width}x{height}, "
-            f"format={image_format}, "
+            f"size={len(decoded.data)} bytes, "
+            f"{_format_dimensions(decoded)}, "
             f"base64_length={len(part.data)} chars"
         )
-        return types.Part(inline_data=types.Blob(mime_type=part.media_type, data=image_bytes))
+        return types.Part(inline_data=types.Blob(mime_type=part.media_type, data=decoded.data))
 
     def _process_file_part(self, part: FilePart) -> types.Part | None:
         """Process FilePart and return ADK Part."""
-        if not part.url.startswith("data:"):
+        # Data URL (base64 content after "base64,") or uploaded blob handle
+        image_ingest = self._image_ingest or ImageIngest()
+        decoded = image_ingest.load_url(part.url)
+        if decoded is None:
             return None
+        file_bytes = decoded.data
 
-        # Extract base64 content after "base64,"
-        data_url_parts = part.url.split(",", 1)
-        if len(data_url_parts) != 2:  # noqa: PLR2004
-            return None
-
-        base64_data = data_url_parts[1]
-        file_bytes = base64.b64decode(base64_data)
-
-        # Get image dimensions if it's an image
+        # Get image dimensions if it's an image (header sniffing, no full image decode)
         if part.media_type.startswith("image/"):
-            width, height, image_format = _extract_image_metadata(file_bytes)
             logger.info(
                 f"[FILE INPUT] filename={part.filename}, "
                 f"mediaType={part.media_type}, "
                 f"size={len(file_bytes)} bytes, "
-                f"dimensions={width}x{height}, "
-                f"format={image_format}"
+                f"{_format_dimensions(decoded)}"
             )
         else:
             logger.info(
@@ -450,7 +522,7 @@ class ChatMessage(BaseModel):
 
             # Create ADK FunctionResponse for adk_request_confirmation with approval decision
             # ADR 0002: Use approval.id as the function response ID (this is the confirmation_id)
-            # The backend's confirmation_id_mapping will resolve this to the original tool_call_id
+            # The backend's ApprovalEngine will resolve this to the original tool_call_id
             function_response = types.FunctionResponse(
                 id=approval_id,
                 name="adk_request_confirmation",
@@ -581,7 +653,12 @@ class ChatMessage(BaseModel):
         elif isinstance(part, ToolResultPart):
             self._process_tool_result_part(part, adk_parts)
 
-    def to_adk_content(self, id_mapper: Any = None, delegate: Any = None) -> types.Content:
+    def to_adk_content(
+        self,
+        id_mapper: Any = None,
+        delegate: Any = None,
+        image_ingest: ImageIngest | None = None,
+    ) -> types.Content:
         """
         Convert AI SDK v6 message to ADK Content format.
 
@@ -604,10 +681,13 @@ class ChatMessage(BaseModel):
                       Required for processing tool-result parts in Pattern B.
             delegate: Optional FrontendToolDelegate for resolving Futures in SSE mode
                      Required for resolving pending tool results across turns.
+            image_ingest: Optional request-scoped ImageIngest, so every step of the
+                     request decodes an image payload once. Default: a fresh one.
         """
         # Store ID mapper and delegate temporarily for use in _process_tool_result_part
         self._id_mapper = id_mapper
         self._delegate = delegate
+        self._image_ingest = image_ingest or ImageIngest()
 
         adk_parts = []
 
@@ -625,6 +705,7 @@ class ChatMessage(BaseModel):
 
         # Clean up temporary reference
         self._id_mapper = None
+        self._image_ingest = None
 
         return types.Content(role=self.role, parts=adk_parts)
 
@@ -652,24 +733,25 @@ def _fix_tool_output_role(msg: ChatMessage) -> None:
         msg.role = "user"
 
 
-def _extract_image_blobs_from_parts(parts: list[Any]) -> list[types.Blob]:
+def _extract_image_blobs_from_parts(
+    parts: list[Any], image_ingest: ImageIngest
+) -> list[types.Blob]:
     """Extract image/video blobs from message parts.
 
     Decodes data URL format files and creates ADK Blob objects.
     Used for Live API which requires images to be sent via send_realtime().
+    Payloads already decoded by to_adk_content() come from image_ingest.
     """
     image_blobs: list[types.Blob] = []
 
     logger.info(f"[STEP 2] Processing {len(parts)} parts from last_msg")
     for part in parts:
         logger.info(f"[STEP 2] Part type: {type(part).__name__}")
-        if isinstance(part, FilePart) and part.url.startswith("data:"):
-            # Decode data URL format: "data:image/png;base64,..."
-            data_url_parts = part.url.split(",", 1)
-            if len(data_url_parts) == 2:  # noqa: PLR2004 - data URL format: "data:type;base64,content"
-                file_data_base64 = data_url_parts[1]
-                file_bytes = base64.b64decode(file_data_base64)
-                blob = types.Blob(mime_type=part.media_type, data=file_bytes)
+        if isinstance(part, FilePart):
+            # Data URL format ("data:image/png;base64,...") or uploaded blob handle
+            decoded = image_ingest.load_url(part.url)
+            if decoded is not None:
+                blob = types.Blob(mime_type=part.media_type, data=decoded.data)
                 image_blobs.append(blob)
 
     return image_blobs
@@ -716,9 +798,33 @@ def _build_text_content(
     return types.Content(role=adk_content.role, parts=non_image_parts)
 
 
+async def predecode_images(messages: Iterable[ChatMessage], image_ingest: ImageIngest) -> None:
+    """
+    Decode the image payloads of messages ahead of the synchronous conversion.
+
+    Payloads above the offload threshold are decoded on the offload pool; the
+    results land in image_ingest, so to_adk_content() finds them already decoded.
+    Invalid payloads are skipped here and reported by the conversion step.
+
+    Args:
+        messages: Messages about to be converted
+        image_ingest: Request-scoped ImageIngest passed on to the conversion
+    """
+    for message in messages:
+        for part in message.parts or []:
+            try:  # nosemgrep: forbid-try-except - conversion logs invalid payloads later
+                if isinstance(part, ImagePart):
+                    await image_ingest.decode_async(part.data, strict=True)
+                elif isinstance(part, FilePart):
+                    await image_ingest.load_url_async(part.url)
+            except ValueError:
+                continue
+
+
 def process_chat_message_for_bidi(
     message_data: dict[str, Any],
     id_mapper: Any = None,
+    image_ingest: ImageIngest | None = None,
 ) -> tuple[list[types.Blob], types.Content | None]:
     """
     Process AI SDK v6 message data for BIDI streaming.
@@ -739,7 +845,10 @@ def process_chat_message_for_bidi(
     Args:
         message_data: Message data from WebSocket event (AI SDK v6 format)
                      Example: {"messages": [{"role": "user", "parts": [...]}]}
+                     Messages may already be ChatMessage objects (MessageEvent), then the
+                     last one is converted without parsing it again
         id_mapper: Optional ID mapper for resolving tool_call_id → tool_name
+        image_ingest: Request-scoped ImageIngest (e.g., filled by predecode_images())
 
     Returns:
         (image_blobs, text_content): Tuple of:
@@ -754,21 +863,26 @@ def process_chat_message_for_bidi(
     if not messages:
         return ([], None)
 
-    # STEP 1: Log and parse incoming message
+    # STEP 1: Parse (unless already parsed) and log incoming message
+    last = messages[-1]
+    # Copy: the role fix below must not touch the caller's (already synced) message
+    last_msg = last.model_copy() if isinstance(last, ChatMessage) else ChatMessage(**last)
     logger.info(f"[STEP 1] Received {len(messages)} messages from frontend")
-    logger.info(f"[STEP 1] Last message role: {messages[-1].get('role')}")
-    logger.info(f"[STEP 1] Last message parts: {messages[-1].get('parts', [])}")
-
-    last_msg = ChatMessage(**messages[-1])
+    logger.info(f"[STEP 1] Last message role: {last_msg.role}")
+    logger.info(f"[STEP 1] Last message parts: {last_msg.parts or []}")
 
     # Fix role for tool outputs (ADK requires role="user" for FunctionResponse)
     _fix_tool_output_role(last_msg)
 
     # Convert to ADK Content (handles all part types including confirmation responses)
-    adk_content = last_msg.to_adk_content(id_mapper=id_mapper)
+    # One ImageIngest for both steps: each image payload is decoded once
+    image_ingest = image_ingest or ImageIngest()
+    adk_content = last_msg.to_adk_content(id_mapper=id_mapper, image_ingest=image_ingest)
 
     # STEP 2: Separate image blobs and text content
-    image_blobs = _extract_image_blobs_from_parts(last_msg.parts) if last_msg.parts else []
+    image_blobs = (
+        _extract_image_blobs_from_parts(last_msg.parts, image_ingest) if last_msg.parts else []
+    )
     text_content = _build_text_content(adk_content)
 
     # STEP 3: Log final ADK format
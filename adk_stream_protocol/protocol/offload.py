@@ -0,0 +1,194 @@
+"""
+Offload Pool for CPU-heavy payload work.
+
+Base64 decoding of uploaded images and serialization of large outbound frames
+(data-pcm, file, data-audio) are pure CPU work. Run inline on the event loop, one
+multi-megabyte image stalls audio delivery for every other /live connection on
+the worker. OffloadPool runs such work in an executor once the payload is above
+a size threshold; small payloads stay inline (a pool round trip costs more than
+decoding a few kilobytes).
+
+Pool Kinds:
+    "thread"   ThreadPoolExecutor (base64 / json release the GIL only partly,
+               but the loop keeps serving other connections between calls)
+    "process"  ProcessPoolExecutor (arguments and results are pickled)
+
+Offloaded callables must be module-level functions of plain data (str, bytes,
+dicts) so that every pool kind can run them.
+
+InterpreterPoolExecutor is not offered: the worker functions live in this
+package, whose import pulls in PyO3 extensions (pydantic_core) that cannot be
+loaded in a subinterpreter.
+
+Metrics:
+    OffloadStats counts offloaded calls, payload bytes and time spent waiting
+    for the pool (exposed via offload_pool_stats() on /health).
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent import futures
+from dataclasses import dataclass, replace
+from typing import Literal, TypeVar
+
+from loguru import logger
+
+
+OffloadKind = Literal["thread", "process"]
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class OffloadConfig:
+    """
+    Offload pool settings.
+
+    Attributes:
+        kind: Executor type ("thread" or "process")
+        max_workers: Pool size (None = executor default)
+        threshold_bytes: Offload payloads of at least this many bytes
+    """
+
+    kind: OffloadKind = "thread"
+    max_workers: int | None = None
+    threshold_bytes: int = 256 * 1024
+
+    def __post_init__(self) -> None:
+        if self.kind not in {"thread", "process"}:
+            msg = f"kind must be 'thread' or 'process', got {self.kind!r}"
+            raise ValueError(msg)
+        if self.threshold_bytes < 0:
+            msg = f"threshold_bytes must be >= 0, got {self.threshold_bytes}"
+            raise ValueError(msg)
+
+
+@dataclass
+class OffloadStats:
+    """
+    Counters of offloaded work.
+
+    Attributes:
+        offloaded_calls: Calls run in the pool
+        offloaded_bytes: Payload bytes of those calls
+        failed_calls: Offloaded calls that raised
+        offload_seconds: Total time the callers waited for the pool
+        max_offload_seconds: Longest single wait
+    """
+
+    offloaded_calls: int = 0
+    offloaded_bytes: int = 0
+    failed_calls: int = 0
+    offload_seconds: float = 0.0
+    max_offload_seconds: float = 0.0
+
+
+class OffloadPool:
+    """
+    Size-gated executor for CPU-heavy payload work.
+
+    Usage:
+        pool = OffloadPool(OffloadConfig(kind="process", threshold_bytes=512 * 1024))
+        data = await pool.run(base64.b64decode, payload, size=len(payload))
+        pool.shutdown()
+
+    The executor is created on the first offloaded call, so an idle pool costs
+    nothing (no worker processes at import time).
+    """
+
+    def __init__(self, config: OffloadConfig | None = None) -> None:
+        self.config = config or OffloadConfig()
+        self.stats = OffloadStats()
+        self._executor: futures.Executor | None = None
+
+    def should_offload(self, size: int) -> bool:
+        """True if a payload of this size goes to the pool."""
+        return size >= self.config.threshold_bytes
+
+    async def run(self, func: Callable[..., _T], /, *args: object, size: int) -> _T:
+        """
+        Call func(*args), in the pool if size is above the threshold.
+
+        Args:
+            func: Module-level function (picklable for process pools)
+            *args: Positional arguments (plain data)
+            size: Payload size in bytes (decides inline vs. offloaded)
+
+        Returns:
+            func's return value
+
+        Raises:
+            Exception: Whatever func raises (re-raised in the caller)
+        """
+        if not self.should_offload(size):
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:  # nosemgrep: forbid-try-except - count failures, then re-raise to the caller
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        except Exception:
+            self.stats.failed_calls += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats.offloaded_calls += 1
+            self.stats.offloaded_bytes += size
+            self.stats.offload_seconds += elapsed
+            self.stats.max_offload_seconds = max(self.stats.max_offload_seconds, elapsed)
+
+    def snapshot(self) -> OffloadStats:
+        """Copy of the current counters."""
+        return replace(self.stats)
+
+    def shutdown(self) -> None:
+        """Stop the executor (pending calls finish; the pool restarts on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> futures.Executor:
+        if self._executor is None:
+            self._executor = _create_executor(self.config)
+            logger.info(
+                f"[Offload] Started {self.config.kind} pool "
+                f"(max_workers={self.config.max_workers}, "
+                f"threshold={self.config.threshold_bytes} bytes)"
+            )
+        return self._executor
+
+
+def _create_executor(config: OffloadConfig) -> futures.Executor:
+    if config.kind == "process":
+        return futures.ProcessPoolExecutor(max_workers=config.max_workers)
+    return futures.ThreadPoolExecutor(
+        max_workers=config.max_workers, thread_name_prefix="adk-offload"
+    )
+
+
+# Process-wide pool for ingest / frame encoding (None = all work inline)
+_OFFLOAD_POOL: OffloadPool | None = None
+
+
+def configure_offload_pool(pool: OffloadPool | None) -> None:
+    """
+    Set the pool used for large payloads (None runs everything inline).
+
+    Args:
+        pool: OffloadPool instance, or None
+    """
+    global _OFFLOAD_POOL
+    if _OFFLOAD_POOL is not None and _OFFLOAD_POOL is not pool:
+        _OFFLOAD_POOL.shutdown()
+    _OFFLOAD_POOL = pool
+
+
+def get_offload_pool() -> OffloadPool | None:
+    """The configured offload pool, or None if offloading is disabled."""
+    return _OFFLOAD_POOL
+
+
+def offload_pool_stats() -> OffloadStats | None:
+    """Counters of the configured pool (for /health and metrics), None if disabled."""
+    return _OFFLOAD_POOL.snapshot() if _OFFLOAD_POOL is not None else None
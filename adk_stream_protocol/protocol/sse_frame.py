@@ -0,0 +1,328 @@
+"""
+Typed SSE Frame for AI SDK v6 Data Stream Protocol.
+
+An SseFrame carries the AI SDK v6 event dict together with a lazily-cached
+wire encoding. Frames flow through stream_adk_to_ai_sdk() and both transports
+(BidiEventSender, SseEventStreamer) as objects, so routing code reads
+frame.event directly instead of json.loads()-ing the formatted string again.
+
+Serialization happens at most once per frame, when the transport asks for
+frame.text (WebSocket send_text) or frame.encode() (HTTP SSE body).
+
+Frame Lifecycle:
+    1. StreamProtocolConverter builds SseFrame(event_dict)
+    2. Transports inspect frame.type / frame.event (no parsing)
+    3. Socket boundary calls frame.text or frame.encode() (serialized once, cached)
+
+Bytes-native fast paths:
+    - Constant frames ([DONE], start-step, finish-step) are preencoded once at
+      import time and shared (DONE_FRAME, START_STEP_FRAME, FINISH_STEP_FRAME).
+    - Hot event types are built from byte templates instead of json.dumps() on
+      the whole dict: SseFrame.text_delta() for text-delta / reasoning-delta and
+      SseFrame.data_pcm() for data-pcm, whose base64 payload is spliced into the
+      wire bytes without a str round-trip.
+    Template output is byte-identical to json.dumps(event) for the same dict.
+
+PCM frames:
+    data-pcm frames keep the raw PCM16 bytes (frame.pcm) and build the base64
+    event dict / wire encoding only on demand. Transports that send audio as
+    binary WebSocket frames (see pcm_frame.py) never pay for base64 or JSON.
+
+Large frames:
+    Serializing a multi-megabyte file / data-audio / data-pcm frame is CPU work
+    on the event loop. Transports call await frame.prepare(pool) first: above the
+    offload threshold (see offload.py) the wire encoding is built on the offload
+    pool and cached, so frame.text / frame.encode() are cache hits afterwards.
+
+Legacy pass-through:
+    Pre-formatted SSE strings ('data: {...}\\n\\n') are still accepted by
+    stream_adk_to_ai_sdk() and the transports. SseFrame.coerce() wraps them,
+    parsing the JSON payload once and keeping the original text verbatim.
+"""
+
+import base64
+import json
+from typing import Any
+
+from .offload import OffloadPool
+
+
+# Wire representation of the AI SDK v6 stream terminator
+DONE_SSE_TEXT = "data: [DONE]\n\n"
+
+# Byte templates for hot event types (must match json.dumps default separators)
+_SSE_PREFIX = b'data: {"type": '
+_SSE_SUFFIX = b"}\n\n"
+_DATA_PCM_PREFIX = b'data: {"type": "data-pcm", "data": {"content": "'
+
+
+def _encode_data_pcm(pcm: bytes, sample_rate: int | None) -> bytes:
+    """Encode a data-pcm frame from the byte template."""
+    return b"".join(
+        (
+            _DATA_PCM_PREFIX,
+            base64.b64encode(pcm),
+            b'", "sampleRate": ',
+            str(sample_rate).encode("ascii"),
+            b', "channels": 1, "bitDepth": 16}',
+            _SSE_SUFFIX,
+        )
+    )
+
+
+def _format_event(event: dict[str, Any] | None) -> str:
+    """SSE wire text of an event dict (module-level: runs in any offload pool kind)."""
+    return f"data: {json.dumps(event)}\n\n"
+
+
+class SseFrame:
+    """
+    One AI SDK v6 Data Stream Protocol frame.
+
+    Attributes:
+        event: Event data dict (AI SDK v6 format), or None for the [DONE] marker
+            and for unparseable pass-through strings.
+        pcm: Raw PCM16 audio for data-pcm frames built by data_pcm(), else None
+        sample_rate: PCM sample rate in Hz (data-pcm frames only)
+
+    Note:
+        Frames are treated as immutable once created. Mutating frame.event after
+        frame.text has been read would desynchronize the cached encoding.
+    """
+
+    __slots__ = ("_encoded", "_event", "_text", "is_done", "pcm", "sample_rate")
+
+    def __init__(
+        self,
+        event: dict[str, Any] | None,
+        *,
+        text: str | None = None,
+        is_done: bool = False,
+    ) -> None:
+        """
+        Initialize frame.
+
+        Args:
+            event: Event data dict (AI SDK v6 format), None for [DONE]
+            text: Optional pre-formatted SSE text (pass-through frames)
+            is_done: True for the [DONE] stream terminator
+        """
+        self._event = event
+        self.is_done = is_done
+        self._text = text
+        self._encoded: bytes | None = None
+        self.pcm: bytes | None = None
+        self.sample_rate: int | None = None
+
+    @classmethod
+    def done(cls) -> SseFrame:
+        """Create a [DONE] terminator frame (preencoded)."""
+        return cls._with_encoded(None, DONE_SSE_TEXT.encode("utf-8"), is_done=True)
+
+    @classmethod
+    def preencoded(cls, event: dict[str, Any]) -> SseFrame:
+        """
+        Create a frame whose text and bytes are computed eagerly.
+
+        Intended for module-level constant frames that are sent many times.
+
+        Args:
+            event: Event data dict (AI SDK v6 format)
+
+        Returns:
+            SseFrame with cached text and wire bytes
+        """
+        frame = cls(event)
+        frame.encode()
+        return frame
+
+    @classmethod
+    def text_delta(
+        cls, part_id: str | None, delta: str, event_type: str = "text-delta"
+    ) -> SseFrame:
+        """
+        Build a text-delta (or reasoning-delta) frame from the byte template.
+
+        Only the id and delta strings go through json.dumps(); the surrounding
+        structure is a constant.
+
+        Args:
+            part_id: Text block ID
+            delta: Delta text
+            event_type: "text-delta" or "reasoning-delta"
+
+        Returns:
+            SseFrame equivalent to SseFrame({"type": event_type, "id": ..., "delta": ...})
+        """
+        encoded = b"".join(
+            (
+                _SSE_PREFIX,
+                json.dumps(event_type).encode("ascii"),
+                b', "id": ',
+                json.dumps(part_id).encode("ascii"),
+                b', "delta": ',
+                json.dumps(delta).encode("ascii"),
+                _SSE_SUFFIX,
+            )
+        )
+        return cls._with_encoded({"type": event_type, "id": part_id, "delta": delta}, encoded)
+
+    @classmethod
+    def data_pcm(cls, pcm: bytes, sample_rate: int) -> SseFrame:
+        """
+        Build a data-pcm frame around raw PCM16 audio.
+
+        Base64 encoding, the event dict and the wire bytes are all deferred until
+        first use. The wire bytes come from a byte template: the base64 alphabet
+        needs no JSON escaping, so the payload is spliced in directly.
+
+        Args:
+            pcm: Raw PCM16 mono audio bytes
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            SseFrame equivalent to the dict-built data-pcm event (channels=1, bitDepth=16)
+        """
+        frame = cls(None)
+        frame.pcm = pcm
+        frame.sample_rate = sample_rate
+        return frame
+
+    @classmethod
+    def _with_encoded(
+        cls, event: dict[str, Any] | None, encoded: bytes, *, is_done: bool = False
+    ) -> SseFrame:
+        """Create a frame from already-encoded wire bytes (text is decoded lazily)."""
+        frame = cls(event, is_done=is_done)
+        frame._encoded = encoded
+        return frame
+
+    @classmethod
+    def from_sse(cls, sse_event: str) -> SseFrame:
+        """
+        Wrap a pre-formatted SSE string, parsing its payload once.
+
+        The original string is kept verbatim as the frame text, so the wire
+        output is byte-identical to what the producer formatted.
+
+        Args:
+            sse_event: SSE-formatted string like 'data: {...}\\n\\n'
+
+        Returns:
+            SseFrame with event populated when the payload is a JSON object
+        """
+        if not sse_event.startswith("data:"):
+            return cls(None, text=sse_event)
+
+        payload = sse_event[5:].strip()
+        if payload == "[DONE]":
+            return cls(None, text=sse_event, is_done=True)
+
+        try:  # nosemgrep: forbid-try-except - legacy pass-through strings may be malformed
+            parsed = json.loads(payload)
+        except json.JSONDecodeError:
+            return cls(None, text=sse_event)
+
+        return cls(parsed if isinstance(parsed, dict) else None, text=sse_event)
+
+    @classmethod
+    def coerce(cls, value: SseFrame | str) -> SseFrame:
+        """Return value unchanged if it is a frame, otherwise wrap the SSE string."""
+        if isinstance(value, SseFrame):
+            return value
+        return cls.from_sse(value)
+
+    @property
+    def event(self) -> dict[str, Any] | None:
+        """Event data dict (built on first access for data-pcm frames)."""
+        if self._event is None and self.pcm is not None:
+            self._event = {
+                "type": "data-pcm",
+                "data": {
+                    "content": base64.b64encode(self.pcm).decode("ascii"),
+                    "sampleRate": self.sample_rate,
+                    "channels": 1,
+                    "bitDepth": 16,
+                },
+            }
+        return self._event
+
+    @property
+    def type(self) -> str | None:
+        """AI SDK v6 event type (e.g., "text-delta"), or None for [DONE]/unparsed frames."""
+        if self.pcm is not None:
+            return "data-pcm"
+        if self._event is None:
+            return None
+        return self._event.get("type")
+
+    @property
+    def text(self) -> str:
+        """SSE wire text 'data: {...}\\n\\n' (serialized on first access, then cached)."""
+        if self._text is None:
+            if self._encoded is not None or self.pcm is not None:
+                self._text = self.encode().decode("utf-8")
+            else:
+                self._text = _format_event(self.event)
+        return self._text
+
+    @property
+    def payload_size(self) -> int:
+        """
+        Approximate size of the frame's binary payload, without serializing it.
+
+        Raw PCM length for data-pcm frames; length of the base64 "url" (file) or
+        data "content" (data-audio, data-image) string otherwise; 0 for plain frames.
+        """
+        if self.pcm is not None:
+            return len(self.pcm)
+        if self._event is None:
+            return 0
+        url = self._event.get("url")
+        if isinstance(url, str):
+            return len(url)
+        data = self._event.get("data")
+        content = data.get("content") if isinstance(data, dict) else None
+        return len(content) if isinstance(content, str) else 0
+
+    async def prepare(self, pool: OffloadPool | None) -> None:
+        """
+        Serialize a large frame on the offload pool (no-op for small or cached frames).
+
+        Args:
+            pool: Offload pool, or None (serialization then stays lazy and inline)
+        """
+        if pool is None or self._text is not None or self._encoded is not None:
+            return
+        size = self.payload_size
+        if not pool.should_offload(size):
+            return
+        if self.pcm is not None:
+            self._encoded = await pool.run(_encode_data_pcm, self.pcm, self.sample_rate, size=size)
+        else:
+            self._text = await pool.run(_format_event, self._event, size=size)
+
+    def encode(self) -> bytes:
+        """UTF-8 wire bytes (encoded on first call, then cached)."""
+        if self._encoded is None:
+            if self.pcm is not None and self._text is None:
+                self._encoded = _encode_data_pcm(self.pcm, self.sample_rate)
+            else:
+                self._encoded = self.text.encode("utf-8")
+        return self._encoded
+
+    def __str__(self) -> str:
+        """Return SSE wire text."""
+        return self.text
+
+    def __repr__(self) -> str:
+        """Return debug representation without forcing serialization."""
+        if self.is_done:
+            return "SseFrame([DONE])"
+        return f"SseFrame(type={self.type!r})"
+
+
+# Shared constant frames (immutable, preencoded, safe to reuse across streams)
+DONE_FRAME = SseFrame.done()
+START_STEP_FRAME = SseFrame.preencoded({"type": "start-step"})
+FINISH_STEP_FRAME = SseFrame.preencoded({"type": "finish-step"})
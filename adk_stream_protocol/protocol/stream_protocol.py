@@ -13,11 +13,14 @@ IMPORTANT: This converter is used by BOTH streaming modes:
 The same conversion logic is reused in both cases.
 Only the transport layer differs (HTTP SSE vs WebSocket).
 This ensures protocol consistency across all modes.
+
+Output is a stream of SseFrame objects (event dict + lazily-cached encoding).
+Transports read frame.event for routing and serialize once at the socket boundary.
 """
 
 import base64
 import enum
-import json
+import hashlib
 import traceback
 import uuid
 from collections.abc import AsyncGenerator
@@ -29,6 +32,9 @@ from loguru import logger
 
 from adk_stream_protocol.testing.chunk_logger import Mode, chunk_logger
 
+from .delta_coalescer import CoalesceConfig, coalesce_deltas
+from .sse_frame import DONE_FRAME, SseFrame
+
 
 # Type alias for SSE-formatted event strings
 # Example: 'data: {"type":"text-delta","id":"1","delta":"Hello"}\n\n'
@@ -39,15 +45,19 @@ LOG_FIELD_TRUNCATE_THRESHOLD = 20
 # Maximum length for debug log messages before truncation
 DEBUG_LOG_MAX_LENGTH = 100
 
+# Hard ceilings for per-turn converter state (a BIDI converter lives for the whole
+# connection; state is reset on turn_complete, these bound a single runaway turn)
+MAX_TRACKED_REASONING_PARTS = 1024
+MAX_TOOL_CALL_ID_MAP_SIZE = 256
+
 
 def format_sse_event(event_data: dict[str, Any]) -> SseFormattedEvent:
     """
     Format event data as SSE-formatted string.
 
-    This function is used by:
-    - StreamProtocolConverter: For converting ADK events
-    - BidiEventSender: For formatting confirmation events
-    - SseEventStreamer: For formatting confirmation events
+    The converter and transports pass SseFrame objects instead; this helper
+    remains for callers that need a plain SSE string (e.g., pre-converted
+    events injected into stream_adk_to_ai_sdk()).
 
     Args:
         event_data: Event data dictionary (AI SDK v6 format)
@@ -83,7 +93,7 @@ def format_sse_event(event_data: dict[str, Any]) -> SseFormattedEvent:
     #     f"[ADK→SSE] {str(log_data)[:DEBUG_LOG_MAX_LENGTH]}"
     #     f"{'... (truncated)' if len(str(log_data)) > DEBUG_LOG_MAX_LENGTH else ''}"
     # )
-    return f"data: {json.dumps(event_data)}\n\n"
+    return SseFrame(event_data).text
 
 
 class AISdkFinishReason(str, enum.Enum):
@@ -245,6 +255,80 @@ def _map_adk_finish_reason_to_ai_sdk(finish_reason: types.FinishReason | None) -
     return reason_name.lower()
 
 
+class _ConcatDigest:
+    """
+    Constant-memory stand-in for an accumulated string.
+
+    Tracks a running blake2b digest and the character length of everything
+    added, so "does text equal the concatenation so far?" is answered in
+    O(len(text)) without keeping the concatenation itself.
+    """
+
+    __slots__ = ("_digest", "length")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything added so far."""
+        self._digest = hashlib.blake2b(digest_size=16)
+        self.length = 0
+
+    def add(self, text: str) -> None:
+        """Append text to the tracked concatenation."""
+        self._digest.update(text.encode("utf-8"))
+        self.length += len(text)
+
+    def matches(self, text: str) -> bool:
+        """True if text equals the concatenation (length first, digest only on match)."""
+        if len(text) != self.length:
+            return False
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        return digest == self._digest.digest()
+
+
+class _ReasoningDuplicateIndex:
+    """
+    Incremental index of one turn's reasoning texts for duplicate filtering.
+
+    Replaces a join-and-scan over all reasoning texts per text part (quadratic
+    over a long session) with:
+    - a running digest + length of the concatenation (O(len(part)) per add)
+    - a hash set of individual parts (O(1) membership), capped at
+      MAX_TRACKED_REASONING_PARTS entries
+
+    A text part is checked in O(len(text)): length first, digest only on match.
+    """
+
+    __slots__ = ("_concat", "_parts", "part_count")
+
+    def __init__(self) -> None:
+        self._concat = _ConcatDigest()
+        self._parts: set[str] = set()
+        self.part_count = 0
+
+    def reset(self) -> None:
+        """Forget all reasoning texts (called on turn_complete)."""
+        self._concat.reset()
+        self._parts = set()
+        self.part_count = 0
+
+    def add(self, text: str) -> None:
+        """Index one reasoning text."""
+        self._concat.add(text)
+        if len(self._parts) < MAX_TRACKED_REASONING_PARTS:
+            self._parts.add(text)
+        self.part_count += 1
+
+    def matches_concatenation(self, text: str) -> bool:
+        """True if text equals the concatenation of all indexed reasoning texts."""
+        return self._concat.matches(text)
+
+    def matches_part(self, text: str) -> bool:
+        """True if text equals any individual indexed reasoning text."""
+        return text in self._parts
+
+
 class StreamProtocolConverter:
     """
     Converts ADK agent events to AI SDK v6 Data Stream Protocol.
@@ -287,13 +371,14 @@ class StreamProtocolConverter:
         # Track output transcription text blocks (AI audio response in native-audio models)
         self._output_text_block_id: str | None = None
         self._output_text_block_started = False
-        # Track cumulative output transcription text to filter duplicate final summary
+        # Track cumulative output transcription (digest + length, not the text itself)
+        # to filter duplicate final summary
         # Gemini 2.0 sends final transcription with finished=True containing full text
-        self._output_transcription_accumulated = ""
-        # Track ALL reasoning texts to filter duplicate text-delta events
+        self._output_transcription_accumulated = _ConcatDigest()
+        # Index of this turn's reasoning texts to filter duplicate text-delta events
         # In BIDI mode, Gemini 2.0 sometimes sends reasoning parts followed by a text part
-        # containing the concatenation of all reasoning parts
-        self._accumulated_reasoning_texts: list[str] = []
+        # containing the concatenation of all reasoning parts (reset on turn_complete)
+        self._reasoning_index = _ReasoningDuplicateIndex()
 
         # Track metadata for BIDI mode finalization
         # In BIDI mode (WebSocket), stream doesn't end until connection closes,
@@ -322,7 +407,7 @@ class StreamProtocolConverter:
     # Refactored helper methods for _convert_event()
     # =========================================================================
 
-    def _handle_error_event(self, event: Event) -> str | None:
+    def _handle_error_event(self, event: Event) -> SseFrame | None:
         """
         Check for error in event and return error SSE event if present.
 
@@ -330,12 +415,12 @@ class StreamProtocolConverter:
             event: ADK Event object
 
         Returns:
-            SSE-formatted error event string, or None if no error
+            Error SseFrame, or None if no error
         """
         if hasattr(event, "error_code") and event.error_code:
             error_message = getattr(event, "error_message", None) or "Unknown error"
             logger.error(f"[ERROR] ADK error detected: {event.error_code} - {error_message}")
-            return self.format_sse_event(
+            return SseFrame(
                 {
                     "type": "error",
                     "error": {"code": event.error_code, "message": error_message},
@@ -355,7 +440,7 @@ class StreamProtocolConverter:
         """
         self._metadata.extract(event)
 
-    def _process_content_parts(self, event: Event) -> list[str]:  # noqa: C901
+    def _process_content_parts(self, event: Event) -> list[SseFrame]:  # noqa: C901
         """
         Process content parts from event and return SSE events.
 
@@ -366,9 +451,9 @@ class StreamProtocolConverter:
             event: ADK Event object
 
         Returns:
-            List of SSE-formatted event strings
+            List of SseFrame objects
         """
-        events: list[str] = []
+        events: list[SseFrame] = []
 
         if not event.content or not event.content.parts:
             return events
@@ -384,8 +469,8 @@ class StreamProtocolConverter:
                 logger.info(
                     f"[THOUGHT PART] Processing thought text: length={len(part.text)}, preview='{part.text[:50]}...'"
                 )
-                # Accumulate reasoning text to filter duplicate text-delta
-                self._accumulated_reasoning_texts.append(part.text)
+                # Index reasoning text to filter duplicate text-delta
+                self._reasoning_index.add(part.text)
                 events.extend(self._process_thought_part(part.text))
 
             # Text content (regular answer when thought=False or None)
@@ -439,31 +524,30 @@ class StreamProtocolConverter:
         Returns:
             True if text should be skipped, False otherwise
         """
-        if not self._accumulated_reasoning_texts:
+        index = self._reasoning_index
+        if index.part_count == 0:
             return False
 
         # Check if text matches concatenation of all reasoning texts
-        accumulated_reasoning = "".join(self._accumulated_reasoning_texts)
-        if text == accumulated_reasoning:
+        if index.matches_concatenation(text):
             logger.info(
                 f"[TEXT PART] Filtering duplicate text-delta (matches concatenated reasoning): "
-                f"length={len(text)}, reasoning_parts={len(self._accumulated_reasoning_texts)}, "
+                f"length={len(text)}, reasoning_parts={index.part_count}, "
                 f"preview='{text[:50]}...'"
             )
             return True
 
         # Also check if text matches any individual reasoning text
-        for idx, reasoning_text in enumerate(self._accumulated_reasoning_texts):
-            if text == reasoning_text:
-                logger.info(
-                    f"[TEXT PART] Filtering duplicate text-delta (matches reasoning[{idx}]): "
-                    f"length={len(text)}, preview='{text[:50]}...'"
-                )
-                return True
+        if index.matches_part(text):
+            logger.info(
+                f"[TEXT PART] Filtering duplicate text-delta (matches a reasoning part): "
+                f"length={len(text)}, preview='{text[:50]}...'"
+            )
+            return True
 
         return False
 
-    def _process_input_transcription(self, event: Event) -> list[str]:
+    def _process_input_transcription(self, event: Event) -> list[SseFrame]:
         """
         Process input transcription (user audio input in BIDI mode).
 
@@ -474,9 +558,9 @@ class StreamProtocolConverter:
             event: ADK Event object
 
         Returns:
-            List of SSE-formatted event strings
+            List of SseFrame objects
         """
-        events: list[str] = []
+        events: list[SseFrame] = []
 
         if not hasattr(event, "input_transcription") or not event.input_transcription:
             return events
@@ -493,31 +577,19 @@ class StreamProtocolConverter:
         if not self._input_text_block_started:
             self._input_text_block_id = f"{self.message_id}_input_text"
             self._input_text_block_started = True
-            events.append(
-                self.format_sse_event({"type": "text-start", "id": self._input_text_block_id})
-            )
+            events.append(SseFrame({"type": "text-start", "id": self._input_text_block_id}))
 
         # Send text-delta with the transcription text (AI SDK v6 protocol)
-        events.append(
-            self.format_sse_event(
-                {
-                    "type": "text-delta",
-                    "id": self._input_text_block_id,
-                    "delta": transcription.text,
-                }
-            )
-        )
+        events.append(SseFrame.text_delta(self._input_text_block_id, transcription.text))
 
         # Send text-end if transcription is finished
         if hasattr(transcription, "finished") and transcription.finished:
-            events.append(
-                self.format_sse_event({"type": "text-end", "id": self._input_text_block_id})
-            )
+            events.append(SseFrame({"type": "text-end", "id": self._input_text_block_id}))
             self._input_text_block_started = False
 
         return events
 
-    def _process_output_transcription(self, event: Event) -> list[str]:
+    def _process_output_transcription(self, event: Event) -> list[SseFrame]:
         """
         Process output transcription (AI audio response in native-audio models).
 
@@ -528,9 +600,9 @@ class StreamProtocolConverter:
             event: ADK Event object
 
         Returns:
-            List of SSE-formatted event strings
+            List of SseFrame objects
         """
-        events: list[str] = []
+        events: list[SseFrame] = []
 
         if not hasattr(event, "output_transcription") or not event.output_transcription:
             return events
@@ -544,55 +616,41 @@ class StreamProtocolConverter:
         logger.info(
             f"[OUTPUT TRANSCRIPTION] text_length={text_length}, "
             f"finished={finished}, "
-            f"accumulated_length={len(self._output_transcription_accumulated)}, "
+            f"accumulated_length={self._output_transcription_accumulated.length}, "
             f"text_preview='{transcription.text[:100]}...'"
         )
 
         # Check if this is final transcription with full text (Gemini 2.0 behavior)
         # If finished=True and text matches accumulated, skip (duplicate summary)
-        if finished and transcription.text == self._output_transcription_accumulated:
+        if finished and self._output_transcription_accumulated.matches(transcription.text):
             logger.info(
                 "[OUTPUT TRANSCRIPTION] Filtering duplicate final summary "
                 "(finished=True, matches accumulated text)"
             )
             # Send text-end and skip text-delta
-            events.append(
-                self.format_sse_event({"type": "text-end", "id": self._output_text_block_id})
-            )
+            events.append(SseFrame({"type": "text-end", "id": self._output_text_block_id}))
             self._output_text_block_started = False
         else:
             # Send text-start if this is the first transcription chunk
             if not self._output_text_block_started:
                 self._output_text_block_id = f"{self.message_id}_output_text"
                 self._output_text_block_started = True
-                events.append(
-                    self.format_sse_event({"type": "text-start", "id": self._output_text_block_id})
-                )
+                events.append(SseFrame({"type": "text-start", "id": self._output_text_block_id}))
 
             # Send text-delta with the transcription text (AI SDK v6 protocol)
-            events.append(
-                self.format_sse_event(
-                    {
-                        "type": "text-delta",
-                        "id": self._output_text_block_id,
-                        "delta": transcription.text,
-                    }
-                )
-            )
+            events.append(SseFrame.text_delta(self._output_text_block_id, transcription.text))
 
             # Accumulate text for duplicate detection
-            self._output_transcription_accumulated += transcription.text
+            self._output_transcription_accumulated.add(transcription.text)
 
             # Send text-end if transcription is finished
             if hasattr(transcription, "finished") and transcription.finished:
-                events.append(
-                    self.format_sse_event({"type": "text-end", "id": self._output_text_block_id})
-                )
+                events.append(SseFrame({"type": "text-end", "id": self._output_text_block_id}))
                 self._output_text_block_started = False
 
         return events
 
-    async def _convert_event(self, event: Event) -> AsyncGenerator[str]:
+    async def _convert_event(self, event: Event) -> AsyncGenerator[SseFrame]:
         """
         Convert a single ADK event to AI SDK v6 SSE events.
 
@@ -608,7 +666,7 @@ class StreamProtocolConverter:
             event: ADK Event object
 
         Yields:
-            SSE-formatted event strings
+            SseFrame objects
         """
         # 1. Check for errors FIRST (before any other processing)
         error_event = self._handle_error_event(event)
@@ -621,7 +679,7 @@ class StreamProtocolConverter:
 
         # 3. Send start event on first event
         if not self.has_started:
-            yield self.format_sse_event({"type": "start", "messageId": self.message_id})
+            yield SseFrame({"type": "start", "messageId": self.message_id})
             self.has_started = True
 
         # 4. Process event content parts (thought, text, function_call, etc.)
@@ -655,11 +713,33 @@ class StreamProtocolConverter:
             ):
                 yield final_event
 
+            # Turn state is now snapshotted in the finish event's messageMetadata
+            self._reset_turn_state()
+
+    def _reset_turn_state(self) -> None:
+        """
+        Reset per-turn state at a turn boundary (BIDI turn_complete).
+
+        In BIDI mode one converter lives for the whole WebSocket connection, so
+        anything accumulated per turn must be dropped once finalize() has
+        reported it, keeping memory flat over hours-long sessions.
+
+        Kept across turns: message_id, part/tool-call ID counters (IDs stay unique),
+        has_started.
+        """
+        self.pcm_chunk_count = 0
+        self.pcm_total_bytes = 0
+        self.pcm_sample_rate = None
+        self.tool_call_id_map.clear()
+        self._output_transcription_accumulated.reset()
+        self._reasoning_index.reset()
+        self._metadata = MetadataExtractor(agent_model=self.agent_model)
+
     def _create_streaming_events(
         self,
         event_type_prefix: str,
         content: str,
-    ) -> list[str]:
+    ) -> list[SseFrame]:
         """
         Generic helper for start/delta/end event sequences.
 
@@ -668,29 +748,27 @@ class StreamProtocolConverter:
             content: Content to stream
 
         Returns:
-            List of SSE-formatted events
+            List of SseFrame objects
         """
         part_id = self._generate_part_id()
 
         events = [
-            self.format_sse_event({"type": f"{event_type_prefix}-start", "id": part_id}),
-            self.format_sse_event(
-                {"type": f"{event_type_prefix}-delta", "id": part_id, "delta": content}
-            ),
-            self.format_sse_event({"type": f"{event_type_prefix}-end", "id": part_id}),
+            SseFrame({"type": f"{event_type_prefix}-start", "id": part_id}),
+            SseFrame.text_delta(part_id, content, event_type=f"{event_type_prefix}-delta"),
+            SseFrame({"type": f"{event_type_prefix}-end", "id": part_id}),
         ]
         return events
 
-    def _process_text_part(self, text: str) -> list[str]:
+    def _process_text_part(self, text: str) -> list[SseFrame]:
         """Process text part into text-* events."""
         return self._create_streaming_events("text", text)
 
-    def _process_thought_part(self, thought: str) -> list[str]:
+    def _process_thought_part(self, thought: str) -> list[SseFrame]:
         """Process thought part into reasoning-* events."""
         return self._create_streaming_events("reasoning", thought)
 
     @staticmethod
-    def format_tool_approval_request(original_tool_call_id: str, approval_id: str) -> str:
+    def format_tool_approval_request(original_tool_call_id: str, approval_id: str) -> SseFrame:
         """Generate tool-approval-request event (AI SDK v6 standard).
 
         This method centralizes the generation of tool-approval-request events,
@@ -703,7 +781,7 @@ class StreamProtocolConverter:
                 (e.g., adk_request_confirmation's tool call ID)
 
         Returns:
-            SSE-formatted tool-approval-request event string
+            tool-approval-request SseFrame
 
         Reference:
             - ADR 0002: Tool Approval Architecture
@@ -714,9 +792,9 @@ class StreamProtocolConverter:
             "toolCallId": original_tool_call_id,  # Must match the original tool's ID
             "approvalId": approval_id,  # Unique ID for this approval request
         }
-        return f"data: {json.dumps(event_data)}\n\n"
+        return SseFrame(event_data)
 
-    def _process_function_call(self, function_call: types.FunctionCall) -> list[str]:
+    def _process_function_call(self, function_call: types.FunctionCall) -> list[SseFrame]:
         """
         Process FunctionCall and generate AI SDK v6 SSE events.
 
@@ -729,7 +807,7 @@ class StreamProtocolConverter:
             function_call: ADK FunctionCall object
 
         Returns:
-            List of SSE event strings
+            List of SseFrame objects
         """
         tool_name = function_call.name
         tool_call_id = function_call.id
@@ -744,7 +822,11 @@ class StreamProtocolConverter:
 
         # Store mapping so function_response can use the same ID
         if tool_name and tool_call_id:
+            self.tool_call_id_map.pop(tool_name, None)
             self.tool_call_id_map[tool_name] = tool_call_id
+            if len(self.tool_call_id_map) > MAX_TOOL_CALL_ID_MAP_SIZE:
+                # Hard ceiling: evict the least recently registered tool
+                del self.tool_call_id_map[next(iter(self.tool_call_id_map))]
 
         # Debug: Log tool_args for adk_request_confirmation
         if tool_name == "adk_request_confirmation":
@@ -773,14 +855,14 @@ class StreamProtocolConverter:
 
         # For regular tools: Send tool-input-* events as normal
         events = [
-            self.format_sse_event(
+            SseFrame(
                 {
                     "type": "tool-input-start",
                     "toolCallId": tool_call_id,
                     "toolName": tool_name,
                 }
             ),
-            self.format_sse_event(
+            SseFrame(
                 {
                     "type": "tool-input-available",
                     "toolCallId": tool_call_id,
@@ -792,7 +874,9 @@ class StreamProtocolConverter:
 
         return events
 
-    def _process_function_response(self, function_response: types.FunctionResponse) -> list[str]:
+    def _process_function_response(
+        self, function_response: types.FunctionResponse
+    ) -> list[SseFrame]:
         """
         Process function response into tool-output-available or tool-output-error event (AI SDK v6 spec).
 
@@ -844,7 +928,7 @@ class StreamProtocolConverter:
 
         # Send error event if error detected
         if is_error:
-            event = self.format_sse_event(
+            event = SseFrame(
                 {
                     "type": "tool-output-error",
                     "toolCallId": tool_call_id,
@@ -855,7 +939,7 @@ class StreamProtocolConverter:
             return [event]
 
         # Normal success response
-        event = self.format_sse_event(
+        event = SseFrame(
             {
                 "type": "tool-output-available",
                 "toolCallId": tool_call_id,
@@ -864,9 +948,9 @@ class StreamProtocolConverter:
         )
         return [event]
 
-    def _process_executable_code(self, code: types.ExecutableCode) -> list[str]:
+    def _process_executable_code(self, code: types.ExecutableCode) -> list[SseFrame]:
         """Process executable code as custom data event."""
-        event = self.format_sse_event(
+        event = SseFrame(
             {
                 "type": "data-executable-code",
                 "data": {"language": code.language, "code": code.code},
@@ -874,9 +958,9 @@ class StreamProtocolConverter:
         )
         return [event]
 
-    def _process_code_result(self, result: types.CodeExecutionResult) -> list[str]:
+    def _process_code_result(self, result: types.CodeExecutionResult) -> list[SseFrame]:
         """Process code execution result as custom data event."""
-        event = self.format_sse_event(
+        event = SseFrame(
             {
                 "type": "data-code-execution-result",
                 "data": {"outcome": result.outcome, "output": result.output},
@@ -884,7 +968,7 @@ class StreamProtocolConverter:
         )
         return [event]
 
-    def _process_inline_data_part(self, inline_data: types.Blob) -> list[str]:
+    def _process_inline_data_part(self, inline_data: types.Blob) -> list[SseFrame]:
         """Process inline data (image or audio) as appropriate custom event."""
         # Ensure data is not None
         if inline_data.data is None:
@@ -908,19 +992,9 @@ class StreamProtocolConverter:
             self.pcm_total_bytes += len(inline_data.data)
 
             # Send PCM chunk immediately as data-pcm event (AI SDK v6 Stream Protocol)
-            base64_content = base64.b64encode(inline_data.data).decode("utf-8")
-
-            event = self.format_sse_event(
-                {
-                    "type": "data-pcm",
-                    "data": {
-                        "content": base64_content,
-                        "sampleRate": sample_rate or 24000,
-                        "channels": 1,
-                        "bitDepth": 16,
-                    },
-                }
-            )
+            # Raw PCM is kept on the frame; base64/JSON encoding happens only if the
+            # transport sends it as SSE text (binary WebSocket mode skips both)
+            event = SseFrame.data_pcm(inline_data.data, sample_rate or 24000)
             return [event]
 
         # Process other audio formats (non-PCM) - send directly
@@ -928,7 +1002,7 @@ class StreamProtocolConverter:
             # Convert bytes to base64 string
             base64_content = base64.b64encode(inline_data.data).decode("utf-8")
 
-            event = self.format_sse_event(
+            event = SseFrame(
                 {
                     "type": "data-audio",
                     "data": {
@@ -946,7 +1020,7 @@ class StreamProtocolConverter:
 
             # Use AI SDK v6 standard 'file' event with data URL
             # This matches the input format (symmetric input/output)
-            event = self.format_sse_event(
+            event = SseFrame(
                 {
                     "type": "file",
                     "url": f"data:{mime_type};base64,{base64_content}",
@@ -964,30 +1038,26 @@ class StreamProtocolConverter:
         )
         return []
 
-    def _close_pending_text_blocks(self) -> list[str]:
+    def _close_pending_text_blocks(self) -> list[SseFrame]:
         """
         Close any open text blocks for input/output transcription.
 
         Returns:
-            List of SSE events to close text blocks (may be empty).
+            List of SseFrame objects to close text blocks (may be empty).
         """
-        events: list[str] = []
+        events: list[SseFrame] = []
 
         # Close input transcription text block
         if self._input_text_block_started and self._input_text_block_id:
             logger.debug(
                 f"[INPUT TRANSCRIPTION] Closing text block in finalize: id={self._input_text_block_id}"
             )
-            events.append(
-                self.format_sse_event({"type": "text-end", "id": self._input_text_block_id})
-            )
+            events.append(SseFrame({"type": "text-end", "id": self._input_text_block_id}))
             self._input_text_block_started = False
 
         # Close output transcription text block
         if self._output_text_block_started and self._output_text_block_id:
-            events.append(
-                self.format_sse_event({"type": "text-end", "id": self._output_text_block_id})
-            )
+            events.append(SseFrame({"type": "text-end", "id": self._output_text_block_id}))
             self._output_text_block_started = False
 
         return events
@@ -1111,7 +1181,7 @@ class StreamProtocolConverter:
         citation_metadata: Any | None = None,
         cache_metadata: Any | None = None,
         model_version: str | None = None,
-    ) -> AsyncGenerator[str]:
+    ) -> AsyncGenerator[SseFrame]:
         """
         Send final events to close the stream.
 
@@ -1125,10 +1195,10 @@ class StreamProtocolConverter:
             model_version: Optional model version string
 
         Yields:
-            Final SSE events
+            Final SseFrame objects
         """
         if error:
-            yield self.format_sse_event({"type": "error", "error": str(error)})
+            yield SseFrame({"type": "error", "error": str(error)})
         else:
             # Close any open text blocks
             for event in self._close_pending_text_blocks():
@@ -1148,25 +1218,77 @@ class StreamProtocolConverter:
             if metadata:
                 finish_event["messageMetadata"] = metadata
 
-            yield self.format_sse_event(finish_event)
+            yield SseFrame(finish_event)
 
         # Always send [DONE] marker
         logger.debug("[ADK→SSE] Sending [DONE] marker")
-        yield "data: [DONE]\n\n"
+        yield DONE_FRAME
+
+
+def _log_frame(frame: SseFrame, mode: Mode) -> None:
+    """Record an outgoing frame in the chunk logger (serializes only when logging is enabled)."""
+    if chunk_logger.is_enabled():
+        chunk_logger.log_chunk(
+            location="backend-sse-event",
+            direction="out",
+            chunk=frame.text,
+            mode=mode,
+        )
 
 
 async def stream_adk_to_ai_sdk(
-    event_stream: AsyncGenerator[Event | SseFormattedEvent],
+    event_stream: AsyncGenerator[Event | SseFrame | SseFormattedEvent],
     message_id: str | None = None,
     mode: Mode = "adk-sse",  # "adk-sse" or "adk-bidi" for chunk logger
     agent_model: str | None = None,  # Agent model name as fallback when event.model_version is None
-) -> AsyncGenerator[SseFormattedEvent]:
+    coalesce: CoalesceConfig | None = None,  # Optional text/reasoning delta coalescing
+) -> AsyncGenerator[SseFrame]:
     """
     Convert ADK event stream to AI SDK v6 Data Stream Protocol.
 
-    Accepts two types of events:
+    Accepts ADK Events, SseFrames and pre-formatted SSE strings (see
+    _convert_adk_stream() for details).
+
+    Optional delta coalescing (off by default): when coalesce has a time or
+    byte window set, consecutive text-delta / reasoning-delta frames
+    for the same block id are merged (see delta_coalescer.coalesce_deltas()).
+    Any other event type, including finish and [DONE], flushes the buffer first.
+
+    Args:
+        event_stream: AsyncGenerator of Event, SseFrame or SseFormattedEvent
+        message_id: Optional message ID
+        mode: Backend mode ("adk-sse" or "adk-bidi") for chunk logger
+        agent_model: Agent model name as fallback when event.model_version is None
+        coalesce: Delta coalescing windows (None or no window set = disabled)
+
+    Yields:
+        SseFrame objects (serialize with frame.text / frame.encode() at the socket boundary)
+    """
+    frames = _convert_adk_stream(event_stream, message_id, mode, agent_model)
+    if coalesce is None or not coalesce.enabled:
+        async for frame in frames:
+            yield frame
+        return
+
+    async for frame in coalesce_deltas(
+        frames, window_ms=coalesce.window_ms, max_bytes=coalesce.max_bytes
+    ):
+        yield frame
+
+
+async def _convert_adk_stream(
+    event_stream: AsyncGenerator[Event | SseFrame | SseFormattedEvent],
+    message_id: str | None,
+    mode: Mode,
+    agent_model: str | None,
+) -> AsyncGenerator[SseFrame]:
+    """
+    Convert ADK event stream to AI SDK v6 frames (no coalescing).
+
+    Accepts three types of events:
     - Event: ADK native events from run_live() (unconverted, requires conversion)
-    - SseFormattedEvent (str): Pre-converted SSE format strings (pass-through)
+    - SseFrame: Pre-converted frames (pass-through)
+    - SseFormattedEvent (str): Pre-converted SSE format strings (wrapped, pass-through)
 
     Confirmation events are pre-converted to SSE format by:
     - BIDI mode: BidiEventSender._handle_confirmation_if_needed()
@@ -1174,15 +1296,15 @@ async def stream_adk_to_ai_sdk(
 
     This design maintains type-based conversion state:
     - Event type = unconverted (needs converter)
-    - str type = already converted (pass-through)
+    - SseFrame / str type = already converted (pass-through)
 
     Args:
-        event_stream: AsyncGenerator of Event or SseFormattedEvent
+        event_stream: AsyncGenerator of Event, SseFrame or SseFormattedEvent
         message_id: Optional message ID
         mode: Backend mode ("adk-sse" or "adk-bidi") for chunk logger
 
     Yields:
-        SSE-formatted event strings
+        SseFrame objects (serialize with frame.text / frame.encode() at the socket boundary)
     """
     converter = StreamProtocolConverter(message_id, agent_model=agent_model)
     error_list: list[Exception] = []
@@ -1191,36 +1313,28 @@ async def stream_adk_to_ai_sdk(
 
     try:
         async for event in event_stream:
-            # Type-based handling: str (pre-converted) vs Event (needs conversion)
-            if isinstance(event, str):
+            # Type-based handling: SseFrame/str (pre-converted) vs Event (needs conversion)
+            if isinstance(event, SseFrame | str):
+                frame = SseFrame.coerce(event)
                 # Chunk Logger: Record SSE event (already converted)
-                chunk_logger.log_chunk(
-                    location="backend-sse-event",
-                    direction="out",
-                    chunk=event,
-                    mode=mode,
-                )
-                yield event
+                _log_frame(frame, mode)
+                yield frame
                 continue
 
             # Chunk Logger: Record ADK event (input)
-            chunk_logger.log_chunk(
-                location="backend-adk-event",
-                direction="in",
-                chunk=repr(event),
-                mode=mode,
-            )
-
-            # Convert ADK Event to SSE format
-            async for sse_event in converter._convert_event(event):
-                # Chunk Logger: Record SSE event (output)
+            if chunk_logger.is_enabled():
                 chunk_logger.log_chunk(
-                    location="backend-sse-event",
-                    direction="out",
-                    chunk=sse_event,
+                    location="backend-adk-event",
+                    direction="in",
+                    chunk=repr(event),
                     mode=mode,
                 )
-                yield sse_event
+
+            # Convert ADK Event to SSE frames
+            async for frame in converter._convert_event(event):
+                # Chunk Logger: Record SSE event (output)
+                _log_frame(frame, mode)
+                yield frame
 
             # Extract metadata from Event for finalization (delegates to MetadataExtractor)
             metadata_extractor.extract(event)
@@ -1245,7 +1359,7 @@ async def stream_adk_to_ai_sdk(
         if error:
             logger.error(f"[FINALIZE] Sending error: {error!s}")
 
-        async for final_event in converter.finalize(
+        async for final_frame in converter.finalize(
             usage_metadata=metadata_extractor.usage_metadata,
             error=error,
             finish_reason=metadata_extractor.finish_reason,
@@ -1255,12 +1369,6 @@ async def stream_adk_to_ai_sdk(
             model_version=metadata_extractor.model_version,
         ):
             # Chunk Logger: Record final SSE event (output)
-            # Log raw SSE string to avoid encoding/decoding issues
-            chunk_logger.log_chunk(
-                location="backend-sse-event",
-                direction="out",
-                chunk=final_event,
-                mode=mode,
-            )
+            _log_frame(final_frame, mode)
 
-            yield final_event
+            yield final_frame
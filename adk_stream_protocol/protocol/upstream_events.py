@@ -0,0 +1,141 @@
+"""
+Upstream WebSocket Events for BIDI mode (Frontend → Backend).
+
+Typed counterparts of the BidiEvent union in lib/bidi/event_sender.ts. Text
+frames on /live are validated straight from the raw frame with
+parse_upstream_event() (pydantic-core parses and validates in one pass, no
+json.loads dict in between), dispatched on "type". Message events carry their
+history as ChatMessage objects, so history sync and BIDI conversion share one
+parse.
+
+Flat structure (no 'data' wrapper):
+- Metadata fields: type, version, timestamp (protocol-level)
+- Payload fields: event-specific data (application-level)
+
+Unknown event types validate as UnknownEvent so the receiver can log them
+instead of dropping the connection.
+"""
+
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, Discriminator, Field, Tag, TypeAdapter
+
+from .message_types import ChatMessage
+
+
+class _UpstreamEventBase(BaseModel):
+    """Metadata shared by all upstream events."""
+
+    model_config = {"extra": "allow"}
+
+    version: str | None = None
+    timestamp: int | float | None = None  # Client timestamp (milliseconds since epoch)
+
+
+class MessageEvent(_UpstreamEventBase):
+    """Chat messages (same payload as the SSE /stream request body)."""
+
+    type: Literal["message"] = "message"
+    id: str | None = None  # chatId
+    messages: list[ChatMessage] = Field(default_factory=list)
+    trigger: Literal["submit-message", "regenerate-message"] | None = None
+    messageId: str | None = None  # noqa: N815
+    historyCursor: int | None = Field(default=None, ge=0)  # noqa: N815
+
+
+class ToolResultEvent(_UpstreamEventBase):
+    """Frontend tool execution result (resolves FrontendToolDelegate futures)."""
+
+    type: Literal["tool_result"] = "tool_result"
+    toolCallId: str | None = None  # noqa: N815
+    result: dict[str, Any] | None = None
+
+
+class AudioControlEvent(_UpstreamEventBase):
+    """Audio input start/stop (CMD key press/release)."""
+
+    type: Literal["audio_control"] = "audio_control"
+    action: str | None = None  # "start" | "stop"
+
+
+class AudioChunkEvent(_UpstreamEventBase):
+    """base64 PCM16 microphone audio (JSON fallback for binary frames)."""
+
+    type: Literal["audio_chunk"] = "audio_chunk"
+    chunk: str | None = None
+    sampleRate: int | None = None  # noqa: N815
+    channels: int | None = None
+    bitDepth: int | None = None  # noqa: N815
+
+
+class InterruptEvent(_UpstreamEventBase):
+    """User interruption during streaming."""
+
+    type: Literal["interrupt"] = "interrupt"
+    reason: str = "user_abort"
+
+
+class PingEvent(_UpstreamEventBase):
+    """Keepalive, answered with pong at the WebSocket layer."""
+
+    type: Literal["ping"] = "ping"
+
+
+class UnknownEvent(_UpstreamEventBase):
+    """Event with a type this server does not know (logged and ignored)."""
+
+    type: Any = None
+
+
+_EVENT_TYPES = frozenset(
+    {"message", "tool_result", "audio_control", "audio_chunk", "interrupt", "ping"}
+)
+
+
+def _event_tag(value: Any) -> str:
+    """Discriminator for UpstreamEvent: known "type" values, else "unknown"."""
+    event_type = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    if isinstance(event_type, str) and event_type in _EVENT_TYPES:
+        return event_type
+    return "unknown"
+
+
+UpstreamEvent = Annotated[
+    Annotated[MessageEvent, Tag("message")]
+    | Annotated[ToolResultEvent, Tag("tool_result")]
+    | Annotated[AudioControlEvent, Tag("audio_control")]
+    | Annotated[AudioChunkEvent, Tag("audio_chunk")]
+    | Annotated[InterruptEvent, Tag("interrupt")]
+    | Annotated[PingEvent, Tag("ping")]
+    | Annotated[UnknownEvent, Tag("unknown")],
+    Discriminator(_event_tag),
+]
+"""Union of all upstream WebSocket events, dispatched on "type"."""
+
+_UPSTREAM_EVENT_ADAPTER: TypeAdapter[UpstreamEvent] = TypeAdapter(UpstreamEvent)
+
+
+def parse_upstream_event(data: str | bytes) -> UpstreamEvent:
+    """
+    Validate a raw WebSocket text frame as an upstream event.
+
+    Args:
+        data: JSON text frame (str or bytes)
+
+    Returns:
+        Typed upstream event
+
+    Raises:
+        pydantic.ValidationError: Invalid JSON or an event that does not match its type
+    """
+    return _UPSTREAM_EVENT_ADAPTER.validate_json(data)
+
+
+def to_upstream_event(event: dict[str, Any]) -> UpstreamEvent:
+    """
+    Validate an already-decoded event dict (tests, in-process callers).
+
+    Raises:
+        pydantic.ValidationError: Event does not match its type
+    """
+    return _UPSTREAM_EVENT_ADAPTER.validate_python(event)
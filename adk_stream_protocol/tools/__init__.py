@@ -3,22 +3,28 @@ Tools Layer - Tool execution coordination and approval management.
 
 This subpackage handles:
 - Frontend tool execution management (FrontendToolDelegate)
-- Approval queue for deferred approval flow (ApprovalQueue)
-- Tool confirmation service for BIDI mode (ConfirmationDelegate)
+- Approval requests for both BIDI confirmation flows (ApprovalEngine)
 
 Components:
 - FrontendToolDelegate: Makes frontend tool execution awaitable using asyncio.Future
-- ApprovalQueue: Queue-based approval mechanism for BIDI mode
-- ConfirmationDelegate: Tool confirmation flow using Future pattern (formerly ToolConfirmationDelegate)
+- ApprovalEngine: One registry of pending approvals with timer-wheel timeouts
 """
 
-from .approval_queue import ApprovalQueue
-from .confirmation_service import ConfirmationDelegate
+from .approval_engine import (
+    ApprovalConfig,
+    ApprovalEngine,
+    ApprovalStats,
+    PendingApproval,
+    approval_stats,
+)
 from .frontend_tool_service import FrontendToolDelegate
 
 
 __all__ = [
-    "ApprovalQueue",
-    "ConfirmationDelegate",
+    "ApprovalConfig",
+    "ApprovalEngine",
+    "ApprovalStats",
     "FrontendToolDelegate",
+    "PendingApproval",
+    "approval_stats",
 ]
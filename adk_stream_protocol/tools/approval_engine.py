@@ -0,0 +1,490 @@
+"""
+Approval Engine for BIDI tool approvals.
+
+Single owner of approval state. It replaces three pieces that had to be kept
+consistent by hand:
+- ApprovalQueue (asyncio.Event + result dicts, one wait_for task per request)
+- ConfirmationDelegate (futures)
+- session.state["pending_long_running_calls"] / ["confirmation_id_mapping"]
+  (mutated directly by BidiEventSender and BidiEventReceiver)
+
+One PendingApproval per tool call:
+
+    BidiEventSender          track(tool_call_id, name, args, approval_id)
+      (tool-approval-request sent to the frontend)
+    BLOCKING tool            await wait(tool_call_id, name, args, timeout)
+    BidiEventReceiver        decide_batch({approval_id: approved, ...})
+      (frontend answered every request of the approval step in one message)
+
+- One asyncio.Future per request, created only when a tool waits; a decision
+  that arrives first is kept and returned by wait() immediately.
+- O(1) lookup by approval id or tool call id.
+- Timeouts run on a hashed timer wheel: one loop timer per engine (armed only
+  while requests are pending), no wait_for task per request, so tens of
+  thousands of pending approvals cost one dict entry and one future each.
+- Undecided requests expire after their timeout (waiters get TimeoutError);
+  decided requests nobody collects are dropped at the same deadline.
+- Deferred requests (the tool returned a pending status, see defer()) never
+  expire: they stay until decided and discarded, cancelled, or closed.
+- cancel() / close() answer pending requests with a denial, so blocked tools
+  return immediately.
+
+Counters (ApprovalStats, approval_stats() on /health) are process-wide.
+"""
+
+import asyncio
+import math
+import time
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from loguru import logger
+
+
+# session.state key of the session's engine (see get_approval_engine)
+APPROVAL_ENGINE_STATE_KEY = "approval_engine"
+
+
+@dataclass(frozen=True)
+class ApprovalConfig:
+    """
+    Approval engine settings.
+
+    Attributes:
+        timeout_seconds: Default time a request waits for the user's decision
+        tick_seconds: Timer wheel resolution (timeouts fire up to one tick late)
+        wheel_slots: Timer wheel size (deadlines further out wrap around)
+    """
+
+    timeout_seconds: float = 30.0
+    tick_seconds: float = 0.25
+    wheel_slots: int = 512
+
+    def __post_init__(self) -> None:
+        if self.tick_seconds <= 0 or self.wheel_slots <= 0:
+            msg = (
+                f"tick_seconds and wheel_slots must be > 0, "
+                f"got {self.tick_seconds} / {self.wheel_slots}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass
+class ApprovalStats:
+    """
+    Process-wide approval counters.
+
+    Attributes:
+        requested: Approval requests created
+        approved: Requests approved by the user
+        denied: Requests denied by the user
+        timed_out: Requests that expired without a decision
+        cancelled: Requests answered by cancel() / close() (connection or session ended)
+        pending: Requests currently awaiting a decision
+        batches: Messages that answered several requests at once (decide_batch())
+    """
+
+    requested: int = 0
+    approved: int = 0
+    denied: int = 0
+    timed_out: int = 0
+    cancelled: int = 0
+    pending: int = 0
+    batches: int = 0
+
+
+_STATS = ApprovalStats()
+
+
+def approval_stats() -> ApprovalStats:
+    """Copy of the approval counters (for /health and metrics)."""
+    return replace(_STATS)
+
+
+@dataclass(slots=True)
+class PendingApproval:
+    """
+    One tool call awaiting (or holding) the user's decision.
+
+    Attributes:
+        tool_call_id: ADK function_call.id of the tool
+        tool_name: Tool name
+        args: Tool arguments (shown to the user; used by Legacy Approval Mode)
+        approval_id: Id of the tool-approval-request sent to the frontend
+        decision: True / False once decided, None while pending
+        future: Set while a BLOCKING tool waits in wait()
+        deadline: time.monotonic() after which the request expires (inf once deferred)
+        deferred: The tool returned a pending status instead of waiting
+            (LongRunningFunctionTool, Legacy Approval Mode); see ApprovalEngine.defer
+    """
+
+    tool_call_id: str
+    tool_name: str
+    args: dict[str, Any]
+    approval_id: str | None = None
+    decision: bool | None = None
+    future: asyncio.Future[dict[str, Any]] | None = field(default=None, repr=False)
+    deadline: float = 0.0
+    deferred: bool = False
+
+    @property
+    def has_waiter(self) -> bool:
+        """True if a BLOCKING tool awaits this decision."""
+        return self.future is not None and not self.future.done()
+
+
+class TimerWheel:
+    """
+    Hashed timing wheel: O(1) schedule / cancel, expiry in tick-sized steps.
+
+    Keys land in slot (deadline tick % slots) with their absolute tick, so
+    deadlines beyond one revolution stay in their slot until their turn.
+    """
+
+    def __init__(self, tick_seconds: float, slots: int) -> None:
+        self._tick = tick_seconds
+        self._slots: list[dict[str, int]] = [{} for _ in range(slots)]
+        self._slot_of: dict[str, int] = {}
+        self._cursor = math.floor(time.monotonic() / tick_seconds)
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def schedule(self, key: str, deadline: float) -> None:
+        """Expire key at deadline (time.monotonic() based); reschedules a known key."""
+        self.cancel(key)
+        due = max(math.ceil(deadline / self._tick), self._cursor + 1)
+        slot = due % len(self._slots)
+        self._slots[slot][key] = due
+        self._slot_of[key] = slot
+
+    def cancel(self, key: str) -> bool:
+        """Forget key; False if it was not scheduled."""
+        slot = self._slot_of.pop(key, None)
+        if slot is None:
+            return False
+        del self._slots[slot][key]
+        return True
+
+    def advance(self, now: float) -> list[str]:
+        """Move the wheel to now and return the keys that expired."""
+        target = math.floor(now / self._tick)
+        if target <= self._cursor:
+            return []
+        slot_count = len(self._slots)
+        steps = min(target - self._cursor, slot_count)
+        expired: list[str] = []
+        for offset in range(1, steps + 1):
+            slot = self._slots[(self._cursor + offset) % slot_count]
+            due_keys = [key for key, due in slot.items() if due <= target]
+            for key in due_keys:
+                del slot[key]
+                del self._slot_of[key]
+            expired.extend(due_keys)
+        self._cursor = target
+        return expired
+
+    def seconds_to_next_tick(self, now: float) -> float:
+        """Delay until the next tick boundary."""
+        return max((self._cursor + 1) * self._tick - now, 0.0)
+
+
+class ApprovalEngine:
+    """
+    Approval requests of one session (BIDI mode).
+
+    Usage:
+        engine = get_approval_engine(session.state)
+
+        # BidiEventSender: tool-approval-request sent to the frontend
+        engine.track("call-1", "process_payment", {"amount": 50}, approval_id="confirm-1")
+
+        # BLOCKING tool
+        decision = await engine.wait("call-1", "process_payment", {"amount": 50})
+        decision["approved"]  # → True / False (TimeoutError after the timeout)
+
+        # BidiEventReceiver: frontend answered
+        engine.decide("confirm-1", approved=True)
+    """
+
+    def __init__(self, config: ApprovalConfig | None = None) -> None:
+        """
+        Initialize engine.
+
+        Args:
+            config: Timeout and timer wheel settings (defaults: 30 s timeout, 250 ms ticks)
+        """
+        self.config = config or ApprovalConfig()
+        self._by_tool_call: dict[str, PendingApproval] = {}
+        self._by_approval: dict[str, PendingApproval] = {}
+        self._wheel = TimerWheel(self.config.tick_seconds, self.config.wheel_slots)
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Requests awaiting a decision."""
+        return sum(1 for request in self._by_tool_call.values() if request.decision is None)
+
+    def get(self, key: str) -> PendingApproval | None:
+        """Request by approval id or tool call id (O(1))."""
+        return self._by_approval.get(key) or self._by_tool_call.get(key)
+
+    def awaiting_decision(self, tool_call_id: str | None) -> bool:
+        """True if the tool call has a request the user has not answered yet."""
+        request = self._by_tool_call.get(tool_call_id) if tool_call_id else None
+        return request is not None and request.decision is None
+
+    def track(
+        self,
+        tool_call_id: str,
+        tool_name: str,
+        args: dict[str, Any],
+        approval_id: str | None = None,
+        timeout: float | None = None,
+    ) -> PendingApproval:
+        """
+        Register an approval request (idempotent per tool call).
+
+        Args:
+            tool_call_id: ADK function_call.id of the tool
+            tool_name: Tool name
+            args: Tool arguments
+            approval_id: Id of the tool-approval-request (second lookup key)
+            timeout: Seconds until the request expires (default: config.timeout_seconds)
+
+        Returns:
+            The (new or existing) request
+        """
+        request = self._by_tool_call.get(tool_call_id)
+        if request is None:
+            request = PendingApproval(tool_call_id, tool_name, args)
+            self._by_tool_call[tool_call_id] = request
+            self._set_deadline(request, timeout)
+            _STATS.requested += 1
+            _STATS.pending += 1
+            logger.info(f"[Approval] Request registered: {tool_call_id} ({tool_name})")
+        if approval_id is not None and request.approval_id != approval_id:
+            if request.approval_id is not None:
+                self._by_approval.pop(request.approval_id, None)
+            request.approval_id = approval_id
+            self._by_approval[approval_id] = request
+        return request
+
+    async def wait(
+        self,
+        tool_call_id: str,
+        tool_name: str,
+        args: dict[str, Any],
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Await the user's decision on a tool call (BLOCKING tools).
+
+        Args:
+            tool_call_id: ADK function_call.id (ToolContext.function_call_id)
+            tool_name: Tool name
+            args: Tool arguments
+            timeout: Seconds to wait (default: config.timeout_seconds)
+
+        Returns:
+            {"approved": bool} (also {"cancelled": True} if the connection ended)
+
+        Raises:
+            TimeoutError: No decision within timeout
+        """
+        request = self.track(tool_call_id, tool_name, args)
+        if request.decision is not None:
+            self._remove(request)
+            return {"approved": request.decision}
+
+        self._set_deadline(request, timeout)
+        request.future = asyncio.get_running_loop().create_future()
+        logger.info(f"[Approval] Waiting for approval: {tool_call_id} ({tool_name})")
+        try:  # nosemgrep: forbid-try-except - a cancelled tool must not leave its request behind
+            return await request.future
+        except asyncio.CancelledError:
+            if self._by_tool_call.get(tool_call_id) is request:
+                self._remove(request)
+                _STATS.pending -= 1
+                _STATS.cancelled += 1
+            raise
+
+    def decide(self, key: str, approved: bool) -> PendingApproval | None:
+        """
+        Record the user's decision and wake the waiting tool.
+
+        Args:
+            key: Approval id or tool call id
+            approved: True if approved, False if denied
+
+        Returns:
+            The decided request, None if unknown (expired, already decided, or never tracked)
+        """
+        decided = self.decide_batch({key: approved})
+        return decided[0] if decided else None
+
+    def decide_batch(self, decisions: Mapping[str, bool]) -> list[PendingApproval]:
+        """
+        Record several decisions at once (one approval step answered in one message).
+
+        Every key is resolved before any decision is recorded, and all decisions
+        are recorded before the waiting tools are woken, so the tools of one turn
+        resume together. Unknown or already decided keys are skipped (the user's
+        other decisions still apply).
+
+        Args:
+            decisions: Approval id or tool call id → approved
+
+        Returns:
+            The decided requests, in decisions order
+        """
+        batch: list[tuple[PendingApproval, bool]] = []
+        seen: set[str] = set()
+        for key, approved in decisions.items():
+            request = self.get(key)
+            if request is None or request.decision is not None or request.tool_call_id in seen:
+                logger.warning(f"[Approval] No pending approval for {key}")
+                continue
+            seen.add(request.tool_call_id)
+            batch.append((request, approved))
+
+        for request, approved in batch:
+            request.decision = approved
+            _STATS.pending -= 1
+            if approved:
+                _STATS.approved += 1
+            else:
+                _STATS.denied += 1
+            logger.info(
+                f"[Approval] {'APPROVED' if approved else 'DENIED'}: "
+                f"{request.tool_call_id} ({request.tool_name})"
+            )
+        if len(batch) > 1:
+            _STATS.batches += 1
+            logger.info(f"[Approval] Applied {len(batch)} decisions as one batch")
+
+        for request, approved in batch:
+            if request.future is not None:
+                self._remove(request)
+                if not request.future.done():
+                    request.future.set_result({"approved": approved})
+        return [request for request, _ in batch]
+
+    def defer(self, key: str) -> PendingApproval | None:
+        """
+        Mark an undecided request as deferred: its tool returned a pending status.
+
+        Nothing waits on a deferred request, but its tool still needs a
+        FunctionResponse once the user decides, so the request no longer expires.
+
+        Args:
+            key: Approval id or tool call id
+
+        Returns:
+            The deferred request, None if unknown or already decided
+        """
+        request = self.get(key)
+        if request is None or request.decision is not None:
+            return None
+        request.deferred = True
+        request.deadline = math.inf
+        self._wheel.cancel(request.tool_call_id)
+        return request
+
+    def discard(self, key: str) -> None:
+        """Forget a request whose decision has been handled (Legacy Approval Mode)."""
+        request = self.get(key)
+        if request is not None:
+            if request.decision is None:
+                _STATS.pending -= 1
+            self._remove(request)
+
+    def cancel(self, key: str) -> bool:
+        """
+        Answer a pending request with a denial (e.g., the tool call was abandoned).
+
+        Returns:
+            True if a pending request was cancelled
+        """
+        request = self.get(key)
+        if request is None or request.decision is not None:
+            return False
+        self._remove(request)
+        _STATS.pending -= 1
+        _STATS.cancelled += 1
+        if request.future is not None and not request.future.done():
+            request.future.set_result({"approved": False, "cancelled": True})
+        return True
+
+    def close(self) -> None:
+        """Release the engine (connection closed or session evicted): deny everything pending."""
+        requests = list(self._by_tool_call.values())
+        cancelled = sum(self.cancel(request.tool_call_id) for request in requests)
+        self._by_tool_call.clear()
+        self._by_approval.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if cancelled:
+            logger.info(f"[Approval] Closed, denied {cancelled} pending approval(s)")
+
+    def _set_deadline(self, request: PendingApproval, timeout: float | None) -> None:
+        seconds = self.config.timeout_seconds if timeout is None else timeout
+        request.deadline = time.monotonic() + seconds
+        self._wheel.schedule(request.tool_call_id, request.deadline)
+        self._arm()
+
+    def _remove(self, request: PendingApproval) -> None:
+        self._by_tool_call.pop(request.tool_call_id, None)
+        if request.approval_id is not None:
+            self._by_approval.pop(request.approval_id, None)
+        self._wheel.cancel(request.tool_call_id)
+
+    def _arm(self) -> None:
+        """Keep one loop timer running while the wheel has deadlines."""
+        if self._timer is not None or not len(self._wheel):
+            return
+        try:  # nosemgrep: forbid-try-except - tracked outside a loop (tests): expire on next call
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        delay = self._wheel.seconds_to_next_tick(time.monotonic())
+        self._timer = loop.call_later(delay, self._on_tick)
+
+    def _on_tick(self) -> None:
+        self._timer = None
+        for tool_call_id in self._wheel.advance(time.monotonic()):
+            request = self._by_tool_call.get(tool_call_id)
+            if request is not None:
+                self._expire(request)
+        self._arm()
+
+    def _expire(self, request: PendingApproval) -> None:
+        self._remove(request)
+        if request.decision is not None:
+            return  # Decided, but no tool collected it (e.g., tool already gone)
+        _STATS.pending -= 1
+        _STATS.timed_out += 1
+        logger.error(f"[Approval] Timeout: {request.tool_call_id} ({request.tool_name})")
+        if request.future is not None and not request.future.done():
+            request.future.set_exception(
+                TimeoutError(f"Approval timeout for {request.tool_call_id}")
+            )
+
+
+def get_approval_engine(state: MutableMapping[str, Any]) -> ApprovalEngine:
+    """
+    The session's approval engine, created on first use.
+
+    Args:
+        state: session.state of the BIDI session
+
+    Returns:
+        ApprovalEngine stored under APPROVAL_ENGINE_STATE_KEY
+    """
+    engine = state.get(APPROVAL_ENGINE_STATE_KEY)
+    if engine is None:
+        engine = ApprovalEngine()
+        state[APPROVAL_ENGINE_STATE_KEY] = engine
+    return engine
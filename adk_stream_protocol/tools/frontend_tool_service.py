@@ -49,22 +49,52 @@ class FrontendToolDelegate:
 
     Note: SSE mode only supports Pattern A (approval + result in same request).
     See ADR-0008 for rationale.
+
+    Lifecycle:
+        The delegate lives as long as its session (see ags/_internal/registry.py).
+        close() fails pending calls and drops cached results when the session ends.
     """
 
-    def __init__(self, id_mapper: IDMapper | None = None) -> None:
+    def __init__(
+        self, id_mapper: IDMapper | None = None, max_pre_resolved_results: int = 256
+    ) -> None:
         """
         Initialize the delegate.
 
         Args:
             id_mapper: Optional ID mapper (creates new instance if not provided)
+            max_pre_resolved_results: Cached Pattern A results kept (oldest dropped first)
         """
         self._pending_calls: dict[str, asyncio.Future[dict[str, Any]]] = {}
         # SSE Mode Pattern A: Cache for results that arrive before Future creation
         # In Pattern A, tool-result arrives during message processing (to_adk_content)
         # but Future is created later when ADK calls the tool (execute_on_frontend)
         self._pre_resolved_results: dict[str, dict[str, Any]] = {}
+        self._max_pre_resolved_results = max_pre_resolved_results
         self._id_mapper = id_mapper or IDMapper()
 
+    @property
+    def pending_call_count(self) -> int:
+        """Number of frontend tool calls awaiting a result."""
+        return len(self._pending_calls)
+
+    @property
+    def pre_resolved_count(self) -> int:
+        """Number of cached results waiting for their tool call (SSE Pattern A)."""
+        return len(self._pre_resolved_results)
+
+    def close(self) -> None:
+        """
+        Release the delegate (session ended or evicted).
+
+        Pending calls fail with RuntimeError (execute_on_frontend returns Error),
+        cached results and ID mappings are dropped.
+        """
+        for tool_call_id in list(self._pending_calls):
+            self._reject_tool_call(tool_call_id, "Session closed before frontend tool result")
+        self._pre_resolved_results.clear()
+        self._id_mapper._clear()
+
     def set_function_call_id(self, tool_name: str, function_call_id: str) -> Result[None, str]:
         """
         Set the function_call.id for a tool_name.
@@ -84,6 +114,7 @@ class FrontendToolDelegate:
         tool_name: str,
         args: dict[str, Any],
         original_context: dict[str, Any] | None = None,
+        function_call_id: str | None = None,
     ) -> Result[dict[str, Any], str]:
         """
         Delegate tool execution to frontend and await result.
@@ -92,13 +123,17 @@ class FrontendToolDelegate:
             tool_name: Name of the tool to execute (may be intercepted tool name)
             args: Tool arguments
             original_context: Original function_call context (for intercepted tools)
+            function_call_id: The call's own id if known (ToolContext.function_call_id),
+                which must be outstanding; otherwise the oldest outstanding call of
+                the tool is used
 
         Returns:
             Ok(result dict) if execution succeeds, Error(str) if execution fails
         """
         # Resolve function_call.id using ID mapper
         # If not found, use fallback for testing
-        resolved_id = self._id_mapper.get_function_call_id(tool_name, original_context)
+        # Each execution claims its own id (parallel calls of the same tool in one turn)
+        resolved_id = self._id_mapper.claim(tool_name, original_context, function_call_id)
 
         if resolved_id:
             function_call_id = resolved_id
@@ -150,6 +185,10 @@ class FrontendToolDelegate:
             return Error(
                 f"Timeout waiting for frontend tool result (tool={tool_name}, id={function_call_id})"
             )
+        except asyncio.CancelledError:
+            # Run cancelled (e.g., client abandoned the stream): drop the wait, keep cancelling
+            self._pending_calls.pop(function_call_id, None)
+            raise
         except RuntimeError as e:
             logger.error(
                 f"[FrontendDelegate] Tool execution failed: "
@@ -204,6 +243,11 @@ class FrontendToolDelegate:
             f"[FrontendDelegate] Pre-resolving result for SSE mode (id={tool_call_id}). "
             f"Result will be used when tool executes."
         )
+        if len(self._pre_resolved_results) >= self._max_pre_resolved_results:
+            # Results whose tool call never came (e.g., aborted turn); drop the oldest
+            stale_id = next(iter(self._pre_resolved_results))
+            del self._pre_resolved_results[stale_id]
+            logger.warning(f"[FrontendDelegate] Dropped stale pre-resolved result (id={stale_id})")
         self._pre_resolved_results[tool_call_id] = result
 
     def _reject_tool_call(self, tool_call_id: str, error_message: str) -> None:
@@ -6,16 +6,41 @@ This package provides transport-level event handlers for streaming data.
 Components:
     - BidiEventReceiver: WebSocket upstream (Frontend → ADK)
     - BidiEventSender: WebSocket downstream (ADK → Frontend)
+    - BidiSessionRegistry: Reattach reconnecting /live clients to their live session
+    - ConnectionSupervisor: TaskGroup lifetime and immediate teardown of a /live connection
     - SseEventStreamer: HTTP SSE streaming (ADK → Frontend)
+    - OutboundFrameQueue: Bounded per-connection send queue for BidiEventSender
+    - ResumableSseRegistry: Last-Event-ID replay for HTTP SSE streams
+    - AgentRunGuard: Stop a /stream agent run once its HTTP clients are gone
 """
 
 from .bidi_event_receiver import BidiEventReceiver
 from .bidi_event_sender import BidiEventSender
+from .bidi_resume import BidiLiveSession, BidiSessionRegistry, ReattachableWebSocket
+from .connection_supervisor import ConnectionSupervisor, TeardownStats, teardown_stats
+from .send_queue import OutboundFrameQueue, SendQueueConfig, SendQueueStats
+from .sse_abandon import AbandonConfig, AbandonStats, AgentRunGuard, abandon_stats
 from .sse_event_streamer import SseEventStreamer
+from .sse_resume import ResumableSseRegistry, SseReplayBuffer
 
 
 __all__ = [
+    "AbandonConfig",
+    "AbandonStats",
+    "AgentRunGuard",
     "BidiEventReceiver",
     "BidiEventSender",
+    "BidiLiveSession",
+    "BidiSessionRegistry",
+    "ConnectionSupervisor",
+    "OutboundFrameQueue",
+    "ReattachableWebSocket",
+    "ResumableSseRegistry",
+    "SendQueueConfig",
+    "SendQueueStats",
     "SseEventStreamer",
+    "SseReplayBuffer",
+    "TeardownStats",
+    "abandon_stats",
+    "teardown_stats",
 ]
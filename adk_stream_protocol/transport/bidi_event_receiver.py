@@ -22,14 +22,33 @@ from google.adk.runners import Runner
 from google.adk.sessions import Session
 from google.genai import types
 from loguru import logger
+from pydantic import BaseModel
 
 from adk_stream_protocol.adk.session import Event as AdkEvent
-from adk_stream_protocol.adk.session import sync_conversation_history_to_session
+from adk_stream_protocol.adk.session import (
+    advance_history_cursor,
+    sync_conversation_history_to_session,
+)
+from adk_stream_protocol.ags import Error, Ok
 from adk_stream_protocol.ags.tools import execute_get_location, execute_process_payment
-from adk_stream_protocol.protocol.message_types import ChatMessage, process_chat_message_for_bidi
-from adk_stream_protocol.tools.approval_queue import ApprovalQueue
+from adk_stream_protocol.protocol.image_ingest import ImageIngest
+from adk_stream_protocol.protocol.message_types import (
+    predecode_images,
+    process_chat_message_for_bidi,
+)
+from adk_stream_protocol.protocol.upstream_events import (
+    AudioChunkEvent,
+    AudioControlEvent,
+    InterruptEvent,
+    MessageEvent,
+    PingEvent,
+    ToolResultEvent,
+    UpstreamEvent,
+    to_upstream_event,
+)
+from adk_stream_protocol.tools.approval_engine import PendingApproval, get_approval_engine
 from adk_stream_protocol.tools.frontend_tool_service import FrontendToolDelegate
-from adk_stream_protocol.transport._utils import ensure_session_state_key, log_implementation_gap
+from adk_stream_protocol.transport._utils import log_implementation_gap
 
 
 class BidiEventReceiver:
@@ -61,61 +80,62 @@ class BidiEventReceiver:
             bidi_agent_runner: ADK Runner with session_service
 
         Note:
-            Tool execution deferral state is accessed via session.state["pending_confirmations"]
-            Approval queue for BLOCKING tools is stored in session.state["approval_queue"]
+            Approval state (BLOCKING tools and Legacy Approval Mode) lives in the
+            session's ApprovalEngine, session.state["approval_engine"]
         """
         self._session = session
         self._delegate = frontend_delegate
         self._live_request_queue = live_request_queue
         self._ag_runner = bidi_agent_runner
 
-        # Setup approval queue for BLOCKING tools (BIDI Blocking Mode)
-        approval_queue = ApprovalQueue()
-        session.state["approval_queue"] = approval_queue
-        logger.info("[BidiEventReceiver] ✓ ApprovalQueue initialized and stored in session.state")
-
-        # Initialize session state dicts upfront (B2: consistency improvement)
-        # These are used by both BidiEventSender and BidiEventReceiver
-        ensure_session_state_key(session, "pending_long_running_calls", {})
-        ensure_session_state_key(session, "confirmation_id_mapping", {})
-        logger.info("[BidiEventReceiver] ✓ Session state dicts initialized")
+        # Approval engine shared with BidiEventSender and the BLOCKING tools
+        self._approvals = get_approval_engine(session.state)
+        logger.info("[BidiEventReceiver] ✓ ApprovalEngine ready in session.state")
 
         # Set mode to "bidi" for tool functions to detect mode
         session.state["mode"] = "bidi"
         logger.info("[BidiEventReceiver] ✓ Session mode set to 'bidi'")
 
-    async def handle_event(self, event: dict[str, Any]) -> None:
+    async def handle_event(self, event: UpstreamEvent | dict[str, Any]) -> dict[str, Any] | None:
         """
         Route event to appropriate handler based on event type.
 
         Args:
-            event: WebSocket event dict with 'type' and optional 'data'
+            event: Typed upstream event (see parse_upstream_event), or an event dict
+                that is validated here
+
+        Returns:
+            Control message to send back to the client (non-SSE JSON, like pong), or None
+
+        Raises:
+            pydantic.ValidationError: Event dict does not match its type
         """
-        event_type = event.get("type")
-        event_version = event.get("version", "unknown")
+        if not isinstance(event, BaseModel):
+            event = to_upstream_event(event)
 
         # Ignore ping events in logs (too noisy)
-        if event_type != "ping":
-            logger.info(f"[BIDI] Received event: {event_type} (v{event_version})")
+        if not isinstance(event, PingEvent):
+            logger.info(f"[BIDI] Received event: {event.type} (v{event.version or 'unknown'})")
 
         # Route to specific handler
-        if event_type == "message":
-            await self._handle_message_event(event)
-        elif event_type == "interrupt":
+        if isinstance(event, MessageEvent):
+            return await self._handle_message_event(event)
+        elif isinstance(event, InterruptEvent):
             await self._handle_interrupt_event(event)
-        elif event_type == "audio_control":
+        elif isinstance(event, AudioControlEvent):
             await self._handle_audio_control_event(event)
-        elif event_type == "audio_chunk":
+        elif isinstance(event, AudioChunkEvent):
             await self._handle_audio_chunk_event(event)
-        elif event_type == "tool_result":
+        elif isinstance(event, ToolResultEvent):
             await self._handle_tool_result_event(event)
-        elif event_type == "ping":
+        elif isinstance(event, PingEvent):
             # Ping events are handled at WebSocket layer, no action needed
             pass
         else:
-            logger.warning(f"[BIDI] Unknown event type: {event_type}")
+            logger.warning(f"[BIDI] Unknown event type: {event.type}")
+        return None
 
-    async def _handle_message_event(self, event: dict[str, Any]) -> None:
+    async def _handle_message_event(self, event: MessageEvent) -> dict[str, Any] | None:
         """
         Handle 'message' event: chat messages with text/images/tool responses.
 
@@ -126,14 +146,26 @@ class BidiEventReceiver:
         4. Send images via send_realtime()
         5. Handle FunctionResponse specially (append to session history)
         6. Send regular text via send_content()
+
+        Delta history: with historyCursor set, messages holds only the tail after
+        the cursor and no history is synced (the session already has it). A stale
+        cursor drops the event and returns a history_mismatch control message;
+        the client then resends the event with its full history.
+
+        Messages were parsed once, with the event (parse_upstream_event); the
+        same ChatMessage objects feed history sync and BIDI conversion.
+
+        Returns:
+            history_mismatch control message on a stale historyCursor, else None
         """
         # Flat structure: payload fields at same level as metadata
         # Create message_data dict for process_chat_message_for_bidi compatibility
+        messages = event.messages
         message_data = {
-            "messages": event.get("messages", []),
-            "id": event.get("id"),
-            "trigger": event.get("trigger"),
-            "messageId": event.get("messageId"),
+            "messages": messages,
+            "id": event.id,
+            "trigger": event.trigger,
+            "messageId": event.messageId,
         }
 
         # Track whether any queue operation was performed
@@ -141,25 +173,32 @@ class BidiEventReceiver:
 
         # BUG-006 FIX: Sync history for BIDI mode
         # When switching from Gemini Direct or ADK SSE to BIDI
-        messages = message_data.get("messages", [])
+        history_cursor = event.historyCursor
         if messages:
-            # Convert to ChatMessage objects for sync function
-            chat_messages = [ChatMessage(**msg) for msg in messages]
-
-            # Sync conversation history
-            await sync_conversation_history_to_session(
-                session=self._session,
-                session_service=self._ag_runner.session_service,
-                messages=chat_messages,
-                current_mode="BIDI",
-            )
+            match advance_history_cursor(self._session.id, messages, history_cursor):
+                case Error(expected):
+                    return {"type": "history_mismatch", "expectedCursor": expected}
+                case Ok(cursor):
+                    logger.info(f"[BIDI] History cursor: {cursor}")
+
+            # Sync conversation history (full history only; a delta has nothing to sync)
+            if history_cursor is None:
+                await sync_conversation_history_to_session(
+                    session=self._session,
+                    session_service=self._ag_runner.session_service,
+                    messages=messages,
+                    current_mode="BIDI",
+                )
 
         # Process AI SDK v6 message format → ADK format
         # Separates image blobs from text parts (Live API requirement)
         # Tool confirmations handled in ChatMessage.to_adk_content()
         # Pass ID mapper for tool-result part resolution
+        # Large images are decoded on the offload pool first (keeps other connections' audio flowing)
+        image_ingest = ImageIngest()
+        await predecode_images(messages[-1:], image_ingest)
         image_blobs, text_content = process_chat_message_for_bidi(
-            message_data, id_mapper=self._delegate._id_mapper
+            message_data, id_mapper=self._delegate._id_mapper, image_ingest=image_ingest
         )
 
         # Send images/videos to ADK LiveRequestQueue
@@ -204,6 +243,7 @@ class BidiEventReceiver:
             )
             logger.error("[BIDI]   2. Empty message_data with no content")
             logger.error("[BIDI]   3. Logic bug in event processing path")
+        return None
 
     async def _handle_function_response(self, text_content: types.Content) -> None:
         """
@@ -218,6 +258,9 @@ class BidiEventReceiver:
         """
         logger.info("[BIDI] Processing FunctionResponse")
 
+        # Approval decisions of this message (one approval step answered at once)
+        confirmations: list[tuple[str, dict[str, Any]]] = []
+
         # Process each FunctionResponse part
         for part in text_content.parts or []:
             if hasattr(part, "function_response") and part.function_response:
@@ -230,7 +273,7 @@ class BidiEventReceiver:
                 if func_resp.name == "adk_request_confirmation":
                     logger.info("[BIDI] Handling adk_request_confirmation (not sending to ADK)")
                     if func_resp.id and response_data is not None:
-                        await self._handle_confirmation_approval(func_resp.id, response_data)
+                        confirmations.append((func_resp.id, response_data))
                     else:
                         logger.error(
                             f"[BIDI] Invalid confirmation approval: id={func_resp.id}, "
@@ -258,174 +301,96 @@ class BidiEventReceiver:
 
             continue
 
-    async def _handle_confirmation_approval(
-        self, confirmation_id: str, response_data: dict[str, Any]
-    ) -> None:
-        """
-        Handle confirmation approval: Route to BIDI Blocking Mode (BLOCKING) or Legacy Approval Mode.
+        if confirmations:
+            await self._handle_confirmation_approvals(confirmations)
 
-        Args:
-            confirmation_id: The ID of the confirmation FunctionResponse (lookup key)
-            response_data: FunctionResponse.response dict with {"confirmed": bool} or {"approved": bool}
-        """
-        logger.info("=" * 80)
-        logger.info("[BIDI-APPROVAL] ===== APPROVAL MESSAGE ARRIVED =====")
-        logger.info(
-            f"[BIDI-APPROVAL] confirmation_id={confirmation_id}, response_data={response_data}"
-        )
-        logger.info("=" * 80)
-
-        # Route to appropriate handler based on approval_queue presence
-        if self._session.state.get("approval_queue"):
-            await self._handle_blocking_mode_approval(confirmation_id, response_data)
-        else:
-            await self._handle_legacy_mode_approval(confirmation_id, response_data)
-
-    async def _handle_blocking_mode_approval(
-        self, confirmation_id: str, response_data: dict[str, Any]
+    async def _handle_confirmation_approvals(
+        self, confirmations: list[tuple[str, dict[str, Any]]]
     ) -> None:
         """
-        Handle confirmation approval in BIDI Blocking Mode mode.
+        Handle the approval decisions of one message: Apply them as one batch, then
+        route each tool to BIDI Blocking Mode (BLOCKING) or Legacy Approval Mode.
 
-        BIDI Blocking Mode (BLOCKING mode):
-        - Tool is BLOCKING and awaiting approval via approval_queue
-        - Submit approval decision to approval_queue
-        - Tool function will resume and return final result
+        The frontend answers every tool-approval-request of an approval step in one
+        message (see BidiEventSender._flush_approval_step). All decisions are recorded
+        in the ApprovalEngine before any tool resumes.
 
         Args:
-            confirmation_id: The ID of the confirmation FunctionResponse (lookup key)
-            response_data: FunctionResponse.response dict with {"confirmed": bool} or {"approved": bool}
+            confirmations: (confirmation_id, FunctionResponse.response) pairs, with
+                response {"confirmed": bool} or {"approved": bool}
         """
-        logger.info(
-            "[BIDI-APPROVAL] BIDI Blocking Mode: BLOCKING mode detected (approval_queue exists)"
-        )
-
-        approval_queue: ApprovalQueue | None = self._session.state.get("approval_queue")
-        if approval_queue is None:
-            # This should never happen - caller verified approval_queue exists
-            logger.error("[BIDI-APPROVAL] BIDI Blocking Mode: approval_queue unexpectedly None")
-            return
-
-        # Look up original tool_call_id using confirmation_id
-        confirmation_id_mapping = self._session.state.get("confirmation_id_mapping", {})
-        original_tool_call_id = confirmation_id_mapping.get(confirmation_id)
-
-        if not original_tool_call_id:
-            logger.error(
-                f"[BIDI-APPROVAL] BIDI Blocking Mode: confirmation_id {confirmation_id} not found in mapping"
-            )
-            return
-
-        # Extract approval decision (try both "confirmed" and "approved" fields for compatibility)
-        approved = response_data.get("approved", response_data.get("confirmed", False))
-
-        logger.info(
-            f"[BIDI-APPROVAL] BIDI Blocking Mode: Submitting to approval_queue: "
-            f"tool_call_id={original_tool_call_id}, approved={approved}"
-        )
-
-        # Submit to approval_queue (this unblocks the BLOCKING tool function)
-        approval_queue.submit_approval(original_tool_call_id, approved)
-
-        # Clean up pending_long_running_calls to allow final tool-output-available to be sent
-        # IMPORTANT: Without this, BidiEventSender will skip the final result event
-        pending_calls = self._session.state.get("pending_long_running_calls", {})
-        if original_tool_call_id in pending_calls:
-            del pending_calls[original_tool_call_id]
+        logger.info("=" * 80)
+        logger.info("[BIDI-APPROVAL] ===== APPROVAL MESSAGE ARRIVED =====")
+        for confirmation_id, response_data in confirmations:
             logger.info(
-                f"[BIDI-APPROVAL] BIDI Blocking Mode: Removed {original_tool_call_id} from pending_long_running_calls"
+                f"[BIDI-APPROVAL] confirmation_id={confirmation_id}, response_data={response_data}"
             )
+        logger.info("=" * 80)
 
-        # Clean up confirmation mapping
-        del confirmation_id_mapping[confirmation_id]
-        logger.info(
-            f"[BIDI-APPROVAL] BIDI Blocking Mode: Cleaned up confirmation mapping for {confirmation_id}"
-        )
+        # Extract approval decisions (try both "approved" and "confirmed" fields for compatibility)
+        decisions = {
+            confirmation_id: bool(response_data.get("approved", response_data.get("confirmed")))
+            for confirmation_id, response_data in confirmations
+        }
+        decided = self._approvals.decide_batch(decisions)
+        if not decided:
+            logger.error(f"[BIDI-APPROVAL] No pending approval for {list(decisions)}")
+            return
 
-        logger.info(
-            "[BIDI-APPROVAL] BIDI Blocking Mode: ✓ Approval decision submitted to ApprovalQueue"
-        )
-        logger.info("[BIDI-APPROVAL] BIDI Blocking Mode: Tool will resume and return final result")
+        # Route on how each tool handles its approval: a LongRunningFunctionTool returned
+        # a pending status (deferred); a BLOCKING tool awaits (or will await) the decision
+        deferred: list[PendingApproval] = []
+        for request in decided:
+            if request.deferred:
+                deferred.append(request)
+            else:
+                logger.info(
+                    f"[BIDI-APPROVAL] BIDI Blocking Mode: ✓ Decision recorded: "
+                    f"tool_call_id={request.tool_call_id}, approved={request.decision}; "
+                    f"tool will resume and return final result"
+                )
+        if deferred:
+            await self._handle_legacy_mode_approvals(deferred)
 
-    async def _handle_legacy_mode_approval(
-        self, confirmation_id: str, response_data: dict[str, Any]
-    ) -> None:
+    async def _handle_legacy_mode_approvals(self, requests: list[PendingApproval]) -> None:
         """
-        Handle confirmation approval in Legacy Approval Mode (LongRunningFunctionTool).
+        Handle decided approvals in Legacy Approval Mode (LongRunningFunctionTool).
 
         Legacy Approval Mode (LongRunningFunctionTool):
-        - Tool returned pending status without execution
+        - Tools returned pending status without execution
         - Server executes actual tool logic after approval
-        - Server sends FunctionResponse with execution result to ADK
+        - Server sends the FunctionResponses with execution results to ADK, in one message
 
         Args:
-            confirmation_id: The ID of the confirmation FunctionResponse (lookup key)
-            response_data: FunctionResponse.response dict with {"confirmed": bool}
+            requests: Decided requests of deferred tools
         """
         logger.info(
-            "[BIDI-APPROVAL] Legacy Approval Mode: LongRunningFunctionTool (no approval_queue)"
+            f"[BIDI-APPROVAL] Legacy Approval Mode: {len(requests)} LongRunningFunctionTool(s)"
         )
 
-        # Look up original tool_call_id using confirmation_id from session.state
-        try:  # nosemgrep: forbid-try-except - legitimate session.state access with KeyError handling
-            confirmation_id_mapping = self._session.state["confirmation_id_mapping"]
+        results: list[tuple[PendingApproval, dict[str, Any]]] = []
+        for request in requests:
+            approved = bool(request.decision)
+            logger.info("=" * 80)
+            logger.info("[BIDI-APPROVAL] ===== EXECUTING TOOL LOGIC (Legacy Approval Mode) =====")
             logger.info(
-                f"[BIDI-APPROVAL] confirmation_id_mapping keys: {list(confirmation_id_mapping.keys())}"
-            )
-        except KeyError as e:
-            logger.error(
-                f"[BIDI-APPROVAL] KeyError accessing confirmation_id_mapping: {e}. "
-                f"session.state keys: {list(self._session.state.keys())}"
+                f"[BIDI-APPROVAL] tool_name={request.tool_name}, args={request.args}, "
+                f"approved={approved}"
             )
-            return
+            logger.info("=" * 80)
 
-        if confirmation_id not in confirmation_id_mapping:
-            logger.error(
-                f"[BIDI-APPROVAL] confirmation_id {confirmation_id} not found in mapping. "
-                f"Available keys: {list(confirmation_id_mapping.keys())}"
-            )
-            return
+            # Execute tool logic
+            result = await self._execute_legacy_tool(request.tool_name, request.args, approved)
+            logger.info(f"[BIDI-APPROVAL] Execution result: {result}")
+            results.append((request, result))
 
-        # Get original tool_call_id
-        tool_call_id = confirmation_id_mapping[confirmation_id]
-        logger.info(
-            f"[BIDI-APPROVAL] Resolved confirmation mapping: {confirmation_id} → {tool_call_id}"
-        )
+        # Send FunctionResponses to ADK
+        self._send_function_responses_to_adk(results)
 
-        # Extract approval status
-        # response_data is {"confirmed": True/False} from ai_sdk_v6_compat.py
-        approved = response_data.get("confirmed", False)
-        logger.info(f"[BIDI-APPROVAL] Approval status: {approved}")
-
-        # ===== GET PENDING LONG-RUNNING CALL DETAILS =====
-        pending_calls = self._session.state.get("pending_long_running_calls", {})
-        if tool_call_id not in pending_calls:
-            logger.error(
-                f"[BIDI-APPROVAL] tool_call_id {tool_call_id} not found in pending_long_running_calls. "
-                f"Available keys: {list(pending_calls.keys())}"
-            )
-            return
-
-        pending_call = pending_calls[tool_call_id]
-        tool_name = pending_call["name"]
-        tool_args = pending_call["args"]
-
-        logger.info("=" * 80)
-        logger.info("[BIDI-APPROVAL] ===== EXECUTING TOOL LOGIC (Legacy Approval Mode) =====")
-        logger.info(f"[BIDI-APPROVAL] tool_name={tool_name}, args={tool_args}, approved={approved}")
-        logger.info("=" * 80)
-
-        # Execute tool logic
-        result = await self._execute_legacy_tool(tool_name, tool_args, approved)
-        logger.info(f"[BIDI-APPROVAL] Execution result: {result}")
-
-        # Send FunctionResponse to ADK
-        await self._send_function_response_to_adk(tool_call_id, tool_name, result)
-
-        # Clean up mappings
-        del confirmation_id_mapping[confirmation_id]
-        del pending_calls[tool_call_id]
-        logger.info(f"[BIDI-APPROVAL] Cleaned up mappings for {tool_call_id}")
+        # Decisions handled: drop the requests
+        for request in requests:
+            self._approvals.discard(request.tool_call_id)
+            logger.info(f"[BIDI-APPROVAL] Cleaned up approval for {request.tool_call_id}")
 
     async def _execute_legacy_tool(
         self, tool_name: str, tool_args: dict[str, Any], approved: bool
@@ -464,41 +429,41 @@ class BidiEventReceiver:
             else:
                 return {"success": False, "error": f"{tool_name} rejected by user"}
 
-    async def _send_function_response_to_adk(
-        self, tool_call_id: str, tool_name: str, result: dict[str, Any]
+    def _send_function_responses_to_adk(
+        self, results: list[tuple[PendingApproval, dict[str, Any]]]
     ) -> None:
         """
-        Send FunctionResponse to ADK via LiveRequestQueue.
+        Send FunctionResponses to ADK via LiveRequestQueue (one message for the batch).
 
         Args:
-            tool_call_id: Original tool call ID
-            tool_name: Name of the tool
-            result: Tool execution result
+            results: (approval request of the original tool call, tool execution result)
         """
         logger.info("=" * 80)
         logger.info("[BIDI-APPROVAL] ===== SENDING FUNCTIONRESPONSE TO ADK =====")
-        logger.info(f"[BIDI-APPROVAL] id={tool_call_id}, name={tool_name}")
+        for request, _ in results:
+            logger.info(f"[BIDI-APPROVAL] id={request.tool_call_id}, name={request.tool_name}")
         logger.info("=" * 80)
 
-        # Create FunctionResponse with same id and name as original FunctionCall
+        # Create FunctionResponses with same id and name as the original FunctionCalls
         function_response = types.Content(
             role="user",
             parts=[
                 types.Part(
                     function_response=types.FunctionResponse(
-                        id=tool_call_id, name=tool_name, response=result
+                        id=request.tool_call_id, name=request.tool_name, response=result
                     )
                 )
+                for request, result in results
             ],
         )
 
         # Send to ADK via LiveRequestQueue
         self._live_request_queue.send_content(function_response)
 
-        logger.info("[BIDI-APPROVAL] ✓ FunctionResponse sent to ADK")
-        logger.info("[BIDI-APPROVAL] ADK will continue execution with this result")
+        logger.info(f"[BIDI-APPROVAL] ✓ {len(results)} FunctionResponse(s) sent to ADK")
+        logger.info("[BIDI-APPROVAL] ADK will continue execution with these results")
 
-    async def _handle_interrupt_event(self, event: dict[str, Any]) -> None:
+    async def _handle_interrupt_event(self, event: InterruptEvent) -> None:
         """
         Handle 'interrupt' event: user interruption during streaming.
 
@@ -509,26 +474,24 @@ class BidiEventReceiver:
 
         Reference: https://google.github.io/adk-docs/streaming/dev-guide/part3/
         """
-        reason = event.get("reason", "user_abort")
-        logger.info(f"[BIDI] User interrupted (reason: {reason})")
+        logger.info(f"[BIDI] User interrupted (reason: {event.reason})")
         logger.info("[BIDI] Note: LiveRequestQueue remains open, interrupt is a state change only")
 
-    async def _handle_audio_control_event(self, event: dict[str, Any]) -> None:
+    async def _handle_audio_control_event(self, event: AudioControlEvent) -> None:
         """
         Handle 'audio_control' event: audio input start/stop.
 
         Tracks audio recording state (CMD key press/release).
         Actual audio chunks are streamed separately via audio_chunk events.
         """
-        action = event.get("action")
-        if action == "start":
+        if event.action == "start":
             logger.info("[BIDI] Audio input started (CMD key pressed)")
-        elif action == "stop":
+        elif event.action == "stop":
             logger.info("[BIDI] Audio input stopped (CMD key released, auto-send)")
         # Note: Audio chunks are streamed separately via audio_chunk events
         # ADK processes the audio in real-time through LiveRequestQueue
 
-    async def _handle_audio_chunk_event(self, event: dict[str, Any]) -> None:
+    async def _handle_audio_chunk_event(self, event: AudioChunkEvent) -> None:
         """
         Handle 'audio_chunk' event: streaming audio data.
 
@@ -536,35 +499,39 @@ class BidiEventReceiver:
         - Format: 16-bit signed integer, 16kHz, mono
         - Encoded: base64
         - Sent to ADK via LiveRequestQueue
-        """
-        # Flat structure: payload fields at same level as metadata
-        chunk_base64 = event.get("chunk")
 
-        if chunk_base64:
+        JSON fallback for clients that do not send binary frames (see send_audio_bytes()).
+        """
+        if event.chunk:
             # Decode base64 PCM audio data
-            audio_bytes = base64.b64decode(chunk_base64)
+            self.send_audio_bytes(base64.b64decode(event.chunk))
 
-            # Frontend now sends raw PCM audio via AudioWorklet
-            # Format: 16-bit signed integer, 16kHz, mono
-            # This matches ADK Live API requirements
+    def send_audio_bytes(self, audio_bytes: bytes) -> None:
+        """
+        Send raw PCM16 microphone audio to ADK.
 
-            # Create audio blob for ADK
-            # Using audio/pcm mime type (raw PCM from AudioWorklet)
-            audio_blob = types.Blob(mime_type="audio/pcm", data=audio_bytes)
+        Fast path for binary WebSocket frames: /live routes them here directly,
+        skipping event validation, base64 decoding, handle_event() routing and logging.
 
-            # Send to ADK via LiveRequestQueue
-            self._live_request_queue.send_realtime(audio_blob)
+        Args:
+            audio_bytes: Raw PCM audio (16-bit signed integer, 16kHz, mono)
+        """
+        # Using audio/pcm mime type (raw PCM from AudioWorklet)
+        # This matches ADK Live API requirements
+        audio_blob = types.Blob(mime_type="audio/pcm", data=audio_bytes)
+
+        # Send to ADK via LiveRequestQueue
+        self._live_request_queue.send_realtime(audio_blob)
 
-    async def _handle_tool_result_event(self, event: dict[str, Any]) -> None:
+    async def _handle_tool_result_event(self, event: ToolResultEvent) -> None:
         """
         Handle 'tool_result' event: frontend tool execution result.
 
         Resolves pending FrontendToolDelegate.execute_on_frontend() calls.
         This event is sent by frontend after executing tools like get_location, change_bgm.
         """
-        # Flat structure: payload fields at same level as metadata
-        tool_call_id = event.get("toolCallId")
-        result = event.get("result")
+        tool_call_id = event.toolCallId
+        result = event.result
 
         if tool_call_id and result:
             self._delegate.resolve_tool_result(tool_call_id, result)
@@ -573,5 +540,5 @@ class BidiEventReceiver:
 
         log_implementation_gap(
             "Invalid tool_result event. should have toolCallId and result",
-            event=event,
+            event=event.model_dump(exclude_none=True),
         )
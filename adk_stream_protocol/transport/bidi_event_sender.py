@@ -20,17 +20,37 @@ from typing import Any
 
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketDisconnect
+from google.adk.events import Event
 from google.adk.sessions import Session
 from loguru import logger
 
 from adk_stream_protocol.ags import Error, Ok
+from adk_stream_protocol.protocol.delta_coalescer import CoalesceConfig
+from adk_stream_protocol.protocol.offload import get_offload_pool
+from adk_stream_protocol.protocol.pcm_frame import encode_pcm_frame
+from adk_stream_protocol.protocol.sse_frame import (
+    FINISH_STEP_FRAME,
+    START_STEP_FRAME,
+    SseFrame,
+)
 from adk_stream_protocol.protocol.stream_protocol import (
     StreamProtocolConverter,
     stream_adk_to_ai_sdk,
 )
+from adk_stream_protocol.tools.approval_engine import get_approval_engine
 from adk_stream_protocol.tools.frontend_tool_service import FrontendToolDelegate
-from adk_stream_protocol.transport._utils import ensure_session_state_key
-from adk_stream_protocol.utils import _parse_sse_event_data
+from adk_stream_protocol.transport.bidi_resume import ReattachableWebSocket
+from adk_stream_protocol.transport.send_queue import (
+    OutboundFrameQueue,
+    SendQueueConfig,
+    SendQueueStats,
+)
+
+
+# Frames that belong to a tool call's input; any other frame closes the approval step
+_TOOL_INPUT_FRAME_TYPES = frozenset(
+    {"tool-input-start", "tool-input-delta", "tool-input-available"}
+)
 
 
 class BidiEventSender:
@@ -45,35 +65,65 @@ class BidiEventSender:
     Counterpart: BidiEventReceiver handles upstream (WebSocket → ADK).
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917 - optional settings extend the original signature
         self,
-        websocket: WebSocket,
+        websocket: WebSocket | ReattachableWebSocket,
         frontend_delegate: FrontendToolDelegate,
         session: Session,
         agent_model: str | None = None,  # Agent model name for modelVersion fallback
         confirmation_tools: list[str] | None = None,  # Tools requiring confirmation
+        coalesce: CoalesceConfig | None = None,  # Optional text/reasoning delta coalescing
+        pcm_binary: bool = False,  # Send PCM as binary WebSocket frames (negotiated)
+        send_queue: SendQueueConfig | None = None,  # Bounded outbound queue + writer task
     ) -> None:
         """
         Initialize BIDI event sender.
 
         Args:
-            websocket: FastAPI WebSocket for sending events
+            websocket: FastAPI WebSocket for sending events, or a ReattachableWebSocket
+                that buffers events while the client reconnects (see bidi_resume.py)
             frontend_delegate: Frontend tool delegate for ID mapping
             session: ADK Session (for invocation_id tracking and shared state access)
             agent_model: Agent model name (used as fallback when event.model_version is None)
             confirmation_tools: List of tool names requiring confirmation (e.g., ["process_payment"])
+            coalesce: Delta coalescing windows (None = coalescing disabled)
+            pcm_binary: Send data-pcm audio as binary WebSocket frames (see pcm_frame.py).
+                Only enable when the client negotiated PCM_BINARY_SUBPROTOCOL.
+            send_queue: Bounded outbound queue settings (None = await each send inline).
+                With a queue, a writer task drains frames to the socket so a slow
+                client does not stall run_live() consumption (see send_queue.py).
 
         Note:
-            Tool execution deferral state is stored in session.state["pending_confirmations"]
+            Approval requests are registered in the session's ApprovalEngine
+            (session.state["approval_engine"], shared with BidiEventReceiver)
         """
         self._ws = websocket
         self._delegate = frontend_delegate
         self._session = session
         self._agent_model = agent_model
         self._confirmation_tools = set(confirmation_tools or [])
+        self._coalesce = coalesce
+        self._pcm_binary = pcm_binary
+        self._send_queue_config = send_queue
+        self._queue: OutboundFrameQueue | None = None
+        # Binary PCM framing: block id advances per turn, sequence restarts per block
+        self._pcm_block_id = 0
+        self._pcm_sequence = 0
         # Track tool-input-start events that require confirmation
         # Maps tool_call_id -> tool_name for pending confirmation injection
         self._pending_confirmation: dict[str, str] = {}
+        # Approval requests of the ADK event being converted: (tool_call_id, confirmation_id).
+        # All tool calls of one model turn share one approval step (see _flush_approval_step)
+        self._approval_batch: list[tuple[str, str]] = []
+        # Approval tool calls seen in the ADK event whose frames are not all handled yet
+        self._approval_calls_expected: set[str] = set()
+        # False once a batched call was not announced by an ADK event (unknown turn size)
+        self._approval_batch_known = True
+
+    @property
+    def send_queue_stats(self) -> SendQueueStats | None:
+        """Depth and drop counters of the current outbound queue (None without a queue)."""
+        return self._queue.stats if self._queue is not None else None
 
     async def send_events(self, live_events: AsyncIterable[Any]) -> None:
         """
@@ -96,27 +146,47 @@ class BidiEventSender:
         # Initialize invocation_id capture
         self._current_invocation_id = None
 
+        if self._send_queue_config is not None:
+            self._queue = OutboundFrameQueue(
+                self._send_sse_event, self._send_queue_config, send_batch=self._send_sse_batch
+            )
+            self._queue.start()
+
         try:
             async for sse_event in stream_adk_to_ai_sdk(
                 self._events_with_invocation_capture(live_events),
                 mode="adk-bidi",  # Chunk logger: distinguish from adk-sse mode
                 agent_model=self._agent_model,  # Pass agent model for modelVersion fallback
+                coalesce=self._coalesce,
             ):
                 event_count += 1
+                frame = SseFrame.coerce(sse_event)
 
                 # Log SSE output (after ADK conversion)
-                self._log_sse_output(sse_event)
+                self._log_sse_output(frame)
+
+                # Frames after the turn's tool input close its approval step
+                if frame.type not in _TOOL_INPUT_FRAME_TYPES:
+                    await self._flush_approval_step()
 
                 # Check if this is a tool-input-available event requiring confirmation
-                should_send_now = await self._handle_confirmation_if_needed(sse_event)
+                should_send_now = await self._handle_confirmation_if_needed(frame)
 
                 if should_send_now:
-                    await self._send_sse_event(sse_event)
+                    await self._deliver(frame)
+
+                # Every approval tool call of the ADK event is batched: send the step now,
+                # run_live() produces nothing more until the tools are answered
+                if self._approval_batch_complete():
+                    await self._flush_approval_step()
 
                 # Log [DONE] markers for debugging multi-turn flow
-                if sse_event.strip() == "data: [DONE]":
+                if frame.is_done:
                     logger.info("[BIDI] Sent [DONE] marker (turn completed, stream continues)")
 
+            await self._flush_approval_step()
+            if self._queue is not None:
+                await self._queue.close()  # Drain remaining frames
             logger.info(f"[BIDI] Sent {event_count} events to client")
         except WebSocketDisconnect:
             logger.warning(
@@ -126,6 +196,25 @@ class BidiEventSender:
             # Gracefully stop - do not re-raise
             return
         # no except any other exceptions. Let them propagate to caller for handling.
+        finally:
+            if self._queue is not None:
+                await self._queue.cancel()
+                logger.info(f"[BIDI] Send queue stats: {self._queue.stats}")
+
+    async def _deliver(self, frame: SseFrame) -> None:
+        """
+        Hand a frame to the socket: enqueue it, or send inline without a queue.
+
+        Args:
+            frame: Frame to send
+
+        Raises:
+            WebSocketDisconnect: Client disconnected (inline send or writer task)
+        """
+        if self._queue is not None:
+            await self._queue.put(frame)
+        else:
+            await self._send_sse_event(frame)
 
     async def _events_with_invocation_capture(
         self, live_events: AsyncIterable[Any]
@@ -148,8 +237,22 @@ class BidiEventSender:
             # Log ADK events (before conversion to SSE) - skip audio
             self._log_adk_event(event)
 
+            # Only recorded here: send_events() sends the approval step once the
+            # consumer has handled the frames of these calls
+            self._approval_calls_expected = self._approval_call_ids(event)
+
             yield event
 
+    def _approval_call_ids(self, event: Any) -> set[str]:
+        """Ids of the event's function calls that require confirmation."""
+        if not isinstance(event, Event):
+            return set()
+        return {
+            call.id
+            for call in event.get_function_calls()
+            if call.name in self._confirmation_tools and call.id
+        }
+
     def _log_adk_event(self, event: Any) -> None:
         """
         Log ADK events for debugging. Focuses on tool-related events, skips audio.
@@ -182,77 +285,51 @@ class BidiEventSender:
         if has_tool_content or event_type in ["TurnComplete", "ToolOutputAvailable"]:
             logger.info(f"[ADK→SSE INPUT] Event type: {event_type}")
 
-    def _log_sse_output(self, sse_event: str) -> None:
+    def _log_sse_output(self, frame: SseFrame) -> None:
         """
         Log SSE output events for debugging. Focuses on tool-related events.
 
         Args:
-            sse_event: SSE-formatted event string
+            frame: SSE frame (event dict is read directly, no parsing)
         """
-        if not sse_event.startswith("data:") or "DONE" in sse_event:
-            return
-
-        match _parse_sse_event_data(sse_event):
-            case Ok(event_data):
-                event_type = event_data.get("type", "unknown")
-                # Log tool-related events only
-                if event_type in [
-                    "tool-input-start",
-                    "tool-input-available",
-                    "tool-output-available",
-                ]:
-                    logger.info(
-                        f"[ADK→SSE OUTPUT] {event_type}: {event_data.get('toolName', 'N/A')}"
-                    )
-                elif event_type in ["finish", "start"]:
-                    logger.info(f"[ADK→SSE OUTPUT] {event_type}")
-
-    async def _send_sse_event(self, sse_event: str) -> bool:  # noqa: C901 - event routing requires complexity
+        # Check frame.type first: reading frame.event would build data-pcm payloads
+        event_type = frame.type
+        # Log tool-related events only
+        if event_type in [
+            "tool-input-start",
+            "tool-input-available",
+            "tool-output-available",
+        ]:
+            event_data = frame.event or {}
+            logger.info(f"[ADK→SSE OUTPUT] {event_type}: {event_data.get('toolName', 'N/A')}")
+        elif event_type in ["finish", "start"]:
+            logger.info(f"[ADK→SSE OUTPUT] {event_type}")
+
+    async def _send_sse_event(self, sse_event: SseFrame | str) -> bool:
         """
-        Send SSE-formatted event to WebSocket with logging and ID mapping.
+        Send SSE frame to WebSocket with logging and ID mapping.
 
         Args:
-            sse_event: SSE-formatted string like 'data: {...}\\n\\n'
+            sse_event: SseFrame, or SSE-formatted string like 'data: {...}\\n\\n'
 
         Returns:
             True if sent successfully, False if send failed (B3: graceful error handling)
         """
-        # Log event types for debugging
-        if sse_event.startswith("data:"):
-            # Skip DONE event
-            if "DONE" == sse_event.strip()[5:].strip():
-                try:
-                    await self._ws.send_text(sse_event)
-                    return True
-                except WebSocketDisconnect:
-                    raise
-                except Exception as e:
-                    logger.error(f"[BIDI-SEND] Failed to send [DONE] event: {e!s}")
-                    return False
-
-            match _parse_sse_event_data(sse_event):
-                case Ok(event_data):
-                    event_type = event_data.get("type", "unknown")
-                    # Detailed logging moved to send_events loop
-
-                    # Register function_call.id mapping for frontend delegate tools
-                    if event_type == "tool-input-available":
-                        tool_name = event_data.get("toolName")
-                        tool_call_id = event_data.get("toolCallId")
-                        if tool_name and tool_call_id and self._delegate:
-                            result = self._delegate.set_function_call_id(tool_name, tool_call_id)
-                            match result:
-                                case Ok(_):
-                                    logger.debug(
-                                        f"[BIDI-SEND] Registered mapping: {tool_name} → {tool_call_id}"
-                                    )
-                                case Error(error_msg):
-                                    # ID mapping is optional - log and continue if it fails
-                                    logger.debug(f"[BIDI-SEND] {error_msg}")
+        frame = SseFrame.coerce(sse_event)
+        self._register_frontend_tool_call(frame)
+
+        # Negotiated binary audio: raw PCM with a compact header, no base64/JSON
+        if self._pcm_binary and frame.pcm is not None:
+            return await self._send_pcm_binary(frame)
 
         # Send to WebSocket with error handling (B3: log but don't crash for non-disconnect errors)
+        # Serialization happens here, at the socket boundary (cached on the frame);
+        # large frames are serialized on the offload pool
+        await frame.prepare(get_offload_pool())
         try:
-            await self._ws.send_text(sse_event)
+            await self._ws.send_text(frame.text)
+            if frame.is_done:
+                self._start_next_pcm_block()
             return True
         except WebSocketDisconnect:
             # Re-raise disconnect so outer handler in send_events() can catch it
@@ -260,28 +337,128 @@ class BidiEventSender:
             raise
         except Exception as e:
             logger.error(f"[BIDI-SEND] ✗ Failed to send event: {e}")
-            logger.error(f"[BIDI-SEND] Event that failed: {sse_event[:200]}")
+            logger.error(f"[BIDI-SEND] Event that failed: {frame.text[:200]}")
+            return False
+
+    async def _send_sse_batch(self, frames: list[SseFrame]) -> bool:
+        """
+        Send several frames as one WebSocket text message ("data: ...\n\n" concatenated).
+
+        The frontend EventReceiver splits batched messages on the SSE frame
+        separator. Binary PCM frames (pcm_binary mode) cannot share a text
+        message; they flush the pending text and go out as their own binary message.
+
+        Args:
+            frames: Frames in send order (a [DONE] frame, if any, is last)
+
+        Returns:
+            True if every write succeeded, False if any write failed
+        """
+        ok = True
+        pending_text: list[str] = []
+        for frame in frames:
+            self._register_frontend_tool_call(frame)
+            if self._pcm_binary and frame.pcm is not None:
+                ok = await self._send_batched_text(pending_text) and ok
+                pending_text = []
+                ok = await self._send_pcm_binary(frame) and ok
+            else:
+                await frame.prepare(get_offload_pool())
+                pending_text.append(frame.text)
+        ok = await self._send_batched_text(pending_text) and ok
+        if frames and frames[-1].is_done:
+            self._start_next_pcm_block()
+        return ok
+
+    async def _send_batched_text(self, texts: list[str]) -> bool:
+        """Write pending SSE texts as a single WebSocket text message."""
+        if not texts:
+            return True
+        try:
+            await self._ws.send_text("".join(texts))
+            return True
+        except WebSocketDisconnect:
+            raise
+        except Exception as e:
+            logger.error(f"[BIDI-SEND] ✗ Failed to send batch of {len(texts)} events: {e}")
+            return False
+
+    def _start_next_pcm_block(self) -> None:
+        """Turn finished ([DONE] sent): next audio belongs to a new block."""
+        self._pcm_block_id += 1
+        self._pcm_sequence = 0
+
+    def _register_frontend_tool_call(self, frame: SseFrame) -> None:
+        """
+        Register function_call.id mapping for frontend delegate tools.
+
+        Args:
+            frame: Outgoing frame (only tool-input-available frames are inspected)
+        """
+        if frame.type == "tool-input-available" and frame.event is not None:
+            tool_name = frame.event.get("toolName")
+            tool_call_id = frame.event.get("toolCallId")
+            if tool_name and tool_call_id and self._delegate:
+                result = self._delegate.set_function_call_id(tool_name, tool_call_id)
+                match result:
+                    case Ok(_):
+                        logger.debug(
+                            f"[BIDI-SEND] Registered mapping: {tool_name} → {tool_call_id}"
+                        )
+                    case Error(error_msg):
+                        # ID mapping is optional - log and continue if it fails
+                        logger.debug(f"[BIDI-SEND] {error_msg}")
+
+    async def _send_pcm_binary(self, frame: SseFrame) -> bool:
+        """
+        Send a data-pcm frame as a binary WebSocket message.
+
+        Args:
+            frame: data-pcm frame (frame.pcm is set)
+
+        Returns:
+            True if sent successfully, False if send failed
+        """
+        data = encode_pcm_frame(
+            frame.pcm or b"",
+            block_id=self._pcm_block_id,
+            sample_rate=frame.sample_rate or 24000,
+            sequence=self._pcm_sequence,
+        )
+        self._pcm_sequence += 1
+        try:
+            await self._ws.send_bytes(data)
+            return True
+        except WebSocketDisconnect:
+            raise
+        except Exception as e:
+            logger.error(f"[BIDI-SEND] ✗ Failed to send binary PCM frame: {e}")
             return False
 
-    async def _send_confirmation_step(self, sse_data: str, step_name: str) -> None:
+    async def _send_confirmation_step(self, frame: SseFrame, step_name: str) -> None:
         """
         Send a confirmation step event to WebSocket with logging and error handling.
 
         Args:
-            sse_data: SSE-formatted string to send
+            frame: SSE frame to send
             step_name: Human-readable step name for logging (e.g., "start-step", "finish-step")
 
         Raises:
             Exception: Re-raises any exception after logging
         """
+        if self._queue is not None:
+            # Keep ordering with frames already queued; the writer sends it
+            await self._queue.put(frame)
+            logger.info(f"[BIDI Approval] ✓ Queued {step_name}")
+            return
         try:
-            await self._ws.send_text(sse_data)
+            await self._ws.send_text(frame.text)
             logger.info(f"[BIDI Approval] ✓ Sent {step_name}")
         except Exception as e:
             logger.error(f"[BIDI Approval] ✗ Failed to send {step_name}: {e!s}")
             raise
 
-    async def _handle_confirmation_if_needed(self, sse_event: str) -> bool:
+    async def _handle_confirmation_if_needed(self, sse_event: SseFrame | str) -> bool:
         """
         Legacy Approval Mode: Detect LongRunningFunctionTool calls and inject confirmation flow.
 
@@ -291,61 +468,47 @@ class BidiEventSender:
 
         Flow:
         1. On tool-input-start: Record tool_name for confirmation-required tools
-        2. On tool-input-available: Inject confirmation events immediately
-        3. Extract tool call arguments from input event
-        4. Send original tool-input-available
-        5. Inject tool-input-start/available for adk_request_confirmation
-        6. Save pending call info for later execution
+        2. On tool-input-available: Register the approval request and send the event
+        3. Once the ADK event's approval tool calls are handled (send_events): Inject
+           one approval step (start-step, tool-approval-request per tool call, finish-step)
 
         Args:
-            sse_event: SSE-formatted string like 'data: {"type":"tool-input-available",...}\n\n'
+            sse_event: SseFrame, or SSE-formatted string like
+                'data: {"type":"tool-input-available",...}\n\n'
 
         Returns:
             True if the event should be sent immediately, False if it was deferred and sent later
         """
-        logger.info(
-            f"[BIDI Approval] _handle_confirmation_if_needed called with: {sse_event[:100]}"
-        )
+        frame = SseFrame.coerce(sse_event)
 
-        # Only process data events (skip DONE, comments, etc.)
-        if not sse_event.startswith("data:"):
+        # Only tool events take part in the confirmation flow (skip DONE, audio, etc.)
+        if frame.type not in {"tool-input-start", "tool-input-available", "tool-output-available"}:
             return True
-
-        # EXPERIMENT: Comment out DONE skip to see if it affects behavior
-        # # Skip [DONE] marker
-        # if "DONE" == sse_event.strip()[5:].strip():
-        #     return True
-
-        # Parse event data
-        match _parse_sse_event_data(sse_event):
-            case Ok(event_data):
-                event_type = event_data.get("type")
-                tool_call_id = event_data.get("toolCallId")
-                tool_name = event_data.get("toolName")
-
-                # Legacy Approval Mode Step 1: Record tool-input-start for confirmation-required tools
-                if (
-                    event_type == "tool-input-start"
-                    and tool_name in self._confirmation_tools
-                    and tool_call_id
-                ):
-                    self._record_tool_confirmation(tool_call_id, tool_name)
-                    return True  # Send this event normally
-
-                # Legacy Approval Mode Step 2: Detect tool-input-available for confirmation-required tools
-                elif event_type == "tool-input-available":
-                    if tool_call_id and tool_call_id in self._pending_confirmation:
-                        await self._inject_confirmation_flow(sse_event, tool_call_id, event_data)
-                        return False  # Already sent the original event
-
-                # Legacy Approval Mode Step 3: Skip tool-output-available for confirmation-required tools
-                elif event_type == "tool-output-available":
-                    if self._skip_pending_output(tool_call_id):
-                        return False  # Skip this event
-
-            case _:
-                # Parse failed, send event normally
-                pass
+        event_data = frame.event or {}
+
+        event_type = event_data.get("type")
+        tool_call_id = event_data.get("toolCallId")
+        tool_name = event_data.get("toolName")
+
+        # Legacy Approval Mode Step 1: Record tool-input-start for confirmation-required tools
+        if (
+            event_type == "tool-input-start"
+            and tool_name in self._confirmation_tools
+            and tool_call_id
+        ):
+            self._record_tool_confirmation(tool_call_id, tool_name)
+            return True  # Send this event normally
+
+        # Legacy Approval Mode Step 2: Detect tool-input-available for confirmation-required tools
+        elif event_type == "tool-input-available":
+            if tool_call_id and tool_call_id in self._pending_confirmation:
+                await self._inject_confirmation_flow(frame, tool_call_id, event_data)
+                return False  # Already sent the original event
+
+        # Legacy Approval Mode Step 3: Skip tool-output-available for confirmation-required tools
+        elif event_type == "tool-output-available":
+            if self._skip_pending_output(tool_call_id):
+                return False  # Skip this event
 
         # Default: send event normally
         return True
@@ -364,20 +527,21 @@ class BidiEventSender:
         )
 
     async def _inject_confirmation_flow(
-        self, sse_event: str, tool_call_id: str, event_data: dict[str, Any]
+        self, frame: SseFrame, tool_call_id: str, event_data: dict[str, Any]
     ) -> None:
         """
         Legacy Approval Mode Step 2: Inject confirmation flow for tools requiring approval.
 
         Flow:
-        1. Send original tool-input-available
-        2. Save pending call info
-        3. Inject start-step, tool-approval-request, finish-step
+        1. Register the approval request
+        2. Send original tool-input-available
+        3. Queue the tool-approval-request for the turn's approval step
+           (_flush_approval_step sends start-step, requests, finish-step)
 
         Args:
-            sse_event: Original SSE event string
+            frame: Original tool-input-available frame
             tool_call_id: Tool call identifier
-            event_data: Parsed event data dict
+            event_data: Event data dict of the original frame
         """
         # Get tool_name from pending_confirmation dict
         tool_name = self._pending_confirmation.pop(tool_call_id)
@@ -388,48 +552,74 @@ class BidiEventSender:
         # Extract args from input event
         tool_args = event_data.get("input", {})
 
-        # Save pending call info for later execution
-        ensure_session_state_key(self._session, "pending_long_running_calls", {})
-        self._session.state["pending_long_running_calls"][tool_call_id] = {
-            "name": tool_name,
-            "args": tool_args,
-        }
+        # Generate unique ID for confirmation tool call
+        confirmation_id = f"confirm-{uuid.uuid4()}"
+
+        # Register the request (lookup by confirmation_id or tool_call_id) before the
+        # frontend can answer it
+        get_approval_engine(self._session.state).track(
+            tool_call_id, tool_name, tool_args, approval_id=confirmation_id
+        )
         logger.info(
-            f"[BIDI Approval] Saved pending call: id={tool_call_id}, "
-            f"name={tool_name}, args={tool_args}"
+            f"[BIDI Approval] Registered approval request: id={tool_call_id}, "
+            f"confirmation_id={confirmation_id}, name={tool_name}, args={tool_args}"
         )
 
         # Send original tool-input-available FIRST
-        await self._send_sse_event(sse_event)
+        await self._deliver(frame)
+
+        # Other tool calls of the same model turn join this approval step
+        self._approval_batch.append((tool_call_id, confirmation_id))
+        if tool_call_id in self._approval_calls_expected:
+            self._approval_calls_expected.discard(tool_call_id)
+        else:
+            self._approval_batch_known = False
+
+    def _approval_batch_complete(self) -> bool:
+        """True if the batch holds every approval tool call its ADK event announced."""
+        return (
+            bool(self._approval_batch)
+            and self._approval_batch_known
+            and not self._approval_calls_expected
+        )
 
-        # Generate unique ID for confirmation tool call
-        confirmation_id = f"confirm-{uuid.uuid4()}"
-        logger.info(f"[BIDI Approval] Injecting approval step for {tool_name}")
+    async def _flush_approval_step(self) -> None:
+        """
+        Legacy Approval Mode Step 2b: Send one approval step for the batched tool calls.
+
+        All tool calls of one ADK event (one model turn) that require approval
+        share a single step, so the frontend answers them in one message
+        (BidiEventReceiver applies the decisions as one batch) instead of one
+        round trip per tool call.
+
+        Called by send_events() between frames it handled, never from inside the
+        conversion pipeline: with delta coalescing the pipeline runs ahead of the
+        consumer, and the step's frames must stay contiguous.
+        """
+        if not self._approval_batch:
+            return
+        batch, self._approval_batch = self._approval_batch, []
+        self._approval_batch_known = True
+        logger.info(f"[BIDI Approval] Injecting approval step for {len(batch)} tool call(s)")
 
         # ADR 0011: Inject start-step to begin approval step
-        start_step_sse = 'data: {"type":"start-step"}\n\n'
         await self._send_confirmation_step(
-            start_step_sse, "start-step before tool-approval-request"
+            START_STEP_FRAME, "start-step before tool-approval-request"
         )
 
-        # Send tool-approval-request (AI SDK v6 standard event)
-        approval_request_sse = StreamProtocolConverter.format_tool_approval_request(
-            original_tool_call_id=tool_call_id,
-            approval_id=confirmation_id,
-        )
-        await self._send_confirmation_step(approval_request_sse, "tool-approval-request")
+        # Send tool-approval-request (AI SDK v6 standard event) per tool call
+        for tool_call_id, confirmation_id in batch:
+            approval_request_sse = StreamProtocolConverter.format_tool_approval_request(
+                original_tool_call_id=tool_call_id,
+                approval_id=confirmation_id,
+            )
+            await self._send_confirmation_step(
+                approval_request_sse, f"tool-approval-request ({tool_call_id})"
+            )
 
         # ADR 0011: Inject finish-step to complete approval step
-        finish_step_sse = 'data: {"type":"finish-step"}\n\n'
         await self._send_confirmation_step(
-            finish_step_sse, "finish-step after tool-approval-request"
-        )
-
-        # Save confirmation_id → original_tool_call_id mapping
-        ensure_session_state_key(self._session, "confirmation_id_mapping", {})
-        self._session.state["confirmation_id_mapping"][confirmation_id] = tool_call_id
-        logger.info(
-            f"[BIDI Approval] Saved confirmation mapping: {confirmation_id} → {tool_call_id} for tool {tool_name}"
+            FINISH_STEP_FRAME, "finish-step after tool-approval-request"
         )
 
     def _skip_pending_output(self, tool_call_id: str | None) -> bool:
@@ -445,14 +635,13 @@ class BidiEventSender:
         Returns:
             True if event should be skipped, False otherwise
         """
-        pending_calls = self._session.state.get("pending_long_running_calls", {})
-        logger.info(
-            f"[BIDI Approval] Checking tool-output-available: tool_call_id={tool_call_id}, "
-            f"pending_calls={list(pending_calls.keys())}"
-        )
+        logger.info(f"[BIDI Approval] Checking tool-output-available: tool_call_id={tool_call_id}")
 
-        if tool_call_id and tool_call_id in pending_calls:
-            tool_name = pending_calls[tool_call_id]["name"]
+        approvals = get_approval_engine(self._session.state)
+        # The tool returned instead of waiting: its decision is handled by the receiver
+        request = approvals.defer(tool_call_id) if tool_call_id else None
+        if request is not None:
+            tool_name = request.tool_name
             logger.info(
                 f"[BIDI Approval] Skipping tool-output-available for {tool_name} (ID: {tool_call_id}) - "
                 "pending status should not be sent to frontend"
@@ -461,6 +650,6 @@ class BidiEventSender:
 
         logger.info(
             f"[BIDI Approval] NOT skipping tool-output-available (ID: {tool_call_id}) - "
-            f"not in pending_calls or tool_call_id is None"
+            f"no undecided approval request"
         )
         return False
@@ -0,0 +1,349 @@
+"""
+BIDI Session Reattachment (WebSocket reconnect without a fresh run_live).
+
+Without reattachment, every /live connection creates a new ADK session, a new
+LiveRequestQueue and a new run_live() call, so a network blip (mobile handoff,
+proxy timeout) throws away the live model session and pays the full Live API
+setup latency again. This module keeps a dropped connection's live state alive
+for a grace period:
+
+- On connect the server issues a resume token ({"type": "session", ...}).
+- The downstream run_live() consumer writes through a ReattachableWebSocket.
+  While no client is attached, outgoing messages go to a bounded replay buffer
+  instead of raising WebSocketDisconnect, so run_live() keeps running.
+- A reconnect carrying the token (/live?resume=<token>) reattaches to the same
+  session, LiveRequestQueue, receiver and sender; buffered messages are flushed
+  to the new socket first, in order.
+- If nobody reconnects within grace_seconds, the LiveRequestQueue is closed and
+  the downstream task is cancelled.
+
+Buffer Policy:
+    The replay buffer holds at most max_buffered_messages messages. When it is
+    full the oldest message is dropped (counted in dropped_messages); the
+    client sees a gap instead of the server growing without bound.
+"""
+
+import asyncio
+import secrets
+from collections import OrderedDict, deque
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import WebSocket
+from fastapi.websockets import WebSocketDisconnect
+from google.adk.agents import LiveRequestQueue
+from google.adk.sessions import Session
+from loguru import logger
+
+
+class ReattachableWebSocket:
+    """
+    WebSocket stand-in for BidiEventSender that survives client reconnects.
+
+    Implements the send_text()/send_bytes() subset BidiEventSender uses. A send
+    that fails because the client went away detaches the socket and buffers the
+    message instead of raising.
+    """
+
+    def __init__(self, websocket: WebSocket, max_buffered_messages: int = 256) -> None:
+        """
+        Initialize with the first client connection.
+
+        Args:
+            websocket: Accepted client WebSocket
+            max_buffered_messages: Replay buffer size while detached
+        """
+        self._ws: WebSocket | None = websocket
+        self._pending: deque[str | bytes] = deque()
+        self._max_buffered = max_buffered_messages
+        self._lock = asyncio.Lock()
+        self.dropped_messages = 0
+
+    @property
+    def websocket(self) -> WebSocket | None:
+        """Currently attached client connection (None while detached)."""
+        return self._ws
+
+    @property
+    def buffered_messages(self) -> int:
+        """Number of messages waiting for a reconnect."""
+        return len(self._pending)
+
+    async def send_text(self, data: str) -> None:
+        """Send a text message, or buffer it while detached."""
+        await self._send(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        """Send a binary message, or buffer it while detached."""
+        await self._send(data)
+
+    def detach(self, websocket: WebSocket | None = None) -> bool:
+        """
+        Stop writing to the client connection (buffer from now on).
+
+        Args:
+            websocket: Only detach if this connection is still the attached one
+                (None = detach unconditionally)
+
+        Returns:
+            True if the socket was detached, False if another connection owns it
+        """
+        if websocket is not None and self._ws is not websocket:
+            return False
+        self._ws = None
+        return True
+
+    async def attach(self, websocket: WebSocket) -> int:
+        """
+        Reattach to a new client connection and flush buffered messages.
+
+        Args:
+            websocket: Accepted client WebSocket
+
+        Returns:
+            Number of buffered messages replayed
+        """
+        async with self._lock:
+            self._ws = websocket
+            replayed = 0
+            while self._pending and self._ws is websocket:
+                if not await self._write(websocket, self._pending[0]):
+                    break
+                self._pending.popleft()
+                replayed += 1
+            return replayed
+
+    async def _send(self, data: str | bytes) -> None:
+        async with self._lock:
+            websocket = self._ws
+            if websocket is None or not await self._write(websocket, data):
+                self._buffer(data)
+
+    async def _write(self, websocket: WebSocket, data: str | bytes) -> bool:
+        """Write one message; on a dropped connection detach and return False."""
+        try:  # nosemgrep: forbid-try-except - a dropped client must not stop run_live()
+            if isinstance(data, bytes):
+                await websocket.send_bytes(data)
+            else:
+                await websocket.send_text(data)
+            return True
+        except (WebSocketDisconnect, RuntimeError, OSError) as e:
+            logger.info(f"[BIDI-RESUME] Client connection lost during send ({e!r}), buffering")
+            self.detach(websocket)
+            return False
+
+    def _buffer(self, data: str | bytes) -> None:
+        if len(self._pending) >= self._max_buffered:
+            self._pending.popleft()
+            self.dropped_messages += 1
+            if self.dropped_messages == 1:
+                logger.warning("[BIDI-RESUME] Replay buffer full - dropping oldest messages")
+        self._pending.append(data)
+
+
+@dataclass
+class BidiLiveSession:
+    """
+    Live state of one /live conversation that outlives a single connection.
+
+    Attributes:
+        user_id: Owner (reconnects from other users are rejected)
+        session: ADK Session
+        live_request_queue: Queue feeding the running run_live()
+        socket: Reattachable socket BidiEventSender writes to
+        resume_token: Opaque token the client presents to reattach
+        downstream: Task consuming run_live() (owned by the registry once parked)
+    """
+
+    user_id: str
+    session: Session
+    live_request_queue: LiveRequestQueue
+    socket: ReattachableWebSocket
+    resume_token: str = field(default_factory=lambda: secrets.token_urlsafe(24))
+    downstream: asyncio.Task[None] | None = None
+    _expiry: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+    def close(self) -> None:
+        """End the conversation: close the queue and cancel run_live() consumption."""
+        if self._expiry is not None:
+            self._expiry.cancel()
+            self._expiry = None
+        self.live_request_queue.close()
+        if self.downstream is not None and not self.downstream.done():
+            self.downstream.cancel()
+
+
+class BidiSessionRegistry:
+    """
+    Registry of reattachable /live conversations, keyed by resume token.
+
+    Usage:
+        live = registry.reattach(token, user_id)  # None = start fresh
+        if live is None:
+            live = registry.create(websocket, user_id, session, live_request_queue)
+            registry.start(live, consume_run_live())  # BidiEventSender(live.socket)
+        else:
+            await live.socket.attach(websocket)
+        ...
+        registry.park(live, websocket)   # connection dropped: start grace period
+        registry.close(live)             # conversation over: release immediately
+    """
+
+    def __init__(
+        self,
+        grace_seconds: float = 30.0,
+        max_buffered_messages: int = 256,
+        on_close: Callable[[BidiLiveSession], None] | None = None,
+    ) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            grace_seconds: How long a dropped conversation waits for a reconnect
+            max_buffered_messages: Replay buffer size per conversation
+            on_close: Called once per conversation after it was closed
+                (e.g., to release the ADK session)
+        """
+        self._grace_seconds = grace_seconds
+        self._max_buffered = max_buffered_messages
+        self._on_close = on_close
+        self._sessions: OrderedDict[str, BidiLiveSession] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(
+        self,
+        websocket: WebSocket,
+        user_id: str,
+        session: Session,
+        live_request_queue: LiveRequestQueue,
+    ) -> BidiLiveSession:
+        """
+        Register a new conversation for the given first connection.
+
+        Args:
+            websocket: Accepted client WebSocket
+            user_id: Owner of the conversation
+            session: ADK Session
+            live_request_queue: Queue feeding run_live()
+
+        Returns:
+            Live session (pass live.socket to BidiEventSender)
+        """
+        live = BidiLiveSession(
+            user_id=user_id,
+            session=session,
+            live_request_queue=live_request_queue,
+            socket=ReattachableWebSocket(websocket, self._max_buffered),
+        )
+        self._sessions[live.resume_token] = live
+        return live
+
+    def start(self, live: BidiLiveSession, downstream: Coroutine[Any, Any, None]) -> None:
+        """
+        Run the run_live() consumer as a task owned by the conversation.
+
+        If the task ends while no client is attached, the conversation is closed.
+
+        Args:
+            live: Conversation returned by create()
+            downstream: Coroutine consuming run_live() (e.g., BidiEventSender.send_events)
+        """
+        live.downstream = asyncio.create_task(downstream, name=f"bidi-downstream-{live.session.id}")
+        live.downstream.add_done_callback(lambda task: self._on_downstream_done(live, task))
+
+    def get(self, resume_token: str) -> BidiLiveSession | None:
+        """Look up a conversation (None if unknown or expired)."""
+        return self._sessions.get(resume_token)
+
+    def reattach(self, resume_token: str, user_id: str) -> BidiLiveSession | None:
+        """
+        Claim a conversation for a reconnecting client.
+
+        Cancels the grace timer and detaches any previous connection. Call
+        await live.socket.attach(websocket) afterwards to flush buffered messages.
+
+        Args:
+            resume_token: Token issued on the first connect
+            user_id: Reconnecting user (must own the conversation)
+
+        Returns:
+            Live session, or None if unknown, expired, finished or owned by another user
+        """
+        live = self._sessions.get(resume_token)
+        if live is None or live.user_id != user_id:
+            return None
+        if live.downstream is not None and live.downstream.done():
+            self.close(live)
+            return None
+        if live._expiry is not None:
+            live._expiry.cancel()
+            live._expiry = None
+        live.socket.detach()
+        logger.info(
+            f"[BIDI-RESUME] Reattaching session {live.session.id} "
+            f"({live.socket.buffered_messages} buffered messages)"
+        )
+        return live
+
+    def park(self, live: BidiLiveSession, websocket: WebSocket) -> None:
+        """
+        A connection dropped: keep the conversation alive for grace_seconds.
+
+        No-op if another connection has already reattached.
+
+        Args:
+            live: Conversation of the dropped connection
+            websocket: The dropped connection
+        """
+        if not live.socket.detach(websocket):
+            return
+        if live.resume_token not in self._sessions:
+            return
+        if self._grace_seconds <= 0 or (live.downstream is not None and live.downstream.done()):
+            self.close(live)
+            return
+        loop = asyncio.get_running_loop()
+        live._expiry = loop.call_later(self._grace_seconds, self._expire, live.resume_token)
+        logger.info(
+            f"[BIDI-RESUME] Session {live.session.id} parked for {self._grace_seconds:.0f}s"
+        )
+
+    def close(self, live: BidiLiveSession) -> None:
+        """Release a conversation immediately."""
+        if self._sessions.pop(live.resume_token, None) is None:
+            return
+        live.close()
+        if self._on_close is not None:
+            self._on_close(live)
+
+    async def aclose(self) -> None:
+        """Close every conversation (server shutdown)."""
+        sessions = list(self._sessions.values())
+        for live in sessions:
+            self.close(live)
+        tasks = [live.downstream for live in sessions if live.downstream is not None]
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def _on_downstream_done(self, live: BidiLiveSession, task: asyncio.Task[None]) -> None:
+        if live.socket.websocket is not None or live.resume_token not in self._sessions:
+            return  # The attached connection (or close()) handles the outcome
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                f"[BIDI-RESUME] run_live() for parked session {live.session.id} failed: "
+                f"{task.exception()!s}"
+            )
+        self.close(live)
+
+    def _expire(self, resume_token: str) -> None:
+        live = self._sessions.get(resume_token)
+        if live is None or live.socket.websocket is not None:
+            return
+        logger.info(
+            f"[BIDI-RESUME] Session {live.session.id} not resumed within grace period, closing "
+            f"({live.socket.buffered_messages} buffered messages discarded)"
+        )
+        self.close(live)
@@ -0,0 +1,165 @@
+"""
+Connection Supervisor for /live (structured-concurrency teardown).
+
+With asyncio.gather(upstream, downstream), a dropped socket ends the upstream
+task but nothing cancels its sibling: run_live() consumption keeps the Live API
+stream open, and tools blocked waiting for the user (approval, confirmation,
+frontend tool result) hold their waits until their own timeouts expire. Under
+connection churn those zombie waits pile up.
+
+ConnectionSupervisor runs both tasks in an asyncio.TaskGroup:
+
+- The upstream task ending (client disconnected, protocol error) ends the
+  connection; so does the downstream task failing.
+- At that moment the teardown callbacks run first (fail pending futures, deny
+  pending approvals, close the LiveRequestQueue), so blocked tools return
+  immediately instead of timing out; then the TaskGroup cancels the remaining
+  task and waits for it.
+- A downstream task that completes normally leaves upstream running (same as
+  gather: the client may still be sending).
+
+Teardown latency (disconnect detected → all tasks finished) is recorded in
+TeardownStats, exposed via teardown_stats() on /health.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, replace
+from typing import Any
+
+from fastapi.websockets import WebSocketDisconnect
+from loguru import logger
+
+
+@dataclass
+class TeardownStats:
+    """
+    Process-wide /live teardown counters.
+
+    Attributes:
+        connections: Connections torn down
+        cancelled_tasks: Sibling tasks cancelled at teardown (still running when the other ended)
+        last_teardown_seconds: Latency of the most recent teardown
+        max_teardown_seconds: Highest teardown latency observed
+        total_teardown_seconds: Sum of all teardown latencies
+    """
+
+    connections: int = 0
+    cancelled_tasks: int = 0
+    last_teardown_seconds: float = 0.0
+    max_teardown_seconds: float = 0.0
+    total_teardown_seconds: float = 0.0
+
+
+_STATS = TeardownStats()
+
+
+def teardown_stats() -> TeardownStats:
+    """Copy of the /live teardown counters (for /health and metrics)."""
+    return replace(_STATS)
+
+
+class _ConnectionEnded(Exception):  # noqa: N818 - control-flow signal, not an error
+    """Raised inside the TaskGroup to cancel the remaining task."""
+
+
+class ConnectionSupervisor:
+    """
+    Owns the tasks and blocking waits of one /live connection.
+
+    Usage:
+        supervisor = ConnectionSupervisor(session.id)
+        supervisor.on_teardown(live_request_queue.close)
+        supervisor.on_teardown(lambda: release_session(session.id))
+        await supervisor.serve(upstream_task(), downstream_task())
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize supervisor.
+
+        Args:
+            name: Connection name for logs (e.g., session ID)
+        """
+        self.name = name
+        self._callbacks: list[Callable[[], None]] = []
+        self._teardown_started: float | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def on_teardown(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback run once when the connection ends (in registration order).
+
+        Callbacks must not block: they fail futures, deny approvals, close queues.
+        """
+        self._callbacks.append(callback)
+
+    async def serve(
+        self,
+        upstream: Coroutine[Any, Any, None],
+        downstream: Coroutine[Any, Any, None],
+    ) -> None:
+        """
+        Run upstream and downstream until the connection ends, then tear down.
+
+        WebSocketDisconnect and task errors are logged, not raised; cancellation
+        of the caller (server shutdown) still tears down and propagates.
+
+        Args:
+            upstream: WebSocket → LiveRequestQueue loop (its end ends the connection)
+            downstream: run_live() → WebSocket loop (its failure ends the connection)
+        """
+        try:  # nosemgrep: forbid-try-except - a connection ending is normal, not an app error
+            async with asyncio.TaskGroup() as group:
+                self._tasks = [
+                    group.create_task(self._guard(upstream, ends_connection=True)),
+                    group.create_task(self._guard(downstream, ends_connection=False)),
+                ]
+        except* _ConnectionEnded:
+            pass
+        except* WebSocketDisconnect:
+            logger.warning(f"[BIDI] WebSocket disconnected ({self.name})")
+        except* Exception as group_error:
+            for error in group_error.exceptions:
+                logger.error(f"[live_chat] Exception: {error!s}")
+        finally:
+            self._begin_teardown()
+            self._record_teardown()
+
+    async def _guard(self, coro: Coroutine[Any, Any, None], *, ends_connection: bool) -> None:
+        try:  # nosemgrep: forbid-try-except - tear down before the TaskGroup cancels the sibling
+            await coro
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            self._begin_teardown()
+            raise
+        if ends_connection:
+            self._begin_teardown()
+            raise _ConnectionEnded
+
+    def _begin_teardown(self) -> None:
+        """Run the teardown callbacks (once), before the sibling task is cancelled."""
+        if self._teardown_started is not None:
+            return
+        self._teardown_started = time.perf_counter()
+        for callback in self._callbacks:
+            try:  # nosemgrep: forbid-try-except - one failing cleanup must not skip the others
+                callback()
+            except Exception as e:
+                logger.error(f"[BIDI] Teardown callback failed ({self.name}): {e!s}")
+
+    def _record_teardown(self) -> None:
+        started = self._teardown_started or time.perf_counter()
+        elapsed = time.perf_counter() - started
+        cancelled = sum(1 for task in self._tasks if task.cancelled())
+        _STATS.connections += 1
+        _STATS.cancelled_tasks += cancelled
+        _STATS.last_teardown_seconds = elapsed
+        _STATS.max_teardown_seconds = max(_STATS.max_teardown_seconds, elapsed)
+        _STATS.total_teardown_seconds += elapsed
+        logger.info(
+            f"[BIDI] Connection {self.name} torn down in {elapsed * 1000:.1f} ms "
+            f"(cancelled {cancelled} task(s))"
+        )
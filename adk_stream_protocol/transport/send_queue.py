@@ -0,0 +1,311 @@
+"""
+Outbound Send Queue for BIDI WebSocket connections.
+
+Without a queue, BidiEventSender awaits the WebSocket write for every converted
+event inline, so one slow client stalls consumption of run_live() and the Live
+API stream backs up. OutboundFrameQueue decouples the two: the sender enqueues
+frames and a writer task drains them to the socket.
+
+Backpressure Policy:
+    The queue holds at most max_frames frames. When it is full:
+    - Control / text / tool frames are never dropped: put() waits for space.
+    - data-pcm frames follow audio_policy:
+        "block"       wait for space like any other frame (no audio loss)
+        "drop-oldest" drop the oldest queued data-pcm frame (stale audio first)
+        "merge"       append the PCM to a data-pcm frame at the tail of the queue
+                      (up to max_merge_bytes), else drop the oldest data-pcm frame
+
+Batched Writes:
+    With batch_max_bytes set and a send_batch callback, the writer packs every
+    frame that is already queued when it wakes up into one batch (up to
+    batch_max_bytes), so a burst of deltas costs one WebSocket message instead
+    of one per frame. A batch always ends at a [DONE] frame.
+
+Frames are always written in enqueue order. Depth and drop counters are exposed
+via SendQueueStats for logging / metrics.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from loguru import logger
+
+from adk_stream_protocol.protocol.sse_frame import SseFrame
+
+
+AudioBackpressurePolicy = Literal["block", "drop-oldest", "merge"]
+
+
+@dataclass(frozen=True)
+class SendQueueConfig:
+    """
+    Outbound send queue settings.
+
+    Attributes:
+        max_frames: Maximum number of queued frames per connection
+        audio_policy: What to do with data-pcm frames when the queue is full
+        max_merge_bytes: Upper bound for a merged data-pcm payload ("merge" policy)
+        batch_max_bytes: Pack ready frames into one write up to this many bytes
+            (None = one write per frame)
+    """
+
+    max_frames: int = 256
+    audio_policy: AudioBackpressurePolicy = "drop-oldest"
+    max_merge_bytes: int = 64 * 1024
+    batch_max_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_frames < 1:
+            msg = f"max_frames must be >= 1, got {self.max_frames}"
+            raise ValueError(msg)
+
+
+@dataclass
+class SendQueueStats:
+    """
+    Live counters for one outbound queue.
+
+    Attributes:
+        depth: Frames currently waiting to be written
+        max_depth: Highest depth observed
+        sent_frames: Frames written to the socket
+        sent_batches: Socket writes (equals sent_frames without batching)
+        dropped_audio_frames: data-pcm frames dropped under backpressure
+        dropped_audio_bytes: PCM bytes dropped under backpressure
+        merged_audio_frames: data-pcm frames merged into a queued frame
+    """
+
+    depth: int = 0
+    max_depth: int = 0
+    sent_frames: int = 0
+    sent_batches: int = 0
+    dropped_audio_frames: int = 0
+    dropped_audio_bytes: int = 0
+    merged_audio_frames: int = 0
+
+
+class OutboundFrameQueue:
+    """
+    Bounded per-connection frame queue drained by a writer task.
+
+    Usage:
+        queue = OutboundFrameQueue(sender._send_sse_event, SendQueueConfig())
+        queue.start()
+        await queue.put(frame)   # waits only when full (or drops stale audio)
+        await queue.close()      # drains remaining frames, re-raises writer errors
+
+    If the writer fails (e.g., WebSocketDisconnect), the next put() or close()
+    re-raises that exception so the producer stops.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[SseFrame], Awaitable[object]],
+        config: SendQueueConfig,
+        send_batch: Callable[[list[SseFrame]], Awaitable[object]] | None = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            send: Coroutine function that writes one frame to the socket
+            config: Queue bounds, audio backpressure policy and batch size
+            send_batch: Coroutine function that writes several frames at once
+                (required for batching; without it every frame is sent alone)
+        """
+        self._send = send
+        self._send_batch = send_batch
+        self._config = config
+        self._frames: deque[SseFrame] = deque()
+        self._not_empty = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._closing = False
+        self._writer: asyncio.Task[None] | None = None
+        self.stats = SendQueueStats()
+
+    @property
+    def depth(self) -> int:
+        """Number of frames waiting to be written."""
+        return len(self._frames)
+
+    def start(self) -> None:
+        """Start the writer task (idempotent)."""
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run_writer(), name="bidi-send-writer")
+
+    async def put(self, frame: SseFrame) -> None:
+        """
+        Enqueue a frame for sending.
+
+        Args:
+            frame: Frame to send
+
+        Raises:
+            Exception: The writer task's exception, if it has failed
+        """
+        self._raise_if_writer_failed()
+
+        if len(self._frames) >= self._config.max_frames and frame.pcm is not None:
+            if self._make_room_for_audio(frame):
+                return
+
+        while len(self._frames) >= self._config.max_frames:
+            self._space.clear()
+            await self._wait_for_space()
+            self._raise_if_writer_failed()
+
+        self._append(frame)
+
+    async def close(self) -> None:
+        """
+        Drain queued frames and stop the writer.
+
+        Raises:
+            Exception: The writer task's exception, if it failed
+        """
+        self._closing = True
+        self._not_empty.set()
+        if self._writer is not None:
+            await self._writer
+
+    async def cancel(self) -> None:
+        """Stop the writer immediately, discarding queued frames."""
+        self._closing = True
+        self._frames.clear()
+        self.stats.depth = 0
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+            await asyncio.wait({self._writer})
+
+    def _append(self, frame: SseFrame) -> None:
+        self._frames.append(frame)
+        depth = len(self._frames)
+        self.stats.depth = depth
+        self.stats.max_depth = max(self.stats.max_depth, depth)
+        self._not_empty.set()
+
+    def _make_room_for_audio(self, frame: SseFrame) -> bool:
+        """
+        Apply the audio policy to a data-pcm frame arriving at a full queue.
+
+        Returns:
+            True if the frame was merged (nothing left to enqueue), False otherwise.
+            When False, the caller enqueues the frame (space was freed by dropping
+            stale audio) or waits for space ("block" / no queued audio).
+        """
+        policy = self._config.audio_policy
+        if policy == "block":
+            return False
+
+        if policy == "merge" and self._merge_into_tail(frame):
+            return True
+
+        self._drop_oldest_audio()
+        return False
+
+    def _merge_into_tail(self, frame: SseFrame) -> bool:
+        """Append frame's PCM to a data-pcm frame at the tail of the queue."""
+        tail = self._frames[-1] if self._frames else None
+        if (
+            tail is None
+            or tail.pcm is None
+            or tail.sample_rate is None
+            or tail.sample_rate != frame.sample_rate
+            or len(tail.pcm) + len(frame.pcm or b"") > self._config.max_merge_bytes
+        ):
+            return False
+        self._frames[-1] = SseFrame.data_pcm(tail.pcm + (frame.pcm or b""), tail.sample_rate)
+        self.stats.merged_audio_frames += 1
+        return True
+
+    def _drop_oldest_audio(self) -> None:
+        """Remove the oldest queued data-pcm frame, if any."""
+        for index, queued in enumerate(self._frames):
+            if queued.pcm is not None:
+                del self._frames[index]
+                self.stats.depth = len(self._frames)
+                self.stats.dropped_audio_frames += 1
+                self.stats.dropped_audio_bytes += len(queued.pcm)
+                if self.stats.dropped_audio_frames == 1:
+                    logger.warning("[BIDI-SEND] Client is falling behind - dropping stale audio")
+                return
+
+    async def _wait_for_space(self) -> None:
+        """Wait until the writer frees a slot or stops."""
+        if self._writer is None:
+            msg = "OutboundFrameQueue.start() must be called before put() on a full queue"
+            raise RuntimeError(msg)
+        space = asyncio.ensure_future(self._space.wait())
+        try:
+            await asyncio.wait({space, self._writer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            space.cancel()
+
+    def _raise_if_writer_failed(self) -> None:
+        writer = self._writer
+        if writer is not None and writer.done() and not writer.cancelled():
+            error = writer.exception()
+            if error is not None:
+                raise error
+
+    def _pop_batch(self) -> list[SseFrame]:
+        """Pop the next frame plus any ready followers that fit in batch_max_bytes."""
+        batch = [self._frames.popleft()]
+        max_bytes = self._config.batch_max_bytes
+        if self._send_batch is None or max_bytes is None:
+            return batch
+
+        size = _frame_size(batch[0])
+        while self._frames and not batch[-1].is_done:
+            next_size = _frame_size(self._frames[0])
+            if size + next_size > max_bytes:
+                break
+            batch.append(self._frames.popleft())
+            size += next_size
+        return batch
+
+    async def _run_writer(self) -> None:
+        """Write queued frames in order until closed and drained."""
+        try:
+            while True:
+                while not self._frames:
+                    if self._closing:
+                        return
+                    self._not_empty.clear()
+                    await self._not_empty.wait()
+
+                batch = self._pop_batch()
+                self.stats.depth = len(self._frames)
+                self._space.set()
+
+                if self._send_batch is not None and len(batch) > 1:
+                    await self._send_batch(batch)
+                else:
+                    await self._send(batch[0])
+                self.stats.sent_frames += len(batch)
+                self.stats.sent_batches += 1
+        finally:
+            # Wake producers blocked on a full queue so they observe the writer's exit
+            self._space.set()
+
+
+# Allowance for the SSE envelope and event fields around a frame's payload
+_FRAME_ENVELOPE_BYTES = 128
+
+
+def _frame_size(frame: SseFrame) -> int:
+    """
+    Approximate wire size, without serializing frames that carry a payload.
+
+    PCM, file and data-audio frames are sized from their payload, so the writer
+    serializes them later (on the offload pool when large, see SseFrame.prepare()).
+    Plain frames are small and never offloaded; their exact encoding is cached.
+    """
+    payload_size = frame.payload_size
+    if payload_size:
+        return payload_size + _FRAME_ENVELOPE_BYTES
+    return len(frame.encode())
@@ -0,0 +1,295 @@
+"""
+Client Abandonment for /stream (stop run_async when nobody reads the answer).
+
+A browser that goes away does not stop the agent: the ADK run keeps
+generating (and billing tokens) and tools keep running, because the
+disconnect is only noticed at the next write, if at all (resumable streams
+are consumed by a detached producer on purpose). AgentRunGuard ties the run's
+producer task to its HTTP clients:
+
+- follow_client() watches each response for http.disconnect (a concurrent
+  receive(), so silence during a long tool call does not hide the disconnect).
+- When the last client is gone, the run is abandoned, after grace_seconds for
+  resumable streams (a reconnect within the window reattaches and keeps it).
+
+Abandon Policies:
+    "cancel"       cancel the producer now (run_async and in-flight tools get
+                   CancelledError)
+    "finish-tool"  same, but a tool call that already started (tool-input-available
+                   without its output yet) may finish first; the run stops right
+                   after the tool output, before the model answers
+    "continue"     keep running (previous behavior; only counted)
+
+Counters (AbandonStats, abandon_stats() on /health): client_abandoned is the
+number of runs whose clients all went away before the run finished.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, AsyncIterable
+from dataclasses import dataclass, replace
+from typing import Any, Literal
+
+from loguru import logger
+from starlette.types import Receive
+
+from adk_stream_protocol.protocol.sse_frame import SseFrame
+
+
+AbandonPolicy = Literal["cancel", "finish-tool", "continue"]
+
+# Frames that open / close a tool call of the run
+_TOOL_STARTED = "tool-input-available"
+_TOOL_SETTLED = frozenset({"tool-output-available", "tool-output-error", "tool-approval-request"})
+
+
+@dataclass(frozen=True)
+class AbandonConfig:
+    """
+    What to do with a run whose clients went away.
+
+    Attributes:
+        policy: "cancel", "finish-tool" or "continue"
+        grace_seconds: Wait this long for a reconnect before abandoning (resumable streams)
+    """
+
+    policy: AbandonPolicy = "finish-tool"
+    grace_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.policy not in {"cancel", "finish-tool", "continue"}:
+            msg = f"policy must be 'cancel', 'finish-tool' or 'continue', got {self.policy!r}"
+            raise ValueError(msg)
+
+
+@dataclass
+class AbandonStats:
+    """
+    Process-wide abandonment counters.
+
+    Attributes:
+        client_abandoned: Runs whose clients all disconnected before the run finished
+        cancelled_runs: Abandoned runs cancelled immediately
+        tool_finished_runs: Abandoned runs stopped after letting an in-flight tool finish
+        continued_runs: Abandoned runs left running ("continue" policy)
+    """
+
+    client_abandoned: int = 0
+    cancelled_runs: int = 0
+    tool_finished_runs: int = 0
+    continued_runs: int = 0
+
+
+_STATS = AbandonStats()
+
+
+def abandon_stats() -> AbandonStats:
+    """Copy of the abandonment counters (for /health and metrics)."""
+    return replace(_STATS)
+
+
+class AgentRunGuard:
+    """
+    Stops one agent run's producer task when all of its clients are gone.
+
+    The producer calls observe() for every frame (tool call tracking) and stops
+    when it returns True; attach() / detach() count the HTTP responses reading
+    the run (see follow_client()).
+    """
+
+    def __init__(self, config: AbandonConfig, name: str) -> None:
+        """
+        Initialize guard.
+
+        Args:
+            config: Abandon policy and reconnect grace period
+            name: Run name for logs (e.g., stream ID)
+        """
+        self.config = config
+        self.name = name
+        self.abandoned = False
+        self._clients = 0
+        self._tools_in_flight: set[str] = set()
+        self._producer: asyncio.Task[Any] | None = None
+        self._grace_timer: asyncio.TimerHandle | None = None
+
+    @property
+    def tools_in_flight(self) -> int:
+        """Tool calls started but not yet answered."""
+        return len(self._tools_in_flight)
+
+    def bind(self, producer: asyncio.Task[Any]) -> None:
+        """Set the task consuming run_async (the one cancelled on abandonment)."""
+        self._producer = producer
+
+    def attach(self) -> None:
+        """A client started reading the run (initial response or reconnect)."""
+        self._clients += 1
+        if self._grace_timer is not None:
+            self._grace_timer.cancel()
+            self._grace_timer = None
+
+    def detach(self) -> None:
+        """A client stopped reading (disconnected or response complete)."""
+        self._clients = max(self._clients - 1, 0)
+        if self._clients or self.abandoned or self._run_finished():
+            return
+        if self.config.grace_seconds <= 0:
+            self._abandon()
+            return
+        loop = asyncio.get_running_loop()
+        self._grace_timer = loop.call_later(self.config.grace_seconds, self._abandon_if_idle)
+
+    def observe(self, frame: SseFrame) -> bool:
+        """
+        Track tool calls in the run's frames.
+
+        Returns:
+            True if the producer must stop now (abandoned, and the tool it was
+            allowed to finish has answered)
+        """
+        frame_type = frame.type
+        if frame_type == _TOOL_STARTED or frame_type in _TOOL_SETTLED:
+            tool_call_id = (frame.event or {}).get("toolCallId")
+            if isinstance(tool_call_id, str):
+                if frame_type == _TOOL_STARTED:
+                    self._tools_in_flight.add(tool_call_id)
+                else:
+                    self._tools_in_flight.discard(tool_call_id)
+        return self.abandoned and self.config.policy == "finish-tool" and not self._tools_in_flight
+
+    def _run_finished(self) -> bool:
+        return self._producer is not None and self._producer.done()
+
+    def _abandon_if_idle(self) -> None:
+        self._grace_timer = None
+        if not self._clients and not self.abandoned and not self._run_finished():
+            self._abandon()
+
+    def _abandon(self) -> None:
+        self.abandoned = True
+        _STATS.client_abandoned += 1
+        policy = self.config.policy
+        logger.warning(
+            f"[SSE] Client abandoned run {self.name} "
+            f"(policy={policy}, tools in flight={len(self._tools_in_flight)})"
+        )
+        if policy == "continue":
+            _STATS.continued_runs += 1
+            return
+        if policy == "finish-tool" and self._tools_in_flight:
+            _STATS.tool_finished_runs += 1  # Producer stops once observe() sees the output
+            return
+        _STATS.cancelled_runs += 1
+        if self._producer is not None:
+            self._producer.cancel()
+
+
+async def _wait_for_disconnect(receive: Receive) -> None:
+    """Return once the ASGI server reports http.disconnect (request body already read)."""
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def follow_client(
+    chunks: AsyncIterable[bytes],
+    guard: AgentRunGuard,
+    receive: Receive,
+) -> AsyncGenerator[bytes]:
+    """
+    Stream a run's wire bytes to one HTTP client, reporting its disconnect to guard.
+
+    Args:
+        chunks: Encoded frames for this client
+        guard: Guard of the run being read
+        receive: ASGI receive callable of the client's request (Request.receive)
+
+    Yields:
+        chunks, unchanged
+    """
+    guard.attach()
+    detached = False
+
+    def detach(_: object = None) -> None:
+        nonlocal detached
+        if not detached:
+            detached = True
+            guard.detach()
+
+    watcher = asyncio.create_task(_wait_for_disconnect(receive))
+    watcher.add_done_callback(lambda task: None if task.cancelled() else detach())
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        watcher.cancel()
+        detach()
+
+
+async def produce_guarded(
+    frames: AsyncIterable[SseFrame], guard: AgentRunGuard
+) -> AsyncGenerator[SseFrame]:
+    """
+    Pass frames through guard.observe(), stopping (and closing frames) when it says so.
+
+    Args:
+        frames: Frame stream of the run (closed on exit, which closes run_async)
+        guard: Guard of the run
+
+    Yields:
+        Frames, until the stream ends or the abandoned run may stop
+    """
+    try:
+        async for frame in frames:
+            yield frame
+            if guard.observe(frame):
+                logger.info(f"[SSE] Stopping abandoned run {guard.name} after tool output")
+                return
+    finally:
+        aclose = getattr(frames, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def stream_detached(
+    frames: AsyncIterable[SseFrame], guard: AgentRunGuard
+) -> AsyncGenerator[SseFrame]:
+    """
+    Consume frames in a producer task bound to guard, and yield them in order.
+
+    Used for non-resumable /stream responses: the HTTP response reads from a
+    one-frame queue, so the run keeps its backpressure, while guard can cancel
+    the producer even when no frame is being written.
+
+    Raises:
+        Exception: The producer's exception, after the frames before it
+    """
+    queue: asyncio.Queue[SseFrame | None] = asyncio.Queue(maxsize=1)
+    error: BaseException | None = None
+    reader_gone = False
+
+    async def produce() -> None:
+        nonlocal error
+        try:  # nosemgrep: forbid-try-except - producer errors are handed to the reader
+            async with contextlib.aclosing(produce_guarded(frames, guard)) as guarded:
+                async for frame in guarded:
+                    if not reader_gone:  # Nobody reads any more: drain until the run may stop
+                        await queue.put(frame)
+        except Exception as e:
+            logger.error(f"[SSE] Run {guard.name} failed: {e!s}")
+            error = e
+        finally:
+            if not reader_gone:
+                await queue.put(None)
+
+    producer = asyncio.create_task(produce(), name=f"sse-run-{guard.name}")
+    guard.bind(producer)
+    try:
+        while (frame := await queue.get()) is not None:
+            yield frame
+        if error is not None:
+            raise error
+    finally:
+        reader_gone = True
+        if not queue.empty():
+            queue.get_nowait()  # Unblock a put() the producer may be waiting in
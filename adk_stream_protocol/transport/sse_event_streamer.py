@@ -20,10 +20,10 @@ from google.adk.runners import Runner
 from google.adk.sessions import Session
 from loguru import logger
 
-from adk_stream_protocol.ags import Ok
+from adk_stream_protocol.protocol.delta_coalescer import CoalesceConfig
+from adk_stream_protocol.protocol.sse_frame import SseFrame
 from adk_stream_protocol.protocol.stream_protocol import stream_adk_to_ai_sdk
 from adk_stream_protocol.tools.frontend_tool_service import FrontendToolDelegate
-from adk_stream_protocol.utils import _parse_sse_event_data
 
 
 class SseEventStreamer:
@@ -44,6 +44,7 @@ class SseEventStreamer:
         confirmation_tools: list[str],
         session: Session,
         sse_agent_runner: Runner | None = None,
+        coalesce: CoalesceConfig | None = None,
     ) -> None:
         """
         Initialize SSE event streamer.
@@ -53,24 +54,27 @@ class SseEventStreamer:
             confirmation_tools: List of tool names requiring confirmation
             session: ADK Session for frontend_delegate access
             sse_agent_runner: Runner instance for accessing session_service
+            coalesce: Delta coalescing windows (None = coalescing disabled)
         """
         self._delegate = frontend_delegate
         self._confirmation_tools = confirmation_tools
         self._session = session
         self._ag_runner = sse_agent_runner
+        self._coalesce = coalesce
         # Track tool IDs currently in confirmation flow
         # Used to intercept and consume confirmation error FunctionResponses
         self._confirmation_in_progress: set[str] = set()
 
-    async def stream_events(self, live_events: AsyncIterable[Any]) -> AsyncIterable[str]:
+    async def stream_events(self, live_events: AsyncIterable[Any]) -> AsyncIterable[SseFrame]:
         """
-        Stream ADK events as SSE-formatted messages.
+        Stream ADK events as SSE frames.
 
         Args:
             live_events: AsyncIterable of ADK events from run_live()
 
         Yields:
-            SSE-formatted strings like 'data: {"type":"text-delta","text":"..."}\\n\\n'
+            SseFrame objects; the caller serializes them at the HTTP boundary
+            via frame.encode() (wire format 'data: {"type":"text-delta",...}\\n\\n')
         """
         event_count = 0
         logger.info("[SSE] Starting to stream ADK events via SSE")
@@ -91,30 +95,20 @@ class SseEventStreamer:
         async for sse_event in stream_adk_to_ai_sdk(
             events_with_invocation_capture(),
             mode="adk-sse",  # Chunk logger: distinguish from adk-bidi mode
+            coalesce=self._coalesce,
         ):
             event_count += 1
+            frame = SseFrame.coerce(sse_event)
 
             # Register function_call.id mapping for frontend delegate tools
-            if sse_event.startswith("data:"):
-                # Skip DONE event
-                if "DONE" == sse_event.strip()[5:].strip():
-                    yield sse_event
-                    continue
-
-                match _parse_sse_event_data(sse_event):
-                    case Ok(event_data):
-                        event_type = event_data.get("type")
-
-                        if event_type == "tool-input-available":
-                            tool_name = event_data.get("toolName")
-                            tool_call_id = event_data.get("toolCallId")
-                            if tool_name and tool_call_id and self._delegate:
-                                self._delegate.set_function_call_id(tool_name, tool_call_id)
-                                logger.debug(
-                                    f"[SSE] Registered mapping: {tool_name} → {tool_call_id}"
-                                )
-
-            yield sse_event
+            if frame.type == "tool-input-available" and frame.event is not None:
+                tool_name = frame.event.get("toolName")
+                tool_call_id = frame.event.get("toolCallId")
+                if tool_name and tool_call_id and self._delegate:
+                    self._delegate.set_function_call_id(tool_name, tool_call_id)
+                    logger.debug(f"[SSE] Registered mapping: {tool_name} → {tool_call_id}")
+
+            yield frame
 
         logger.info(f"[SSE] Streamed {event_count} events to client")
         # no except any other exceptions. Let them propagate to caller for handling.
@@ -0,0 +1,279 @@
+"""
+Resumable SSE Streams (HTTP SSE Mode: Last-Event-ID replay).
+
+Without event ids, a dropped /stream connection (proxy timeout, mobile network
+switch) forces the client to resend the whole request, which re-runs the agent
+and pays for the model tokens again. This module makes a stream resumable:
+
+- Every frame gets a sequential SSE event id ('id: 7\\ndata: {...}\\n\\n').
+- The ADK stream is consumed by a producer task that is detached from the HTTP
+  response, so a client disconnect does not cancel run_async().
+- A bounded per-stream ring buffer keeps the most recent encoded frames.
+- A reconnect carrying Last-Event-ID replays only the missing tail, then keeps
+  following the still-running producer.
+
+Backpressure:
+    While at least one reader is attached, the producer waits when the slowest
+    reader falls max_frames behind (same behavior as a plain StreamingResponse).
+    With no reader attached, the producer runs free and the ring buffer drops
+    the oldest frames; a reconnect older than the buffer cannot be resumed.
+"""
+
+import asyncio
+import functools
+import itertools
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator, AsyncIterable
+
+from loguru import logger
+
+from adk_stream_protocol.ags import Error, Ok, Result
+from adk_stream_protocol.protocol.sse_frame import SseFrame
+from adk_stream_protocol.transport.sse_abandon import AgentRunGuard
+
+
+class SseReplayBuffer:
+    """
+    Ring buffer of one stream's encoded frames, keyed by sequential event id.
+
+    Event ids start at 1; Last-Event-ID 0 (or None) means "from the beginning".
+    """
+
+    def __init__(self, stream_id: str, max_frames: int, owner: str | None = None) -> None:
+        """
+        Initialize replay buffer.
+
+        Args:
+            stream_id: Stream identifier returned to the client (X-Stream-Id header)
+            max_frames: Number of recent frames kept for replay
+            owner: User the stream belongs to (reconnects from other users are rejected)
+        """
+        self.stream_id = stream_id
+        self.owner = owner
+        self._max_frames = max_frames
+        self._frames: deque[bytes] = deque(maxlen=max_frames)
+        self._last_id = 0
+        self._changed = asyncio.Condition()
+        self._reader_cursors: dict[int, int] = {}
+        self._reader_ids = itertools.count()
+        self._error: BaseException | None = None
+        self.guard: AgentRunGuard | None = None  # Abandonment of the run (see sse_abandon.py)
+        self.finished = False
+        self.finished_at: float | None = None
+
+    @property
+    def last_event_id(self) -> int:
+        """Id of the most recent frame (0 before the first frame)."""
+        return self._last_id
+
+    @property
+    def first_buffered_id(self) -> int:
+        """Id of the oldest frame still in the buffer."""
+        return self._last_id - len(self._frames) + 1
+
+    async def append(self, frame: SseFrame) -> None:
+        """
+        Assign the next event id to frame and store its wire bytes.
+
+        Waits while an attached reader is max_frames behind, so no live reader
+        ever loses frames to the ring buffer.
+
+        Args:
+            frame: Frame to append
+        """
+        async with self._changed:
+            await self._changed.wait_for(self._has_room)
+            self._last_id += 1
+            self._frames.append(b"id: %d\n" % self._last_id + frame.encode())
+            self._changed.notify_all()
+
+    async def finish(self, error: BaseException | None = None) -> None:
+        """
+        Mark the stream as complete (readers end after the last frame).
+
+        Args:
+            error: Producer exception, re-raised to readers after the buffered frames
+        """
+        async with self._changed:
+            self.finished = True
+            self.finished_at = time.monotonic()
+            self._error = error
+            self._changed.notify_all()
+
+    def check_resumable(self, last_event_id: int | None) -> Result[int, str]:
+        """
+        Validate a Last-Event-ID against the buffered window.
+
+        Args:
+            last_event_id: Last id the client received (None = from the beginning)
+
+        Returns:
+            Ok(cursor) to pass to follow(), or Error(reason) if frames were already dropped
+        """
+        cursor = last_event_id or 0
+        if cursor > self._last_id:
+            return Error(f"Last-Event-ID {cursor} is ahead of stream (last id {self._last_id})")
+        if cursor + 1 < self.first_buffered_id:
+            return Error(
+                f"Last-Event-ID {cursor} is older than the replay buffer "
+                f"(oldest buffered id {self.first_buffered_id})"
+            )
+        return Ok(cursor)
+
+    async def follow(self, cursor: int = 0) -> AsyncGenerator[bytes]:
+        """
+        Yield wire bytes of every frame after cursor, following until finished.
+
+        Args:
+            cursor: Last event id already delivered to the client (see check_resumable)
+
+        Yields:
+            Encoded frames ('id: N\\ndata: ...\\n\\n')
+
+        Raises:
+            BaseException: The producer's exception, after all buffered frames
+        """
+        reader_id = next(self._reader_ids)
+        self._reader_cursors[reader_id] = cursor
+        try:
+            while True:
+                async with self._changed:
+                    await self._changed.wait_for(functools.partial(self._has_news, cursor))
+                    if cursor < self.first_buffered_id - 1:
+                        # Cannot happen for attached readers (append waits for them)
+                        logger.warning(f"[SSE-RESUME] Reader fell out of buffer {self.stream_id}")
+                        return
+                    start = len(self._frames) - (self._last_id - cursor)
+                    chunk = list(itertools.islice(self._frames, start, None))
+                    cursor = self._last_id
+                    self._reader_cursors[reader_id] = cursor
+                    self._changed.notify_all()
+                    done = self.finished
+                    error = self._error
+
+                for data in chunk:
+                    yield data
+                if done:
+                    if error is not None:
+                        raise error
+                    return
+        finally:
+            del self._reader_cursors[reader_id]
+            async with self._changed:
+                self._changed.notify_all()
+
+    def _has_news(self, cursor: int) -> bool:
+        return cursor < self._last_id or self.finished
+
+    def _has_room(self) -> bool:
+        if not self._reader_cursors:
+            return True
+        slowest = min(self._reader_cursors.values())
+        return self._last_id - slowest < self._max_frames
+
+
+class ResumableSseRegistry:
+    """
+    Registry of resumable SSE streams (one producer task per stream).
+
+    Finished streams are kept for retain_seconds so late reconnects can still
+    replay the tail; at most max_streams finished streams are retained.
+    """
+
+    def __init__(
+        self, max_frames: int = 512, max_streams: int = 64, retain_seconds: float = 60.0
+    ) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            max_frames: Ring buffer size per stream
+            max_streams: Maximum number of retained finished streams
+            retain_seconds: How long finished streams stay resumable
+        """
+        self._max_frames = max_frames
+        self._max_streams = max_streams
+        self._retain_seconds = retain_seconds
+        self._buffers: OrderedDict[str, SseReplayBuffer] = OrderedDict()
+        self._producers: dict[str, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def start(
+        self,
+        stream_id: str,
+        frames: AsyncIterable[SseFrame],
+        owner: str | None = None,
+        guard: AgentRunGuard | None = None,
+    ) -> SseReplayBuffer:
+        """
+        Start consuming frames in a detached producer task.
+
+        Args:
+            stream_id: Unique stream identifier
+            frames: Frame stream (e.g., SseEventStreamer output)
+            owner: User the stream belongs to
+            guard: Cancels the producer once every reader has been gone for its grace period
+
+        Returns:
+            Replay buffer to follow() for the initial response
+        """
+        self._purge()
+        buffer = SseReplayBuffer(stream_id, self._max_frames, owner=owner)
+        self._buffers[stream_id] = buffer
+        producer = asyncio.create_task(
+            self._produce(buffer, frames), name=f"sse-producer-{stream_id}"
+        )
+        self._producers[stream_id] = producer
+        if guard is not None:
+            buffer.guard = guard
+            guard.bind(producer)
+        return buffer
+
+    def get(self, stream_id: str) -> SseReplayBuffer | None:
+        """Look up a stream (None if unknown or expired)."""
+        self._purge()
+        return self._buffers.get(stream_id)
+
+    async def aclose(self) -> None:
+        """Cancel all running producers (server shutdown)."""
+        producers = list(self._producers.values())
+        for task in producers:
+            task.cancel()
+        if producers:
+            await asyncio.wait(producers)
+        self._buffers.clear()
+
+    async def _produce(self, buffer: SseReplayBuffer, frames: AsyncIterable[SseFrame]) -> None:
+        error: BaseException | None = None
+        try:  # nosemgrep: forbid-try-except - producer errors are handed to readers
+            async for frame in frames:
+                await buffer.append(frame)
+        except Exception as e:
+            logger.error(f"[SSE-RESUME] Producer for {buffer.stream_id} failed: {e!s}")
+            error = e
+        finally:
+            self._producers.pop(buffer.stream_id, None)
+            aclose = getattr(frames, "aclose", None)
+            if aclose is not None:
+                await aclose()  # Cancelled mid-append: close run_async now, not at GC
+            await buffer.finish(error)
+            logger.info(
+                f"[SSE-RESUME] Stream {buffer.stream_id} finished ({buffer.last_event_id} frames)"
+            )
+
+    def _purge(self) -> None:
+        """Drop expired finished streams and enforce max_streams (oldest finished first)."""
+        now = time.monotonic()
+        finished = [
+            stream_id
+            for stream_id, buffer in self._buffers.items()
+            if buffer.finished_at is not None
+        ]
+        excess = max(len(finished) - self._max_streams, 0)
+        for index, stream_id in enumerate(finished):
+            finished_at = self._buffers[stream_id].finished_at or now
+            if index < excess or now - finished_at >= self._retain_seconds:
+                del self._buffers[stream_id]
@@ -60,6 +60,17 @@ export interface EventReceiverConfig {
    */
   onPong?: (timestamp: number) => void;
 
+  /**
+   * Callback for the backend session message (resume token for reconnects)
+   */
+  onSession?: (resumeToken: string) => void;
+
+  /**
+   * Callback when the backend rejected a delta-history message event
+   * (stale historyCursor); the event must be resent with the full history
+   */
+  onHistoryMismatch?: (expectedCursor: number | null) => void;
+
   /**
    * Callback when tool-approval-request is received
    * Used by transport to start timeout for backend response (ADR 0011 gap fix)
@@ -118,6 +129,18 @@ export class EventReceiver {
         return;
       }
 
+      // Backend may batch several SSE frames into one message
+      // ("data: {...}\n\ndata: {...}\n\n"); JSON payloads never contain a raw
+      // newline, so "\n\n" only occurs as a frame separator
+      if (data.includes("\n\ndata: ")) {
+        for (const frame of data.split("\n\n")) {
+          if (frame) {
+            this.handleSSEMessage(frame, controller);
+          }
+        }
+        return;
+      }
+
       // Backend sends SSE-formatted events (data: {...}\n\n)
       this.handleSSEMessage(data, controller);
     } catch (error) {
@@ -154,7 +177,7 @@ export class EventReceiver {
   }
 
   /**
-   * Handle non-SSE formatted messages (ping/pong)
+   * Handle non-SSE formatted messages (ping/pong, session, history_mismatch)
    */
   private handleNonSSEMessage(data: string): void {
     try {
@@ -164,6 +187,10 @@ export class EventReceiver {
       );
       if (message.type === "pong" && message.timestamp) {
         this.config.onPong?.(message.timestamp);
+      } else if (message.type === "session" && message.resumeToken) {
+        this.config.onSession?.(message.resumeToken);
+      } else if (message.type === "history_mismatch") {
+        this.config.onHistoryMismatch?.(message.expectedCursor ?? null);
       }
     } catch {
       // Not JSON, log for debugging
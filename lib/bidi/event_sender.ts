@@ -31,6 +31,7 @@ export type MessageEvent = {
   messages: UIMessageFromAISDKv6[]; // messages array (same as SSE)
   trigger: "submit-message" | "regenerate-message"; // trigger (same as SSE)
   messageId: string | undefined; // messageId (same as SSE)
+  historyCursor?: number; // Delta history: messages holds only the tail after this cursor
 };
 
 export type ToolResultEvent = {
@@ -170,6 +171,7 @@ export class EventSender {
    * - Includes chatId, messages, trigger, messageId
    * - Confirmation approvals remain in assistant message parts
    * - Backend receives identical format to SSE mode
+   * - With historyCursor, messages holds only the messages after the cursor
    *
    * @param options - Message sending options (same as SSE)
    */
@@ -178,6 +180,7 @@ export class EventSender {
     messages: UIMessageFromAISDKv6[];
     trigger: "submit-message" | "regenerate-message";
     messageId: string | undefined;
+    historyCursor?: number;
   }): void {
     // Standard message event (matches AI SDK v6 HttpChatTransport format with metadata)
     // Flat structure: metadata (type, version, timestamp) + payload (id, messages, trigger, messageId)
@@ -189,6 +192,9 @@ export class EventSender {
       messages: options.messages,
       trigger: options.trigger,
       messageId: options.messageId,
+      ...(options.historyCursor !== undefined && {
+        historyCursor: options.historyCursor,
+      }),
     };
 
     const lastMsg = options.messages[options.messages.length - 1];
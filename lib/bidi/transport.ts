@@ -61,12 +61,20 @@ import { EventSender } from "./event_sender";
  *                          Only used in voice mode to route audio chunks to Web Audio API
  * @property latencyCallback - Optional callback invoked with latency measurements (ms)
  *                             Useful for monitoring connection quality in real-time
+ * @property resumable - Ask the backend for a resume token (/live?resumable=1) and
+ *                       reconnect with it (/live?resume=<token>) after a dropped
+ *                       connection, reattaching to the running live session
+ * @property deltaHistory - After the first message of a connection, send only the
+ *                          last message plus a historyCursor instead of the full
+ *                          history; a history_mismatch reply triggers a full resend
  */
 export interface WebSocketChatTransportConfig {
   url: string;
   timeout?: number;
   audioContext?: AudioContextValue;
   latencyCallback?: (latency: number) => void;
+  resumable?: boolean;
+  deltaHistory?: boolean;
 }
 
 /**
@@ -117,6 +125,10 @@ export class WebSocketChatTransport implements ChatTransportFromAISDKv6 {
   private eventReceiver: EventReceiver;
   private eventSender: EventSender;
 
+  private resumeToken: string | null = null; // Backend session to reattach on reconnect
+  private historySynced = false; // Backend has this connection's full history (delta mode)
+  private lastSentMessages: Parameters<EventSender["sendMessages"]>[0] | null =
+    null; // Full-history form of the last message event (resent on history_mismatch)
   private pingInterval: NodeJS.Timeout | null = null; // Ping interval timer
   private lastPingTime: number | null = null; // Timestamp of last ping
 
@@ -165,6 +177,10 @@ export class WebSocketChatTransport implements ChatTransportFromAISDKv6 {
           }
         : undefined,
       onPong: (timestamp: number) => this._handlePong(timestamp),
+      onSession: (resumeToken: string) => {
+        this.resumeToken = resumeToken;
+      },
+      onHistoryMismatch: () => this._resendFullHistory(),
       // ADR 0011 gap fix: Start timeout when approval-request received
       onApprovalRequestReceived: () => this._startApprovalTimeout(),
       // ADR 0011 gap fix: Clear timeout when finish-step/[DONE] received
@@ -312,7 +328,8 @@ export class WebSocketChatTransport implements ChatTransportFromAISDKv6 {
       lastMessage: options.messages[options.messages.length - 1],
     });
 
-    const { url, timeout } = this.config;
+    const { timeout } = this.config;
+    const url = this._connectionUrl();
 
     return new ReadableStream<UIMessageChunkFromAISDKv6>({
       start: async (controller) => {
@@ -346,6 +363,7 @@ export class WebSocketChatTransport implements ChatTransportFromAISDKv6 {
 
                 // Update EventSender with new WebSocket instance
                 this.eventSender.setWebSocket(this.ws);
+                this.historySynced = false; // New connection: start with full history
 
                 // DEBUG: Expose WebSocket for e2e testing (Phase 4 timeout test)
                 if (typeof window !== "undefined") {
@@ -486,7 +504,7 @@ export class WebSocketChatTransport implements ChatTransportFromAISDKv6 {
 
           // Send messages to backend using structured event format
           // Format matches AI SDK v6 HttpChatTransportFromAISDKv6 (SSE mode) exactly
-          this.eventSender.sendMessages({
+          this._sendMessageEvent({
             chatId: options.chatId,
             messages: options.messages,
             trigger: options.trigger,
@@ -505,6 +523,50 @@ export class WebSocketChatTransport implements ChatTransportFromAISDKv6 {
     });
   }
 
+  /**
+   * Send a message event (delta history: only the last message after the first event)
+   */
+  private _sendMessageEvent(
+    event: Parameters<EventSender["sendMessages"]>[0],
+  ): void {
+    this.lastSentMessages = event;
+    const { messages } = event;
+    if (!this.config.deltaHistory || !this.historySynced || messages.length < 2) {
+      this.historySynced = Boolean(this.config.deltaHistory);
+      this.eventSender.sendMessages(event);
+      return;
+    }
+    this.eventSender.sendMessages({
+      ...event,
+      messages: messages.slice(-1),
+      historyCursor: messages.length - 1,
+    });
+  }
+
+  /**
+   * Backend rejected the historyCursor: resend the last message event in full
+   */
+  private _resendFullHistory(): void {
+    console.warn("[WS Transport] History cursor mismatch, resending full history");
+    if (this.lastSentMessages) {
+      this.eventSender.sendMessages(this.lastSentMessages);
+    }
+  }
+
+  /**
+   * WebSocket URL for the next connection (adds resume parameters when resumable)
+   */
+  private _connectionUrl(): string {
+    const { url, resumable } = this.config;
+    if (!resumable) {
+      return url;
+    }
+    const separator = url.includes("?") ? "&" : "?";
+    return this.resumeToken
+      ? `${url}${separator}resume=${encodeURIComponent(this.resumeToken)}`
+      : `${url}${separator}resumable=1`;
+  }
+
   private _handleWebSocketMessage(
     data: string,
     controller: ReadableStreamDefaultController<UIMessageChunkFromAISDKv6>,
@@ -528,6 +590,7 @@ export class WebSocketChatTransport implements ChatTransportFromAISDKv6 {
   _close(): void {
     this._clearApprovalTimeout(); // Clear any pending approval timeout
     this._stopPing();
+    this.resumeToken = null; // Explicit close ends the backend session
     this.ws?.close();
     this.ws = null;
   }
@@ -26,6 +26,7 @@
  * Responsibilities:
  * - Type definitions for SSE mode configuration
  * - Helper functions for SSE transport setup
+ * - Opt-in delta history (historyCursor + last message instead of full history)
  * - Re-export DefaultChatTransportFromAISDKv6 for consistency
  */
 
@@ -45,6 +46,59 @@ export interface SseTransportConfig {
     messages: unknown[];
     // biome-ignore lint/suspicious/noExplicitAny: AI SDK v6 internal options type
   }) => Promise<any>;
+
+  /**
+   * Delta history: after the first successful request, send only the last
+   * message plus historyCursor. A 409 history_cursor_mismatch response is
+   * retried once with the full history.
+   */
+  deltaHistory?: boolean;
+}
+
+/**
+ * Delta-history request state of one SSE transport
+ *
+ * The backend session is the source of truth; historyCursor is the number of
+ * messages before the one sent (see advance_history_cursor in the backend).
+ */
+class DeltaHistory {
+  private synced = false; // Backend accepted a request from this transport
+  private fullBody: Record<string, unknown> | null = null; // Resent on mismatch
+
+  prepareBody(body: Record<string, unknown>): Record<string, unknown> {
+    this.fullBody = body;
+    const messages = body.messages as unknown[];
+    if (!this.synced || messages.length < 2) {
+      return body;
+    }
+    return {
+      ...body,
+      messages: messages.slice(-1),
+      historyCursor: messages.length - 1,
+    };
+  }
+
+  fetch: typeof fetch = async (input, init) => {
+    let response = await fetch(input, init);
+    if (response.status === 409 && this.fullBody) {
+      const error = await response
+        .clone()
+        .json()
+        .then((json) => json?.detail?.error)
+        .catch(() => undefined);
+      if (error === "history_cursor_mismatch") {
+        console.warn(
+          "[SSE Transport] History cursor mismatch, resending full history",
+        );
+        response = await fetch(input, {
+          ...init,
+          body: JSON.stringify(this.fullBody),
+        });
+      }
+    }
+    this.synced = response.ok;
+    return response;
+  };
 }
 
 /**
@@ -70,9 +124,30 @@ export interface SseTransportConfig {
 export function createSseTransport(
   config: SseTransportConfig,
 ): DefaultChatTransportFromAISDKv6 {
+  if (!config.deltaHistory) {
+    return new DefaultChatTransport({
+      api: config.api,
+      prepareSendMessagesRequest: config.prepareSendMessagesRequest,
+    });
+  }
+
+  const history = new DeltaHistory();
   return new DefaultChatTransport({
     api: config.api,
-    prepareSendMessagesRequest: config.prepareSendMessagesRequest,
+    fetch: history.fetch,
+    // biome-ignore lint/suspicious/noExplicitAny: AI SDK v6 internal options type
+    prepareSendMessagesRequest: async (options: any) => {
+      const prepared = (await config.prepareSendMessagesRequest?.(options)) ?? {};
+      // Same default body as AI SDK's HttpChatTransport when the hook returns none
+      const body = prepared.body ?? {
+        ...options.body,
+        id: options.id,
+        messages: options.messages,
+        trigger: options.trigger,
+        messageId: options.messageId,
+      };
+      return { ...prepared, body: history.prepareBody(body) };
+    },
   });
 }
 
@@ -111,6 +111,19 @@ describe("BIDI EventReceiver", () => {
       });
     });
 
+    it("should split batched SSE frames in one message", () => {
+      // given - backend batched writes: several frames in one WebSocket message
+      const first = { type: "text-delta", id: "t1", delta: "Hello" };
+      const second = { type: "text-delta", id: "t1", delta: "\n\nWorld" };
+      const batched = `data: ${JSON.stringify(first)}\n\ndata: ${JSON.stringify(second)}\n\n`;
+
+      // when
+      receiver.handleMessage(batched, mockController);
+
+      // then - frames enqueued in order, escaped newlines in payload untouched
+      expect(enqueuedChunks).toEqual([first, second]);
+    });
+
     it("should handle malformed JSON gracefully", () => {
       // given
       const malformedMessage = "data: {invalid json}\n\n";
@@ -282,6 +295,24 @@ describe("BIDI EventReceiver", () => {
       expect(onPong).toHaveBeenCalledWith(123456);
     });
 
+    it("should handle session messages", () => {
+      // given
+      const onSession = vi.fn();
+      receiver = new EventReceiver({ onSession });
+      const sessionMessage = JSON.stringify({
+        type: "session",
+        resumeToken: "token-1",
+        resumed: false,
+      });
+
+      // when
+      receiver.handleMessage(sessionMessage, mockController);
+
+      // then
+      expect(onSession).toHaveBeenCalledWith("token-1");
+      expect(mockController.enqueue).not.toHaveBeenCalled();
+    });
+
     it("should handle non-JSON non-SSE messages gracefully", () => {
       // given
       const invalidMessage = "not json and not sse";
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+ChatMessage Parsing Benchmark
+
+Measures how long parsing a request history takes: 200 messages where every
+fourth user message carries an image, the rest mix text and tool parts.
+
+Compared:
+    tagged      - ChatMessage (MessagePart dispatched on "type", images decoded lazily)
+    plain union - same models as a plain smart union, plus the eager base64 decode
+                  the old ImagePart validator did while parsing
+
+Usage:
+    uv run python scripts/bench_message_parsing.py [--messages 200] [--image-kb 64]
+"""
+
+import argparse
+import base64
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adk_stream_protocol.protocol.message_types import (
+    ChatMessage,
+    FilePart,
+    GenericPart,
+    ImagePart,
+    StepPart,
+    TextPart,
+    ToolResultPart,
+    ToolUsePart,
+)
+
+
+def build_history(message_count: int, image_kb: int) -> list[dict[str, Any]]:
+    """Build an AI SDK v6 style history (raw dicts, as received in the request body)."""
+    image = base64.b64encode(os.urandom(image_kb * 1024)).decode("ascii")
+    history: list[dict[str, Any]] = []
+    for index in range(message_count):
+        if index % 2 == 0:
+            parts: list[dict[str, Any]] = [{"type": "text", "text": f"question {index}"}]
+            if index % 4 == 0:
+                parts.append({"type": "image", "data": image, "media_type": "image/png"})
+            history.append({"id": f"m{index}", "role": "user", "parts": parts})
+        else:
+            parts = [
+                {"type": "step-start"},
+                {"type": "text", "text": f"answer {index} " * 20},
+                {
+                    "type": "tool-change_bgm",
+                    "toolCallId": f"call_{index}",
+                    "state": "output-available",
+                    "input": {"track": 1},
+                    "output": {"ok": True},
+                },
+                {"type": "finish-step"},
+            ]
+            history.append({"id": f"m{index}", "role": "assistant", "parts": parts})
+    return history
+
+
+def time_runs(func: Any, runs: int) -> list[float]:
+    """Run func `runs` times and return the durations in milliseconds."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--image-kb", type=int, default=64)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    history = build_history(args.messages, args.image_kb)
+    tagged = TypeAdapter(list[ChatMessage])
+    plain_union = TypeAdapter(
+        list[
+            TextPart | ImagePart | FilePart | ToolUsePart | ToolResultPart | StepPart | GenericPart
+        ]
+    )
+
+    def parse_tagged() -> None:
+        tagged.validate_python(history)
+
+    def parse_plain_union() -> None:
+        for message in history:
+            for part in plain_union.validate_python(message["parts"]):
+                if isinstance(part, ImagePart):
+                    base64.b64decode(part.data, validate=True)
+
+    print(f"history: {args.messages} messages, {args.image_kb} KB per image, {args.runs} runs")
+    for name, func in [("tagged", parse_tagged), ("plain union", parse_plain_union)]:
+        durations = time_runs(func, args.runs)
+        print(
+            f"  {name:<12} median {statistics.median(durations):8.2f} ms   "
+            f"min {min(durations):8.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
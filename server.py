@@ -10,9 +10,10 @@ import asyncio
 import json
 import os
 import uuid
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, Literal, cast
 
 from dotenv import load_dotenv
 
@@ -34,16 +35,19 @@ from fastapi import (  # noqa: E402
     FastAPI,
     Header,
     HTTPException,
+    Request,
     WebSocket,
     WebSocketDisconnect,
 )
+from fastapi.exceptions import RequestValidationError  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from fastapi.responses import StreamingResponse  # noqa: E402
 from google.adk.agents import LiveRequestQueue  # noqa: E402
 from google.adk.agents.run_config import RunConfig, StreamingMode  # noqa: E402
+from google.adk.sessions import Session  # noqa: E402
 from google.genai import types  # noqa: E402
 from loguru import logger  # noqa: E402
-from pydantic import BaseModel, field_validator  # noqa: E402
+from pydantic import BaseModel, Field, ValidationError, field_validator  # noqa: E402
 from websockets.exceptions import ConnectionClosedError  # noqa: E402
 
 from adk_stream_protocol import (  # noqa: E402
@@ -51,7 +55,9 @@ from adk_stream_protocol import (  # noqa: E402
     BidiEventReceiver,
     BidiEventSender,
     ChatMessage,
+    Error,
     FrontendToolDelegate,
+    Ok,
     SseEventStreamer,
     ToolUsePart,
     bidi_agent,
@@ -60,15 +66,73 @@ from adk_stream_protocol import (  # noqa: E402
     register_delegate,
     sse_agent,
     sse_agent_runner,
+    unregister_delegate,
 )
 
 # Private imports (internal implementation details)
-from adk_stream_protocol.adk.session import clear_sessions, get_or_create_session  # noqa: E402
-from adk_stream_protocol.protocol.message_types import ToolCallState  # noqa: E402
+from adk_stream_protocol.adk.session import (  # noqa: E402
+    _session_store,
+    advance_history_cursor,
+    clear_sessions,
+    configure_session_eviction,
+    get_or_create_session,
+    pin_session,
+    release_session,
+)
+from adk_stream_protocol.ags import (  # noqa: E402
+    configure_delegate_registry,
+    delegate_registry_stats,
+)
+from adk_stream_protocol.protocol.blob_store import (  # noqa: E402
+    BlobStore,
+    configure_blob_store,
+)
+from adk_stream_protocol.protocol.delta_coalescer import CoalesceConfig  # noqa: E402
+from adk_stream_protocol.protocol.image_ingest import ImageIngest  # noqa: E402
+from adk_stream_protocol.protocol.message_types import (  # noqa: E402
+    ToolCallState,
+    predecode_images,
+)
+from adk_stream_protocol.protocol.offload import (  # noqa: E402
+    OffloadConfig,
+    OffloadKind,
+    OffloadPool,
+    configure_offload_pool,
+    get_offload_pool,
+    offload_pool_stats,
+)
+from adk_stream_protocol.protocol.pcm_frame import PCM_BINARY_SUBPROTOCOL  # noqa: E402
+from adk_stream_protocol.protocol.upstream_events import (  # noqa: E402
+    PingEvent,
+    parse_upstream_event,
+)
 from adk_stream_protocol.testing.chunk_logger import chunk_logger  # noqa: E402
-from adk_stream_protocol.tools.confirmation_service import (  # noqa: E402
-    ConfirmationDelegate,
+from adk_stream_protocol.tools.approval_engine import (  # noqa: E402
+    APPROVAL_ENGINE_STATE_KEY,
+    ApprovalEngine,
+    approval_stats,
+)
+from adk_stream_protocol.transport.bidi_resume import (  # noqa: E402
+    BidiLiveSession,
+    BidiSessionRegistry,
+)
+from adk_stream_protocol.transport.connection_supervisor import (  # noqa: E402
+    ConnectionSupervisor,
+    teardown_stats,
 )
+from adk_stream_protocol.transport.send_queue import (  # noqa: E402
+    AudioBackpressurePolicy,
+    SendQueueConfig,
+)
+from adk_stream_protocol.transport.sse_abandon import (  # noqa: E402
+    AbandonConfig,
+    AgentRunGuard,
+    abandon_stats,
+    follow_client,
+    produce_guarded,
+    stream_detached,
+)
+from adk_stream_protocol.transport.sse_resume import ResumableSseRegistry  # noqa: E402
 
 
 # ========== API Key Authentication ==========
@@ -156,6 +220,140 @@ if not os.getenv("GOOGLE_GENERATIVE_AI_API_KEY"):
 use_vertexai = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "0") == "1"
 
 
+# Optional text-delta/reasoning-delta coalescing (disabled when both are unset)
+# STREAM_COALESCE_WINDOW_MS: max milliseconds a delta is held for merging
+# STREAM_COALESCE_MAX_BYTES: flush merged delta once it reaches this many bytes
+_coalesce_window_ms = os.getenv("STREAM_COALESCE_WINDOW_MS", "").strip()
+_coalesce_max_bytes = os.getenv("STREAM_COALESCE_MAX_BYTES", "").strip()
+STREAM_COALESCE = CoalesceConfig(
+    window_ms=float(_coalesce_window_ms) if _coalesce_window_ms else None,
+    max_bytes=int(_coalesce_max_bytes) if _coalesce_max_bytes else None,
+)
+
+# Per-connection outbound queue for /live (slow clients must not stall run_live())
+# BIDI_SEND_QUEUE_MAX_FRAMES: queued frames per connection (0 = send inline, no queue)
+# BIDI_AUDIO_BACKPRESSURE: "drop-oldest" | "merge" | "block" for data-pcm when full
+# BIDI_SEND_BATCH_MAX_BYTES: pack ready frames into one WebSocket message (0 = off).
+#   Only for clients that split messages on "\n\n" (lib/bidi EventReceiver does);
+#   off by default because older clients expect one SSE frame per message.
+_send_queue_max_frames = int(os.getenv("BIDI_SEND_QUEUE_MAX_FRAMES", "256"))
+_send_batch_max_bytes = int(os.getenv("BIDI_SEND_BATCH_MAX_BYTES", "0"))
+_audio_backpressure = os.getenv("BIDI_AUDIO_BACKPRESSURE", "drop-oldest")
+if _audio_backpressure not in {"block", "drop-oldest", "merge"}:
+    msg = f"Invalid BIDI_AUDIO_BACKPRESSURE: {_audio_backpressure!r}"
+    raise ValueError(msg)
+BIDI_SEND_QUEUE = (
+    SendQueueConfig(
+        max_frames=_send_queue_max_frames,
+        audio_policy=cast(AudioBackpressurePolicy, _audio_backpressure),
+        batch_max_bytes=_send_batch_max_bytes if _send_batch_max_bytes > 0 else None,
+    )
+    if _send_queue_max_frames > 0
+    else None
+)
+
+
+def _release_session_resources(session_id: str, session: Any) -> None:
+    """Eviction callback: drop per-session objects that live outside the session store."""
+    delegate = unregister_delegate(session_id)
+    if delegate is not None:
+        delegate.close()  # Fail pending frontend tool calls, drop cached results
+    approvals = session.state.get(APPROVAL_ENGINE_STATE_KEY)
+    if approvals is not None:
+        approvals.close()  # Deny pending approvals (blocked tools return, no timeout wait)
+
+
+# Bounded session store (every /live connection creates a session)
+# SESSION_STORE_MAX_SESSIONS: least recently used sessions beyond this are evicted (0 = unbounded)
+# SESSION_STORE_IDLE_TTL_SECONDS: sessions idle this long are evicted (0 = never)
+_session_store_max = int(os.getenv("SESSION_STORE_MAX_SESSIONS", "1000"))
+_session_store_ttl = float(os.getenv("SESSION_STORE_IDLE_TTL_SECONDS", "3600"))
+configure_session_eviction(
+    max_sessions=_session_store_max if _session_store_max > 0 else None,
+    idle_ttl_seconds=_session_store_ttl if _session_store_ttl > 0 else None,
+    on_evict=_release_session_resources,
+)
+# FrontendToolDelegate registry: drop the registry's own reference after this idle time
+configure_delegate_registry(idle_ttl_seconds=_session_store_ttl if _session_store_ttl > 0 else None)
+
+
+# Reattachable /live sessions (opt in: /live?resumable=1, reconnect: /live?resume=<token>)
+# BIDI_RESUME_GRACE_SECONDS: how long a dropped session waits for a reconnect (0 = disabled)
+# BIDI_RESUME_BUFFER_MESSAGES: unsent messages kept for the reconnecting client
+_bidi_resume_grace = float(os.getenv("BIDI_RESUME_GRACE_SECONDS", "30"))
+BIDI_RESUME = (
+    BidiSessionRegistry(
+        grace_seconds=_bidi_resume_grace,
+        max_buffered_messages=int(os.getenv("BIDI_RESUME_BUFFER_MESSAGES", "256")),
+        on_close=lambda live: release_session(live.session.id),
+    )
+    if _bidi_resume_grace > 0
+    else None
+)
+
+
+# Resumable /stream responses (event ids + Last-Event-ID replay)
+# SSE_RESUME_BUFFER_FRAMES: frames kept per stream for replay (0 = disabled, no event ids)
+# SSE_RESUME_RETAIN_SECONDS: how long a finished stream stays resumable
+# Off by default: a client must read the X-Stream-Id header to reconnect to a stream
+_sse_resume_frames = int(os.getenv("SSE_RESUME_BUFFER_FRAMES", "0"))
+SSE_RESUME = (
+    ResumableSseRegistry(
+        max_frames=_sse_resume_frames,
+        retain_seconds=float(os.getenv("SSE_RESUME_RETAIN_SECONDS", "60")),
+    )
+    if _sse_resume_frames > 0
+    else None
+)
+
+# What happens to a /stream agent run whose client disconnected
+# SSE_ABANDON_POLICY: cancel | finish-tool (let a started tool call finish, then stop) | continue
+# SSE_ABANDON_GRACE_SECONDS: reconnect window before a resumable run is abandoned
+SSE_ABANDON = AbandonConfig(
+    policy=cast(
+        Literal["cancel", "finish-tool", "continue"],
+        os.getenv("SSE_ABANDON_POLICY", "finish-tool"),
+    ),
+    grace_seconds=float(os.getenv("SSE_ABANDON_GRACE_SECONDS", "15")),
+)
+
+# Uploaded files (POST /upload), referenced from FilePart.url as "adk-blob:<sha256>"
+# BLOB_STORE_DIR: content-addressed store directory
+# BLOB_STORE_MAX_BYTES: largest accepted upload
+# BLOB_STORE_MMAP: serve blob reads from memory-mapped files (1 = enabled)
+BLOB_STORE = BlobStore(
+    root=os.getenv("BLOB_STORE_DIR", "./blob_store"),
+    max_bytes=int(os.getenv("BLOB_STORE_MAX_BYTES", str(20 * 1024 * 1024))),
+    memory_map=os.getenv("BLOB_STORE_MMAP", "0") == "1",
+)
+configure_blob_store(BLOB_STORE)
+
+# CPU-heavy payload work (image decode, large frame encoding) above a size threshold
+# INGEST_OFFLOAD_POOL: "thread" | "process" | "none" (all work inline)
+# INGEST_OFFLOAD_THRESHOLD_BYTES: smallest payload sent to the pool
+# INGEST_OFFLOAD_MAX_WORKERS: pool size (empty = executor default)
+_offload_kind = os.getenv("INGEST_OFFLOAD_POOL", "thread").strip()
+_offload_max_workers = os.getenv("INGEST_OFFLOAD_MAX_WORKERS", "").strip()
+if _offload_kind != "none":
+    configure_offload_pool(
+        OffloadPool(
+            OffloadConfig(
+                kind=cast(OffloadKind, _offload_kind),
+                max_workers=int(_offload_max_workers) if _offload_max_workers else None,
+                threshold_bytes=int(os.getenv("INGEST_OFFLOAD_THRESHOLD_BYTES", "262144")),
+            )
+        )
+    )
+
+SSE_RESPONSE_HEADERS = {
+    "Content-Type": "text/event-stream",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+    "x-vercel-ai-ui-message-stream": "v1",  # AI SDK v6 Data Stream Protocol marker
+}
+
+
 app = FastAPI(
     title="ADK Stream Protocol ",
     description="ADK Backend Server with FastAPI implementing AI SDK v6 Data Stream Protocol",
@@ -172,6 +370,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Resumable /stream responses identify the stream to reconnect to
+    expose_headers=["X-Stream-Id"],
 )
 
 # ========== Global Frontend Tool Delegate ==========
@@ -189,21 +389,29 @@ class ChatRequest(BaseModel):
       "messages": UIMessage[],           // Full conversation history (required)
       "chatId": string,                  // Unique chat session ID (optional)
       "trigger": "submit-message" | "regenerate-message",  // Optional
-      "messageId": string | undefined    // Message to regenerate (optional)
+      "messageId": string | undefined,   // Message to regenerate (optional)
+      "historyCursor": number            // Delta-history protocol (optional)
     }
 
     Note: AI SDK v6's DefaultChatTransport (SSE mode) may send only messages field.
     BIDI mode explicitly sends all fields via MessageEvent.
 
+    Delta history: with historyCursor set, messages holds only the messages
+    after the cursor (see advance_history_cursor). A stale cursor is answered
+    with 409 {"error": "history_cursor_mismatch"}; the client then resends the
+    full history without historyCursor.
+
     Validation:
     - messages array must not be empty
     - Each message must conform to ChatMessage (UIMessage) schema
+    - Validated from the raw body bytes in one pass (see read_chat_request)
     """
 
     messages: list[ChatMessage]
     chatId: str | None = None  # Optional - for compatibility with BIDI mode  # noqa: N815
     trigger: Literal["submit-message", "regenerate-message"] | None = None
     messageId: str | None = None  # noqa: N815
+    historyCursor: int | None = Field(default=None, ge=0)  # noqa: N815
 
     # Pydantic v2 uses model_config instead of Config class
     model_config = {"extra": "allow"}  # Allow additional fields for future compatibility
@@ -217,6 +425,27 @@ class ChatRequest(BaseModel):
         return v
 
 
+async def read_chat_request(request: Request) -> ChatRequest:
+    """
+    Validate the /stream body straight from the raw bytes.
+
+    One pydantic-core pass (model_validate_json) instead of FastAPI's json.loads
+    into dicts followed by model validation of the whole history.
+
+    Raises:
+        RequestValidationError: 422 with the same error shape as a FastAPI body model
+    """
+    body = await request.body()
+    # nosemgrep: forbid-try-except - Translate to FastAPI's 422 response
+    try:
+        return ChatRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body) from e
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -228,8 +457,16 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """Health check endpoint"""
-    return {"status": "healthy"}
+    """Health check endpoint (with session / frontend delegate gauges)"""
+    return {
+        "status": "healthy",
+        "sessions": len(_session_store),
+        "frontend_delegates": asdict(delegate_registry_stats()),
+        "offload": asdict(stats) if (stats := offload_pool_stats()) is not None else None,
+        "live_teardown": asdict(teardown_stats()),
+        "approvals": asdict(approval_stats()),
+        "sse_abandon": asdict(abandon_stats()),
+    }
 
 
 @app.post("/clear-sessions")
@@ -253,8 +490,48 @@ async def clear_backend_sessions():
     return {"status": "success", "message": "All sessions cleared"}
 
 
+@app.post("/upload")
+async def upload(
+    api_key: Annotated[str, Depends(verify_api_key)],
+    request: Request,
+) -> dict[str, Any]:
+    """
+    Store an uploaded file (raw request body) in the blob store.
+
+    The body is streamed to disk while hashed, never held in memory as a whole.
+    The returned url goes into FilePart.url in place of a base64 data URL:
+
+        {"type": "file", "mediaType": "image/png", "url": "adk-blob:<sha256>"}
+
+    Returns:
+        {"url": "adk-blob:<sha256>", "size": <bytes>, "mediaType": <Content-Type>}
+
+    Raises:
+        HTTPException(413): Body larger than BLOB_STORE_MAX_BYTES
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit():
+        if int(content_length) > BLOB_STORE.max_bytes:
+            raise HTTPException(
+                status_code=413, detail=f"Upload exceeds {BLOB_STORE.max_bytes} bytes"
+            )
+
+    match await BLOB_STORE.put_stream(request.stream()):
+        case Ok(ref):
+            media_type = request.headers.get("content-type", "application/octet-stream")
+            logger.info(f"[/upload] Stored {ref.url} ({ref.size} bytes, {media_type})")
+            return {"url": ref.url, "size": ref.size, "mediaType": media_type}
+        case Error(reason):
+            logger.warning(f"[/upload] Rejected: {reason}")
+            raise HTTPException(status_code=413, detail=reason)
+
+
 def _process_latest_message(
-    last_message: ChatMessage, session: Any, id_mapper: Any = None, delegate: Any = None
+    last_message: ChatMessage,
+    session: Any,
+    id_mapper: Any = None,
+    delegate: Any = None,
+    image_ingest: ImageIngest | None = None,
 ) -> types.Content | None:
     """
     Process the latest message and convert to ADK Content.
@@ -266,6 +543,7 @@ def _process_latest_message(
         last_message: Message to process
         session: ADK session (for accessing pending_confirmations in Turn 2)
         id_mapper: Optional ID mapper for resolving tool_call_id → tool_name
+        image_ingest: Request-scoped ImageIngest (images already decoded for this request)
     """
     # When user approves adk_request_confirmation, AI SDK sends assistant message back
     # with tool output (not a new user message). We need to send the confirmation
@@ -281,7 +559,9 @@ def _process_latest_message(
         if has_confirmation:
             # Convert confirmation to ADK content
             # This will be a FunctionResponse that ADK can process
-            message_content = last_message.to_adk_content(id_mapper=id_mapper, delegate=delegate)
+            message_content = last_message.to_adk_content(
+                id_mapper=id_mapper, delegate=delegate, image_ingest=image_ingest
+            )
             logger.info(f"[/stream] Processing confirmation response: {message_content}")
             return message_content
         else:
@@ -291,7 +571,9 @@ def _process_latest_message(
     else:
         # User message processing
         # Create ADK message content (includes text, images, function responses, etc.)
-        message_content = last_message.to_adk_content(id_mapper=id_mapper, delegate=delegate)
+        message_content = last_message.to_adk_content(
+            id_mapper=id_mapper, delegate=delegate, image_ingest=image_ingest
+        )
 
         # Log processing type
         last_user_message_text = last_message._get_text_content()
@@ -305,8 +587,9 @@ def _process_latest_message(
 
 @app.post("/stream")
 async def stream(  # noqa: C901, PLR0915
-    request: ChatRequest,
     api_key: Annotated[str, Depends(verify_api_key)],
+    request: Annotated[ChatRequest, Depends(read_chat_request)],
+    http_request: Request,
 ):
     """
     SSE streaming endpoint (requires API key authentication).
@@ -321,12 +604,21 @@ async def stream(  # noqa: C901, PLR0915
     7. Convert ADK events to AI SDK format and stream
 
     AI SDK v6 Data Stream Protocol compliant endpoint.
-    - Request: UIMessage[] (full message history)
+    - Request: UIMessage[] (full message history, or the tail after historyCursor)
     - Response: SSE stream (text-start, text-delta, text-end, finish)
     - Header: X-API-Key (required)
+    - 409: historyCursor does not match the session (client must resend full history)
     """
     logger.info("[/stream] ===== API REQUEST RECEIVED =====")
-    logger.info(f"[/stream] Total messages: {len(request.messages)}")
+    logger.info(
+        f"[/stream] Total messages: {len(request.messages)} "
+        f"(historyCursor: {request.historyCursor})"
+    )
+
+    # Each image payload of this request is decoded once, whichever step converts it
+    # (large payloads on the offload pool, before the synchronous conversion below)
+    image_ingest = ImageIngest()
+    await predecode_images(request.messages, image_ingest)
 
     # Debug logging for all incoming messages with detailed parts
     # Note: Pass ID mapper for tool-result part resolution
@@ -335,7 +627,9 @@ async def stream(  # noqa: C901, PLR0915
         logger.info(f"[/stream] role: {msg.role}")
 
         msg_context = msg.to_adk_content(
-            id_mapper=frontend_delegate._id_mapper, delegate=frontend_delegate
+            id_mapper=frontend_delegate._id_mapper,
+            delegate=frontend_delegate,
+            image_ingest=image_ingest,
         )
         logger.info(f"[/stream] parts count: {len(msg_context.parts) if msg_context.parts else 0}")
 
@@ -363,15 +657,24 @@ async def stream(  # noqa: C901, PLR0915
     if not request.messages:
         raise ValueError("No messages provided in request")
 
-    # Create SSE stream generator inline (transaction script pattern)
-    async def generate_sse_stream():  # noqa: C901, PLR0912, PLR0915
-        # 2. Session management
-        # Get user ID derived from API key (ensures user isolation)
-        user_id = _get_user(api_key)
-        # App-based runner requires app_name to match the App's name
-        session = await get_or_create_session(user_id, sse_agent_runner, "adk_assistant_app_sse")
-        logger.info(f"[/stream] Session ID: {session.id}")
+    # 2. Session management (before streaming, so a stale history cursor gets a 409)
+    # Get user ID derived from API key (ensures user isolation)
+    user_id = _get_user(api_key)
+    # App-based runner requires app_name to match the App's name
+    session = await get_or_create_session(user_id, sse_agent_runner, "adk_assistant_app_sse")
+    logger.info(f"[/stream] Session ID: {session.id}")
+
+    match advance_history_cursor(session.id, request.messages, request.historyCursor):
+        case Ok(cursor):
+            logger.info(f"[/stream] History cursor: {cursor}")
+        case Error(expected):
+            raise HTTPException(
+                status_code=409,
+                detail={"error": "history_cursor_mismatch", "expectedCursor": expected},
+            )
 
+    # Create SSE frame generator inline (transaction script pattern)
+    async def generate_sse_frames():  # noqa: C901, PLR0912, PLR0915
         # Get or create session-specific frontend delegate
         # Delegate must persist across turns so Futures created in Turn 1 can be resolved in Turn 2
         # Note: Cannot store in session.state (not serializable - contains asyncio.Future)
@@ -393,6 +696,7 @@ async def stream(  # noqa: C901, PLR0915
             session,
             id_mapper=frontend_delegate._id_mapper,
             delegate=frontend_delegate,
+            image_ingest=image_ingest,
         )
         if message_content is None:
             return
@@ -484,11 +788,13 @@ async def stream(  # noqa: C901, PLR0915
             confirmation_tools=SSE_CONFIRMATION_TOOLS,
             session=session,
             sse_agent_runner=sse_agent_runner,
+            coalesce=STREAM_COALESCE,
         )
 
         # Stream events to client (handles conversion, confirmation, ID mapping)
-        async for sse_event in streamer.stream_events(event_stream):
-            yield sse_event
+        async for frame in streamer.stream_events(event_stream):
+            await frame.prepare(get_offload_pool())  # Large frames encode off the event loop
+            yield frame
 
         # After streaming, save invocation_id from SseEventStreamer for Turn 2 continuation
         current_invocation_id = getattr(streamer, "_current_invocation_id", None)
@@ -500,20 +806,173 @@ async def stream(  # noqa: C901, PLR0915
 
         logger.info("[/stream] Completed streaming events")
 
-    # Return streaming response
+    # Frames are serialized once, at the HTTP boundary.
+    # The run is stopped per SSE_ABANDON_POLICY once no client reads it any more.
+    if SSE_RESUME is None:
+        guard = AgentRunGuard(AbandonConfig(policy=SSE_ABANDON.policy), name=session.id)
+        return StreamingResponse(
+            follow_client(
+                (frame.encode() async for frame in stream_detached(generate_sse_frames(), guard)),
+                guard,
+                http_request.receive,
+            ),
+            media_type="text/event-stream",
+            headers=SSE_RESPONSE_HEADERS,
+        )
+
+    # Resumable: the agent run is consumed by a detached producer, so a dropped
+    # connection can reattach via GET /stream/{stream_id} with Last-Event-ID
+    stream_id = str(uuid.uuid4())
+    guard = AgentRunGuard(SSE_ABANDON, name=stream_id)
+    replay = SSE_RESUME.start(
+        stream_id, produce_guarded(generate_sse_frames(), guard), owner=user_id, guard=guard
+    )
+    logger.info(f"[/stream] Resumable stream started: stream_id={stream_id}")
     return StreamingResponse(
-        generate_sse_stream(),
+        follow_client(replay.follow(), guard, http_request.receive),
         media_type="text/event-stream",
-        headers={
-            "Content-Type": "text/event-stream",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "x-vercel-ai-ui-message-stream": "v1",  # AI SDK v6 Data Stream Protocol marker
-        },
+        headers={**SSE_RESPONSE_HEADERS, "X-Stream-Id": stream_id},
+    )
+
+
+@app.get("/stream/{stream_id}")
+async def resume_stream(
+    stream_id: str,
+    api_key: Annotated[str, Depends(verify_api_key)],
+    http_request: Request,
+    last_event_id: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+):
+    """
+    Resume a dropped /stream response (requires API key authentication).
+
+    Replays frames after Last-Event-ID from the stream's ring buffer, then keeps
+    following the still-running agent invocation. No model call is repeated.
+
+    Responses:
+    - 200: SSE stream (missing tail + live frames)
+    - 400: Last-Event-ID is not an integer
+    - 404: Unknown, expired, or other user's stream
+    - 410: Last-Event-ID is older than the replay buffer (client must resend the request)
+    """
+    replay = SSE_RESUME.get(stream_id) if SSE_RESUME is not None else None
+    if replay is None or replay.owner != _get_user(api_key):
+        raise HTTPException(status_code=404, detail="Unknown or expired stream")
+
+    if last_event_id is not None and not last_event_id.strip().isdigit():
+        raise HTTPException(status_code=400, detail="Last-Event-ID must be an integer")
+    cursor = int(last_event_id) if last_event_id is not None else None
+
+    match replay.check_resumable(cursor):
+        case Ok(start):
+            logger.info(
+                f"[/stream] Resuming stream_id={stream_id} after event {start} "
+                f"(last id {replay.last_event_id})"
+            )
+            frames = replay.follow(start)
+            return StreamingResponse(
+                frames
+                if replay.guard is None
+                else follow_client(frames, replay.guard, http_request.receive),
+                media_type="text/event-stream",
+                headers={**SSE_RESPONSE_HEADERS, "X-Stream-Id": stream_id},
+            )
+        case Error(reason):
+            raise HTTPException(status_code=410, detail=reason)
+
+
+async def _receive_upstream(websocket: WebSocket, session: Session) -> None:
+    """Receives messages from WebSocket and sends to LiveRequestQueue."""
+    logger.info("[BIDI] upstream_task started")
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+
+        # Binary frame = raw PCM16 microphone audio (16kHz mono)
+        # Fast path: straight to LiveRequestQueue, no JSON/base64/event routing
+        audio_bytes = message.get("bytes")
+        if audio_bytes is not None:
+            receiver = session.state.get("bidi_event_receiver")
+            if receiver:
+                receiver.send_audio_bytes(audio_bytes)
+            continue
+
+        # Text frame = JSON event (audio_chunk with base64 stays as fallback)
+        data = message.get("text") or ""
+
+        # Parse and validate the raw frame in one pass (typed event, messages included)
+        # nosemgrep: forbid-try-except - External WebSocket input requires exception handling
+        try:
+            event = parse_upstream_event(data)
+        except ValidationError as e:
+            logger.error(f"[BIDI] Invalid event received: {e!s}")
+            # Close connection with protocol error code (1002 = protocol error)
+            # (WebSocket close reasons are limited to 123 bytes)
+            reason = f"Invalid event: {e.errors(include_url=False)[0]['msg']}"
+            await websocket.close(code=1002, reason=reason[:123])
+            break
+
+        # Handle ping/pong
+        if isinstance(event, PingEvent):
+            await websocket.send_text(json.dumps({"type": "pong", "timestamp": event.timestamp}))
+            continue
+
+        # Get current receiver from session.state
+        receiver = session.state.get("bidi_event_receiver")
+        if receiver:
+            reply = await receiver.handle_event(event)
+            if reply is not None:
+                # Control message (e.g., history_mismatch), not SSE like pong
+                await websocket.send_text(json.dumps(reply))
+        else:
+            logger.warning(f"[BIDI] No receiver available for event: {event.type}")
+
+
+async def _send_session_token(
+    websocket: WebSocket, live: BidiLiveSession, *, resumed: bool
+) -> None:
+    """Tell the client which token reattaches to this session (non-SSE, like pong)."""
+    await websocket.send_text(
+        json.dumps({"type": "session", "resumeToken": live.resume_token, "resumed": resumed})
     )
 
 
+async def _serve_resumable_connection(
+    websocket: WebSocket, registry: BidiSessionRegistry, live: BidiLiveSession
+) -> None:
+    """
+    Serve one connection of a reattachable /live session.
+
+    Receives upstream messages until the client disconnects (session parked for
+    the grace period) or run_live() ends (session closed).
+    """
+    upstream = asyncio.create_task(_receive_upstream(websocket, live.session))
+    waiting = {upstream} if live.downstream is None else {upstream, live.downstream}
+    try:
+        await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        registry.park(live, websocket)
+        raise
+    finally:
+        upstream.cancel()
+
+    if live.downstream is not None and live.downstream.done():
+        # run_live() ended (completed or failed): the conversation is over
+        if not live.downstream.cancelled() and live.downstream.exception() is not None:
+            logger.error(f"[live_chat] Exception: {live.downstream.exception()!s}")
+        registry.close(live)
+        return
+
+    error = upstream.exception()
+    if isinstance(error, WebSocketDisconnect):
+        logger.warning(f"[BIDI] WebSocket disconnected, keeping session {live.session.id}")
+        registry.park(live, websocket)
+        return
+    if error is not None:
+        logger.error(f"[live_chat] Exception: {error!s}")
+    registry.close(live)
+
+
 @app.websocket("/live")
 async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
     """
@@ -530,6 +989,16 @@ async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
        - Client sends: AI SDK v6 ChatMessage as JSON
        - Server converts: JSON → ADK Content format
        - Server enqueues: Content → LiveRequestQueue
+       - Microphone audio: binary frames of raw PCM16 (16kHz mono) go straight to
+         LiveRequestQueue.send_realtime(); JSON audio_chunk (base64) is still accepted
+       - Reconnect: /live?resumable=1 makes the server send {"type": "session",
+         "resumeToken": ...} first. Reconnecting with /live?resume=<token> within
+         BIDI_RESUME_GRACE_SECONDS reattaches to the same session, LiveRequestQueue
+         and run_live(); messages sent meanwhile are replayed first.
+       - Delta history: a message event with "historyCursor" carries only the
+         messages after the cursor. A stale cursor is answered with
+         {"type": "history_mismatch", "expectedCursor": ...}; the client resends
+         the event with its full history.
 
     2. Server → Client (Downstream):
        - ADK generates: Events from run_live()
@@ -537,6 +1006,8 @@ async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
          (Same converter as /stream endpoint - 100% code reuse!)
        - WebSocket sends: SSE-formatted strings like 'data: {...}\n\n'
        - Client parses: SSE format → UIMessageChunk
+       - Optional: if the client offers the "adk-pcm-binary.v1" subprotocol, PCM audio
+         is sent as binary frames (12-byte header + PCM16) instead of data-pcm JSON
 
     Architecture: "SSE format over WebSocket"
     - Protocol: AI SDK v6 Data Stream Protocol (SSE format)
@@ -550,16 +1021,38 @@ async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
     - Usage metadata
     """
 
-    await websocket.accept()
-    logger.info("[BIDI] WebSocket connection established")
+    # Negotiate binary PCM audio frames: accepted only if the client offers the subprotocol
+    pcm_binary = PCM_BINARY_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    await websocket.accept(subprotocol=PCM_BINARY_SUBPROTOCOL if pcm_binary else None)
+    logger.info(f"[BIDI] WebSocket connection established (binary PCM: {pcm_binary})")
+
+    # Get user ID (single user mode for demo environment without database)
+    user_id = _get_user()
+
+    # Reconnect: reattach to a dropped connection's live session (no new run_live())
+    resume_token = websocket.query_params.get("resume")
+    resumable = resume_token is not None or websocket.query_params.get("resumable") == "1"
+    if BIDI_RESUME is not None and resume_token:
+        parked = BIDI_RESUME.get(resume_token)
+        # Binary PCM framing is fixed for the sender's lifetime: the subprotocol must match
+        live = (
+            BIDI_RESUME.reattach(resume_token, user_id)
+            if parked is not None and parked.session.state.get("pcm_binary") == pcm_binary
+            else None
+        )
+        if live is not None:
+            await _send_session_token(websocket, live, resumed=True)
+            replayed = await live.socket.attach(websocket)
+            logger.info(f"[BIDI] Reattached session {live.session.id} (replayed {replayed})")
+            await _serve_resumable_connection(websocket, BIDI_RESUME, live)
+            return
+        logger.info("[BIDI] Resume token unknown, expired or incompatible - new session")
 
     connection_signature = str(uuid.uuid4())
     logger.info(f"[BIDI] New connection: {connection_signature}")
 
     # Create connection-specific session
     # ADK Design: session = connection (prevents concurrent run_live() race conditions)
-    # Get user ID (single user mode for demo environment without database)
-    user_id = _get_user()
     session = await get_or_create_session(
         user_id,
         bidi_agent_runner,
@@ -567,6 +1060,8 @@ async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
         connection_signature=connection_signature,  # KEY: Creates unique session per connection
     )
     logger.info(f"[BIDI] Session created: {session.id}")
+    # Connection-scoped session: never evicted while open, released when the socket closes
+    pin_session(session.id)
 
     # Get or create session-specific frontend delegate
     # Delegate must persist across turns so Futures created in Turn 1 can be resolved in Turn 2
@@ -639,18 +1134,15 @@ async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
         )
 
     # Tool functions (process_payment, get_location) use this to await user confirmation
-    confirmation_delegate = ConfirmationDelegate()
-    session.state["confirmation_delegate"] = confirmation_delegate
-    logger.info("[BIDI] ConfirmationDelegate initialized")
+    session.state[APPROVAL_ENGINE_STATE_KEY] = ApprovalEngine()
+    logger.info("[BIDI] ApprovalEngine initialized")
 
     # Set mode flag for tool functions to detect SSE vs BIDI mode
     session.state["mode"] = "bidi"
     logger.info("[BIDI] Set session.state['mode'] = 'bidi'")
 
-    # Initialize confirmation_id_mapping for BidiEventSender/Receiver
-    # Maps confirmation_id → original_tool_call_id for approval resolution
-    session.state["confirmation_id_mapping"] = {}
-    logger.info("[BIDI] confirmation_id_mapping dict initialized")
+    # Negotiated outbound audio framing (a reattaching client must negotiate the same)
+    session.state["pcm_binary"] = pcm_binary
 
     # Create BidiEventReceiver (upstream: WebSocket → ADK)
     # Single receiver handles all messages across all turns
@@ -668,13 +1160,24 @@ async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
         bidi_agent.model if isinstance(bidi_agent.model, str) else str(bidi_agent.model)
     )
 
+    # Reattachable session: the sender writes through live.socket, which buffers
+    # outgoing messages while the client is reconnecting
+    live = (
+        BIDI_RESUME.create(websocket, user_id, session, live_request_queue)
+        if BIDI_RESUME is not None and resumable
+        else None
+    )
+
     # Create BidiEventSender for downstream (ADK → WebSocket)
     bidi_event_sender = BidiEventSender(
-        websocket=websocket,
+        websocket=live.socket if live is not None else websocket,
         frontend_delegate=frontend_delegate,
         session=session,
         agent_model=agent_model_str,  # Pass agent model for modelVersion fallback
         confirmation_tools=["process_payment", "get_location"],  # Tools requiring user approval
+        coalesce=STREAM_COALESCE,
+        pcm_binary=pcm_binary,
+        send_queue=BIDI_SEND_QUEUE,
     )
     logger.info("[BIDI] BidiEventSender created (downstream: ADK → WebSocket)")
 
@@ -736,47 +1239,23 @@ async def live_chat(websocket: WebSocket):  # noqa: C901, PLR0915
     # Upstream task: Receive WebSocket messages and send to LiveRequestQueue
     async def upstream_task():
         """Receives messages from WebSocket and sends to LiveRequestQueue."""
-        logger.info("[BIDI] upstream_task started")
-        while True:
-            data = await websocket.receive_text()
-
-            # Parse JSON and handle parse errors
-            # nosemgrep: forbid-try-except - External WebSocket input requires exception handling
-            try:
-                event = json.loads(data)
-            except json.JSONDecodeError as e:
-                logger.error(f"[BIDI] Invalid JSON received: {e!s}")
-                # Close connection with protocol error code (1002 = protocol error)
-                await websocket.close(code=1002, reason=f"Invalid JSON: {e!s}")
-                break
-
-            event_type = event.get("type")
-
-            # Handle ping/pong
-            if event_type == "ping":
-                await websocket.send_text(
-                    json.dumps({"type": "pong", "timestamp": event.get("timestamp")})
-                )
-                continue
-
-            # Get current receiver from session.state
-            receiver = session.state.get("bidi_event_receiver")
-            if receiver:
-                await receiver.handle_event(event)
-            else:
-                logger.warning(f"[BIDI] No receiver available for event: {event_type}")
-
-    try:
-        # Run both tasks concurrently (following official bidi-demo pattern)
-        logger.info("[BIDI] Starting asyncio.gather() for upstream/downstream tasks")
-        await asyncio.gather(upstream_task(), downstream_task())
-
-    except WebSocketDisconnect:
-        logger.warning("[BIDI] WebSocket disconnected")
-    except Exception as e:
-        logger.error(f"[live_chat] Exception: {e!s}")
-    finally:
-        live_request_queue.close()
+        await _receive_upstream(websocket, session)
+
+    if live is not None and BIDI_RESUME is not None:
+        # Reattachable: run_live() consumption outlives this connection
+        await _send_session_token(websocket, live, resumed=False)
+        BIDI_RESUME.start(live, downstream_task())
+        await _serve_resumable_connection(websocket, BIDI_RESUME, live)
+        return
+
+    # Run both tasks in one TaskGroup: when the client goes away, pending tool waits
+    # fail and the queue closes at once, then the sibling task is cancelled
+    supervisor = ConnectionSupervisor(session.id)
+    supervisor.on_teardown(live_request_queue.close)
+    # Eviction fails frontend tool futures and denies pending approvals
+    supervisor.on_teardown(lambda: release_session(session.id))
+    logger.info("[BIDI] Starting connection supervisor for upstream/downstream tasks")
+    await supervisor.serve(upstream_task(), downstream_task())
 
 
 if __name__ == "__main__":
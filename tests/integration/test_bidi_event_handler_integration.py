@@ -21,6 +21,7 @@ import pytest
 from google.genai import types
 
 from adk_stream_protocol import BidiEventReceiver, FrontendToolDelegate
+from adk_stream_protocol.protocol import to_upstream_event
 from adk_stream_protocol.protocol.id_mapper import IDMapper
 from tests.utils.bidi import (
     create_bidi_event_handler,
@@ -78,7 +79,7 @@ async def test_level2_message_event_with_real_frontend_delegate() -> None:
         event = {"type": "message", "version": "1.0", "messages": []}
 
         # when
-        await handler._handle_message_event(event)
+        await handler._handle_message_event(to_upstream_event(event))
 
         # then
         # Should call append_event
@@ -121,7 +122,7 @@ async def test_level2_tool_result_event_with_real_frontend_delegate() -> None:
     }
 
     # when
-    await handler._handle_tool_result_event(event)
+    await handler._handle_tool_result_event(to_upstream_event(event))
 
     # then
     # Should resolve the pending future
@@ -175,7 +176,7 @@ async def test_level2_confirmation_flow_with_real_delegate() -> None:
         event = {"type": "message", "version": "1.0", "messages": []}
 
         # when
-        await handler._handle_message_event(event)
+        await handler._handle_message_event(to_upstream_event(event))
 
         # then
         # Should resolve pending request
@@ -220,7 +221,7 @@ async def test_level3_interrupt_event_with_real_queue() -> None:
     event = {"type": "interrupt", "reason": "user_abort"}
 
     # when
-    await handler._handle_interrupt_event(event)
+    await handler._handle_interrupt_event(to_upstream_event(event))
 
     # then - queue should NOT be closed (interrupt is state change only)
     mock_queue.close.assert_not_called()
@@ -254,7 +255,7 @@ async def test_level3_audio_chunk_with_real_blob_creation() -> None:
     event = {"type": "audio_chunk", "version": "1.0", "chunk": chunk_base64}
 
     # when
-    await handler._handle_audio_chunk_event(event)
+    await handler._handle_audio_chunk_event(to_upstream_event(event))
 
     # then
     mock_queue.send_realtime.assert_called_once()
@@ -311,7 +312,7 @@ async def test_level4_complete_message_flow() -> None:
         event = {"type": "message", "version": "1.0", "messages": []}
 
         # when
-        await handler._handle_message_event(event)
+        await handler._handle_message_event(to_upstream_event(event))
 
         # then
         # Should send content to queue (not append_event, since it's not FunctionResponse)
@@ -353,7 +354,7 @@ async def test_level4_sequential_events() -> None:
         return_value=([], text_content_1),
     ):
         event_1 = {"type": "message", "data": {"messages": []}}
-        await handler._handle_message_event(event_1)
+        await handler._handle_message_event(to_upstream_event(event_1))
 
     # Step 2: Tool result comes back
     pending_future: asyncio.Future[dict[str, Any]] = asyncio.Future()
@@ -365,7 +366,7 @@ async def test_level4_sequential_events() -> None:
         "toolCallId": "loc-call-123",
         "result": {"city": "Tokyo", "country": "Japan"},
     }
-    await handler._handle_tool_result_event(event_2)
+    await handler._handle_tool_result_event(to_upstream_event(event_2))
 
     # Step 3: FunctionResponse message
     function_response = types.FunctionResponse(
@@ -379,7 +380,7 @@ async def test_level4_sequential_events() -> None:
         return_value=([], text_content_3),
     ):
         event_3 = {"type": "message", "data": {"messages": []}}
-        await handler._handle_message_event(event_3)
+        await handler._handle_message_event(to_upstream_event(event_3))
 
     # then
     # Verify sequence
@@ -423,7 +424,7 @@ async def test_level2_missing_tool_result_with_real_delegate() -> None:
     }
 
     # when
-    await handler._handle_tool_result_event(event)
+    await handler._handle_tool_result_event(to_upstream_event(event))
 
     # then
     # Should handle gracefully (no exception)
@@ -454,4 +455,4 @@ async def test_level3_malformed_audio_chunk() -> None:
 
     # when/then
     with pytest.raises(binascii.Error):  # base64 decode error
-        await handler._handle_audio_chunk_event(event)
+        await handler._handle_audio_chunk_event(to_upstream_event(event))
@@ -78,7 +78,7 @@ async def test_sse_confirmation_should_send_tool_input_events_for_original_tool(
     # when - collect streamed events
     sent_events = []
     async for event in streamer.stream_events(mock_live_events()):
-        sent_events.append(event)
+        sent_events.append(event.text)
 
     # then - verify event sequence
     # Find original tool-input-start
@@ -234,6 +234,7 @@ class TestGetLocation:
         mock_tool_context = MagicMock()
         mock_tool_context.session = mock_session
         mock_tool_context.invocation_id = "test-invocation-123"
+        mock_tool_context.function_call_id = "test-invocation-123"
 
         # when: Call get_location with tool_context
         result = await get_location(tool_context=mock_tool_context)
@@ -242,6 +243,7 @@ class TestGetLocation:
         mock_delegate.execute_on_frontend.assert_called_once_with(
             tool_name="get_location",
             args={},
+            function_call_id="test-invocation-123",
         )
         assert result["success"] is True
         assert result["latitude"] == 35.6762
@@ -48,7 +48,7 @@ async def test_change_bgm_uses_wrong_id_when_calling_execute_on_frontend() -> No
 
     # Store delegate in session state (this is how BIDI mode works)
     mock_session.state["frontend_delegate"] = mock_delegate
-    mock_session.state["confirmation_delegate"] = Mock()  # Required to trigger BIDI mode
+    mock_session.state["mode"] = "bidi"  # Required to trigger BIDI mode
 
     # Create ToolContext with DIFFERENT invocation_id and function_call.id
     invocation_id = "e-3166e920-26d8-4452-9a7e-eb2851d2447f"  # ADK event ID
@@ -102,7 +102,6 @@ async def test_get_location_uses_wrong_id_when_calling_execute_on_frontend() ->
         return_value=Ok({"latitude": 35.6762, "longitude": 139.6503, "location": "Tokyo"})
     )
     mock_session.state["frontend_delegate"] = mock_delegate
-    mock_session.state["confirmation_delegate"] = Mock()  # Required to trigger BIDI mode
 
     invocation_id = "e-abc123-def456"
 
@@ -163,7 +162,7 @@ async def test_frontend_delegate_tools_should_use_id_mapper() -> None:
     mock_delegate.execute_on_frontend = AsyncMock(return_value=Ok({"success": True, "track": 1}))
 
     mock_session.state["frontend_delegate"] = mock_delegate
-    mock_session.state["confirmation_delegate"] = Mock()  # Required to trigger BIDI mode
+    mock_session.state["mode"] = "bidi"  # Required to trigger BIDI mode
 
     invocation_id = "e-3166e920-26d8-4452-9a7e-eb2851d2447f"
 
@@ -0,0 +1,236 @@
+"""
+Unit tests for ApprovalEngine (BIDI tool approvals).
+
+Tests:
+- A decision by approval id wakes the BLOCKING tool waiting on the tool call id
+- A decision that arrives before wait() is returned immediately
+- Undecided requests time out on the timer wheel (TimeoutError, counted)
+- Deferred requests (LongRunningFunctionTool) stay decidable past the timeout
+- cancel() / close() answer pending requests with a denial
+- Lookup works by approval id and tool call id; unknown or repeated decisions are ignored
+- The timer wheel expires many requests with one loop timer
+- decide_batch() records a whole approval step before waking the tools
+"""
+
+import asyncio
+import math
+import time
+
+import pytest
+
+from adk_stream_protocol.tools.approval_engine import (
+    APPROVAL_ENGINE_STATE_KEY,
+    ApprovalConfig,
+    ApprovalEngine,
+    TimerWheel,
+    approval_stats,
+    get_approval_engine,
+)
+
+
+_FAST = ApprovalConfig(timeout_seconds=0.05, tick_seconds=0.01, wheel_slots=8)
+
+
+@pytest.mark.asyncio
+async def test_decide_by_approval_id_wakes_waiter() -> None:
+    """The frontend answers with the approval id; the tool waits on its own call id."""
+    # given
+    engine = ApprovalEngine()
+    engine.track("call-1", "process_payment", {"amount": 50}, approval_id="confirm-1")
+    waiter = asyncio.create_task(engine.wait("call-1", "process_payment", {"amount": 50}))
+    await asyncio.sleep(0)
+    assert engine.get("confirm-1").has_waiter
+
+    # when
+    request = engine.decide("confirm-1", approved=True)
+
+    # then
+    assert request is not None
+    assert request.tool_call_id == "call-1"
+    assert await asyncio.wait_for(waiter, timeout=1.0) == {"approved": True}
+    assert engine.get("call-1") is None
+    assert engine.get("confirm-1") is None
+    engine.close()
+
+
+@pytest.mark.asyncio
+async def test_decision_before_wait_returns_immediately() -> None:
+    """A decision that arrives before the tool starts waiting is not lost."""
+    # given
+    engine = ApprovalEngine()
+    engine.track("call-1", "get_location", {}, approval_id="confirm-1")
+    engine.decide("confirm-1", approved=False)
+
+    # when
+    result = await asyncio.wait_for(engine.wait("call-1", "get_location", {}), timeout=1.0)
+
+    # then
+    assert result == {"approved": False}
+    assert engine.pending_count == 0
+    assert engine.get("call-1") is None
+    engine.close()
+
+
+@pytest.mark.asyncio
+async def test_undecided_request_times_out() -> None:
+    """No decision within the timeout raises TimeoutError in the waiting tool."""
+    # given
+    engine = ApprovalEngine(_FAST)
+    before = approval_stats()
+
+    # when/then
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(engine.wait("call-1", "process_payment", {}), timeout=1.0)
+    assert engine.get("call-1") is None
+    after = approval_stats()
+    assert after.timed_out == before.timed_out + 1
+    assert after.pending == before.pending
+    engine.close()
+
+
+@pytest.mark.asyncio
+async def test_deferred_request_outlives_timeout() -> None:
+    """A tool that returned a pending status still gets the user's decision after the timeout."""
+    # given
+    engine = ApprovalEngine(_FAST)
+    engine.track("call-1", "process_payment", {}, approval_id="confirmation-call-1")
+    assert engine.defer("call-1") is not None
+    before = approval_stats()
+
+    # when
+    await asyncio.sleep(_FAST.timeout_seconds * 4)
+
+    # then
+    decided = engine.decide_batch({"confirmation-call-1": True})
+    assert [(request.tool_call_id, request.decision) for request in decided] == [("call-1", True)]
+    assert decided[0].deferred
+    assert approval_stats().timed_out == before.timed_out
+    assert engine.defer("call-1") is None
+    engine.discard("call-1")
+    assert engine.get("call-1") is None
+    engine.close()
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_close_deny_pending_requests() -> None:
+    """Blocked tools return a cancelled denial instead of waiting for their timeout."""
+    # given
+    engine = ApprovalEngine()
+    first = asyncio.create_task(engine.wait("call-1", "process_payment", {}))
+    second = asyncio.create_task(engine.wait("call-2", "get_location", {}))
+    await asyncio.sleep(0)
+    before = approval_stats()
+
+    # when
+    cancelled = engine.cancel("call-1")
+    engine.close()
+
+    # then
+    assert cancelled
+    assert await first == {"approved": False, "cancelled": True}
+    assert await second == {"approved": False, "cancelled": True}
+    assert engine.pending_count == 0
+    assert approval_stats().cancelled == before.cancelled + 2
+
+
+@pytest.mark.asyncio
+async def test_lookup_and_repeated_decisions() -> None:
+    """Both ids resolve to one request; unknown and repeated decisions return None."""
+    # given
+    engine = ApprovalEngine()
+    request = engine.track("call-1", "process_payment", {}, approval_id="confirm-1")
+
+    # when/then
+    assert engine.get("call-1") is request
+    assert engine.get("confirm-1") is request
+    assert engine.awaiting_decision("call-1")
+    assert not engine.awaiting_decision(None)
+    assert engine.decide("unknown", approved=True) is None
+    assert engine.decide("call-1", approved=True) is request
+    assert not engine.awaiting_decision("call-1")
+    assert engine.decide("confirm-1", approved=False) is None
+    assert request.decision is True
+
+    # when the legacy flow has handled the decision
+    engine.discard("confirm-1")
+
+    # then
+    assert engine.get("call-1") is None
+    engine.close()
+
+
+@pytest.mark.asyncio
+async def test_wheel_expires_many_requests() -> None:
+    """Thousands of pending requests expire together, without a task per request."""
+    # given
+    engine = ApprovalEngine(_FAST)
+    for index in range(5000):
+        engine.track(f"call-{index}", "process_payment", {})
+    assert engine.pending_count == 5000
+
+    # when
+    await asyncio.sleep(0.2)
+
+    # then
+    assert engine.pending_count == 0
+    assert engine.get("call-0") is None
+    engine.close()
+
+
+def test_timer_wheel_wraps_around() -> None:
+    """Deadlines beyond one revolution stay scheduled until their own tick."""
+    # given
+    wheel = TimerWheel(tick_seconds=1.0, slots=4)
+    start = math.floor(time.monotonic()) + 10.0
+    wheel.advance(start)
+    wheel.schedule("near", start + 2)
+    wheel.schedule("far", start + 6)
+
+    # when/then
+    assert wheel.advance(start + 2) == ["near"]
+    assert wheel.advance(start + 5) == []
+    assert wheel.advance(start + 6) == ["far"]
+    assert len(wheel) == 0
+    assert not wheel.cancel("far")
+
+
+def test_get_approval_engine_creates_once() -> None:
+    """The session's engine is stored in session.state and reused."""
+    # given
+    state: dict[str, object] = {}
+
+    # when
+    engine = get_approval_engine(state)
+
+    # then
+    assert state[APPROVAL_ENGINE_STATE_KEY] is engine
+    assert get_approval_engine(state) is engine
+
+
+@pytest.mark.asyncio
+async def test_decide_batch_applies_all_decisions_before_waking() -> None:
+    """One message answering several requests decides them together; unknown keys are skipped."""
+    # given
+    engine = ApprovalEngine()
+    engine.track("call-1", "process_payment", {}, approval_id="confirm-1")
+    engine.track("call-2", "process_payment", {}, approval_id="confirm-2")
+    first = asyncio.create_task(engine.wait("call-1", "process_payment", {}))
+    second = asyncio.create_task(engine.wait("call-2", "process_payment", {}))
+    await asyncio.sleep(0)
+    before = approval_stats()
+
+    # when
+    decided = engine.decide_batch(
+        {"confirm-1": True, "call-1": False, "expired": True, "confirm-2": False}
+    )
+
+    # then
+    assert [request.tool_call_id for request in decided] == ["call-1", "call-2"]
+    assert await first == {"approved": True}
+    assert await second == {"approved": False}
+    after = approval_stats()
+    assert after.batches == before.batches + 1
+    assert after.approved == before.approved + 1
+    assert after.denied == before.denied + 1
+    assert engine.pending_count == 0
+    engine.close()
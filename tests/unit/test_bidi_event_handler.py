@@ -5,12 +5,16 @@ Tests BIDI event handling logic extracted from WebSocket handler.
 This enables testing with recorded chunk logs and isolated event processing.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from google.genai import types
+from pydantic import ValidationError
 
 from adk_stream_protocol import BidiEventReceiver
+from adk_stream_protocol.protocol import MessageEvent, parse_upstream_event, to_upstream_event
+from adk_stream_protocol.tools.approval_engine import approval_stats, get_approval_engine
 from tests.utils.mocks import create_mock_session
 
 
@@ -115,7 +119,7 @@ async def test_handle_message_event_syncs_history(mock_process, mock_sync) -> No
     }
 
     # when
-    await handler._handle_message_event(event)
+    await handler._handle_message_event(to_upstream_event(event))
 
     # then
     mock_sync.assert_called_once()
@@ -125,6 +129,62 @@ async def test_handle_message_event_syncs_history(mock_process, mock_sync) -> No
     assert call_kwargs["current_mode"] == "BIDI"
 
 
+@pytest.mark.asyncio
+@patch("adk_stream_protocol.transport.bidi_event_receiver.sync_conversation_history_to_session")
+@patch("adk_stream_protocol.transport.bidi_event_receiver.process_chat_message_for_bidi")
+async def test_handle_message_event_rejects_stale_history_cursor(mock_process, mock_sync) -> None:
+    """A delta message with a stale historyCursor is dropped with a history_mismatch reply."""
+    # given
+    mock_session = create_mock_session()
+    mock_session.id = "session-delta-history"
+    mock_queue = Mock()
+    handler = BidiEventReceiver(
+        session=mock_session,
+        frontend_delegate=Mock(),
+        live_request_queue=mock_queue,
+        bidi_agent_runner=Mock(),
+    )
+    mock_process.return_value = ([], types.Content(role="user", parts=[types.Part(text="Hi")]))
+    hello = {"role": "user", "content": [{"type": "text", "text": "Hello"}]}
+    await handler.handle_event({"type": "message", "messages": [hello]})  # Full history
+    mock_sync.reset_mock()
+    mock_queue.reset_mock()
+
+    # when
+    reply = await handler.handle_event({"type": "message", "messages": [hello], "historyCursor": 7})
+
+    # then
+    assert reply == {"type": "history_mismatch", "expectedCursor": 2}
+    mock_sync.assert_not_called()
+    mock_queue.send_content.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("adk_stream_protocol.transport.bidi_event_receiver.sync_conversation_history_to_session")
+@patch("adk_stream_protocol.transport.bidi_event_receiver.process_chat_message_for_bidi")
+async def test_handle_message_event_shares_one_parse(mock_process, mock_sync) -> None:
+    """History sync and BIDI conversion get the ChatMessage objects parsed with the event."""
+    # given
+    handler = BidiEventReceiver(
+        session=create_mock_session(),
+        frontend_delegate=Mock(),
+        live_request_queue=Mock(),
+        bidi_agent_runner=Mock(),
+    )
+    mock_process.return_value = ([], None)
+    event = parse_upstream_event(
+        b'{"type": "message", "version": "1.0", "messages": [{"role": "user", "content": "Hi"}]}'
+    )
+
+    # when
+    await handler.handle_event(event)
+
+    # then
+    assert isinstance(event, MessageEvent)
+    assert mock_sync.call_args.kwargs["messages"] is event.messages
+    assert mock_process.call_args.args[0]["messages"] is event.messages
+
+
 @pytest.mark.asyncio
 @patch("adk_stream_protocol.transport.bidi_event_receiver.process_chat_message_for_bidi")
 async def test_handle_message_event_sends_image_blobs(mock_process) -> None:
@@ -146,7 +206,7 @@ async def test_handle_message_event_sends_image_blobs(mock_process) -> None:
     event = {"type": "message", "version": "1.0", "messages": []}
 
     # when
-    await handler._handle_message_event(event)
+    await handler._handle_message_event(to_upstream_event(event))
 
     # then
     assert mock_queue.send_realtime.call_count == 2
@@ -174,7 +234,7 @@ async def test_handle_message_event_sends_regular_text(mock_process) -> None:
     event = {"type": "message", "version": "1.0", "messages": []}
 
     # when
-    await handler._handle_message_event(event)
+    await handler._handle_message_event(to_upstream_event(event))
 
     # then
     mock_queue.send_content.assert_called_once_with(text_content)
@@ -212,7 +272,7 @@ async def test_handle_message_event_handles_function_response(mock_process) -> N
     event = {"type": "message", "version": "1.0", "messages": []}
 
     # when
-    await handler._handle_message_event(event)
+    await handler._handle_message_event(to_upstream_event(event))
 
     # then
     # Should call append_event (not send_content)
@@ -224,6 +284,95 @@ async def test_handle_message_event_handles_function_response(mock_process) -> N
     mock_delegate.resolve_tool_result.assert_called_once_with("call_789", {"confirmed": True})
 
 
+def _confirmations(*decisions: tuple[str, bool]) -> types.Content:
+    """One message answering an approval step (adk_request_confirmation per tool call)."""
+    return types.Content(
+        parts=[
+            types.Part(
+                function_response=types.FunctionResponse(
+                    id=confirmation_id,
+                    name="adk_request_confirmation",
+                    response={"confirmed": confirmed},
+                )
+            )
+            for confirmation_id, confirmed in decisions
+        ]
+    )
+
+
+@pytest.mark.asyncio
+@patch("adk_stream_protocol.transport.bidi_event_receiver.process_chat_message_for_bidi")
+async def test_handle_message_event_applies_approval_batch_to_blocking_tools(mock_process) -> None:
+    """All decisions of one message are recorded at once and resume every waiting tool."""
+    # given
+    mock_session = create_mock_session()
+    mock_queue = Mock()
+    handler = BidiEventReceiver(
+        session=mock_session,
+        frontend_delegate=Mock(),
+        live_request_queue=mock_queue,
+        bidi_agent_runner=Mock(),
+    )
+    approvals = get_approval_engine(mock_session.state)
+    approvals.track("call-1", "process_payment", {}, approval_id="confirm-1")
+    approvals.track("call-2", "process_payment", {}, approval_id="confirm-2")
+    first = asyncio.create_task(approvals.wait("call-1", "process_payment", {}))
+    second = asyncio.create_task(approvals.wait("call-2", "process_payment", {}))
+    await asyncio.sleep(0)
+    mock_process.return_value = ([], _confirmations(("confirm-1", True), ("confirm-2", False)))
+    before = approval_stats()
+
+    # when
+    await handler._handle_message_event(to_upstream_event({"type": "message", "messages": []}))
+
+    # then
+    assert await first == {"approved": True}
+    assert await second == {"approved": False}
+    assert approval_stats().batches == before.batches + 1
+    mock_queue.send_content.assert_not_called()  # BLOCKING tools return their own results
+    approvals.close()
+
+
+@pytest.mark.asyncio
+@patch("adk_stream_protocol.transport.bidi_event_receiver.execute_process_payment")
+@patch("adk_stream_protocol.transport.bidi_event_receiver.process_chat_message_for_bidi")
+async def test_handle_message_event_sends_deferred_batch_results_together(
+    mock_process, mock_execute
+) -> None:
+    """Deferred (long-running) tools of one approval step answer ADK in one message."""
+    # given
+    mock_session = create_mock_session()
+    mock_queue = Mock()
+    handler = BidiEventReceiver(
+        session=mock_session,
+        frontend_delegate=Mock(),
+        live_request_queue=mock_queue,
+        bidi_agent_runner=Mock(),
+    )
+    approvals = get_approval_engine(mock_session.state)
+    for index in (1, 2):
+        request = approvals.track(
+            f"call-{index}", "process_payment", {"amount": index}, approval_id=f"confirm-{index}"
+        )
+        request.deferred = True
+    mock_execute.return_value = {"success": True}
+    mock_process.return_value = ([], _confirmations(("confirm-1", True), ("confirm-2", False)))
+
+    # when
+    await handler._handle_message_event(to_upstream_event({"type": "message", "messages": []}))
+
+    # then
+    mock_execute.assert_called_once_with(amount=1)
+    mock_queue.send_content.assert_called_once()
+    content = mock_queue.send_content.call_args[0][0]
+    responses = [part.function_response for part in content.parts]
+    assert [response.id for response in responses] == ["call-1", "call-2"]
+    assert responses[0].response == {"success": True}
+    assert responses[1].response["success"] is False
+    assert approvals.get("call-1") is None
+    assert approvals.get("call-2") is None
+
+
 # ============================================================
 # Interrupt Event Tests
 # ============================================================
@@ -244,7 +393,7 @@ async def test_handle_interrupt_event_closes_queue() -> None:
     event = {"type": "interrupt", "reason": "user_abort"}
 
     # when - Should not raise error
-    await handler._handle_interrupt_event(event)
+    await handler._handle_interrupt_event(to_upstream_event(event))
 
     # then - Queue should NOT be closed (interrupt is state change only)
     mock_queue.close.assert_not_called()
@@ -265,7 +414,7 @@ async def test_handle_interrupt_event_with_default_reason() -> None:
     event = {"type": "interrupt"}  # No reason
 
     # when - Should not raise error
-    await handler._handle_interrupt_event(event)
+    await handler._handle_interrupt_event(to_upstream_event(event))
 
     # then - Queue should NOT be closed (interrupt is state change only)
     mock_queue.close.assert_not_called()
@@ -290,7 +439,7 @@ async def test_handle_audio_control_event_start() -> None:
     event = {"type": "audio_control", "action": "start"}
 
     # when/then - Should not raise error
-    await handler._handle_audio_control_event(event)
+    await handler._handle_audio_control_event(to_upstream_event(event))
 
 
 @pytest.mark.asyncio
@@ -307,7 +456,7 @@ async def test_handle_audio_control_event_stop() -> None:
     event = {"type": "audio_control", "action": "stop"}
 
     # when/then - Should not raise error
-    await handler._handle_audio_control_event(event)
+    await handler._handle_audio_control_event(to_upstream_event(event))
 
 
 # ============================================================
@@ -335,7 +484,7 @@ async def test_handle_audio_chunk_event_decodes_and_sends() -> None:
     event = {"type": "audio_chunk", "version": "1.0", "chunk": chunk_base64}
 
     # when
-    await handler._handle_audio_chunk_event(event)
+    await handler._handle_audio_chunk_event(to_upstream_event(event))
 
     # then
     mock_queue.send_realtime.assert_called_once()
@@ -360,10 +509,33 @@ async def test_handle_audio_chunk_event_missing_chunk() -> None:
     event = {"type": "audio_chunk", "version": "1.0"}  # No chunk
 
     # when/then - Should not raise error
-    await handler._handle_audio_chunk_event(event)
+    await handler._handle_audio_chunk_event(to_upstream_event(event))
     mock_queue.send_realtime.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_send_audio_bytes_sends_raw_pcm_without_decoding() -> None:
+    """send_audio_bytes() (binary frame fast path) should forward raw PCM as-is."""
+    # given
+    mock_queue = Mock()
+    handler = BidiEventReceiver(
+        session=create_mock_session(),
+        frontend_delegate=Mock(),
+        live_request_queue=mock_queue,
+        bidi_agent_runner=Mock(),
+    )
+    audio_data = b"\x00\x01" * 320
+
+    # when
+    handler.send_audio_bytes(audio_data)
+
+    # then
+    call_arg = mock_queue.send_realtime.call_args[0][0]
+    assert isinstance(call_arg, types.Blob)
+    assert call_arg.mime_type == "audio/pcm"
+    assert call_arg.data == audio_data
+
+
 # ============================================================
 # Tool Result Event Tests
 # ============================================================
@@ -389,7 +561,7 @@ async def test_handle_tool_result_event_resolves_result() -> None:
     }
 
     # when
-    await handler._handle_tool_result_event(event)
+    await handler._handle_tool_result_event(to_upstream_event(event))
 
     # then
     mock_delegate.resolve_tool_result.assert_called_once_with(
@@ -416,7 +588,7 @@ async def test_handle_tool_result_event_missing_tool_call_id() -> None:
     }
 
     # when/then - Should not raise error
-    await handler._handle_tool_result_event(event)
+    await handler._handle_tool_result_event(to_upstream_event(event))
     mock_delegate.resolve_tool_result.assert_not_called()
 
 
@@ -439,7 +611,7 @@ async def test_handle_tool_result_event_missing_result() -> None:
     }
 
     # when/then - Should not raise error
-    await handler._handle_tool_result_event(event)
+    await handler._handle_tool_result_event(to_upstream_event(event))
     mock_delegate.resolve_tool_result.assert_not_called()
 
 
@@ -523,7 +695,7 @@ async def test_handle_event_with_none_event_raises_error() -> None:
     )
 
     # when/then
-    with pytest.raises(AttributeError):
+    with pytest.raises(ValidationError):
         await handler.handle_event(None)  # type: ignore
 
 
@@ -539,7 +711,7 @@ async def test_handle_event_with_non_dict_event_raises_error() -> None:
     )
 
     # when/then
-    with pytest.raises(AttributeError):
+    with pytest.raises(ValidationError):
         await handler.handle_event("not_a_dict")  # type: ignore
 
 
@@ -562,7 +734,7 @@ async def test_handle_message_event_with_process_chat_error_raises() -> None:
         side_effect=ValueError("Invalid message format"),
     ):
         with pytest.raises(ValueError, match="Invalid message format"):
-            await handler._handle_message_event(event)
+            await handler._handle_message_event(to_upstream_event(event))
 
 
 @pytest.mark.asyncio
@@ -590,7 +762,7 @@ async def test_handle_message_event_with_sync_history_error_raises() -> None:
         side_effect=RuntimeError("Session sync failed"),
     ):
         with pytest.raises(RuntimeError, match="Session sync failed"):
-            await handler._handle_message_event(event)
+            await handler._handle_message_event(to_upstream_event(event))
 
 
 @pytest.mark.asyncio
@@ -619,7 +791,7 @@ async def test_handle_message_event_with_send_content_error_raises() -> None:
         return_value=([], text_content),
     ):
         with pytest.raises(RuntimeError, match="Queue send failed"):
-            await handler._handle_message_event(event)
+            await handler._handle_message_event(to_upstream_event(event))
 
 
 @pytest.mark.asyncio
@@ -644,7 +816,7 @@ async def test_handle_message_event_with_send_realtime_error_raises() -> None:
         return_value=([Mock()], None),  # Return image blob
     ):
         with pytest.raises(RuntimeError, match="Realtime send failed"):
-            await handler._handle_message_event(event)
+            await handler._handle_message_event(to_upstream_event(event))
 
 
 @pytest.mark.asyncio
@@ -723,7 +895,7 @@ async def test_handle_audio_chunk_with_send_realtime_error_raises() -> None:
 
     # when/then
     with pytest.raises(RuntimeError, match="Send realtime failed"):
-        await handler._handle_audio_chunk_event(event)
+        await handler._handle_audio_chunk_event(to_upstream_event(event))
 
 
 @pytest.mark.asyncio
@@ -749,7 +921,7 @@ async def test_handle_tool_result_with_resolve_error_raises() -> None:
 
     # when/then
     with pytest.raises(RuntimeError, match="Resolve error"):
-        await handler._handle_tool_result_event(event)
+        await handler._handle_tool_result_event(to_upstream_event(event))
 
 
 @pytest.mark.asyncio
@@ -766,6 +938,6 @@ async def test_handle_message_event_with_invalid_messages_format() -> None:
     # Invalid message: not a dict
     event = {"type": "message", "version": "1.0", "messages": ["not_a_dict"]}
 
-    # when/then - should raise error when converting to ChatMessage
-    with pytest.raises(TypeError):
-        await handler._handle_message_event(event)
+    # when/then - rejected while validating the event, before any handler runs
+    with pytest.raises(ValidationError):
+        await handler.handle_event(event)
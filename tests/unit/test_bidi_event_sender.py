@@ -5,12 +5,20 @@ Tests BIDI event sending logic for downstream communication (ADK → WebSocket).
 This enables testing protocol conversion and WebSocket transmission in isolation.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import WebSocketDisconnect
+from google.adk.events import Event
+from google.genai import types
 
 from adk_stream_protocol import BidiEventSender, Error, Ok
+from adk_stream_protocol.protocol.delta_coalescer import CoalesceConfig
+from adk_stream_protocol.protocol.pcm_frame import decode_pcm_frame
+from adk_stream_protocol.protocol.sse_frame import DONE_FRAME, SseFrame
+from adk_stream_protocol.tools.approval_engine import get_approval_engine
+from adk_stream_protocol.transport.send_queue import SendQueueConfig
 from tests.utils.mocks import (
     create_mock_live_events,
     create_mock_session,
@@ -350,6 +358,149 @@ async def test_send_sse_event_handles_tool_approval_request() -> None:
     mock_websocket.send_text.assert_called_once_with(sse_event)
 
 
+def test_skip_pending_output_defers_undecided_approval() -> None:
+    """A pending tool output for an undecided approval is skipped and marks it deferred."""
+    # given
+    mock_session = create_mock_session()
+    sender = BidiEventSender(
+        websocket=Mock(),
+        frontend_delegate=Mock(),
+        confirmation_tools=["process_payment"],
+        session=mock_session,
+    )
+    approvals = get_approval_engine(mock_session.state)
+    request = approvals.track("call-1", "process_payment", {}, approval_id="confirm-1")
+
+    # when/then
+    assert sender._skip_pending_output("call-1")
+    assert request.deferred
+    assert not sender._skip_pending_output("call-2")
+
+    # when the user has decided
+    approvals.decide("confirm-1", approved=True)
+
+    # then the real result is sent
+    assert not sender._skip_pending_output("call-1")
+    approvals.close()
+
+
+@pytest.mark.asyncio
+async def test_send_events_batches_approval_requests_of_one_turn() -> None:
+    """Tool calls of one model turn share a single approval step."""
+    # given
+    mock_websocket = create_mock_websocket()
+    mock_session = create_mock_session()
+    sender = BidiEventSender(
+        websocket=mock_websocket,
+        frontend_delegate=Mock(),
+        confirmation_tools=["process_payment"],
+        session=mock_session,
+    )
+    tool_calls = [
+        f'data: {{"type":"{event_type}","toolCallId":"call-{index}",'
+        f'"toolName":"process_payment","input":{{}}}}\n\n'
+        for index in (1, 2)
+        for event_type in ("tool-input-start", "tool-input-available")
+    ]
+    answer = ['data: {"type":"text-delta","id":"t1","delta":"Done"}\n\n']
+
+    async def convert(events, **kwargs):
+        async for frames in events:  # One "ADK event" = the frames it converts to
+            for frame in frames:
+                yield frame
+
+    # when
+    with patch(
+        "adk_stream_protocol.transport.bidi_event_sender.stream_adk_to_ai_sdk",
+        side_effect=convert,
+    ):
+        await sender.send_events(create_mock_live_events(tool_calls, answer))
+
+    # then
+    sent = [SseFrame.coerce(call.args[0]) for call in mock_websocket.send_text.call_args_list]
+    assert [frame.type for frame in sent] == [
+        "tool-input-start",
+        "tool-input-available",
+        "tool-input-start",
+        "tool-input-available",
+        "start-step",
+        "tool-approval-request",
+        "tool-approval-request",
+        "finish-step",
+        "text-delta",
+    ]
+    approvals = get_approval_engine(mock_session.state)
+    for frame in sent[5:7]:
+        request = approvals.get(frame.event["approvalId"])
+        assert request is not None
+        assert request.tool_call_id == frame.event["toolCallId"]
+    approvals.close()
+
+
+@pytest.mark.asyncio
+async def test_approval_step_is_contiguous_with_coalescing() -> None:
+    """With the delta coalescer's time window on, the approval step is sent as one block."""
+    # given
+    mock_websocket = create_mock_websocket()
+    mock_session = create_mock_session()
+    sender = BidiEventSender(
+        websocket=mock_websocket,
+        frontend_delegate=Mock(),
+        confirmation_tools=["process_payment"],
+        session=mock_session,
+        coalesce=CoalesceConfig(window_ms=5),
+    )
+    step_sent = asyncio.Event()
+    mock_websocket.send_text.side_effect = lambda text: (
+        step_sent.set() if SseFrame.coerce(text).type == "finish-step" else None
+    )
+
+    def model_event(*parts: types.Part, partial: bool = False) -> Event:
+        return Event(
+            author="model",
+            partial=partial,
+            content=types.Content(role="model", parts=list(parts)),
+        )
+
+    async def live_events():
+        for text in ("Paying ", "both ", "now."):
+            yield model_event(types.Part(text=text), partial=True)
+            await asyncio.sleep(0.01)  # Let the time window flush the buffered text
+        yield model_event(
+            *[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        id=f"call-{index}", name="process_payment", args={"amount": index}
+                    )
+                )
+                for index in (1, 2)
+            ]
+        )
+        # run_live() blocks on the tools until the approval step has been answered
+        await asyncio.wait_for(step_sent.wait(), timeout=1.0)
+        yield model_event(types.Part(text="Done"), partial=True)
+
+    # when
+    await sender.send_events(live_events())
+
+    # then
+    types_sent = [
+        SseFrame.coerce(call.args[0]).type for call in mock_websocket.send_text.call_args_list
+    ]
+    start = types_sent.index("start-step")
+    assert types_sent.count("start-step") == 1
+    assert types_sent[start - 1] == "tool-input-available"
+    assert types_sent[start : start + 4] == [
+        "start-step",
+        "tool-approval-request",
+        "tool-approval-request",
+        "finish-step",
+    ]
+    assert types_sent[:start].count("tool-input-available") == 2
+    assert "text-delta" in types_sent[start + 4 :]
+    get_approval_engine(mock_session.state).close()
+
+
 @pytest.mark.asyncio
 async def test_send_sse_event_handles_non_data_events() -> None:
     """_send_sse_event() should handle events without 'data:' prefix."""
@@ -699,3 +850,160 @@ async def test_send_sse_event_with_invalid_json_in_data() -> None:
 
     # then
     mock_websocket.send_text.assert_called_once_with(sse_event)
+
+
+# ============================================================
+# Binary PCM Mode Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_send_sse_event_sends_pcm_as_binary_when_negotiated() -> None:
+    """With pcm_binary, data-pcm frames go out via send_bytes with block id and sequence."""
+    # given
+    mock_websocket = create_mock_websocket()
+    mock_websocket.send_bytes = AsyncMock()
+    sender = BidiEventSender(
+        websocket=mock_websocket,
+        frontend_delegate=Mock(),
+        session=create_mock_session(),
+        pcm_binary=True,
+    )
+    pcm = b"\x00\x01" * 480
+
+    # when - two chunks, end of turn, one more chunk
+    await sender._send_sse_event(SseFrame.data_pcm(pcm, 24000))
+    await sender._send_sse_event(SseFrame.data_pcm(pcm, 24000))
+    await sender._send_sse_event(DONE_FRAME)
+    await sender._send_sse_event(SseFrame.data_pcm(pcm, 24000))
+
+    # then
+    headers = [
+        decode_pcm_frame(call.args[0])[0] for call in mock_websocket.send_bytes.call_args_list
+    ]
+    assert [(h.block_id, h.sequence, h.sample_rate) for h in headers] == [
+        (0, 0, 24000),
+        (0, 1, 24000),
+        (1, 0, 24000),
+    ]
+    assert bytes(decode_pcm_frame(mock_websocket.send_bytes.call_args_list[0].args[0])[1]) == pcm
+    mock_websocket.send_text.assert_called_once_with("data: [DONE]\n\n")
+
+
+@pytest.mark.asyncio
+async def test_send_sse_event_sends_pcm_as_sse_text_by_default() -> None:
+    """Without negotiation, data-pcm frames keep the SSE-over-WebSocket JSON format."""
+    # given
+    mock_websocket = create_mock_websocket()
+    mock_websocket.send_bytes = AsyncMock()
+    sender = BidiEventSender(
+        websocket=mock_websocket,
+        frontend_delegate=Mock(),
+        session=create_mock_session(),
+    )
+
+    # when
+    await sender._send_sse_event(SseFrame.data_pcm(b"\x00\x01", 24000))
+
+    # then
+    mock_websocket.send_bytes.assert_not_called()
+    sent = mock_websocket.send_text.call_args.args[0]
+    assert sent.startswith('data: {"type": "data-pcm"')
+
+
+# ============================================================
+# Outbound Send Queue Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_send_events_with_send_queue_sends_all_frames_in_order() -> None:
+    """With send_queue, frames are written by the writer task and drained before returning."""
+    # given
+    mock_websocket = create_mock_websocket()
+    sender = BidiEventSender(
+        websocket=mock_websocket,
+        frontend_delegate=Mock(),
+        session=create_mock_session(),
+        send_queue=SendQueueConfig(max_frames=1),
+    )
+
+    async def mock_live_events():
+        yield Mock()
+
+    async def mock_stream():
+        for i in range(5):
+            yield SseFrame.text_delta("t1", str(i))
+        yield DONE_FRAME
+
+    # when
+    with patch(
+        "adk_stream_protocol.transport.bidi_event_sender.stream_adk_to_ai_sdk",
+        return_value=mock_stream(),
+    ):
+        await sender.send_events(mock_live_events())
+
+    # then
+    sent = [call.args[0] for call in mock_websocket.send_text.call_args_list]
+    assert sent[:-1] == [SseFrame.text_delta("t1", str(i)).text for i in range(5)]
+    assert sent[-1] == "data: [DONE]\n\n"
+    assert sender.send_queue_stats is not None
+    assert sender.send_queue_stats.sent_frames == 6
+
+
+@pytest.mark.asyncio
+async def test_send_events_with_send_queue_handles_disconnect_gracefully() -> None:
+    """A disconnect in the writer task stops send_events() without raising."""
+    # given
+    mock_websocket = create_mock_websocket()
+    mock_websocket.send_text = AsyncMock(side_effect=WebSocketDisconnect)
+    sender = BidiEventSender(
+        websocket=mock_websocket,
+        frontend_delegate=Mock(),
+        session=create_mock_session(),
+        send_queue=SendQueueConfig(max_frames=2),
+    )
+
+    async def mock_live_events():
+        yield Mock()
+
+    async def mock_stream():
+        for i in range(10):
+            yield SseFrame.text_delta("t1", str(i))
+
+    # when/then - should not raise
+    with patch(
+        "adk_stream_protocol.transport.bidi_event_sender.stream_adk_to_ai_sdk",
+        return_value=mock_stream(),
+    ):
+        await sender.send_events(mock_live_events())
+
+    assert mock_websocket.send_text.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_send_sse_batch_packs_text_frames_into_one_message() -> None:
+    """_send_sse_batch() concatenates SSE frames; binary PCM splits the text message."""
+    # given
+    mock_websocket = create_mock_websocket()
+    mock_websocket.send_bytes = AsyncMock()
+    sender = BidiEventSender(
+        websocket=mock_websocket,
+        frontend_delegate=Mock(),
+        session=create_mock_session(),
+        pcm_binary=True,
+    )
+    a = SseFrame.text_delta("t1", "a")
+    b = SseFrame.text_delta("t1", "b")
+    c = SseFrame.text_delta("t1", "c")
+
+    # when
+    result = await sender._send_sse_batch([a, b, SseFrame.data_pcm(b"\x00\x01", 24000), c])
+
+    # then
+    assert result is True
+    assert [call.args[0] for call in mock_websocket.send_text.call_args_list] == [
+        a.text + b.text,
+        c.text,
+    ]
+    mock_websocket.send_bytes.assert_called_once()
@@ -0,0 +1,188 @@
+"""
+Unit tests for BIDI session reattachment.
+
+Tests ReattachableWebSocket and BidiSessionRegistry:
+- Messages are buffered while detached and replayed in order on attach()
+- A dropped connection during send detaches instead of raising
+- The replay buffer is bounded (oldest messages dropped)
+- reattach() rejects unknown tokens and other users
+- Parked sessions are closed when the grace period expires
+- park() from a stale connection does not detach a newer one
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from adk_stream_protocol.transport.bidi_resume import BidiSessionRegistry, ReattachableWebSocket
+
+
+class _FakeSocket:
+    """Records sent messages; raises WebSocketDisconnect once closed."""
+
+    def __init__(self) -> None:
+        self.sent: list[str | bytes] = []
+        self.closed = False
+
+    async def send_text(self, data: str) -> None:
+        if self.closed:
+            raise WebSocketDisconnect(1006)
+        self.sent.append(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        if self.closed:
+            raise WebSocketDisconnect(1006)
+        self.sent.append(data)
+
+
+def _live_session(registry: BidiSessionRegistry, websocket: _FakeSocket, user_id: str = "user_1"):
+    session = Mock()
+    session.id = "session_1"
+    queue = Mock()
+    return registry.create(websocket, user_id, session, queue)  # type: ignore[arg-type]
+
+
+# ============================================================
+# ReattachableWebSocket Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_send_failure_detaches_and_buffers() -> None:
+    """A dropped client does not raise; the message waits for a reconnect."""
+    # given
+    first = _FakeSocket()
+    socket = ReattachableWebSocket(first)  # type: ignore[arg-type]
+    await socket.send_text("data: 1\n\n")
+    first.closed = True
+
+    # when
+    await socket.send_text("data: 2\n\n")
+    await socket.send_bytes(b"pcm")
+
+    # then
+    assert first.sent == ["data: 1\n\n"]
+    assert socket.websocket is None
+    assert socket.buffered_messages == 2
+
+
+@pytest.mark.asyncio
+async def test_attach_replays_buffered_messages_in_order() -> None:
+    """attach() flushes buffered messages before any new message."""
+    # given
+    socket = ReattachableWebSocket(_FakeSocket())  # type: ignore[arg-type]
+    socket.detach()
+    await socket.send_text("data: a\n\n")
+    await socket.send_bytes(b"pcm")
+
+    # when
+    second = _FakeSocket()
+    replayed = await socket.attach(second)  # type: ignore[arg-type]
+    await socket.send_text("data: b\n\n")
+
+    # then
+    assert replayed == 2
+    assert second.sent == ["data: a\n\n", b"pcm", "data: b\n\n"]
+    assert socket.buffered_messages == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_buffer_drops_oldest_when_full() -> None:
+    """The replay buffer keeps only the newest max_buffered_messages messages."""
+    # given
+    socket = ReattachableWebSocket(_FakeSocket(), max_buffered_messages=2)  # type: ignore[arg-type]
+    socket.detach()
+
+    # when
+    for i in range(4):
+        await socket.send_text(f"data: {i}\n\n")
+
+    # then
+    second = _FakeSocket()
+    await socket.attach(second)  # type: ignore[arg-type]
+    assert second.sent == ["data: 2\n\n", "data: 3\n\n"]
+    assert socket.dropped_messages == 2
+
+
+# ============================================================
+# BidiSessionRegistry Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_reattach_requires_known_token_and_same_user() -> None:
+    """Unknown tokens and other users' tokens start a fresh session instead."""
+    # given
+    registry = BidiSessionRegistry(grace_seconds=10)
+    first = _FakeSocket()
+    live = _live_session(registry, first)
+    registry.park(live, first)  # type: ignore[arg-type]
+
+    # when/then
+    assert registry.reattach("unknown", "user_1") is None
+    assert registry.reattach(live.resume_token, "user_2") is None
+    assert registry.reattach(live.resume_token, "user_1") is live
+    live.live_request_queue.close.assert_not_called()
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_parked_session_closes_after_grace_period() -> None:
+    """Without a reconnect, the queue is closed and the downstream task cancelled."""
+    # given
+    registry = BidiSessionRegistry(grace_seconds=0.01)
+    first = _FakeSocket()
+    live = _live_session(registry, first)
+    registry.start(live, asyncio.Event().wait())  # type: ignore[arg-type]
+
+    # when
+    registry.park(live, first)  # type: ignore[arg-type]
+    await asyncio.sleep(0.05)
+
+    # then
+    assert registry.get(live.resume_token) is None
+    live.live_request_queue.close.assert_called_once()
+    assert live.downstream is not None
+    assert live.downstream.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_park_from_stale_connection_keeps_new_connection() -> None:
+    """A late disconnect of the old connection must not detach the reattached one."""
+    # given
+    registry = BidiSessionRegistry(grace_seconds=10)
+    first = _FakeSocket()
+    live = _live_session(registry, first)
+
+    # when: client reconnects before the server noticed the old connection dropped
+    assert registry.reattach(live.resume_token, "user_1") is live
+    second = _FakeSocket()
+    await live.socket.attach(second)  # type: ignore[arg-type]
+    registry.park(live, first)  # type: ignore[arg-type]
+
+    # then
+    assert live.socket.websocket is second
+    assert registry.get(live.resume_token) is live
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_downstream_end_while_parked_closes_session() -> None:
+    """If run_live() ends while nobody is attached, the session is released."""
+    # given
+    registry = BidiSessionRegistry(grace_seconds=10)
+    first = _FakeSocket()
+    live = _live_session(registry, first)
+    release = asyncio.Event()
+    registry.start(live, release.wait())  # type: ignore[arg-type]
+    registry.park(live, first)  # type: ignore[arg-type]
+
+    # when
+    release.set()
+    await asyncio.sleep(0.01)
+
+    # then
+    assert registry.get(live.resume_token) is None
+    assert len(registry) == 0
@@ -0,0 +1,163 @@
+"""
+Unit tests for blob_store module.
+
+Tests:
+- Uploads are stored under their SHA-256 and identical content dedupes
+- Uploads over max_bytes are rejected without leaving files behind
+- Malformed or unknown handles are rejected (no path traversal)
+- Memory-mapped reads return the stored content
+- FilePart "adk-blob:" handles resolve to types.Blob in to_adk_content()
+"""
+
+import hashlib
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import pytest
+
+from adk_stream_protocol.ags import Error, Ok
+from adk_stream_protocol.protocol.blob_store import (
+    BLOB_URL_PREFIX,
+    BlobStore,
+    blob_digest,
+    configure_blob_store,
+)
+from adk_stream_protocol.protocol.message_types import ChatMessage, FilePart, TextPart
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def blob_store(tmp_path: Path) -> Iterator[BlobStore]:
+    """Blob store in a temp dir, configured as the process-wide store for the test."""
+    store = BlobStore(tmp_path / "blobs", max_bytes=1024)
+    configure_blob_store(store)
+    yield store
+    configure_blob_store(None)
+
+
+@pytest.mark.asyncio
+async def test_put_stream_stores_content_under_sha256(blob_store: BlobStore) -> None:
+    """Streamed chunks are hashed and stored at the content address."""
+    # given
+    digest = hashlib.sha256(b"hello world").hexdigest()
+
+    # when
+    result = await blob_store.put_stream(_chunks(b"hello ", b"world"))
+
+    # then
+    assert isinstance(result, Ok)
+    assert result.value.url == f"{BLOB_URL_PREFIX}{digest}"
+    assert result.value.size == 11
+    assert blob_store.path_for(digest).read_bytes() == b"hello world"
+    assert list((blob_store.root / "tmp").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_dedupe(blob_store: BlobStore) -> None:
+    """Uploading the same content twice returns the same handle and keeps one file."""
+    # when
+    first = await blob_store.put_stream(_chunks(b"same"))
+    second = blob_store.put_bytes(b"same")
+
+    # then
+    assert isinstance(first, Ok) and isinstance(second, Ok)
+    assert first.value == second.value
+    digest = blob_digest(first.value.url)
+    assert digest is not None
+    assert list(blob_store.path_for(digest).parent.iterdir()) == [blob_store.path_for(digest)]
+
+
+@pytest.mark.asyncio
+async def test_upload_over_limit_is_rejected(blob_store: BlobStore) -> None:
+    """An upload larger than max_bytes is an Error and leaves nothing on disk."""
+    # when
+    streamed = await blob_store.put_stream(_chunks(b"x" * 1000, b"x" * 1000))
+    in_memory = blob_store.put_bytes(b"x" * 2000)
+
+    # then
+    assert isinstance(streamed, Error)
+    assert isinstance(in_memory, Error)
+    assert sorted(path.name for path in blob_store.root.iterdir()) == ["tmp"]
+    assert list((blob_store.root / "tmp").iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "adk-blob:../../etc/passwd",
+        "adk-blob:" + "A" * 64,  # Upper-case hex is not a handle this store issues
+        "adk-blob:" + "0" * 63,
+        "data:image/png;base64,AAAA",
+        "adk-blob:" + "0" * 64,  # Well-formed but never stored
+    ],
+)
+def test_read_rejects_malformed_or_unknown_handles(blob_store: BlobStore, url: str) -> None:
+    """read() only resolves well-formed handles of stored blobs."""
+    # when/then
+    assert isinstance(blob_store.read(url), Error)
+
+
+def test_memory_mapped_read(tmp_path: Path) -> None:
+    """memory_map=True serves the same bytes (and empty blobs) through the mmap LRU."""
+    # given
+    store = BlobStore(tmp_path, memory_map=True, max_mapped_files=1)
+    first = store.put_bytes(b"first blob")
+    second = store.put_bytes(b"second blob")
+    empty = store.put_bytes(b"")
+    assert isinstance(first, Ok) and isinstance(second, Ok) and isinstance(empty, Ok)
+
+    # when
+    results = [store.read(ref.value.url) for ref in (first, second, first, empty)]
+    store.close()
+
+    # then
+    assert results == [Ok(b"first blob"), Ok(b"second blob"), Ok(b"first blob"), Ok(b"")]
+
+
+def test_file_part_blob_handle_resolves_in_to_adk_content(blob_store: BlobStore) -> None:
+    """A FilePart carrying an "adk-blob:" handle becomes an inline types.Blob."""
+    # given
+    png_bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+    stored = blob_store.put_bytes(png_bytes)
+    assert isinstance(stored, Ok)
+    message = ChatMessage(
+        role="user",
+        parts=[
+            TextPart(text="What is this?"),
+            FilePart(filename="photo.png", media_type="image/png", url=stored.value.url),
+        ],
+    )
+
+    # when
+    content = message.to_adk_content()
+
+    # then
+    assert content.parts is not None
+    assert len(content.parts) == 2
+    assert content.parts[1].inline_data is not None
+    assert content.parts[1].inline_data.data == png_bytes
+    assert content.parts[1].inline_data.mime_type == "image/png"
+
+
+def test_file_part_blob_handle_without_store_is_skipped(tmp_path: Path) -> None:
+    """Without a configured store, a blob handle is skipped (not an error)."""
+    # given
+    configure_blob_store(None)
+    message = ChatMessage(
+        role="user",
+        parts=[
+            TextPart(text="hi"),
+            FilePart(filename="photo.png", media_type="image/png", url="adk-blob:" + "0" * 64),
+        ],
+    )
+
+    # when
+    content = message.to_adk_content()
+
+    # then
+    assert content.parts is not None
+    assert len(content.parts) == 1
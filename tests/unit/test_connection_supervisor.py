@@ -0,0 +1,160 @@
+"""
+Unit tests for ConnectionSupervisor (/live structured-concurrency teardown).
+
+Tests:
+- A client disconnect cancels the downstream task and runs teardown callbacks once
+- Blocked tool waits (approval, frontend tool) are released at teardown, not at timeout
+- A downstream failure cancels upstream
+- A downstream that completes normally leaves upstream running
+- Teardown latency is recorded
+"""
+
+import asyncio
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from adk_stream_protocol.tools.approval_engine import ApprovalEngine
+from adk_stream_protocol.tools.frontend_tool_service import FrontendToolDelegate
+from adk_stream_protocol.transport.connection_supervisor import (
+    ConnectionSupervisor,
+    teardown_stats,
+)
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_downstream_and_tears_down_once() -> None:
+    """Upstream ending with WebSocketDisconnect ends the whole connection."""
+    # given
+    supervisor = ConnectionSupervisor("conn-1")
+    calls: list[str] = []
+    supervisor.on_teardown(lambda: calls.append("teardown"))
+    downstream_cancelled = asyncio.Event()
+    before = teardown_stats()
+
+    async def upstream() -> None:
+        await asyncio.sleep(0)
+        raise WebSocketDisconnect(1006)
+
+    async def downstream() -> None:
+        try:  # nosemgrep: forbid-try-except - observe cancellation in the test
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            downstream_cancelled.set()
+            raise
+
+    # when
+    await asyncio.wait_for(supervisor.serve(upstream(), downstream()), timeout=1.0)
+
+    # then
+    assert downstream_cancelled.is_set()
+    assert calls == ["teardown"]
+    after = teardown_stats()
+    assert after.connections == before.connections + 1
+    assert after.cancelled_tasks == before.cancelled_tasks + 1
+    assert after.last_teardown_seconds < 1.0
+
+
+@pytest.mark.asyncio
+async def test_blocked_tool_waits_are_released_at_teardown() -> None:
+    """Approval and frontend tool waits end at teardown instead of after their timeouts."""
+    # given
+    supervisor = ConnectionSupervisor("conn-2")
+    approvals = ApprovalEngine()
+    frontend = FrontendToolDelegate()
+    frontend.set_function_call_id("get_location", "call_1")
+    supervisor.on_teardown(approvals.close)
+    supervisor.on_teardown(frontend.close)
+    results: dict[str, object] = {}
+    upstream_may_end = asyncio.Event()
+
+    async def tool_waits() -> None:
+        approve = asyncio.create_task(approvals.wait("call_0", "process_payment", {}))
+        execute = asyncio.create_task(frontend.execute_on_frontend("get_location", {}))
+        await asyncio.sleep(0)
+        upstream_may_end.set()
+        results["approval"] = await approve
+        results["frontend"] = await execute
+
+    async def upstream() -> None:
+        await upstream_may_end.wait()
+        raise WebSocketDisconnect(1000)
+
+    # when
+    waits = asyncio.create_task(tool_waits())
+    await asyncio.wait_for(supervisor.serve(upstream(), asyncio.sleep(3600)), timeout=1.0)
+    await asyncio.wait_for(waits, timeout=1.0)
+
+    # then
+    assert results["approval"] == {"approved": False, "cancelled": True}
+    assert "Session closed" in str(results["frontend"])
+    assert approvals.pending_count == 0
+    assert frontend.pending_call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_downstream_failure_cancels_upstream() -> None:
+    """A failing run_live() consumer ends the connection (error is logged, not raised)."""
+    # given
+    supervisor = ConnectionSupervisor("conn-3")
+    upstream_cancelled = asyncio.Event()
+
+    async def upstream() -> None:
+        try:  # nosemgrep: forbid-try-except - observe cancellation in the test
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            upstream_cancelled.set()
+            raise
+
+    async def downstream() -> None:
+        raise RuntimeError("Live API closed")
+
+    # when
+    await asyncio.wait_for(supervisor.serve(upstream(), downstream()), timeout=1.0)
+
+    # then
+    assert upstream_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_downstream_completion_keeps_upstream_running() -> None:
+    """run_live() finishing normally does not cut off the client (gather semantics)."""
+    # given
+    supervisor = ConnectionSupervisor("conn-4")
+    order: list[str] = []
+
+    async def upstream() -> None:
+        await asyncio.sleep(0.01)
+        order.append("upstream")
+
+    async def downstream() -> None:
+        order.append("downstream")
+
+    # when
+    await asyncio.wait_for(supervisor.serve(upstream(), downstream()), timeout=1.0)
+
+    # then
+    assert order == ["downstream", "upstream"]
+
+
+@pytest.mark.asyncio
+async def test_failing_teardown_callback_does_not_skip_others() -> None:
+    """Every teardown callback runs even if an earlier one raises."""
+    # given
+    supervisor = ConnectionSupervisor("conn-5")
+    calls: list[str] = []
+
+    def broken() -> None:
+        raise RuntimeError("boom")
+
+    supervisor.on_teardown(broken)
+    supervisor.on_teardown(lambda: calls.append("second"))
+
+    async def upstream() -> None:
+        return
+
+    # when
+    await supervisor.serve(upstream(), asyncio.sleep(3600))
+
+    # then
+    assert calls == ["second"]
@@ -0,0 +1,231 @@
+"""
+Unit tests for the delta coalescing stage.
+
+Tests coalesce_deltas() and its integration into stream_adk_to_ai_sdk():
+- Consecutive text-delta / reasoning-delta frames for the same block id are merged
+- Any other event type flushes the buffer first (ordering preserved)
+- Byte window and time window flushes
+- The time window reads upstream on demand, in one task
+- Coalescing is off unless a window is configured
+"""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from adk_stream_protocol.protocol.delta_coalescer import CoalesceConfig, coalesce_deltas
+from adk_stream_protocol.protocol.sse_frame import SseFrame
+from adk_stream_protocol.protocol.stream_protocol import stream_adk_to_ai_sdk
+
+
+async def _frames(*frames: SseFrame, delay: float = 0.0):
+    for frame in frames:
+        if delay:
+            await asyncio.sleep(delay)
+        yield frame
+
+
+def _delta(block_id: str, delta: str, event_type: str = "text-delta") -> SseFrame:
+    return SseFrame({"type": event_type, "id": block_id, "delta": delta})
+
+
+# ============================================================
+# coalesce_deltas() Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_merges_consecutive_deltas_and_flushes_on_other_event() -> None:
+    """Deltas for one block are merged; text-end flushes them before passing through."""
+    # given
+    source = _frames(
+        SseFrame({"type": "text-start", "id": "t1"}),
+        _delta("t1", "Hel"),
+        _delta("t1", "lo, "),
+        _delta("t1", "world"),
+        SseFrame({"type": "text-end", "id": "t1"}),
+    )
+
+    # when
+    result = [frame.event async for frame in coalesce_deltas(source)]
+
+    # then
+    assert result == [
+        {"type": "text-start", "id": "t1"},
+        {"type": "text-delta", "id": "t1", "delta": "Hello, world"},
+        {"type": "text-end", "id": "t1"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_block_or_type_change_flushes() -> None:
+    """A delta for a different block id or delta type starts a new merged frame."""
+    # given
+    source = _frames(
+        _delta("r1", "think", "reasoning-delta"),
+        _delta("r1", "ing", "reasoning-delta"),
+        _delta("t1", "a"),
+        _delta("t2", "b"),
+        _delta("t2", "c"),
+    )
+
+    # when
+    result = [frame.event async for frame in coalesce_deltas(source)]
+
+    # then
+    assert result == [
+        {"type": "reasoning-delta", "id": "r1", "delta": "thinking"},
+        {"type": "text-delta", "id": "t1", "delta": "a"},
+        {"type": "text-delta", "id": "t2", "delta": "bc"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_byte_window_flushes() -> None:
+    """Buffer is flushed as soon as it reaches max_bytes."""
+    # given - "あ" is 3 UTF-8 bytes
+    source = _frames(*[_delta("t1", "あ") for _ in range(5)])
+
+    # when
+    result = [frame.event["delta"] async for frame in coalesce_deltas(source, max_bytes=6)]
+
+    # then
+    assert result == ["ああ", "ああ", "あ"]
+
+
+@pytest.mark.asyncio
+async def test_time_window_flushes_idle_buffer() -> None:
+    """Buffered delta is flushed after window_ms even if upstream is idle."""
+    # given
+    release = asyncio.Event()
+    received: list[str] = []
+
+    async def source():
+        yield _delta("t1", "early")
+        await release.wait()
+        yield SseFrame({"type": "text-end", "id": "t1"})
+
+    async def consume() -> None:
+        async for frame in coalesce_deltas(source(), window_ms=10):
+            received.append(frame.type or "")
+
+    # when
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.1)
+    flushed_while_idle = list(received)
+    release.set()
+    await task
+
+    # then
+    assert flushed_while_idle == ["text-delta"]
+    assert received == ["text-delta", "text-end"]
+
+
+# ============================================================
+# stream_adk_to_ai_sdk() Integration Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_stream_adk_to_ai_sdk_coalescing_disabled_by_default() -> None:
+    """Without a window, every delta passes through unchanged."""
+    # given
+    source = _frames(_delta("t1", "a"), _delta("t1", "b"))
+
+    # when
+    types = [frame.type async for frame in stream_adk_to_ai_sdk(source)]
+
+    # then
+    assert types.count("text-delta") == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_adk_to_ai_sdk_flushes_before_finish() -> None:
+    """Buffered deltas are emitted before finish and [DONE]."""
+    # given
+    source = _frames(_delta("t1", "a"), _delta("t1", "b"))
+
+    # when
+    frames = [
+        frame
+        async for frame in stream_adk_to_ai_sdk(
+            source, coalesce=CoalesceConfig(window_ms=1000, max_bytes=1024)
+        )
+    ]
+
+    # then
+    assert frames[0].event == {"type": "text-delta", "id": "t1", "delta": "ab"}
+    assert frames[-2].type == "finish"
+    assert frames[-1].is_done
+
+
+@pytest.mark.asyncio
+async def test_time_window_advances_upstream_on_demand() -> None:
+    """Upstream steps run only when the consumer asks for the next frame."""
+    # given
+    log: list[str] = []
+
+    async def source():
+        log.append("produce text-start")
+        yield SseFrame({"type": "text-start", "id": "t1"})
+        log.append("produce text-end")
+        yield SseFrame({"type": "text-end", "id": "t1"})
+
+    # when
+    async for frame in coalesce_deltas(source(), window_ms=10):
+        log.append(f"consume {frame.type}")
+        await asyncio.sleep(0.02)
+
+    # then
+    assert log == [
+        "produce text-start",
+        "consume text-start",
+        "produce text-end",
+        "consume text-end",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_time_window_keeps_upstream_context() -> None:
+    """All upstream steps run in one task, so contextvars set upstream carry over."""
+    # given
+    step: contextvars.ContextVar[str] = contextvars.ContextVar("step", default="unset")
+    seen: list[str] = []
+
+    async def source():
+        step.set("first")
+        yield _delta("t1", "a")
+        seen.append(step.get())
+        await asyncio.sleep(0.05)
+        yield SseFrame({"type": "text-end", "id": "t1"})
+        seen.append(step.get())
+
+    # when
+    types = [frame.type async for frame in coalesce_deltas(source(), window_ms=10)]
+
+    # then
+    assert types == ["text-delta", "text-end"]
+    assert seen == ["first", "first"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("window_ms", [None, 1000])
+async def test_upstream_error_flushes_buffer_first(window_ms: float | None) -> None:
+    """Deltas buffered before an upstream error are sent, then the error propagates."""
+    # given
+    received: list[str] = []
+
+    async def source():
+        yield _delta("t1", "Hel")
+        yield _delta("t1", "lo")
+        msg = "upstream failed"
+        raise TimeoutError(msg)
+
+    # when
+    with pytest.raises(TimeoutError, match="upstream failed"):
+        async for frame in coalesce_deltas(source(), window_ms=window_ms):
+            received.append(frame.event["delta"])
+
+    # then
+    assert received == ["Hello"]
@@ -11,7 +11,7 @@ Based on implementation in server.py (FrontendToolDelegate class)
 
 import asyncio
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -198,7 +198,7 @@ async def test_change_bgm_uses_delegate_in_bidi_mode() -> None:
     # Create mock ToolContext with delegate
     mock_tool_context = create_mock_tool_context(
         invocation_id="call_789",
-        session_state={"frontend_delegate": mock_delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": mock_delegate, "mode": "bidi"},
     )
 
     # Register delegate in registry
@@ -275,7 +275,7 @@ async def test_change_bgm_delegate_call_count_spy() -> None:
         # Create mock ToolContext
         mock_tool_context = create_mock_tool_context(
             invocation_id="call_spy_test",
-            session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+            session_state={"frontend_delegate": delegate, "mode": "bidi"},
         )
 
         # Register delegate in registry
@@ -295,6 +295,7 @@ async def test_change_bgm_delegate_call_count_spy() -> None:
         spy.assert_called_once_with(
             tool_name="change_bgm",
             args={"track": 0},
+            function_call_id="call_spy_test",
         )
 
         # Verify result
@@ -345,7 +346,7 @@ async def test_get_location_uses_delegate_in_bidi_mode() -> None:
     # Create mock ToolContext with delegate
     mock_tool_context = create_mock_tool_context(
         invocation_id="call_location_001",
-        session_state={"frontend_delegate": mock_delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": mock_delegate},
     )
 
     # Register delegate in registry
@@ -423,7 +424,7 @@ async def test_get_location_delegate_call_count_spy() -> None:
         # Create mock ToolContext
         mock_tool_context = create_mock_tool_context(
             invocation_id="call_location_spy",
-            session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+            session_state={"frontend_delegate": delegate},
         )
 
         # Register delegate in registry
@@ -443,6 +444,7 @@ async def test_get_location_delegate_call_count_spy() -> None:
         spy.assert_called_once_with(
             tool_name="get_location",
             args={},
+            function_call_id="call_location_spy",
         )
 
         # Verify result
@@ -500,7 +502,7 @@ async def test_get_location_delegate_not_called_on_error() -> None:
         # Create mock ToolContext
         mock_tool_context = create_mock_tool_context(
             invocation_id="call_location_error",
-            session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+            session_state={"frontend_delegate": delegate},
         )
 
         # Register delegate in registry
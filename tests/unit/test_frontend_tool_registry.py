@@ -0,0 +1,136 @@
+"""
+Unit tests for the FrontendToolDelegate registry lifecycle.
+
+Tests:
+- unregister_delegate() removes the entry
+- Idle leases expire; the entry then lives only while someone holds the delegate
+- Leases of delegates with pending calls are renewed instead of dropped
+- delegate_registry_stats() gauges
+- FrontendToolDelegate.close() fails pending calls; pre-resolved cache is bounded
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+from adk_stream_protocol.ags._internal import (
+    _REGISTRY,
+    configure_delegate_registry,
+    delegate_registry_stats,
+    get_delegate,
+    register_delegate,
+    unregister_delegate,
+)
+from adk_stream_protocol.ags._internal.result import Error
+from adk_stream_protocol.tools.frontend_tool_service import FrontendToolDelegate
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Empty registry without lease TTL before and after each test."""
+    _REGISTRY.clear()
+    configure_delegate_registry()
+    yield
+    _REGISTRY.clear()
+    configure_delegate_registry()
+
+
+# ============================================================
+# Registry Lifecycle Tests
+# ============================================================
+
+
+def test_unregister_delegate_removes_entry() -> None:
+    """unregister_delegate() returns the delegate and forgets the session."""
+    # given
+    delegate = FrontendToolDelegate()
+    register_delegate("s1", delegate)
+
+    # when
+    removed = unregister_delegate("s1")
+
+    # then
+    assert removed is delegate
+    assert get_delegate("s1") is None
+    assert unregister_delegate("s1") is None
+
+
+def test_expired_lease_keeps_entry_only_while_delegate_is_held() -> None:
+    """After the idle TTL, only an outside reference (open /live socket) keeps the entry."""
+    # given
+    held = FrontendToolDelegate()
+    register_delegate("live", held)
+    register_delegate("idle", FrontendToolDelegate())
+    configure_delegate_registry(idle_ttl_seconds=0)
+
+    # when
+    stats = delegate_registry_stats()  # Registry access expires the leases
+    gc.collect()
+
+    # then
+    assert stats.leased == 0
+    assert get_delegate("live") is held
+    assert get_delegate("idle") is None
+
+
+@pytest.mark.asyncio
+async def test_lease_of_delegate_with_pending_call_is_renewed() -> None:
+    """A delegate awaiting a frontend result is never dropped by the TTL."""
+    # given
+    delegate = FrontendToolDelegate()
+    delegate.set_function_call_id("get_location", "call_1")
+    register_delegate("s1", delegate)
+    call = asyncio.create_task(delegate.execute_on_frontend("get_location", {}))
+    await asyncio.sleep(0)
+    del delegate
+    configure_delegate_registry(idle_ttl_seconds=0)
+
+    # when
+    stats = delegate_registry_stats()
+    gc.collect()
+
+    # then
+    assert stats.leased == 1
+    assert stats.pending_calls == 1
+    registered = get_delegate("s1")
+    assert registered is not None
+    registered.resolve_tool_result("call_1", {"ok": True})
+    await call
+
+
+# ============================================================
+# FrontendToolDelegate Lifecycle Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_calls() -> None:
+    """close() unblocks awaiting tools with an Error result."""
+    # given
+    delegate = FrontendToolDelegate()
+    delegate.set_function_call_id("get_location", "call_1")
+    call = asyncio.create_task(delegate.execute_on_frontend("get_location", {}))
+    await asyncio.sleep(0)
+
+    # when
+    delegate.close()
+    result = await call
+
+    # then
+    assert isinstance(result, Error)
+    assert delegate.pending_call_count == 0
+
+
+def test_pre_resolved_results_are_bounded() -> None:
+    """Results whose tool call never arrives do not accumulate forever."""
+    # given
+    delegate = FrontendToolDelegate(max_pre_resolved_results=2)
+
+    # when
+    for i in range(4):
+        delegate.resolve_tool_result(f"call_{i}", {"i": i})
+
+    # then
+    assert delegate.pre_resolved_count == 2
+    assert list(delegate._pre_resolved_results) == ["call_2", "call_3"]
@@ -496,3 +496,46 @@ async def test_multiple_pending_calls_one_timeout() -> None:
 
     # then - Both cleaned up
     assert len(delegate._pending_calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_execution_drops_pending_call() -> None:
+    """Cancelling the run (client abandoned /stream) removes the pending call."""
+    # given
+    delegate = FrontendToolDelegate()
+    delegate._id_mapper.register("get_location", "call_abandoned")
+    task = asyncio.create_task(delegate.execute_on_frontend(tool_name="get_location", args={}))
+    await asyncio.sleep(0.01)
+    assert "call_abandoned" in delegate._pending_calls
+
+    # when
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # then
+    assert len(delegate._pending_calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_parallel_calls_of_same_tool_run_concurrently() -> None:
+    """Several calls of one tool in a turn each await their own id and result."""
+    # given
+    delegate = FrontendToolDelegate()
+    for call_id in ("loc_1", "loc_2", "loc_3"):
+        delegate.set_function_call_id("get_location", call_id)
+
+    # when - All three start before any result arrives; results come back out of order
+    tasks = [
+        asyncio.create_task(delegate.execute_on_frontend(tool_name="get_location", args={}))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    assert delegate.pending_call_count == 3
+    for call_id in ("loc_3", "loc_1", "loc_2"):
+        delegate.resolve_tool_result(call_id, {"id": call_id})
+    results = [assert_ok(result) for result in await asyncio.gather(*tasks)]
+
+    # then - Registration order = execution order
+    assert results == [{"id": "loc_1"}, {"id": "loc_2"}, {"id": "loc_3"}]
+    assert delegate.pending_call_count == 0
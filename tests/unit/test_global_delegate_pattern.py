@@ -13,7 +13,7 @@ Based on server.py global frontend_delegate pattern.
 
 import asyncio
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -67,13 +67,13 @@ async def test_global_delegate_shared_across_sessions() -> None:
     # given: Multiple tool contexts from different sessions
     mock_tool_context_1 = create_mock_tool_context(
         invocation_id="session1_call1",
-        session_state={"frontend_delegate": frontend_delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": frontend_delegate, "mode": "bidi"},
         session_id="session-1",
     )
 
     mock_tool_context_2 = create_mock_tool_context(
         invocation_id="session2_call2",
-        session_state={"frontend_delegate": frontend_delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": frontend_delegate},
         session_id="session-2",
     )
 
@@ -129,12 +129,12 @@ async def test_concurrent_tool_execution_with_different_tools() -> None:
     # Create mock tool contexts
     mock_context_bgm = create_mock_tool_context(
         invocation_id="concurrent_bgm",
-        session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": delegate, "mode": "bidi"},
     )
 
     mock_context_location = create_mock_tool_context(
         invocation_id="concurrent_location",
-        session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": delegate},
     )
 
     # Register delegate in registry
@@ -189,7 +189,7 @@ async def test_tool_timeout_when_future_never_resolved() -> None:
 
     mock_context = create_mock_tool_context(
         invocation_id="timeout_call",
-        session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": delegate, "mode": "bidi"},
     )
 
     # Register delegate in registry
@@ -224,7 +224,7 @@ async def test_tool_rejection_raises_runtime_error() -> None:
 
     mock_context = create_mock_tool_context(
         invocation_id="reject_call",
-        session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": delegate},
     )
 
     # Register delegate in registry
@@ -268,7 +268,7 @@ async def test_spy_execute_on_frontend_called_exactly_once() -> None:
         # Set up mock context
         mock_context = create_mock_tool_context(
             invocation_id="spy_test_call",
-            session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+            session_state={"frontend_delegate": delegate, "mode": "bidi"},
         )
 
         # Register delegate in registry
@@ -291,6 +291,7 @@ async def test_spy_execute_on_frontend_called_exactly_once() -> None:
         spy.assert_called_once_with(
             tool_name="change_bgm",
             args={"track": 1},
+            function_call_id="spy_test_call",
         )
         assert result["success"] is True
 
@@ -310,7 +311,7 @@ async def test_spy_resolve_tool_result_called_exactly_once() -> None:
     ) as spy:
         mock_context = create_mock_tool_context(
             invocation_id="resolve_spy_call",
-            session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+            session_state={"frontend_delegate": delegate, "mode": "bidi"},
         )
 
         # Register delegate in registry
@@ -380,7 +381,7 @@ async def test_dead_code_backend_never_sends_tool_result_events() -> None:
     try:
         mock_context = create_mock_tool_context(
             invocation_id="backend_test",
-            session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+            session_state={"frontend_delegate": delegate, "mode": "bidi"},
         )
 
         # Register delegate in registry
@@ -436,7 +437,7 @@ async def test_dead_code_websocket_tool_result_handler_not_triggered() -> None:
     try:
         mock_context = create_mock_tool_context(
             invocation_id="path_test",
-            session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+            session_state={"frontend_delegate": delegate, "mode": "bidi"},
         )
 
         async def execute_tool() -> dict[str, Any]:
@@ -473,7 +474,7 @@ async def test_await_blocks_until_future_resolved() -> None:
 
     mock_context = create_mock_tool_context(
         invocation_id="await_test",
-        session_state={"frontend_delegate": delegate, "confirmation_delegate": Mock()},
+        session_state={"frontend_delegate": delegate, "mode": "bidi"},
     )
 
     # Register delegate in registry
@@ -4,6 +4,7 @@ Unit tests for IDMapper class.
 Tests the ID mapping layer between ADK (invocation_id) and Vercel AI SDK v6 (function_call.id):
 - register(): Register tool_name → function_call.id mapping
 - get_function_call_id(): Resolve function_call.id from tool_name
+- claim(): Hand each parallel call of a tool its own id (FIFO, or exact id)
 - get_function_call_id() with original_context: Resolve for intercepted tools
 - resolve_tool_result(): Reverse lookup function_call.id → tool_name
 - clear(): Clear all mappings
@@ -118,19 +119,103 @@ def test_clear_removes_all_mappings() -> None:
     assert mapper.resolve_tool_result("function-call-123") is None
 
 
-def test_multiple_registrations_same_tool_overwrites() -> None:
-    """Registering same tool_name multiple times should overwrite previous mapping."""
+def test_multiple_registrations_same_tool_are_queued() -> None:
+    """Registering the same tool_name again keeps earlier ids (parallel calls)."""
     # given
     mapper = IDMapper()
-    mapper.register("change_bgm", "function-call-old")
+    mapper.register("change_bgm", "function-call-1")
 
     # when
-    mapper.register("change_bgm", "function-call-new")
+    mapper.register("change_bgm", "function-call-2")
+
+    # then - Oldest outstanding call first, both reverse-resolvable
+    assert mapper.get_function_call_id("change_bgm") == "function-call-1"
+    assert mapper.resolve_tool_result("function-call-1") == "change_bgm"
+    assert mapper.resolve_tool_result("function-call-2") == "change_bgm"
+    assert mapper.outstanding_count == 2
+
+
+def test_claim_hands_out_each_id_once_in_order() -> None:
+    """claim() gives parallel executions of one tool distinct ids, FIFO."""
+    # given
+    mapper = IDMapper()
+    for call_id in ("call-1", "call-2", "call-3"):
+        mapper.register("get_location", call_id)
+
+    # when
+    claimed = [mapper.claim("get_location") for _ in range(4)]
+
+    # then
+    assert claimed == ["call-1", "call-2", "call-3", None]
+    assert mapper.outstanding_count == 0
+    assert mapper.resolve_tool_result("call-2") == "get_location"
+
+
+def test_claim_exact_id_out_of_order() -> None:
+    """A caller that knows its function_call_id claims exactly that id."""
+    # given
+    mapper = IDMapper()
+    mapper.register("process_payment", "call-1")
+    mapper.register("process_payment", "call-2")
+
+    # when
+    second = mapper.claim("process_payment", function_call_id="call-2")
+    first = mapper.claim("process_payment")
+
+    # then
+    assert (first, second) == ("call-1", "call-2")
+
+
+def test_exact_id_not_outstanding_does_not_fall_back() -> None:
+    """An exact id that was never registered or is already claimed resolves to None."""
+    # given
+    mapper = IDMapper()
+    mapper.register("process_payment", "call-1")
+    mapper.register("process_payment", "call-2")
+    mapper.claim("process_payment", function_call_id="call-2")
+
+    # when/then
+    assert mapper.get_function_call_id("process_payment", function_call_id="call-9") is None
+    assert mapper.claim("process_payment", function_call_id="call-2") is None
+    assert (
+        mapper.claim(
+            "payment_interceptor",
+            original_context={"name": "process_payment", "id": "call-9"},
+        )
+        is None
+    )
+    assert mapper.outstanding_count == 1
+    assert mapper.claim("process_payment") == "call-1"
+
+
+def test_register_same_id_twice_is_noop() -> None:
+    """Re-registering a known id (even after it was claimed) does not re-queue it."""
+    # given
+    mapper = IDMapper()
+    mapper.register("change_bgm", "call-1")
+    mapper.claim("change_bgm")
+
+    # when
+    mapper.register("change_bgm", "call-1")
+
+    # then
+    assert mapper.claim("change_bgm") is None
+
+
+def test_retention_limit_drops_oldest_ids() -> None:
+    """Beyond max_retained, the oldest ids are forgotten (forward and reverse)."""
+    # given
+    mapper = IDMapper(max_retained=2)
+
+    # when
+    mapper.register("get_weather", "call-1")
+    mapper.register("get_weather", "call-2")
+    mapper.register("change_bgm", "call-3")
 
     # then
-    assert mapper.get_function_call_id("change_bgm") == "function-call-new"
-    assert mapper.resolve_tool_result("function-call-old") is None
-    assert mapper.resolve_tool_result("function-call-new") == "change_bgm"
+    assert mapper.resolve_tool_result("call-1") is None
+    assert mapper.get_function_call_id("get_weather") == "call-2"
+    assert mapper.outstanding_count == 2
 
 
 def test_original_context_without_name_falls_back_to_tool_name() -> None:
@@ -0,0 +1,100 @@
+"""
+Unit tests for image_ingest module.
+
+Tests:
+- Header sniffing matches the real dimensions for PNG, JPEG, WebP and GIF
+- Unknown or truncated payloads sniff as None
+- ImageIngest decodes each distinct payload once per request
+- ChatMessage image helpers work outside to_adk_content()
+"""
+
+import base64
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from adk_stream_protocol.protocol.image_ingest import ImageInfo, ImageIngest, sniff_image_info
+from adk_stream_protocol.protocol.message_types import ChatMessage, ImagePart
+
+
+def _encode(image_format: str, size: tuple[int, int], **save_options: object) -> bytes:
+    """Render a real image with PIL (test fixture only, not the hot path)."""
+    buffer = BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, format=image_format, **save_options)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("image_format", "save_options"),
+    [
+        ("PNG", {}),
+        ("JPEG", {}),
+        ("JPEG", {"progressive": True}),
+        ("WEBP", {}),
+        ("WEBP", {"lossless": True}),
+        ("GIF", {}),
+    ],
+)
+def test_sniff_image_info_reads_header_dimensions(
+    image_format: str, save_options: dict[str, object]
+) -> None:
+    """Header sniffing agrees with the encoder on width, height and format."""
+    # given
+    data = _encode(image_format, (321, 123), **save_options)
+
+    # when
+    info = sniff_image_info(data)
+
+    # then
+    assert info == ImageInfo(321, 123, image_format)
+
+
+@pytest.mark.parametrize("data", [b"", b"not an image", b"\x89PNG\r\n\x1a\n\x00", b"\xff\xd8\xff"])
+def test_sniff_image_info_unknown_or_truncated(data: bytes) -> None:
+    """Unknown formats and truncated headers give None instead of raising."""
+    # when/then
+    assert sniff_image_info(data) is None
+
+
+def test_image_ingest_decodes_each_payload_once() -> None:
+    """The same payload seen by several steps of a request is decoded once."""
+    # given
+    payload = base64.b64encode(_encode("PNG", (4, 2))).decode("ascii")
+    ingest = ImageIngest()
+
+    # when
+    first = ingest.decode(payload)
+    second = ingest.decode(payload)
+
+    # then
+    assert second is first
+    assert ingest.decode_count == 1
+    assert first.info == ImageInfo(4, 2, "PNG")
+
+
+def test_image_ingest_strict_rejects_invalid_base64() -> None:
+    """strict=True validates the alphabet even if a lenient decode of it was memoized."""
+    # given
+    payload = "AAAA!!AAAA"  # Lenient decode drops the "!" characters
+    ingest = ImageIngest()
+    ingest.decode(payload)
+
+    # when/then
+    with pytest.raises(ValueError):
+        ingest.decode(payload, strict=True)
+
+
+def test_chat_message_image_part_outside_to_adk_content() -> None:
+    """The image part helper works without a request ImageIngest (fresh one per call)."""
+    # given
+    payload = base64.b64encode(_encode("PNG", (4, 2))).decode("ascii")
+    message = ChatMessage(role="user", content="look")
+    part = ImagePart(type="image", data=payload, media_type="image/png")
+
+    # when
+    adk_part = message._process_image_part(part)
+
+    # then
+    assert adk_part is not None
+    assert adk_part.inline_data.data == base64.b64decode(payload)
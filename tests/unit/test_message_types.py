@@ -5,8 +5,10 @@ Tests the AI SDK v6 compatibility layer, focusing on:
 - process_chat_message_for_bidi: BIDI mode message processing (image/text separation)
 - Tool use part validation
 - ADK request confirmation conversion (Legacy Approval Mode)
+- Tagged MessagePart dispatch (tool-* family, GenericPart fallback, lazy image decode)
 """
 
+import base64
 from unittest.mock import patch
 
 import pytest
@@ -19,8 +21,10 @@ from adk_stream_protocol import (
 )
 from adk_stream_protocol.protocol.message_types import (
     GenericPart,
+    ImagePart,
     StepPart,
     ToolCallState,
+    ToolResultPart,
     process_chat_message_for_bidi,
 )
 
@@ -47,8 +51,6 @@ class TestProcessChatMessageForBidi:
 
     def test_message_with_image(self):
         """Should separate image blobs from text parts."""
-        from unittest.mock import MagicMock
-
         # given
         image_data = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
         message_data = {
@@ -68,26 +70,17 @@ class TestProcessChatMessageForBidi:
             ]
         }
 
-        # when - mock both base64 decoding and PIL Image.open
-        with (
-            patch("adk_stream_protocol.protocol.message_types.base64.b64decode") as mock_decode,
-            patch("adk_stream_protocol.protocol.message_types.Image.open") as mock_image_open,
-        ):
-            mock_decode.return_value = b"fake_image_data"
-
-            # Mock PIL Image object with size and format attributes
-            mock_img = MagicMock()
-            mock_img.size = (1, 1)  # 1x1 pixel
-            mock_img.format = "PNG"
-            mock_img.__enter__ = MagicMock(return_value=mock_img)
-            mock_img.__exit__ = MagicMock(return_value=False)
-            mock_image_open.return_value = mock_img
-
+        # when - the image is decoded once, shared by to_adk_content() and blob extraction
+        with patch(
+            "adk_stream_protocol.protocol.image_ingest.base64.b64decode",
+            wraps=base64.b64decode,
+        ) as mock_decode:
             image_blobs, text_content = process_chat_message_for_bidi(message_data)
 
         # then
+        mock_decode.assert_called_once()
         assert len(image_blobs) == 1
-        assert image_blobs[0].data == b"fake_image_data"
+        assert image_blobs[0].data == base64.b64decode(image_data.split(",", 1)[1])
         assert image_blobs[0].mime_type == "image/png"
         assert text_content is not None
         assert len(text_content.parts) == 1
@@ -873,3 +866,58 @@ class TestChatMessageContentField:
         assert message.content is not None
         assert isinstance(message.content, list)
         assert len(message.content) == 1
+
+
+class TestTaggedPartDispatch:
+    """Tests for the "type"-keyed dispatch of MessagePart."""
+
+    def test_tool_prefix_family_dispatches_to_tool_use_part(self):
+        """Should parse any "tool-{toolName}" part as ToolUsePart, but "tool-result" as its own."""
+        # given
+        message_data = {
+            "role": "assistant",
+            "parts": [
+                {"type": "tool-change_bgm", "toolCallId": "c1", "state": "call"},
+                {"type": "tool-result", "toolCallId": "c2", "result": {"ok": True}},
+            ],
+        }
+
+        # when
+        message = ChatMessage(**message_data)
+
+        # then
+        assert message.parts is not None
+        assert isinstance(message.parts[0], ToolUsePart)
+        assert message.parts[0].tool_name == "change_bgm"
+        assert isinstance(message.parts[1], ToolResultPart)
+
+    def test_tool_part_missing_state_falls_back_to_generic(self):
+        """Should keep the GenericPart fallback when the tagged model rejects the part."""
+        # given
+        message_data = {"role": "assistant", "parts": [{"type": "tool-x", "toolCallId": "c1"}]}
+
+        # when
+        message = ChatMessage(**message_data)
+
+        # then
+        assert message.parts is not None
+        assert isinstance(message.parts[0], GenericPart)
+        assert message.parts[0].type == "tool-x"
+
+    def test_image_part_is_decoded_only_at_conversion(self):
+        """Should skip (not raise on) an image whose base64 only looks valid at parse time."""
+        # given: Passes the structural check (length, alphabet of head/tail) but not decoding
+        data = "A" * 64 + "=A==" + "A" * 64
+        message = ChatMessage(
+            role="user",
+            parts=[{"type": "image", "data": data}, {"type": "text", "text": "hi"}],
+        )
+        assert message.parts is not None
+        assert isinstance(message.parts[0], ImagePart)
+
+        # when
+        content = message.to_adk_content()
+
+        # then
+        assert content.parts is not None
+        assert [part.text for part in content.parts] == ["hi"]
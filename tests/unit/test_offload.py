@@ -0,0 +1,157 @@
+"""
+Unit tests for offload module.
+
+Tests:
+- Payloads below the threshold run inline, above it in the pool (with metrics)
+- Failures in the pool are counted and re-raised
+- Process pools run module-level functions
+- ImageIngest.decode_async() and SseFrame.prepare() use the configured pool
+"""
+
+import base64
+import json
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from adk_stream_protocol.protocol.image_ingest import ImageIngest
+from adk_stream_protocol.protocol.message_types import ChatMessage, ImagePart, predecode_images
+from adk_stream_protocol.protocol.offload import (
+    OffloadConfig,
+    OffloadPool,
+    configure_offload_pool,
+    offload_pool_stats,
+)
+from adk_stream_protocol.protocol.sse_frame import SseFrame
+
+
+def _thread_name(_: object) -> str:
+    return threading.current_thread().name
+
+
+def _strict_b64decode(data: str) -> bytes:
+    return base64.b64decode(data, validate=True)
+
+
+@pytest.fixture
+def pool() -> Iterator[OffloadPool]:
+    """Thread pool with a 1 KiB threshold, configured as the process-wide pool."""
+    offload_pool = OffloadPool(OffloadConfig(kind="thread", max_workers=1, threshold_bytes=1024))
+    configure_offload_pool(offload_pool)
+    yield offload_pool
+    configure_offload_pool(None)
+
+
+@pytest.mark.asyncio
+async def test_small_payload_runs_inline(pool: OffloadPool) -> None:
+    """Below the threshold the function runs on the calling thread, uncounted."""
+    # when
+    name = await pool.run(_thread_name, None, size=10)
+
+    # then
+    assert name == threading.current_thread().name
+    assert pool.stats.offloaded_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_large_payload_runs_in_pool(pool: OffloadPool) -> None:
+    """At or above the threshold the function runs in the pool and is counted."""
+    # when
+    name = await pool.run(_thread_name, None, size=4096)
+
+    # then
+    assert name.startswith("adk-offload")
+    stats = offload_pool_stats()
+    assert stats is not None
+    assert stats.offloaded_calls == 1
+    assert stats.offloaded_bytes == 4096
+    assert stats.max_offload_seconds >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_pool_failure_is_counted_and_reraised(pool: OffloadPool) -> None:
+    """Exceptions raised in the pool reach the caller."""
+    # when/then
+    with pytest.raises(ValueError):
+        await pool.run(_strict_b64decode, "AAAA!!AAAA", size=4096)
+    assert pool.stats.failed_calls == 1
+    assert pool.stats.offloaded_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_module_level_function() -> None:
+    """A process pool runs picklable module-level functions."""
+    # given
+    process_pool = OffloadPool(OffloadConfig(kind="process", max_workers=1, threshold_bytes=0))
+
+    # when
+    try:  # nosemgrep: forbid-try-except - always stop the worker process
+        result = await process_pool.run(json.dumps, {"a": 1}, size=1)
+    finally:
+        process_pool.shutdown()
+
+    # then
+    assert result == '{"a": 1}'
+
+
+def test_invalid_kind_is_rejected() -> None:
+    """Unknown pool kinds fail at configuration time."""
+    # when/then
+    with pytest.raises(ValueError):
+        OffloadConfig(kind="fiber")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        OffloadConfig(kind="interpreter")  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_predecode_images_fills_ingest_memo(pool: OffloadPool) -> None:
+    """Large images are decoded in the pool once; the sync conversion reuses the result."""
+    # given
+    payload = base64.b64encode(b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096).decode("ascii")
+    message = ChatMessage(role="user", parts=[ImagePart(data=payload, media_type="image/png")])
+    ingest = ImageIngest()
+
+    # when
+    await predecode_images([message], ingest)
+    content = message.to_adk_content(image_ingest=ingest)
+
+    # then
+    assert pool.stats.offloaded_calls == 1
+    assert ingest.decode_count == 1
+    assert content.parts is not None
+    assert content.parts[0].inline_data is not None
+    assert content.parts[0].inline_data.data == base64.b64decode(payload)
+
+
+@pytest.mark.asyncio
+async def test_predecode_images_skips_invalid_payloads(pool: OffloadPool) -> None:
+    """Invalid base64 is left to the conversion step (which logs and drops the part)."""
+    # given
+    payload = "AAAA" * 200 + "!!!!" + "AAAA" * 200  # Passes the cheap parse-time check
+    message = ChatMessage(role="user", parts=[ImagePart(data=payload, media_type="image/png")])
+
+    # when
+    await predecode_images([message], ImageIngest())
+
+    # then
+    assert pool.stats.failed_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_sse_frame_prepare_encodes_large_frames_in_pool(pool: OffloadPool) -> None:
+    """prepare() caches the wire encoding of large frames; small frames stay lazy."""
+    # given
+    large = SseFrame({"type": "file", "url": "data:image/png;base64," + "A" * 4096})
+    pcm = SseFrame.data_pcm(b"\x01\x02" * 2048, 24000)
+    small = SseFrame({"type": "text-delta", "id": "t", "delta": "hi"})
+
+    # when
+    for frame in (large, pcm, small):
+        await frame.prepare(pool)
+
+    # then
+    assert pool.stats.offloaded_calls == 2
+    assert large.text == f"data: {json.dumps(large.event)}\n\n"
+    assert json.loads(pcm.text[len("data: ") :]) == pcm.event
+    assert small.text == f"data: {json.dumps(small.event)}\n\n"
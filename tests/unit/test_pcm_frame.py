@@ -0,0 +1,67 @@
+"""
+Unit tests for binary PCM WebSocket frames.
+
+Tests the compact header used by the negotiated binary-PCM BIDI mode:
+- encode_pcm_frame(): 12-byte little-endian header + PCM16 payload
+- decode_pcm_frame(): header/payload split, validation errors
+"""
+
+import pytest
+
+from adk_stream_protocol.protocol.pcm_frame import (
+    PCM_FRAME_VERSION,
+    PCM_HEADER_SIZE,
+    PcmFrameHeader,
+    decode_pcm_frame,
+    encode_pcm_frame,
+)
+
+
+def test_encode_decode_roundtrip() -> None:
+    """decode_pcm_frame() should return the header fields and payload passed to encode."""
+    # given
+    pcm = b"\x01\x00\xff\x7f" * 240
+
+    # when
+    data = encode_pcm_frame(pcm, block_id=3, sample_rate=24000, sequence=41)
+    header, payload = decode_pcm_frame(data)
+
+    # then
+    assert len(data) == PCM_HEADER_SIZE + len(pcm) == 12 + len(pcm)
+    assert header == PcmFrameHeader(
+        version=PCM_FRAME_VERSION, channels=1, block_id=3, sample_rate=24000, sequence=41
+    )
+    assert bytes(payload) == pcm
+
+
+def test_header_is_little_endian() -> None:
+    """Header layout should be fixed: version, channels, uint16 block id, uint32 rate, uint32 seq."""
+    # when
+    data = encode_pcm_frame(b"", block_id=0x0102, sample_rate=16000, sequence=7)
+
+    # then
+    assert data == bytes([1, 1, 0x02, 0x01]) + (16000).to_bytes(4, "little") + (7).to_bytes(
+        4, "little"
+    )
+
+
+def test_counters_wrap() -> None:
+    """Block id and sequence should wrap instead of overflowing the header fields."""
+    # when
+    header, _ = decode_pcm_frame(
+        encode_pcm_frame(b"", block_id=0x10001, sample_rate=24000, sequence=2**32 + 5)
+    )
+
+    # then
+    assert header.block_id == 1
+    assert header.sequence == 5
+
+
+def test_decode_rejects_short_and_unknown_version() -> None:
+    """decode_pcm_frame() should raise ValueError for truncated or unknown frames."""
+    with pytest.raises(ValueError, match="too short"):
+        decode_pcm_frame(b"\x01\x01")
+
+    bad_version = bytes([99]) + encode_pcm_frame(b"", 0, 24000, 0)[1:]
+    with pytest.raises(ValueError, match="Unsupported"):
+        decode_pcm_frame(bad_version)
@@ -0,0 +1,298 @@
+"""
+Unit tests for the outbound send queue.
+
+Tests OutboundFrameQueue:
+- Frames are written in order by the writer task
+- data-pcm backpressure policies: drop-oldest, merge, block
+- Control frames are never dropped (put() waits for space)
+- Writer failures (e.g., WebSocketDisconnect) surface on the next put()/close()
+- Batched writes: ready frames packed up to batch_max_bytes, batches end at [DONE]
+- Batching sizes payload frames without serializing them (offload happens at send)
+"""
+
+import asyncio
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from adk_stream_protocol.protocol.sse_frame import DONE_FRAME, SseFrame
+from adk_stream_protocol.transport.send_queue import OutboundFrameQueue, SendQueueConfig
+
+
+def _pcm(data: bytes) -> SseFrame:
+    return SseFrame.data_pcm(data, 24000)
+
+
+def _text(delta: str) -> SseFrame:
+    return SseFrame.text_delta("t1", delta)
+
+
+class _GatedSocket:
+    """Records sent frames; blocks writes until released (a slow client)."""
+
+    def __init__(self) -> None:
+        self.sent: list[SseFrame] = []
+        self.gate = asyncio.Event()
+
+    async def send(self, frame: SseFrame) -> None:
+        await self.gate.wait()
+        self.sent.append(frame)
+
+
+async def _fill_while_stalled(queue: OutboundFrameQueue, *frames: SseFrame) -> None:
+    """Put frames while the writer is stuck on its first send."""
+    for frame in frames:
+        await queue.put(frame)
+        await asyncio.sleep(0)
+
+
+# ============================================================
+# Ordering Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_frames_written_in_order_and_drained_on_close() -> None:
+    """close() should flush every queued frame, in enqueue order."""
+    # given
+    sent: list[SseFrame] = []
+
+    async def send(frame: SseFrame) -> None:
+        sent.append(frame)
+
+    queue = OutboundFrameQueue(send, SendQueueConfig(max_frames=4))
+    queue.start()
+    frames = [_text(str(i)) for i in range(10)]
+
+    # when
+    for frame in frames:
+        await queue.put(frame)
+    await queue.close()
+
+    # then
+    assert sent == frames
+    assert queue.stats.sent_frames == 10
+    assert queue.depth == 0
+
+
+# ============================================================
+# Audio Backpressure Policy Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_drops_stale_audio_not_control_frames() -> None:
+    """A full queue drops the oldest data-pcm frame; text frames survive."""
+    # given: writer stuck on the first frame, 3 slots
+    socket = _GatedSocket()
+    queue = OutboundFrameQueue(socket.send, SendQueueConfig(max_frames=3))
+    queue.start()
+    await _fill_while_stalled(queue, _text("first"), _pcm(b"a"), _text("x"), _pcm(b"b"))
+
+    # when: queue is full (a, x, b) and more audio arrives
+    await queue.put(_pcm(b"c"))
+    socket.gate.set()
+    await queue.close()
+
+    # then: "a" was dropped, order of the rest preserved
+    assert [f.pcm or f.event["delta"] for f in socket.sent] == ["first", "x", b"b", b"c"]
+    assert queue.stats.dropped_audio_frames == 1
+    assert queue.stats.dropped_audio_bytes == 1
+    assert queue.stats.max_depth == 3
+
+
+@pytest.mark.asyncio
+async def test_merge_appends_pcm_to_queued_tail() -> None:
+    """The merge policy concatenates new PCM onto a data-pcm frame at the tail of the queue."""
+    # given
+    socket = _GatedSocket()
+    queue = OutboundFrameQueue(socket.send, SendQueueConfig(max_frames=2, audio_policy="merge"))
+    queue.start()
+    await _fill_while_stalled(queue, _text("first"), _text("x"), _pcm(b"ab"))
+
+    # when
+    await queue.put(_pcm(b"cd"))
+    await queue.put(_pcm(b"ef"))
+    socket.gate.set()
+    await queue.close()
+
+    # then
+    assert [f.pcm or f.event["delta"] for f in socket.sent] == ["first", "x", b"abcdef"]
+    assert queue.stats.merged_audio_frames == 2
+    assert queue.stats.dropped_audio_frames == 0
+
+
+@pytest.mark.asyncio
+async def test_control_frames_wait_for_space() -> None:
+    """Text/control frames are never dropped: put() blocks until the writer catches up."""
+    # given
+    socket = _GatedSocket()
+    queue = OutboundFrameQueue(socket.send, SendQueueConfig(max_frames=1))
+    queue.start()
+    await _fill_while_stalled(queue, _text("first"), _text("second"))
+
+    # when
+    blocked = asyncio.create_task(queue.put(_text("third")))
+    await asyncio.sleep(0.01)
+    was_blocked = not blocked.done()
+    socket.gate.set()
+    await blocked
+    await queue.close()
+
+    # then
+    assert was_blocked
+    assert [f.event["delta"] for f in socket.sent] == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_block_policy_never_drops_audio() -> None:
+    """The block policy applies backpressure to audio as well."""
+    # given
+    socket = _GatedSocket()
+    queue = OutboundFrameQueue(socket.send, SendQueueConfig(max_frames=1, audio_policy="block"))
+    queue.start()
+    await _fill_while_stalled(queue, _pcm(b"a"), _pcm(b"b"))
+
+    # when
+    blocked = asyncio.create_task(queue.put(_pcm(b"c")))
+    await asyncio.sleep(0.01)
+    was_blocked = not blocked.done()
+    socket.gate.set()
+    await blocked
+    await queue.close()
+
+    # then
+    assert was_blocked
+    assert [f.pcm for f in socket.sent] == [b"a", b"b", b"c"]
+    assert queue.stats.dropped_audio_frames == 0
+
+
+# ============================================================
+# Batched Write Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_ready_frames_are_batched_up_to_size_cap() -> None:
+    """Frames queued while the writer is busy go out as batches bounded by batch_max_bytes."""
+    # given
+    socket = _GatedSocket()
+    batches: list[list[SseFrame]] = []
+
+    async def send_batch(frames: list[SseFrame]) -> None:
+        batches.append(frames)
+
+    frame_size = len(_text("0").encode())
+    queue = OutboundFrameQueue(
+        socket.send,
+        SendQueueConfig(max_frames=16, batch_max_bytes=frame_size * 3),
+        send_batch=send_batch,
+    )
+    queue.start()
+    await _fill_while_stalled(queue, _text("first"))
+
+    # when: seven frames become ready while the first write is stalled
+    for i in range(7):
+        await queue.put(_text(str(i)))
+    socket.gate.set()
+    await queue.close()
+
+    # then
+    assert [len(batch) for batch in batches] == [3, 3]
+    assert [f.event["delta"] for f in socket.sent] == ["first", "6"]
+    assert queue.stats.sent_frames == 8
+    assert queue.stats.sent_batches == 4
+
+
+@pytest.mark.asyncio
+async def test_batching_does_not_serialize_payload_frames() -> None:
+    """Large file frames are sized from their payload; the writer serializes them later."""
+    # given
+    socket = _GatedSocket()
+    batches: list[list[SseFrame]] = []
+    serialized_on_arrival: list[bool] = []
+
+    async def send_batch(frames: list[SseFrame]) -> None:
+        batches.append(frames)
+        serialized_on_arrival.extend(
+            frame._encoded is not None or frame._text is not None
+            for frame in frames
+            if frame.type == "file"
+        )
+
+    queue = OutboundFrameQueue(
+        socket.send,
+        SendQueueConfig(max_frames=16, batch_max_bytes=1024 * 1024),
+        send_batch=send_batch,
+    )
+    queue.start()
+    await _fill_while_stalled(queue, _text("first"))
+    url = "data:image/png;base64," + "A" * 200_000
+
+    # when
+    await queue.put(_text("caption"))
+    await queue.put(SseFrame({"type": "file", "url": url, "mediaType": "image/png"}))
+    socket.gate.set()
+    await queue.close()
+
+    # then
+    assert [[frame.type for frame in batch] for batch in batches] == [["text-delta", "file"]]
+    assert serialized_on_arrival == [False]
+
+
+@pytest.mark.asyncio
+async def test_batch_ends_at_done_frame() -> None:
+    """[DONE] is always the last frame of its batch."""
+    # given
+    socket = _GatedSocket()
+    batches: list[list[SseFrame]] = []
+
+    async def send_batch(frames: list[SseFrame]) -> None:
+        batches.append(frames)
+
+    queue = OutboundFrameQueue(
+        socket.send,
+        SendQueueConfig(max_frames=16, batch_max_bytes=1 << 20),
+        send_batch=send_batch,
+    )
+    queue.start()
+    await _fill_while_stalled(queue, _text("first"))
+
+    # when
+    for frame in (_text("a"), DONE_FRAME, _text("b"), _text("c")):
+        await queue.put(frame)
+    socket.gate.set()
+    await queue.close()
+
+    # then
+    assert [[f.is_done for f in batch] for batch in batches] == [[False, True], [False, False]]
+
+
+# ============================================================
+# Error Handling Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_writer_disconnect_surfaces_on_put() -> None:
+    """A WebSocketDisconnect in the writer is re-raised to the producer."""
+
+    # given
+    async def send(frame: SseFrame) -> None:
+        raise WebSocketDisconnect
+
+    queue = OutboundFrameQueue(send, SendQueueConfig(max_frames=1))
+    queue.start()
+    await queue.put(_text("a"))
+    await asyncio.sleep(0)
+
+    # when/then
+    with pytest.raises(WebSocketDisconnect):
+        await queue.put(_text("b"))
+        await queue.put(_text("c"))
+
+
+def test_config_rejects_empty_queue() -> None:
+    """max_frames must be at least 1."""
+    with pytest.raises(ValueError, match="max_frames"):
+        SendQueueConfig(max_frames=0)
@@ -9,14 +9,21 @@ import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.adk.sessions import InMemorySessionService
+from google.adk.sessions.sqlite_session_service import SqliteSessionService
 
 from adk_stream_protocol.adk.session import (
+    SessionStore,
     _session_store,
+    advance_history_cursor,
     clear_sessions,
+    configure_session_eviction,
     get_or_create_session,
+    release_session,
     sync_conversation_history_to_session,
 )
-from adk_stream_protocol.protocol.message_types import process_chat_message_for_bidi
+from adk_stream_protocol.ags import Error, Ok
+from adk_stream_protocol.protocol.message_types import ChatMessage, process_chat_message_for_bidi
 
 
 @pytest.fixture(autouse=True)
@@ -605,3 +612,255 @@ async def test_session_send_message_called_for_user_input():
         f"but was called {session.send_message.call_count} times"
     )
     session.send_message.assert_called_once_with("Send 50 dollars to Hanako")
+
+
+# ============================================================
+# SessionStore Eviction Tests
+# ============================================================
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_session_store_evicts_least_recently_used_over_capacity():
+    """Storing past max_sessions evicts the least recently used session."""
+    # given
+    evicted: list[str] = []
+    store = SessionStore(max_sessions=2, on_evict=lambda sid, _: evicted.append(sid))
+    store.set_session("a", MagicMock())
+    store.set_session("b", MagicMock())
+    store.get_session("a")  # "b" is now least recently used
+
+    # when
+    store.set_session("c", MagicMock())
+
+    # then
+    assert evicted == ["b"]
+    assert store.has_session("a")
+    assert not store.has_session("b")
+    assert len(store) == 2
+
+
+def test_session_store_evicts_idle_sessions_and_synced_counts():
+    """Sessions idle for idle_ttl_seconds are evicted on the next access."""
+    # given
+    clock = _Clock()
+    evicted: list[str] = []
+    store = SessionStore(
+        idle_ttl_seconds=10, on_evict=lambda sid, _: evicted.append(sid), clock=clock
+    )
+    store.set_session("idle", MagicMock())
+    store.set_synced_count("idle", 3)
+    clock.now = 5
+    store.set_session("fresh", MagicMock())
+
+    # when
+    clock.now = 12
+
+    # then
+    assert not store.has_session("idle")
+    assert store.has_session("fresh")
+    assert evicted == ["idle"]
+    assert store.get_synced_count("idle") == 0
+
+
+def test_session_store_never_auto_evicts_pinned_sessions():
+    """Pinned sessions survive capacity and TTL eviction until unpinned."""
+    # given
+    clock = _Clock()
+    store = SessionStore(max_sessions=1, idle_ttl_seconds=10, clock=clock)
+    store.set_session("live", MagicMock())
+    store.pin("live")
+
+    # when
+    store.set_session("sse", MagicMock())
+    clock.now = 100
+
+    # then
+    assert store.has_session("live")
+    assert not store.has_session("sse")
+    store.unpin("live")
+    assert store.has_session("live")  # unpin counts as access
+    clock.now = 111
+    assert not store.has_session("live")
+
+
+def test_session_store_keeps_synced_count_of_persistent_sessions():
+    """Reloading an evicted SQLite-backed session must not re-append its history."""
+    # given
+    store = SessionStore()
+    store.set_session("sqlite", MagicMock(), session_service=MagicMock())
+    store.set_synced_count("sqlite", 4)
+
+    # when
+    store.evict("sqlite")
+
+    # then
+    assert not store.has_session("sqlite")
+    assert store.get_synced_count("sqlite") == 4
+
+
+@pytest.mark.asyncio
+async def test_release_session_deletes_in_memory_adk_session():
+    """Evicting a session of an InMemorySessionService deletes it from ADK."""
+    # given
+    service = InMemorySessionService()
+    session = await service.create_session(app_name="agents", user_id="u1", session_id="s1")
+    _session_store.set_session("s1", session, session_service=service)
+    released: list[str] = []
+    configure_session_eviction(on_evict=lambda sid, _: released.append(sid))
+
+    # when
+    try:
+        release_session("s1")
+        await asyncio.sleep(0)
+    finally:
+        configure_session_eviction()
+
+    # then
+    assert released == ["s1"]
+    assert not _session_store.has_session("s1")
+    assert await service.get_session(app_name="agents", user_id="u1", session_id="s1") is None
+
+
+# ========== History Fingerprint Tests ==========
+# Tests for edit/regeneration detection and batched appends
+
+
+def _chat_messages(*texts: str) -> list[ChatMessage]:
+    roles = ["user", "assistant"]
+    return [ChatMessage(role=roles[i % 2], content=text) for i, text in enumerate(texts)]
+
+
+@pytest.mark.asyncio
+async def test_sync_rebuilds_session_on_edited_message(mock_session, mock_session_service):
+    """An edited message recreates the session and syncs the whole history again."""
+    # given
+    await sync_conversation_history_to_session(
+        mock_session, mock_session_service, _chat_messages("a", "b", "c", "d", "new")
+    )
+    mock_session_service.append_event.reset_mock()
+    mock_session.events.append("stale event")
+
+    # when
+    result = await sync_conversation_history_to_session(
+        mock_session, mock_session_service, _chat_messages("a", "B", "c", "d", "new")
+    )
+
+    # then
+    assert result == 4
+    mock_session_service.delete_session.assert_awaited_once()
+    mock_session_service.create_session.assert_awaited_once()
+    assert mock_session.events == []
+    invocation_ids = [
+        call.kwargs["event"].invocation_id
+        for call in mock_session_service.append_event.call_args_list
+    ]
+    assert invocation_ids == ["sync_0_user", "sync_1_assistant", "sync_2_user", "sync_3_assistant"]
+    assert _session_store.get_synced_count(mock_session.id) == 4
+
+
+@pytest.mark.asyncio
+async def test_sync_detects_regenerated_reply(mock_session, mock_session_service):
+    """A regenerated assistant reply at a synced position rebuilds the session."""
+    # given: "b" was synced, then the user regenerated it (history truncated)
+    await sync_conversation_history_to_session(
+        mock_session, mock_session_service, _chat_messages("a", "b", "c")
+    )
+    truncated = await sync_conversation_history_to_session(
+        mock_session, mock_session_service, _chat_messages("a", "b")
+    )
+    mock_session_service.append_event.reset_mock()
+
+    # when
+    result = await sync_conversation_history_to_session(
+        mock_session, mock_session_service, _chat_messages("a", "b2", "c")
+    )
+
+    # then
+    assert truncated == 0
+    assert result == 2
+    texts = [
+        call.kwargs["event"].content.parts[0].text
+        for call in mock_session_service.append_event.call_args_list
+    ]
+    assert texts == ["a", "b2"]
+
+
+@pytest.mark.asyncio
+async def test_sync_edit_replaces_sqlite_history(tmp_path):
+    """With the real SqliteSessionService, an edit leaves only the edited history."""
+    # given
+    service = SqliteSessionService(db_path=str(tmp_path / "sessions.db"))
+    session = await service.create_session(
+        app_name="agents", user_id="u1", session_id="s1", state={"mode": "sse"}
+    )
+    await sync_conversation_history_to_session(
+        session, service, _chat_messages("a", "b", "c", "new")
+    )
+
+    # when
+    result = await sync_conversation_history_to_session(
+        session, service, _chat_messages("a", "B", "c", "d", "new")
+    )
+
+    # then
+    assert result == 4
+    assert [event.content.parts[0].text for event in session.events] == ["a", "B", "c", "d"]
+    reloaded = await service.get_session(app_name="agents", user_id="u1", session_id="s1")
+    assert reloaded is not None
+    assert [event.content.parts[0].text for event in reloaded.events] == ["a", "B", "c", "d"]
+    assert reloaded.state == {"mode": "sse"}
+    assert reloaded.last_update_time == session.last_update_time
+
+
+# ========== Delta-History Cursor Tests ==========
+# Tests for advance_history_cursor() (client sends only messages after the cursor)
+
+
+def test_history_cursor_follows_turns():
+    """Full history sets the cursor; a delta with the announced cursor advances it."""
+    # given: 3 messages, the reply will be message 4
+    first = advance_history_cursor("s1", _chat_messages("a", "b", "c"))
+
+    # when: next turn sends only the new user message after the reply
+    second = advance_history_cursor("s1", _chat_messages("d"), history_cursor=4)
+
+    # then
+    assert first == Ok(4)
+    assert second == Ok(6)
+
+
+def test_history_cursor_accepts_resent_last_message():
+    """The changed last message (tool approval on the reply) may be re-sent."""
+    # given
+    advance_history_cursor("s1", _chat_messages("a"))
+    reply = ChatMessage(role="assistant", content="approved")
+
+    # when
+    result = advance_history_cursor("s1", [reply], history_cursor=1)
+
+    # then: the reply continues the same assistant message
+    assert result == Ok(2)
+
+
+def test_history_cursor_mismatch_requires_full_history():
+    """Stale cursors and sessions without a cursor are rejected with the expected cursor."""
+    # given
+    advance_history_cursor("s1", _chat_messages("a", "b", "c"))
+
+    # when
+    stale = advance_history_cursor("s1", _chat_messages("x"), history_cursor=1)
+    unknown = advance_history_cursor("unknown", _chat_messages("x"), history_cursor=0)
+
+    # then
+    assert stale == Error(4)
+    assert unknown == Error(None)
+    assert _session_store.get_history_cursor("s1") == 4
@@ -0,0 +1,237 @@
+"""
+Unit tests for client abandonment of /stream runs.
+
+Tests AgentRunGuard, follow_client(), produce_guarded() and stream_detached():
+- "cancel" cancels the producer as soon as the last client detaches
+- "finish-tool" lets a started tool call finish, then stops the run
+- "continue" keeps the run going (only counted)
+- A reconnect within the grace period keeps the run
+- A completed run is not counted as abandoned
+- stream_detached() yields frames in order and re-raises producer errors
+- follow_client() detaches when the client disconnects mid-stream
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from adk_stream_protocol.protocol.sse_frame import SseFrame
+from adk_stream_protocol.transport.sse_abandon import (
+    AbandonConfig,
+    AgentRunGuard,
+    abandon_stats,
+    follow_client,
+    produce_guarded,
+    stream_detached,
+)
+
+
+def _tool_input(tool_call_id: str) -> SseFrame:
+    return SseFrame({"type": "tool-input-available", "toolCallId": tool_call_id})
+
+
+def _tool_output(tool_call_id: str) -> SseFrame:
+    return SseFrame({"type": "tool-output-available", "toolCallId": tool_call_id})
+
+
+async def _endless_run(started: asyncio.Event, closed: asyncio.Event) -> AsyncGenerator[SseFrame]:
+    """Agent run that emits one frame and then waits (e.g., a slow model call)."""
+    try:
+        yield SseFrame.text_delta("t1", "hi")
+        started.set()
+        await asyncio.sleep(3600)
+    finally:
+        closed.set()
+
+
+def _disconnect_after(event: asyncio.Event):
+    """ASGI receive() that reports http.disconnect once event is set."""
+
+    async def receive() -> dict[str, str]:
+        await event.wait()
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+@pytest.mark.asyncio
+async def test_cancel_policy_cancels_producer_on_detach() -> None:
+    """With "cancel", the last client leaving cancels run_async immediately."""
+    # given
+    started, closed = asyncio.Event(), asyncio.Event()
+    guard = AgentRunGuard(AbandonConfig(policy="cancel"), name="run-1")
+    before = abandon_stats()
+    producer = asyncio.create_task(_drain(produce_guarded(_endless_run(started, closed), guard)))
+    guard.bind(producer)
+    guard.attach()
+    await started.wait()
+
+    # when
+    guard.detach()
+    await asyncio.wait_for(asyncio.gather(producer, return_exceptions=True), timeout=1.0)
+
+    # then
+    assert producer.cancelled()
+    assert closed.is_set()
+    after = abandon_stats()
+    assert after.client_abandoned == before.client_abandoned + 1
+    assert after.cancelled_runs == before.cancelled_runs + 1
+
+
+@pytest.mark.asyncio
+async def test_finish_tool_policy_stops_after_tool_output() -> None:
+    """With "finish-tool", a started tool call completes; the model answer is never produced."""
+    # given
+    tool_may_finish = asyncio.Event()
+    produced: list[str] = []
+
+    async def run() -> AsyncGenerator[SseFrame]:
+        yield _tool_input("call_1")
+        await tool_may_finish.wait()
+        yield _tool_output("call_1")
+        produced.append("model-answer")
+        yield SseFrame.text_delta("t1", "the weather is sunny")
+
+    guard = AgentRunGuard(AbandonConfig(policy="finish-tool"), name="run-2")
+    frames: list[SseFrame] = []
+
+    async def consume() -> None:
+        async for frame in produce_guarded(run(), guard):
+            frames.append(frame)
+
+    producer = asyncio.create_task(consume())
+    guard.bind(producer)
+    guard.attach()
+    await asyncio.sleep(0)
+
+    # when
+    guard.detach()
+    tool_may_finish.set()
+    await asyncio.wait_for(producer, timeout=1.0)
+
+    # then
+    assert not producer.cancelled()
+    assert [frame.type for frame in frames] == ["tool-input-available", "tool-output-available"]
+    assert produced == []
+    assert guard.tools_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_continue_policy_keeps_run_going() -> None:
+    """With "continue", the run is only counted as abandoned."""
+    # given
+    started, closed = asyncio.Event(), asyncio.Event()
+    guard = AgentRunGuard(AbandonConfig(policy="continue"), name="run-3")
+    before = abandon_stats()
+    producer = asyncio.create_task(_drain(produce_guarded(_endless_run(started, closed), guard)))
+    guard.bind(producer)
+    guard.attach()
+    await started.wait()
+
+    # when
+    guard.detach()
+    await asyncio.sleep(0.01)
+
+    # then
+    assert not producer.done()
+    assert abandon_stats().continued_runs == before.continued_runs + 1
+    producer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_within_grace_keeps_run() -> None:
+    """A resumable stream's run survives a reconnect inside the grace period."""
+    # given
+    started, closed = asyncio.Event(), asyncio.Event()
+    guard = AgentRunGuard(AbandonConfig(policy="cancel", grace_seconds=0.05), name="run-4")
+    producer = asyncio.create_task(_drain(produce_guarded(_endless_run(started, closed), guard)))
+    guard.bind(producer)
+    guard.attach()
+    await started.wait()
+
+    # when
+    guard.detach()
+    guard.attach()  # Reconnect (GET /stream/{id})
+    await asyncio.sleep(0.1)
+
+    # then
+    assert not guard.abandoned
+    assert not producer.done()
+
+    # when the reconnected client leaves too
+    guard.detach()
+    await asyncio.wait_for(asyncio.gather(producer, return_exceptions=True), timeout=1.0)
+
+    # then
+    assert guard.abandoned
+    assert producer.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_completed_run_is_not_abandoned() -> None:
+    """A client leaving after the run finished is not an abandonment."""
+    # given
+    guard = AgentRunGuard(AbandonConfig(policy="cancel"), name="run-5")
+    before = abandon_stats()
+
+    async def run() -> AsyncGenerator[SseFrame]:
+        yield SseFrame.text_delta("t1", "done")
+
+    # when
+    frames = [frame async for frame in stream_detached(run(), guard)]
+    guard.attach()
+    guard.detach()
+
+    # then
+    assert len(frames) == 1
+    assert not guard.abandoned
+    assert abandon_stats().client_abandoned == before.client_abandoned
+
+
+@pytest.mark.asyncio
+async def test_stream_detached_reraises_producer_error() -> None:
+    """Frames before the failure are delivered, then the error reaches the response."""
+    # given
+    guard = AgentRunGuard(AbandonConfig(), name="run-6")
+
+    async def run() -> AsyncGenerator[SseFrame]:
+        yield SseFrame.text_delta("t1", "a")
+        yield SseFrame.text_delta("t1", "b")
+        raise RuntimeError("model error")
+
+    frames: list[SseFrame] = []
+
+    # when/then
+    with pytest.raises(RuntimeError, match="model error"):
+        async for frame in stream_detached(run(), guard):
+            frames.append(frame)
+    assert [frame.event["delta"] for frame in frames] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_follow_client_cancels_run_on_disconnect() -> None:
+    """http.disconnect during a silent phase (no frame written) still stops the run."""
+    # given
+    started, closed = asyncio.Event(), asyncio.Event()
+    disconnected = asyncio.Event()
+    guard = AgentRunGuard(AbandonConfig(policy="cancel"), name="run-7")
+    chunks = (
+        frame.encode() async for frame in stream_detached(_endless_run(started, closed), guard)
+    )
+    response = follow_client(chunks, guard, _disconnect_after(disconnected))
+
+    # when
+    first = await anext(response)
+    disconnected.set()
+    await asyncio.wait_for(closed.wait(), timeout=1.0)
+
+    # then
+    assert b"hi" in first
+    assert guard.abandoned
+    await response.aclose()
+
+
+async def _drain(frames: AsyncGenerator[SseFrame]) -> None:
+    async for _ in frames:
+        pass
@@ -0,0 +1,163 @@
+"""
+Unit tests for SseFrame.
+
+Tests the typed frame that flows between StreamProtocolConverter and the transports:
+- SseFrame(event): lazy serialization to 'data: {...}\\n\\n', cached
+- from_sse(): wrap pre-formatted strings (parse once, keep text verbatim)
+- coerce(): accept either frames or legacy strings
+- DONE_FRAME: shared [DONE] terminator
+- Bytes-native fast paths: preencoded constants, text_delta()/data_pcm() templates
+"""
+
+import base64
+import json
+
+from adk_stream_protocol.protocol.sse_frame import (
+    DONE_FRAME,
+    DONE_SSE_TEXT,
+    FINISH_STEP_FRAME,
+    START_STEP_FRAME,
+    SseFrame,
+)
+
+
+# ============================================================
+# Serialization Tests
+# ============================================================
+
+
+def test_frame_text_matches_legacy_sse_format() -> None:
+    """frame.text should be identical to the json.dumps based SSE format."""
+    # given
+    event = {"type": "text-delta", "id": "0", "delta": "こんにちは"}
+
+    # when
+    frame = SseFrame(event)
+
+    # then
+    assert frame.text == f"data: {json.dumps(event)}\n\n"
+    assert frame.encode() == frame.text.encode("utf-8")
+    assert frame.type == "text-delta"
+
+
+def test_frame_serializes_once() -> None:
+    """Repeated text/encode() access should return the cached objects."""
+    # given
+    frame = SseFrame({"type": "start"})
+
+    # when
+    first_text = frame.text
+    first_bytes = frame.encode()
+
+    # then
+    assert frame.text is first_text
+    assert frame.encode() is first_bytes
+
+
+def test_done_frame() -> None:
+    """DONE_FRAME should encode as the AI SDK v6 terminator."""
+    assert DONE_FRAME.is_done
+    assert DONE_FRAME.event is None
+    assert DONE_FRAME.type is None
+    assert DONE_FRAME.text == DONE_SSE_TEXT
+
+
+# ============================================================
+# Legacy String Pass-through Tests
+# ============================================================
+
+
+def test_from_sse_keeps_original_text() -> None:
+    """from_sse() should parse the payload and keep the original string verbatim."""
+    # given
+    sse = 'data: {"type":"tool-input-available","toolCallId":"call-1"}\n\n'
+
+    # when
+    frame = SseFrame.from_sse(sse)
+
+    # then
+    assert frame.text is sse
+    assert frame.type == "tool-input-available"
+    assert frame.event == {"type": "tool-input-available", "toolCallId": "call-1"}
+
+
+def test_from_sse_done_and_malformed() -> None:
+    """from_sse() should detect [DONE] and tolerate malformed payloads."""
+    # when
+    done = SseFrame.from_sse("data: [DONE]\n\n")
+    malformed = SseFrame.from_sse("data: {not json\n\n")
+    comment = SseFrame.from_sse(": keep-alive\n\n")
+
+    # then
+    assert done.is_done
+    assert malformed.event is None
+    assert malformed.text == "data: {not json\n\n"
+    assert comment.event is None
+    assert not comment.is_done
+
+
+def test_coerce_returns_frames_unchanged() -> None:
+    """coerce() should not rewrap existing frames."""
+    # given
+    frame = SseFrame({"type": "finish"})
+
+    # when / then
+    assert SseFrame.coerce(frame) is frame
+    assert SseFrame.coerce('data: {"type":"finish"}\n\n').type == "finish"
+
+
+# ============================================================
+# Bytes-native Fast Path Tests
+# ============================================================
+
+
+def test_constant_frames_are_preencoded() -> None:
+    """Constant frames should carry their wire bytes from import time."""
+    assert START_STEP_FRAME.encode() == b'data: {"type": "start-step"}\n\n'
+    assert FINISH_STEP_FRAME.encode() == b'data: {"type": "finish-step"}\n\n'
+    assert DONE_FRAME.encode() == b"data: [DONE]\n\n"
+    assert START_STEP_FRAME.encode() is START_STEP_FRAME.encode()
+
+
+def test_text_delta_template_matches_dict_serialization() -> None:
+    """text_delta() bytes should be identical to serializing the equivalent dict."""
+    # given - id/delta that need JSON escaping and non-ASCII
+    part_id = 'msg_"1"'
+    delta = 'line1\nline2 "quoted" 日本語 \\ end'
+
+    # when
+    fast = SseFrame.text_delta(part_id, delta, event_type="reasoning-delta")
+    slow = SseFrame({"type": "reasoning-delta", "id": part_id, "delta": delta})
+
+    # then
+    assert fast.encode() == slow.encode()
+    assert fast.text == slow.text
+    assert fast.event == slow.event
+
+
+def test_data_pcm_template_matches_dict_serialization() -> None:
+    """data_pcm() bytes should be identical to serializing the equivalent dict."""
+    # given
+    pcm = bytes(range(256)) * 4
+    b64 = base64.b64encode(pcm)
+
+    # when
+    fast = SseFrame.data_pcm(pcm, 24000)
+    slow = SseFrame(
+        {
+            "type": "data-pcm",
+            "data": {
+                "content": b64.decode("ascii"),
+                "sampleRate": 24000,
+                "channels": 1,
+                "bitDepth": 16,
+            },
+        }
+    )
+
+    # then
+    assert fast.encode() == slow.encode()
+    assert fast.text == slow.text
+    assert fast.event == slow.event
+    assert fast.type == "data-pcm"
+    assert fast.pcm is pcm
@@ -0,0 +1,182 @@
+"""
+Unit tests for resumable SSE streams.
+
+Tests SseReplayBuffer and ResumableSseRegistry:
+- Frames get sequential 'id:' fields
+- follow() replays the missing tail after Last-Event-ID, then follows live frames
+- Reconnects older than the ring buffer are rejected (check_resumable)
+- The producer keeps running when no reader is attached (client disconnect)
+- Attached readers apply backpressure instead of losing frames
+"""
+
+import asyncio
+
+import pytest
+
+from adk_stream_protocol import Error, Ok
+from adk_stream_protocol.protocol.sse_frame import DONE_FRAME, SseFrame
+from adk_stream_protocol.transport.sse_resume import ResumableSseRegistry, SseReplayBuffer
+
+
+def _delta(delta: str) -> SseFrame:
+    return SseFrame.text_delta("t1", delta)
+
+
+async def _collect(stream) -> list[bytes]:
+    return [data async for data in stream]
+
+
+# ============================================================
+# SseReplayBuffer Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_frames_get_sequential_event_ids() -> None:
+    """Each frame is prefixed with 'id: N' (starting at 1)."""
+    # given
+    buffer = SseReplayBuffer("s1", max_frames=8)
+
+    # when
+    await buffer.append(_delta("a"))
+    await buffer.append(DONE_FRAME)
+    await buffer.finish()
+    chunks = await _collect(buffer.follow())
+
+    # then
+    assert chunks == [b"id: 1\n" + _delta("a").encode(), b"id: 2\ndata: [DONE]\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_follow_replays_only_missing_tail() -> None:
+    """follow(cursor) yields frames after the cursor only."""
+    # given
+    buffer = SseReplayBuffer("s1", max_frames=8)
+    for delta in "abcd":
+        await buffer.append(_delta(delta))
+    await buffer.finish()
+
+    # when
+    chunks = await _collect(buffer.follow(2))
+
+    # then
+    assert [chunk.split(b"\n", 1)[0] for chunk in chunks] == [b"id: 3", b"id: 4"]
+
+
+def test_check_resumable_rejects_ids_outside_buffer() -> None:
+    """Last-Event-IDs older than the ring buffer or ahead of the stream are errors."""
+    # given: 5 frames, only the last 2 buffered
+    buffer = SseReplayBuffer("s1", max_frames=2)
+
+    async def fill() -> None:
+        for delta in "abcde":
+            await buffer.append(_delta(delta))
+
+    asyncio.run(fill())
+
+    # when/then
+    assert buffer.check_resumable(3) == Ok(3)
+    assert buffer.check_resumable(5) == Ok(5)
+    assert isinstance(buffer.check_resumable(2), Error)
+    assert isinstance(buffer.check_resumable(None), Error)
+    assert isinstance(buffer.check_resumable(6), Error)
+
+
+@pytest.mark.asyncio
+async def test_attached_reader_applies_backpressure() -> None:
+    """The producer waits for an attached reader instead of overwriting unread frames."""
+    # given
+    buffer = SseReplayBuffer("s1", max_frames=2)
+    await buffer.append(_delta("a"))
+    reader = buffer.follow()
+    first = await anext(reader)  # attach; reader has consumed frame 1
+
+    # when: producer tries to get 3 frames ahead of the reader
+    async def produce() -> None:
+        for delta in "bcd":
+            await buffer.append(_delta(delta))
+        await buffer.finish()
+
+    producer = asyncio.create_task(produce())
+    await asyncio.sleep(0.01)
+    stalled_at = buffer.last_event_id
+    rest = await _collect(reader)
+    await producer
+
+    # then
+    assert first.startswith(b"id: 1\n")
+    assert stalled_at < 4
+    assert [chunk.split(b"\n", 1)[0] for chunk in rest] == [b"id: 2", b"id: 3", b"id: 4"]
+
+
+@pytest.mark.asyncio
+async def test_producer_error_is_raised_after_buffered_frames() -> None:
+    """Readers see every buffered frame, then the producer's exception."""
+    # given
+    buffer = SseReplayBuffer("s1", max_frames=8)
+    await buffer.append(_delta("a"))
+    await buffer.finish(RuntimeError("model failed"))
+
+    # when
+    received: list[bytes] = []
+    with pytest.raises(RuntimeError, match="model failed"):
+        async for chunk in buffer.follow():
+            received.append(chunk)
+
+    # then
+    assert len(received) == 1
+
+
+# ============================================================
+# ResumableSseRegistry Tests
+# ============================================================
+
+
+@pytest.mark.asyncio
+async def test_registry_producer_survives_reader_disconnect() -> None:
+    """Dropping the first reader does not cancel the run; a reconnect gets the tail."""
+    # given
+    registry = ResumableSseRegistry(max_frames=16)
+    release = asyncio.Event()
+
+    async def frames():
+        yield _delta("a")
+        await release.wait()
+        yield _delta("b")
+        yield DONE_FRAME
+
+    buffer = registry.start("s1", frames(), owner="user_1")
+
+    # when: first reader gets frame 1, then the connection drops
+    first_reader = buffer.follow()
+    first = await anext(first_reader)
+    await first_reader.aclose()
+    release.set()
+    await asyncio.sleep(0.01)
+
+    resumed = registry.get("s1")
+    assert resumed is not None
+    tail = await _collect(resumed.follow(1))
+
+    # then
+    assert first.startswith(b"id: 1\n")
+    assert [chunk.split(b"\n", 1)[0] for chunk in tail] == [b"id: 2", b"id: 3"]
+    assert resumed.owner == "user_1"
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_expires_finished_streams() -> None:
+    """Finished streams are dropped after retain_seconds."""
+    # given
+    registry = ResumableSseRegistry(max_frames=4, retain_seconds=0)
+
+    async def frames():
+        yield DONE_FRAME
+
+    buffer = registry.start("s1", frames())
+    await _collect(buffer.follow())
+
+    # when/then
+    assert registry.get("s1") is None
+    assert len(registry) == 0
@@ -21,7 +21,10 @@ from adk_stream_protocol import (
     StreamProtocolConverter,
     stream_adk_to_ai_sdk,
 )
-from adk_stream_protocol.protocol.stream_protocol import _map_adk_finish_reason_to_ai_sdk
+from adk_stream_protocol.protocol.stream_protocol import (
+    MAX_TOOL_CALL_ID_MAP_SIZE,
+    _map_adk_finish_reason_to_ai_sdk,
+)
 from tests.utils import parse_sse_event
 from tests.utils.mocks import create_custom_event
 
@@ -207,6 +210,62 @@ class TestReasoningContentConversion:
         assert len(reasoning_delta_events) == 1
         assert reasoning_delta_events[0]["delta"] == thought_content
 
+    @pytest.mark.parametrize(
+        "duplicate_text",
+        [
+            pytest.param("Step 1. Step 2.", id="matches-concatenation"),
+            pytest.param("Step 2.", id="matches-individual-part"),
+        ],
+    )
+    def test_duplicate_reasoning_text_is_filtered(self, duplicate_text: str):
+        """Text parts repeating this turn's reasoning (joined or individual) are skipped."""
+        converter = StreamProtocolConverter()
+
+        # given: reasoning parts followed by a text part repeating them
+        reasoning = create_event(
+            author="model",
+            content=create_content(
+                role="model",
+                parts=[create_reasoning_part("Step 1. "), create_reasoning_part("Step 2.")],
+            ),
+        )
+        duplicate = create_event(
+            author="model",
+            content=create_content(role="model", parts=[create_text_part(duplicate_text)]),
+        )
+
+        # when
+        asyncio.run(convert_and_collect(converter, reasoning))
+        events = asyncio.run(convert_and_collect(converter, duplicate))
+
+        # then: no text events emitted for the duplicate
+        assert [parse_sse_event(e)["type"] for e in events] == []
+
+    def test_duplicate_reasoning_index_resets_on_turn_complete(self):
+        """After turn_complete, text matching the previous turn's reasoning is not filtered."""
+        converter = StreamProtocolConverter()
+
+        # given: turn 1 reasoning, then turn_complete
+        reasoning = create_event(
+            author="model",
+            content=create_content(role="model", parts=[create_reasoning_part("Same text")]),
+        )
+        asyncio.run(convert_and_collect(converter, reasoning))
+        asyncio.run(convert_and_collect(converter, Event(author="model", turn_complete=True)))
+
+        # when: turn 2 answers with the same text
+        answer = create_event(
+            author="model",
+            content=create_content(role="model", parts=[create_text_part("Same text")]),
+        )
+        events = asyncio.run(convert_and_collect(converter, answer))
+
+        # then
+        text_deltas = [
+            parse_sse_event(e) for e in events if parse_sse_event(e)["type"] == "text-delta"
+        ]
+        assert [e["delta"] for e in text_deltas] == ["Same text"]
+
 
 class TestToolExecutionConversion:
     """Test Category 3: Tool Execution (reviews.md section 3)"""
@@ -1458,3 +1517,81 @@ class TestFinishReasonMapping:
 
         # then: Should use lowercase fallback
         assert result == "custom_reason"
+
+
+class TestPerTurnStateReset:
+    """Test: BIDI converter state is reset per turn and bounded within a turn"""
+
+    def test_audio_metadata_is_per_turn(self):
+        """Audio stats in finish metadata cover only the current turn."""
+        converter = StreamProtocolConverter()
+        audio = create_event(
+            author="model",
+            content=create_content(
+                role="model",
+                parts=[create_inline_data_part("audio/pcm;rate=24000", b"\x00\x01" * 100)],
+            ),
+        )
+        turn_complete = Event(author="model", turn_complete=True)
+
+        # given: turn 1 has two chunks, turn 2 has one
+        asyncio.run(convert_and_collect(converter, audio))
+        asyncio.run(convert_and_collect(converter, audio))
+        turn1 = asyncio.run(convert_and_collect(converter, turn_complete))
+        asyncio.run(convert_and_collect(converter, audio))
+        turn2 = asyncio.run(convert_and_collect(converter, turn_complete))
+
+        # then
+        def audio_metadata(events: list[str]) -> dict[str, Any]:
+            finish = next(
+                parse_sse_event(e) for e in events if parse_sse_event(e)["type"] == "finish"
+            )
+            return finish["messageMetadata"]["audio"]
+
+        assert audio_metadata(turn1)["chunks"] == 2
+        assert audio_metadata(turn2)["chunks"] == 1
+        assert audio_metadata(turn2)["bytes"] == 200
+
+    def test_tool_call_id_map_cleared_on_turn_complete(self):
+        """tool_call_id_map only holds the current turn's tool calls."""
+        converter = StreamProtocolConverter()
+        call = create_event(
+            author="model",
+            content=create_content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(id="call-1", name="get_weather", args={})
+                    )
+                ],
+            ),
+        )
+
+        # when
+        asyncio.run(convert_and_collect(converter, call))
+        during_turn = dict(converter.tool_call_id_map)
+        asyncio.run(convert_and_collect(converter, Event(author="model", turn_complete=True)))
+
+        # then
+        assert during_turn == {"get_weather": "call-1"}
+        assert converter.tool_call_id_map == {}
+
+    def test_tool_call_id_map_is_bounded(self):
+        """tool_call_id_map keeps at most MAX_TOOL_CALL_ID_MAP_SIZE entries within a turn."""
+        converter = StreamProtocolConverter()
+        parts = [
+            types.Part(function_call=types.FunctionCall(id=f"call-{i}", name=f"tool_{i}", args={}))
+            for i in range(MAX_TOOL_CALL_ID_MAP_SIZE + 10)
+        ]
+
+        # when
+        asyncio.run(
+            convert_and_collect(
+                converter, create_event(author="model", content=create_content("model", parts))
+            )
+        )
+
+        # then: oldest entries evicted first
+        assert len(converter.tool_call_id_map) == MAX_TOOL_CALL_ID_MAP_SIZE
+        assert "tool_0" not in converter.tool_call_id_map
+        assert f"tool_{MAX_TOOL_CALL_ID_MAP_SIZE + 9}" in converter.tool_call_id_map
@@ -291,3 +291,37 @@ class TestOutputTranscriptionRealResponse:
         assert len(parsed) == 1
         assert parsed[0]["type"] == "start"
         assert "messageId" in parsed[0]
+
+    @pytest.mark.asyncio
+    async def test_finished_duplicate_filtered_within_turn_only(self):
+        """
+        Final finished=True summary equal to the accumulated text is filtered,
+        but accumulation resets on turn_complete so the next turn is unaffected.
+        """
+        # given
+        converter = StreamProtocolConverter()
+
+        def transcription_event(text: str, finished: bool) -> Any:
+            return create_custom_event(
+                content=None,
+                turn_complete=None,
+                usage_metadata=None,
+                finish_reason=None,
+                output_transcription=MockTranscription(text, finished=finished),
+            )
+
+        async def collect(event: Any) -> list[dict[str, Any]]:
+            return [parse_sse_event(e) async for e in converter._convert_event(event)]
+
+        # when: turn 1 streams "Hello world" then repeats it as the final summary
+        await collect(transcription_event("Hello ", finished=False))
+        await collect(transcription_event("world", finished=False))
+        turn1_final = await collect(transcription_event("Hello world", finished=True))
+        await collect(create_custom_event(turn_complete=True, usage_metadata=None))
+
+        # turn 2 starts with the same text as turn 1's accumulation
+        turn2 = await collect(transcription_event("Hello world", finished=True))
+
+        # then
+        assert [e["type"] for e in turn1_final] == ["text-end"]
+        assert [e.get("delta") for e in turn2 if e["type"] == "text-delta"] == ["Hello world"]
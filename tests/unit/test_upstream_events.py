@@ -0,0 +1,85 @@
+"""
+Unit tests for upstream_events module.
+
+Tests typed BIDI upstream events validated from raw WebSocket frames:
+- Dispatch on "type" (message, tool_result, audio_chunk, interrupt, audio_control, ping)
+- Unknown types and invalid frames
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from adk_stream_protocol.protocol import (
+    AudioChunkEvent,
+    ChatMessage,
+    InterruptEvent,
+    MessageEvent,
+    PingEvent,
+    ToolResultEvent,
+    UnknownEvent,
+    parse_upstream_event,
+)
+
+
+def test_message_event_parses_history_in_one_pass() -> None:
+    """Messages come out as ChatMessage objects straight from the raw frame."""
+    # given
+    frame = (
+        b'{"type": "message", "version": "1.0", "id": "chat-1", "historyCursor": 2,'
+        b' "messages": [{"role": "user", "parts": [{"type": "text", "text": "Hi"}]}]}'
+    )
+
+    # when
+    event = parse_upstream_event(frame)
+
+    # then
+    assert isinstance(event, MessageEvent)
+    assert event.id == "chat-1"
+    assert event.historyCursor == 2
+    assert isinstance(event.messages[0], ChatMessage)
+    assert event.messages[0].parts is not None
+    assert event.messages[0].parts[0].text == "Hi"  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize(
+    ("frame", "event_type"),
+    [
+        ('{"type": "tool_result", "toolCallId": "c1", "result": {"ok": true}}', ToolResultEvent),
+        ('{"type": "audio_chunk", "chunk": "AAAA", "sampleRate": 16000}', AudioChunkEvent),
+        ('{"type": "interrupt"}', InterruptEvent),
+        ('{"type": "ping", "version": "1.0", "timestamp": 1700000000000}', PingEvent),
+        ('{"type": "custom-thing", "foo": 1}', UnknownEvent),
+    ],
+)
+def test_events_dispatch_on_type(frame: str, event_type: type) -> None:
+    """Each known type validates as its model; others as UnknownEvent."""
+    # when
+    event = parse_upstream_event(frame)
+
+    # then
+    assert isinstance(event, event_type)
+
+
+def test_ping_timestamp_is_echoed_unchanged() -> None:
+    """Integer client timestamps stay integers (pong echoes them)."""
+    # when
+    event = parse_upstream_event('{"type": "ping", "timestamp": 1700000000000}')
+
+    # then
+    assert event.timestamp == 1700000000000
+    assert isinstance(event.timestamp, int)
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        "{not json",
+        '{"type": "message", "messages": ["not_a_dict"]}',
+        '{"type": "message", "messages": [], "historyCursor": -1}',
+    ],
+)
+def test_invalid_frames_raise_validation_error(frame: str) -> None:
+    """Malformed JSON and events that do not match their type are rejected."""
+    # when/then
+    with pytest.raises(ValidationError):
+        parse_upstream_event(frame)
@@ -154,6 +154,7 @@ def create_mock_tool_context(
 
     mock_context = Mock(spec=ToolContext)
     mock_context.invocation_id = invocation_id
+    mock_context.function_call_id = invocation_id
 
     if session is not None:
         mock_context.session = session
@@ -7,12 +7,14 @@ SSE protocol conversion in the ADK to AI SDK v6 data stream protocol.
 import json
 from typing import Any
 
+from adk_stream_protocol.protocol.sse_frame import SseFrame
 
-def parse_sse_event(sse_string: str) -> dict[str, Any]:
+
+def parse_sse_event(sse_string: SseFrame | str) -> dict[str, Any]:
     """Parse SSE format 'data: {json}\\n\\n' to dict.
 
     Args:
-        sse_string: SSE formatted string (e.g., "data: {...}\\n\\n")
+        sse_string: SseFrame or SSE formatted string (e.g., "data: {...}\\n\\n")
 
     Returns:
         Parsed JSON dict from the SSE data field
@@ -26,6 +28,8 @@ def parse_sse_event(sse_string: str) -> dict[str, Any]:
         >>> parse_sse_event('data: [DONE]\\n\\n')
         {'type': 'DONE'}
     """
+    if isinstance(sse_string, SseFrame):
+        sse_string = sse_string.text
     if sse_string.startswith("data: "):
         data_part = sse_string[6:].strip()
         if data_part == "[DONE]":